@@ -21,20 +21,22 @@ import aiofiles
 
 from parlant.core.persistence.common import (
     Where,
-    matches_filters,
     ensure_is_total,
 )
 from parlant.core.async_utils import ReaderWriterLock
 from parlant.core.persistence.document_database import (
     BaseDocument,
+    DeleteManyResult,
     DeleteResult,
     DocumentCollection,
     DocumentDatabase,
     InsertResult,
     TDocument,
+    UpdateManyResult,
     UpdateResult,
     identity_loader,
 )
+from parlant.core.persistence.indexed_documents import IndexedDocuments
 from parlant.core.loggers import Logger
 
 
@@ -213,7 +215,7 @@ class JSONFileDocumentDatabase(DocumentDatabase):
     async def _flush_unlocked(self) -> None:
         data = {}
         for collection_name in self._collections:
-            data[collection_name] = self._collections[collection_name].documents
+            data[collection_name] = list(self._collections[collection_name].documents)
         await self._save_data(data)
 
 
@@ -232,22 +234,18 @@ class JSONFileDocumentCollection(DocumentCollection[TDocument]):
 
         self._lock = ReaderWriterLock()
 
-        self.documents = list(data) if data else []
+        self.documents = IndexedDocuments(
+            IndexedDocuments.fields_for_schema(schema),
+            data or [],
+        )
 
     @override
     async def find(
         self,
         filters: Where,
     ) -> Sequence[TDocument]:
-        result = []
         async with self._lock.reader_lock:
-            for doc in filter(
-                lambda d: matches_filters(filters, d),
-                self.documents,
-            ):
-                result.append(doc)
-
-        return result
+            return self.documents.find(filters)
 
     @override
     async def find_one(
@@ -255,11 +253,7 @@ class JSONFileDocumentCollection(DocumentCollection[TDocument]):
         filters: Where,
     ) -> Optional[TDocument]:
         async with self._lock.reader_lock:
-            for doc in self.documents:
-                if matches_filters(filters, doc):
-                    return doc
-
-        return None
+            return self.documents.find_one(filters)
 
     @override
     async def insert_one(
@@ -269,7 +263,7 @@ class JSONFileDocumentCollection(DocumentCollection[TDocument]):
         ensure_is_total(document, self._schema)
 
         async with self._lock.writer_lock:
-            self.documents.append(document)
+            self.documents.add(document)
 
         await self._database.flush()
 
@@ -283,18 +277,18 @@ class JSONFileDocumentCollection(DocumentCollection[TDocument]):
         upsert: bool = False,
     ) -> UpdateResult[TDocument]:
         async with self._lock.writer_lock:
-            for i, d in enumerate(self.documents):
-                if matches_filters(filters, d):
-                    self.documents[i] = cast(TDocument, {**self.documents[i], **params})
+            if keys := self.documents.find_keys(filters, limit=1):
+                updated_document = cast(TDocument, {**self.documents.get(keys[0]), **params})
+                self.documents.replace(keys[0], updated_document)
 
-                    await self._database.flush()
+                await self._database.flush()
 
-                    return UpdateResult(
-                        acknowledged=True,
-                        matched_count=1,
-                        modified_count=1,
-                        updated_document=self.documents[i],
-                    )
+                return UpdateResult(
+                    acknowledged=True,
+                    matched_count=1,
+                    modified_count=1,
+                    updated_document=updated_document,
+                )
 
         if upsert:
             await self.insert_one(params)
@@ -319,18 +313,69 @@ class JSONFileDocumentCollection(DocumentCollection[TDocument]):
         filters: Where,
     ) -> DeleteResult[TDocument]:
         async with self._lock.writer_lock:
-            for i, d in enumerate(self.documents):
-                if matches_filters(filters, d):
-                    document = self.documents.pop(i)
+            if keys := self.documents.find_keys(filters, limit=1):
+                document = self.documents.remove(keys[0])
 
-                    await self._database.flush()
+                await self._database.flush()
 
-                    return DeleteResult(
-                        deleted_count=1, acknowledged=True, deleted_document=document
-                    )
+                return DeleteResult(deleted_count=1, acknowledged=True, deleted_document=document)
 
         return DeleteResult(
             acknowledged=True,
             deleted_count=0,
             deleted_document=None,
         )
+
+    @override
+    async def insert_many(
+        self,
+        documents: Sequence[TDocument],
+    ) -> InsertResult:
+        for document in documents:
+            ensure_is_total(document, self._schema)
+
+        async with self._lock.writer_lock:
+            for document in documents:
+                self.documents.add(document)
+
+        if documents:
+            await self._database.flush()
+
+        return InsertResult(acknowledged=True)
+
+    @override
+    async def update_many(
+        self,
+        filters: Where,
+        params: TDocument,
+    ) -> UpdateManyResult:
+        async with self._lock.writer_lock:
+            keys = self.documents.find_keys(filters)
+
+            for key in keys:
+                self.documents.replace(key, cast(TDocument, {**self.documents.get(key), **params}))
+
+            if keys:
+                await self._database.flush()
+
+        return UpdateManyResult(
+            acknowledged=True,
+            matched_count=len(keys),
+            modified_count=len(keys),
+        )
+
+    @override
+    async def delete_many(
+        self,
+        filters: Where,
+    ) -> DeleteManyResult:
+        async with self._lock.writer_lock:
+            keys = self.documents.find_keys(filters)
+
+            for key in keys:
+                self.documents.remove(key)
+
+            if keys:
+                await self._database.flush()
+
+        return DeleteManyResult(acknowledged=True, deleted_count=len(keys))
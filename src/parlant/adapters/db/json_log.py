@@ -0,0 +1,597 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, Optional, Sequence, cast
+from typing_extensions import override, Self
+import aiofiles
+from aiofiles.threadpool.text import AsyncTextIOWrapper
+
+from parlant.core.persistence.common import (
+    Where,
+    ensure_is_total,
+)
+from parlant.core.async_utils import ReaderWriterLock
+from parlant.core.persistence.document_database import (
+    BaseDocument,
+    DeleteManyResult,
+    DeleteResult,
+    DocumentCollection,
+    DocumentDatabase,
+    InsertResult,
+    TDocument,
+    UpdateManyResult,
+    UpdateResult,
+    identity_loader,
+)
+from parlant.core.persistence.indexed_documents import IndexedDocuments
+from parlant.core.loggers import Logger
+
+
+class JSONLogDocumentDatabase(DocumentDatabase):
+    """A document database persisted as an append-only log of JSON lines.
+
+    Every write appends a single record describing the written document, so its cost
+    does not depend on how much data the database already holds. The log is replayed
+    into memory when the database is opened, and is compacted into one record per
+    live document once enough superseded records have accumulated.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        file_path: Path,
+        compaction_threshold: int = 10_000,
+        fsync: bool = False,
+    ) -> None:
+        self.file_path = file_path
+
+        self._logger = logger
+        self._compaction_threshold = compaction_threshold
+        self._fsync = fsync
+
+        self._lock = ReaderWriterLock()
+
+        self._log_file: Optional[AsyncTextIOWrapper] = None
+        self._record_count = 0
+
+        self._raw_data: dict[str, dict[str, BaseDocument]] = {}
+        self._collections: dict[str, JSONLogDocumentCollection[BaseDocument]] = {}
+
+    async def __aenter__(self) -> Self:
+        async with self._lock.writer_lock:
+            self._raw_data = await self._replay()
+            self._log_file = await aiofiles.open(self.file_path, mode="a", encoding="utf-8")
+
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[object],
+    ) -> bool:
+        async with self._lock.writer_lock:
+            if self._record_count > self._live_document_count() + len(self._collection_names()):
+                await self._compact_unlocked()
+
+            if self._log_file:
+                await self._log_file.close()
+                self._log_file = None
+
+        return False
+
+    async def flush(self) -> None:
+        async with self._lock.writer_lock:
+            if self._log_file:
+                await self._log_file.flush()
+
+                if self._fsync:
+                    await asyncio.to_thread(os.fsync, self._log_file.fileno())
+
+    async def compact(self) -> None:
+        async with self._lock.writer_lock:
+            await self._compact_unlocked()
+
+    async def _replay(self) -> dict[str, dict[str, BaseDocument]]:
+        data: dict[str, dict[str, BaseDocument]] = {}
+
+        self._record_count = 0
+
+        if not self.file_path.exists():
+            self.file_path.touch()
+            return data
+
+        async with aiofiles.open(self.file_path, mode="r", encoding="utf-8") as file:
+            content = await file.read()
+
+        lines = content.split("\n")
+
+        # A write that was interrupted midway leaves an unterminated last line behind.
+        # Everything up to the last complete record is intact, so we drop the torn
+        # tail and carry on from there.
+        if lines[-1]:
+            self._logger.warning(
+                f"Discarding incomplete trailing record in {self.file_path}: {lines[-1]!r}"
+            )
+
+            async with aiofiles.open(self.file_path, mode="w", encoding="utf-8") as file:
+                await file.write("".join(f"{line}\n" for line in lines[:-1]))
+
+        for line in lines[:-1]:
+            if not line:
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                self._logger.error(f"Skipping corrupt record in {self.file_path}: {e}")
+                continue
+
+            self._apply_record(data, record)
+            self._record_count += 1
+
+        return data
+
+    def _apply_record(
+        self,
+        data: dict[str, dict[str, BaseDocument]],
+        record: dict[str, Any],
+    ) -> None:
+        collection_name = record["collection"]
+
+        match record["op"]:
+            case "put":
+                document = cast(BaseDocument, record["document"])
+                data.setdefault(collection_name, {})[document["id"]] = document
+            case "delete":
+                data.get(collection_name, {}).pop(record["id"], None)
+            case "create":
+                data[collection_name] = {}
+            case "drop":
+                data.pop(collection_name, None)
+            case _:
+                self._logger.error(f"Skipping record with unknown operation: {record}")
+
+    async def _append_records(
+        self,
+        records: Iterable[dict[str, Any]],
+        apply: Optional[Callable[[], None]] = None,
+    ) -> None:
+        async with self._lock.writer_lock:
+            await self._append_records_unlocked(records)
+
+            # Changes are only applied in memory once they're in the log, so that a failed
+            # write never leaves us serving data that a replay wouldn't bring back.
+            # They're applied before compacting, though, since it writes what's in memory.
+            if apply:
+                apply()
+
+            if self._record_count >= max(
+                self._compaction_threshold,
+                2 * self._live_document_count(),
+            ):
+                await self._compact_unlocked()
+
+    async def _append_records_unlocked(self, records: Iterable[dict[str, Any]]) -> None:
+        if self._log_file is None:
+            raise Exception("Database must be entered before being written to")
+
+        lines = [
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        ]
+
+        await self._log_file.write("".join(lines))
+        await self._log_file.flush()
+
+        if self._fsync:
+            await asyncio.to_thread(os.fsync, self._log_file.fileno())
+
+        self._record_count += len(lines)
+
+    def _live_document_count(self) -> int:
+        return sum(
+            len(self._collections[name].documents)
+            if name in self._collections
+            else len(self._raw_data[name])
+            for name in self._collection_names()
+        )
+
+    def _collection_names(self) -> list[str]:
+        return list(dict.fromkeys([*self._raw_data, *self._collections]))
+
+    async def _compact_unlocked(self) -> None:
+        records: list[dict[str, Any]] = []
+
+        for name in self._collection_names():
+            documents: Iterable[BaseDocument] = (
+                self._collections[name].documents
+                if name in self._collections
+                else self._raw_data[name].values()
+            )
+
+            records.append({"op": "create", "collection": name})
+            records.extend({"op": "put", "collection": name, "document": d} for d in documents)
+
+        temp_path = self.file_path.with_name(f"{self.file_path.name}.compacting")
+
+        async with aiofiles.open(temp_path, mode="w", encoding="utf-8") as file:
+            await file.write(
+                "".join(
+                    json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+                    for record in records
+                )
+            )
+            await file.flush()
+            await asyncio.to_thread(os.fsync, file.fileno())
+
+        if self._log_file:
+            await self._log_file.close()
+
+        # Renaming is atomic, so a crash at any point leaves either
+        # the old log or the compacted one in place—never a mix of both.
+        os.replace(temp_path, self.file_path)
+
+        self._log_file = await aiofiles.open(self.file_path, mode="a", encoding="utf-8")
+        self._record_count = len(records)
+
+    async def load_documents_with_loader(
+        self,
+        name: str,
+        document_loader: Callable[[BaseDocument], Awaitable[Optional[TDocument]]],
+    ) -> Sequence[TDocument]:
+        data: list[TDocument] = []
+        records: list[dict[str, Any]] = []
+        failed_migrations: list[BaseDocument] = []
+
+        for doc in self._raw_data.get(name, {}).values():
+            try:
+                if loaded_doc := await document_loader(doc):
+                    data.append(loaded_doc)
+
+                    if loaded_doc != doc:
+                        if loaded_doc.get("id") != doc["id"]:
+                            records.append({"op": "delete", "collection": name, "id": doc["id"]})
+                        records.append({"op": "put", "collection": name, "document": loaded_doc})
+                else:
+                    self._logger.warning(f'Failed to load document "{doc}"')
+                    failed_migrations.append(doc)
+            except Exception as e:
+                self._logger.error(
+                    f"Failed to load document '{doc}' with error: {e}. Added to failed migrations collection."
+                )
+                failed_migrations.append(doc)
+
+        records.extend(
+            {"op": "delete", "collection": name, "id": doc["id"]} for doc in failed_migrations
+        )
+
+        if records:
+            await self._append_records(records)
+
+        if failed_migrations:
+            failed_migrations_collection = await self.get_or_create_collection(
+                "failed_migrations", BaseDocument, identity_loader
+            )
+
+            for doc in failed_migrations:
+                await failed_migrations_collection.insert_one(doc)
+
+        return data
+
+    @override
+    async def create_collection(
+        self,
+        name: str,
+        schema: type[TDocument],
+    ) -> JSONLogDocumentCollection[TDocument]:
+        self._raw_data.pop(name, None)
+
+        self._collections[name] = JSONLogDocumentCollection(
+            database=self,
+            name=name,
+            schema=schema,
+        )
+
+        await self._append_records([{"op": "create", "collection": name}])
+
+        return cast(JSONLogDocumentCollection[TDocument], self._collections[name])
+
+    @override
+    async def get_collection(
+        self,
+        name: str,
+        schema: type[TDocument],
+        document_loader: Callable[[BaseDocument], Awaitable[Optional[TDocument]]],
+    ) -> JSONLogDocumentCollection[TDocument]:
+        if collection := self._collections.get(name):
+            return cast(JSONLogDocumentCollection[TDocument], collection)
+
+        elif name in self._raw_data:
+            return await self._load_collection(name, schema, document_loader)
+
+        raise ValueError(f'Collection "{name}" does not exists')
+
+    @override
+    async def get_or_create_collection(
+        self,
+        name: str,
+        schema: type[TDocument],
+        document_loader: Callable[[BaseDocument], Awaitable[Optional[TDocument]]],
+    ) -> JSONLogDocumentCollection[TDocument]:
+        if collection := self._collections.get(name):
+            return cast(JSONLogDocumentCollection[TDocument], collection)
+
+        elif name in self._raw_data:
+            return await self._load_collection(name, schema, document_loader)
+
+        return await self.create_collection(name, schema)
+
+    async def _load_collection(
+        self,
+        name: str,
+        schema: type[TDocument],
+        document_loader: Callable[[BaseDocument], Awaitable[Optional[TDocument]]],
+    ) -> JSONLogDocumentCollection[TDocument]:
+        documents = await self.load_documents_with_loader(name, document_loader)
+
+        self._raw_data.pop(name, None)
+
+        self._collections[name] = JSONLogDocumentCollection(
+            database=self,
+            name=name,
+            schema=schema,
+            data=documents,
+        )
+
+        return cast(JSONLogDocumentCollection[TDocument], self._collections[name])
+
+    @override
+    async def delete_collection(
+        self,
+        name: str,
+    ) -> None:
+        if name in self._collections or name in self._raw_data:
+            self._collections.pop(name, None)
+            self._raw_data.pop(name, None)
+
+            await self._append_records([{"op": "drop", "collection": name}])
+            return
+
+        raise ValueError(f'Collection "{name}" does not exists')
+
+
+class JSONLogDocumentCollection(DocumentCollection[TDocument]):
+    def __init__(
+        self,
+        database: JSONLogDocumentDatabase,
+        name: str,
+        schema: type[TDocument],
+        data: Sequence[TDocument] | None = None,
+    ) -> None:
+        self._database = database
+        self._name = name
+        self._schema = schema
+
+        self._lock = ReaderWriterLock()
+
+        self.documents = IndexedDocuments(
+            IndexedDocuments.fields_for_schema(schema),
+            data or [],
+        )
+
+    @override
+    async def find(
+        self,
+        filters: Where,
+    ) -> Sequence[TDocument]:
+        async with self._lock.reader_lock:
+            return self.documents.find(filters)
+
+    @override
+    async def find_one(
+        self,
+        filters: Where,
+    ) -> Optional[TDocument]:
+        async with self._lock.reader_lock:
+            return self.documents.find_one(filters)
+
+    @override
+    async def insert_one(
+        self,
+        document: TDocument,
+    ) -> InsertResult:
+        ensure_is_total(document, self._schema)
+
+        async with self._lock.writer_lock:
+            await self._database._append_records(
+                [{"op": "put", "collection": self._name, "document": document}],
+                apply=lambda: self._put(document),
+            )
+
+        return InsertResult(acknowledged=True)
+
+    def _put(self, document: TDocument) -> None:
+        # Records are keyed by document ID, so a replay would
+        # collapse any duplicates into the last one written.
+        if keys := self.documents.find_keys({"id": {"$eq": document["id"]}}, limit=1):
+            self.documents.replace(keys[0], document)
+        else:
+            self.documents.add(document)
+
+    def _remove(self, keys: Sequence[int]) -> None:
+        for key in keys:
+            self.documents.remove(key)
+
+    @override
+    async def update_one(
+        self,
+        filters: Where,
+        params: TDocument,
+        upsert: bool = False,
+    ) -> UpdateResult[TDocument]:
+        async with self._lock.writer_lock:
+            if keys := self.documents.find_keys(filters, limit=1):
+                document = self.documents.get(keys[0])
+                updated_document = cast(TDocument, {**document, **params})
+
+                records: list[dict[str, Any]] = []
+
+                if updated_document["id"] != document["id"]:
+                    records.append({"op": "delete", "collection": self._name, "id": document["id"]})
+
+                records.append(
+                    {"op": "put", "collection": self._name, "document": updated_document}
+                )
+
+                await self._database._append_records(
+                    records,
+                    apply=lambda: self.documents.replace(keys[0], updated_document),
+                )
+
+                return UpdateResult(
+                    acknowledged=True,
+                    matched_count=1,
+                    modified_count=1,
+                    updated_document=updated_document,
+                )
+
+        if upsert:
+            await self.insert_one(params)
+
+            return UpdateResult(
+                acknowledged=True,
+                matched_count=0,
+                modified_count=0,
+                updated_document=params,
+            )
+
+        return UpdateResult(
+            acknowledged=True,
+            matched_count=0,
+            modified_count=0,
+            updated_document=None,
+        )
+
+    @override
+    async def delete_one(
+        self,
+        filters: Where,
+    ) -> DeleteResult[TDocument]:
+        async with self._lock.writer_lock:
+            if keys := self.documents.find_keys(filters, limit=1):
+                document = self.documents.get(keys[0])
+
+                await self._database._append_records(
+                    [{"op": "delete", "collection": self._name, "id": document["id"]}],
+                    apply=lambda: self._remove(keys),
+                )
+
+                return DeleteResult(deleted_count=1, acknowledged=True, deleted_document=document)
+
+        return DeleteResult(
+            acknowledged=True,
+            deleted_count=0,
+            deleted_document=None,
+        )
+
+    @override
+    async def insert_many(
+        self,
+        documents: Sequence[TDocument],
+    ) -> InsertResult:
+        for document in documents:
+            ensure_is_total(document, self._schema)
+
+        if not documents:
+            return InsertResult(acknowledged=True)
+
+        def apply() -> None:
+            for document in documents:
+                self._put(document)
+
+        async with self._lock.writer_lock:
+            await self._database._append_records(
+                [
+                    {"op": "put", "collection": self._name, "document": document}
+                    for document in documents
+                ],
+                apply=apply,
+            )
+
+        return InsertResult(acknowledged=True)
+
+    @override
+    async def update_many(
+        self,
+        filters: Where,
+        params: TDocument,
+    ) -> UpdateManyResult:
+        async with self._lock.writer_lock:
+            keys = self.documents.find_keys(filters)
+            updated_documents: list[TDocument] = []
+            records: list[dict[str, Any]] = []
+
+            for key in keys:
+                document = self.documents.get(key)
+                updated_document = cast(TDocument, {**document, **params})
+                updated_documents.append(updated_document)
+
+                if updated_document["id"] != document["id"]:
+                    records.append({"op": "delete", "collection": self._name, "id": document["id"]})
+
+                records.append(
+                    {"op": "put", "collection": self._name, "document": updated_document}
+                )
+
+            def apply() -> None:
+                for key, updated_document in zip(keys, updated_documents):
+                    self.documents.replace(key, updated_document)
+
+            if records:
+                await self._database._append_records(records, apply=apply)
+
+        return UpdateManyResult(
+            acknowledged=True,
+            matched_count=len(keys),
+            modified_count=len(keys),
+        )
+
+    @override
+    async def delete_many(
+        self,
+        filters: Where,
+    ) -> DeleteManyResult:
+        async with self._lock.writer_lock:
+            keys = self.documents.find_keys(filters)
+
+            if keys:
+                await self._database._append_records(
+                    [
+                        {
+                            "op": "delete",
+                            "collection": self._name,
+                            "id": self.documents.get(key)["id"],
+                        }
+                        for key in keys
+                    ],
+                    apply=lambda: self._remove(keys),
+                )
+
+        return DeleteManyResult(acknowledged=True, deleted_count=len(keys))
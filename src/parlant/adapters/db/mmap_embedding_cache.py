@@ -0,0 +1,371 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+from pathlib import Path
+import re
+import struct
+from typing import Any, Mapping, Optional, Sequence
+import numpy as np
+from typing_extensions import override, Self
+
+from parlant.core.loggers import Logger
+from parlant.core.nlp.embedding import Embedder, EmbeddingCache, EmbeddingResult
+
+
+_MAGIC = b"PLEMBCCH"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sIIQ")
+_HEADER_SIZE = 64
+_INITIAL_CAPACITY = 1024
+
+
+class _EmbeddingSlots:
+    """A fixed-record file of float32 vectors, each stored in a slot keyed by a digest.
+
+    Each record holds the key's digest, a logical timestamp of its last use (0 marks
+    a free slot) and the vector itself. Records are accessed through a memory map,
+    so reading or writing one entry touches only that entry's bytes on disk.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        dimensions: int,
+        max_entries: int,
+    ) -> None:
+        self.file_path = file_path
+        self.dimensions = dimensions
+
+        self._max_entries = max_entries
+
+        self._dtype = np.dtype(
+            [
+                ("key", "V32"),
+                ("last_used", "<u8"),
+                ("vector", "<f4", (dimensions,)),
+            ]
+        )
+
+        self._records: Optional[np.memmap[Any, np.dtype[Any]]] = None
+        self._capacity = 0
+        self._clock = 0
+        self._free_slots: list[int] = []
+
+        # Maps each key to its slot, least recently used first
+        self._slots: OrderedDict[bytes, int] = OrderedDict()
+
+    @staticmethod
+    def read_dimensions(file_path: Path) -> Optional[int]:
+        try:
+            with open(file_path, "rb") as file:
+                magic, version, dimensions, _ = _HEADER.unpack(file.read(_HEADER.size))
+        except (OSError, struct.error):
+            return None
+
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            return None
+
+        return int(dimensions)
+
+    def open(self) -> None:
+        if self.read_dimensions(self.file_path) == self.dimensions:
+            self._capacity = (self.file_path.stat().st_size - _HEADER_SIZE) // self._dtype.itemsize
+            self._map()
+            self._load_slots()
+        else:
+            self._resize(min(_INITIAL_CAPACITY, self._max_entries))
+
+    def close(self) -> None:
+        if self._records is not None:
+            self._records.flush()
+            self._records = None
+
+    def flush(self) -> None:
+        if self._records is not None:
+            self._records.flush()
+
+    def get(self, keys: Sequence[bytes]) -> list[Optional[list[float]]]:
+        assert self._records is not None
+
+        results: list[Optional[list[float]]] = []
+
+        for key in keys:
+            if (slot := self._slots.get(key)) is None:
+                results.append(None)
+                continue
+
+            self._touch(key, slot)
+            results.append(self._records["vector"][slot].tolist())
+
+        return results
+
+    def set(self, keys: Sequence[bytes], vectors: Sequence[Sequence[float]]) -> None:
+        for key, vector in zip(keys, vectors, strict=True):
+            if (slot := self._slots.get(key)) is None:
+                slot = self._allocate_slot()
+                self._slots[key] = slot
+
+            assert self._records is not None
+
+            self._records["key"][slot] = np.void(key)
+            self._records["vector"][slot] = vector
+            self._touch(key, slot)
+
+    def _touch(self, key: bytes, slot: int) -> None:
+        assert self._records is not None
+
+        self._clock += 1
+        self._records["last_used"][slot] = self._clock
+        self._slots.move_to_end(key)
+
+    def _allocate_slot(self) -> int:
+        if len(self._slots) >= self._max_entries:
+            _, slot = self._slots.popitem(last=False)
+            return slot
+
+        if not self._free_slots:
+            self._resize(min(2 * self._capacity, self._max_entries))
+
+        return self._free_slots.pop()
+
+    def _map(self) -> None:
+        self._records = np.memmap(
+            self.file_path,
+            dtype=self._dtype,
+            mode="r+",
+            offset=_HEADER_SIZE,
+            shape=(self._capacity,),
+        )
+
+    def _load_slots(self) -> None:
+        assert self._records is not None
+
+        last_used = np.asarray(self._records["last_used"])
+        occupied = np.flatnonzero(last_used)
+        occupied = occupied[np.argsort(last_used[occupied], kind="stable")]
+
+        keys = self._records["key"]
+
+        self._slots = OrderedDict((bytes(keys[slot]), int(slot)) for slot in occupied)
+        self._free_slots = [int(slot) for slot in np.flatnonzero(last_used == 0)[::-1]]
+        self._clock = int(last_used.max()) if len(last_used) else 0
+
+        # The file may have been filled under a larger max_entries
+        while len(self._slots) > self._max_entries:
+            _, slot = self._slots.popitem(last=False)
+            self._records["last_used"][slot] = 0
+            self._free_slots.append(slot)
+
+    def _resize(self, capacity: int) -> None:
+        self.close()
+
+        if self._capacity == 0:
+            self.file_path.unlink(missing_ok=True)
+
+        with open(self.file_path, "ab") as file:
+            file.truncate(_HEADER_SIZE + capacity * self._dtype.itemsize)
+
+        with open(self.file_path, "r+b") as file:
+            file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, self.dimensions, capacity))
+
+        self._free_slots = list(range(capacity - 1, self._capacity - 1, -1)) + self._free_slots
+        self._capacity = capacity
+        self._map()
+
+
+class MemoryMappedEmbeddingCache(EmbeddingCache):
+    """An embedding cache that stores float32 vectors in memory-mapped files.
+
+    Each embedding model (at each number of dimensions) gets its own file of fixed-size
+    records, and vectors are cached per text, so a lookup or a write costs the same
+    regardless of how many entries are already cached. Opening a cache only reads the
+    record keys into an in-memory index. Once a file holds max_entries vectors, the least
+    recently used ones are overwritten. File access runs in a worker thread, off the event loop.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        directory: Path,
+        max_entries: int = 100_000,
+    ) -> None:
+        self.directory = directory
+
+        self._logger = logger
+        self._max_entries = max_entries
+
+        self._stores: dict[str, _EmbeddingSlots] = {}
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> Self:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[object],
+    ) -> bool:
+        async with self._lock:
+            await asyncio.to_thread(self._close_stores)
+
+        return False
+
+    def _close_stores(self) -> None:
+        for store in self._stores.values():
+            store.close()
+
+        self._stores.clear()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._flush_stores)
+
+    def _flush_stores(self) -> None:
+        for store in self._stores.values():
+            store.flush()
+
+    def _store_name(
+        self,
+        embedder_type: type[Embedder],
+        embedder: Optional[Embedder],
+    ) -> str:
+        if embedder is None:
+            return embedder_type.__name__
+
+        # Embedders of the same type may serve different models, or the same model
+        # at different dimensions, so each of those gets its own file
+        return re.sub(r"[^\w.-]", "_", f"{embedder.id}-{embedder.dimensions}d")
+
+    def _file_path(self, name: str) -> Path:
+        return self.directory / f"{name}.embeddings"
+
+    def _open_store(self, name: str, dimensions: int) -> _EmbeddingSlots:
+        store = _EmbeddingSlots(self._file_path(name), dimensions, self._max_entries)
+        store.open()
+
+        self._stores[name] = store
+
+        return store
+
+    def _get_store(self, name: str) -> Optional[_EmbeddingSlots]:
+        if store := self._stores.get(name):
+            return store
+
+        if dimensions := _EmbeddingSlots.read_dimensions(self._file_path(name)):
+            return self._open_store(name, dimensions)
+
+        return None
+
+    def _get_or_create_store(self, name: str, dimensions: int) -> _EmbeddingSlots:
+        store = self._get_store(name)
+
+        if store and store.dimensions == dimensions:
+            return store
+
+        if store:
+            self._logger.warning(
+                f"Embedding dimensions of {name} changed from {store.dimensions} "
+                f"to {dimensions}; discarding its cached embeddings"
+            )
+            store.close()
+            store.file_path.unlink(missing_ok=True)
+
+        return self._open_store(name, dimensions)
+
+    def _generate_keys(
+        self,
+        texts: Sequence[str],
+        hints: Mapping[str, Any],
+    ) -> list[bytes]:
+        sorted_hints = json.dumps(dict(sorted(hints.items())), sort_keys=True)
+
+        return [hashlib.sha256(f"{text}:{sorted_hints}".encode()).digest() for text in texts]
+
+    def _read(self, name: str, keys: Sequence[bytes]) -> list[Optional[list[float]]]:
+        if not (store := self._get_store(name)):
+            return [None] * len(keys)
+
+        return store.get(keys)
+
+    def _write(
+        self,
+        name: str,
+        keys: Sequence[bytes],
+        vectors: Sequence[Sequence[float]],
+    ) -> None:
+        store = self._get_or_create_store(name, len(vectors[0]))
+        store.set(keys, vectors)
+
+    @override
+    async def get(
+        self,
+        embedder_type: type[Embedder],
+        texts: list[str],
+        hints: Mapping[str, Any] = {},
+    ) -> Optional[EmbeddingResult]:
+        vectors = await self.get_many(embedder_type, texts, hints)
+
+        if not vectors or any(v is None for v in vectors):
+            return None
+
+        return EmbeddingResult(vectors=[v for v in vectors if v is not None])
+
+    @override
+    async def set(
+        self,
+        embedder_type: type[Embedder],
+        texts: list[str],
+        vectors: Sequence[Sequence[float]],
+        hints: Mapping[str, Any] = {},
+    ) -> None:
+        await self.set_many(embedder_type, texts, vectors, hints)
+
+    @override
+    async def get_many(
+        self,
+        embedder_type: type[Embedder],
+        texts: Sequence[str],
+        hints: Mapping[str, Any] = {},
+        embedder: Optional[Embedder] = None,
+    ) -> Sequence[Optional[Sequence[float]]]:
+        name = self._store_name(embedder_type, embedder)
+        keys = self._generate_keys(texts, hints)
+
+        async with self._lock:
+            return await asyncio.to_thread(self._read, name, keys)
+
+    @override
+    async def set_many(
+        self,
+        embedder_type: type[Embedder],
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        hints: Mapping[str, Any] = {},
+        embedder: Optional[Embedder] = None,
+    ) -> None:
+        if not vectors:
+            return
+
+        name = self._store_name(embedder_type, embedder)
+        keys = self._generate_keys(texts, hints)
+
+        async with self._lock:
+            await asyncio.to_thread(self._write, name, keys, vectors)
@@ -12,36 +12,109 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Awaitable, Callable, Optional, Sequence
+from __future__ import annotations
+from dataclasses import dataclass
+import os
+from typing import Any, Awaitable, Callable, Mapping, Optional, Sequence, cast
 from bson import CodecOptions
 from typing_extensions import Self
 from parlant.core.loggers import Logger
 from parlant.core.persistence.common import Where
 from parlant.core.persistence.document_database import (
     BaseDocument,
+    DeleteManyResult,
     DeleteResult,
     DocumentCollection,
     DocumentDatabase,
     InsertResult,
     TDocument,
+    UpdateManyResult,
     UpdateResult,
 )
-from pymongo import AsyncMongoClient
+from parlant.core.persistence.indexed_documents import DEFAULT_INDEXED_FIELDS, IndexedDocuments
+from pymongo import (
+    ASCENDING,
+    AsyncMongoClient,
+    DeleteOne,
+    IndexModel,
+    InsertOne,
+    ReplaceOne,
+    ReturnDocument,
+    UpdateOne,
+)
 from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.results import BulkWriteResult
+
+
+@dataclass(frozen=True)
+class MongoClientSettings:
+    """Connection pooling settings for the client through which the adapter reaches MongoDB."""
+
+    max_pool_size: int = 100
+    min_pool_size: int = 0
+    max_idle_time_ms: Optional[int] = None
+    wait_queue_timeout_ms: Optional[int] = None
+
+    @staticmethod
+    def from_environment() -> MongoClientSettings:
+        defaults = MongoClientSettings()
+
+        def optional_int(name: str, default: Optional[int]) -> Optional[int]:
+            value = os.environ.get(name)
+            return int(value) if value else default
+
+        return MongoClientSettings(
+            max_pool_size=int(
+                os.environ.get("PARLANT_MONGO_MAX_POOL_SIZE", defaults.max_pool_size)
+            ),
+            min_pool_size=int(
+                os.environ.get("PARLANT_MONGO_MIN_POOL_SIZE", defaults.min_pool_size)
+            ),
+            max_idle_time_ms=optional_int(
+                "PARLANT_MONGO_MAX_IDLE_TIME_MS",
+                defaults.max_idle_time_ms,
+            ),
+            wait_queue_timeout_ms=optional_int(
+                "PARLANT_MONGO_WAIT_QUEUE_TIMEOUT_MS",
+                defaults.wait_queue_timeout_ms,
+            ),
+        )
+
+    def client_options(self) -> dict[str, Any]:
+        return {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "maxIdleTimeMS": self.max_idle_time_ms,
+            "waitQueueTimeoutMS": self.wait_queue_timeout_ms,
+        }
+
+    def create_client(self, url: str) -> AsyncMongoClient[Any]:
+        return AsyncMongoClient[Any](url, **self.client_options())
 
 
 class MongoDocumentDatabase(DocumentDatabase):
+    """A document database backed by MongoDB.
+
+    Indexes are created (if missing) whenever a collection is created or opened:
+    one for each of `indexed_fields` that the collection's schema declares, along
+    with the (possibly compound) indexes that `collection_indexes` lists for it by name.
+    """
+
     def __init__(
         self,
         mongo_client: AsyncMongoClient[Any],
         database_name: str,
         logger: Logger,
+        indexed_fields: Sequence[str] = DEFAULT_INDEXED_FIELDS,
+        collection_indexes: Mapping[str, Sequence[tuple[str, ...]]] = {},
     ):
         self.mongo_client: AsyncMongoClient[Any] = mongo_client
         self.database_name = database_name
 
         self._logger = logger
+        self._indexed_fields = indexed_fields
+        self._collection_indexes = collection_indexes
 
         self._database: Optional[AsyncDatabase[Any]] = None
         self._collections: dict[str, MongoDocumentCollection[Any]] = {}
@@ -54,15 +127,34 @@ class MongoDocumentDatabase(DocumentDatabase):
         if self._database is None:
             raise Exception("underlying database missing.")
 
-        self._collections[name] = MongoDocumentCollection(
-            self,
-            await self._database.create_collection(
-                name=name,
-                codec_options=CodecOptions(document_class=schema),
-            ),
+        mongo_collection = await self._database.create_collection(
+            name=name,
+            codec_options=CodecOptions(document_class=schema),
         )
+        await self._create_indexes(name, schema, mongo_collection)
+
+        self._collections[name] = MongoDocumentCollection(self, mongo_collection)
         return self._collections[name]
 
+    async def _create_indexes(
+        self,
+        name: str,
+        schema: type[TDocument],
+        mongo_collection: AsyncCollection[TDocument],
+    ) -> None:
+        index_keys: list[tuple[str, ...]] = [
+            (field,) for field in IndexedDocuments.fields_for_schema(schema, self._indexed_fields)
+        ]
+        index_keys.extend(k for k in self._collection_indexes.get(name, []) if k not in index_keys)
+
+        if not index_keys:
+            return
+
+        # Creating an index that already exists (with the same keys) is a no-op
+        await mongo_collection.create_indexes(
+            [IndexModel([(field, ASCENDING) for field in keys]) for keys in index_keys]
+        )
+
     async def get_collection(
         self,
         name: str,
@@ -83,37 +175,39 @@ class MongoDocumentDatabase(DocumentDatabase):
             self._logger.info(f"deleting old `{failed_migrations_collection_name}` collection")
             await self.delete_collection(failed_migrations_collection_name)
 
-        failed_migration_collection: Optional[DocumentCollection[TDocument]] = None
+        migrations: list[ReplaceOne[TDocument] | DeleteOne] = []
+        failed_documents: list[TDocument] = []
+
         for doc in await collection_existing_documents.to_list():
             try:
                 if loaded_doc := await document_loader(doc):
-                    await result_collection.replace_one(doc, loaded_doc)
+                    if loaded_doc != doc:
+                        migrations.append(ReplaceOne({"_id": doc["_id"]}, loaded_doc))
                     continue
 
-                if failed_migration_collection is None:
-                    self._logger.warning(
-                        f"creating: `{failed_migrations_collection_name}` collection to store failed migrations..."
-                    )
-                    failed_migration_collection = await self.create_collection(
-                        failed_migrations_collection_name, schema
-                    )
-
                 self._logger.warning(f'failed to load document "{doc}"')
-                await failed_migration_collection.insert_one(doc)
-                await result_collection.delete_one(doc)
+                failed_documents.append(doc)
+                migrations.append(DeleteOne({"_id": doc["_id"]}))
             except Exception as e:
-                if failed_migration_collection is None:
-                    self._logger.warning(
-                        f"creating: `{failed_migrations_collection_name}` collection to store failed migrations..."
-                    )
-                    failed_migration_collection = await self.create_collection(
-                        failed_migrations_collection_name, schema
-                    )
-
                 self._logger.error(
                     f"failed to load document '{doc}' with error: {e}. Added to `{failed_migrations_collection_name}` collection."
                 )
-                await failed_migration_collection.insert_one(doc)
+                failed_documents.append(doc)
+
+        if failed_documents:
+            self._logger.warning(
+                f"creating: `{failed_migrations_collection_name}` collection to store failed migrations..."
+            )
+            failed_migration_collection = cast(
+                MongoDocumentCollection[TDocument],
+                await self.create_collection(failed_migrations_collection_name, schema),
+            )
+            await failed_migration_collection.insert_many(failed_documents)
+
+        if migrations:
+            await result_collection.bulk_write(migrations, ordered=False)
+
+        await self._create_indexes(name, schema, result_collection)
 
         self._collections[name] = MongoDocumentCollection(self, result_collection)
         return self._collections[name]
@@ -171,29 +265,69 @@ class MongoDocumentCollection(DocumentCollection[TDocument]):
         insert_result = await self._collection.insert_one(document)
         return InsertResult(acknowledged=insert_result.acknowledged)
 
+    async def insert_many(self, documents: Sequence[TDocument]) -> InsertResult:
+        if not documents:
+            return InsertResult(acknowledged=True)
+
+        insert_result = await self._collection.insert_many(documents, ordered=False)
+        return InsertResult(acknowledged=insert_result.acknowledged)
+
+    async def update_many(self, filters: Where, params: TDocument) -> UpdateManyResult:
+        update_result = await self._collection.update_many(filters, {"$set": params})
+        return UpdateManyResult(
+            acknowledged=update_result.acknowledged,
+            matched_count=update_result.matched_count,
+            modified_count=update_result.modified_count,
+        )
+
+    async def delete_many(self, filters: Where) -> DeleteManyResult:
+        delete_result = await self._collection.delete_many(filters)
+        return DeleteManyResult(
+            acknowledged=delete_result.acknowledged,
+            deleted_count=delete_result.deleted_count,
+        )
+
+    async def bulk_write(
+        self,
+        operations: Sequence[InsertOne[TDocument] | ReplaceOne[TDocument] | UpdateOne | DeleteOne],
+    ) -> BulkWriteResult:
+        return await self._collection.bulk_write(operations, ordered=False)
+
     async def update_one(
         self,
         filters: Where,
         params: TDocument,
         upsert: bool = False,
     ) -> UpdateResult[TDocument]:
-        update_result = await self._collection.update_one(filters, {"$set": params}, upsert)
-        result_document = await self._collection.find_one(filters)
+        # Fetching the original document in the same (atomic) round-trip tells
+        # whether it was matched, without racing a concurrent writer for it
+        original_document = await self._collection.find_one_and_update(
+            filters,
+            {"$set": params},
+            upsert=upsert,
+            return_document=ReturnDocument.BEFORE,
+        )
+
+        if original_document is not None:
+            return UpdateResult[TDocument](
+                acknowledged=True,
+                matched_count=1,
+                modified_count=1,
+                updated_document=cast(TDocument, {**original_document, **params}),
+            )
+
         return UpdateResult[TDocument](
-            update_result.acknowledged,
-            update_result.matched_count,
-            update_result.modified_count,
-            result_document,
+            acknowledged=True,
+            matched_count=0,
+            modified_count=0,
+            updated_document=params if upsert else None,
         )
 
     async def delete_one(self, filters: Where) -> DeleteResult[TDocument]:
-        result_document = await self._collection.find_one(filters)
-        if result_document is None:
-            return DeleteResult(True, 0, None)
+        result_document = await self._collection.find_one_and_delete(filters)
 
-        delete_result = await self._collection.delete_one(filters)
         return DeleteResult(
-            delete_result.acknowledged,
-            deleted_count=delete_result.deleted_count,
+            acknowledged=True,
+            deleted_count=1 if result_document is not None else 0,
             deleted_document=result_document,
         )
@@ -0,0 +1,569 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import json
+from pathlib import Path
+import re
+import sqlite3
+from typing import Any, Awaitable, Callable, Optional, Sequence, TypeVar, cast
+from typing_extensions import override, Self
+
+from parlant.core.loggers import Logger
+from parlant.core.persistence.common import (
+    LogicalOperator,
+    Where,
+    WhereExpression,
+    ensure_is_total,
+)
+from parlant.core.persistence.document_database import (
+    BaseDocument,
+    DeleteManyResult,
+    DeleteResult,
+    DocumentCollection,
+    DocumentDatabase,
+    InsertResult,
+    TDocument,
+    UpdateManyResult,
+    UpdateResult,
+    identity_loader,
+)
+from parlant.core.persistence.indexed_documents import DEFAULT_INDEXED_FIELDS, IndexedDocuments
+
+
+TResult = TypeVar("TResult")
+
+_FIELD_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_COMPARISONS = {
+    "$eq": "=",
+    "$ne": "IS NOT",
+    "$gt": ">",
+    "$gte": ">=",
+    "$lt": "<",
+    "$lte": "<=",
+}
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _field_expression(field_name: str) -> str:
+    # The path is inlined rather than bound as a parameter,
+    # since SQLite only uses an expression index for an identical expression
+    if not _FIELD_NAME.match(field_name):
+        raise ValueError(f"Unsupported field name: {field_name!r}")
+
+    return f"json_extract(data, '$.{field_name}')"
+
+
+def translate_filters(where: Where) -> tuple[str, list[Any]]:
+    """Translates a filter into an SQL condition over the JSON documents
+    of a collection table, along with the parameters to bind to it."""
+
+    if not where:
+        return "1", []
+
+    clauses: list[str] = []
+    params: list[Any] = []
+
+    if next(iter(where.keys())) in ("$and", "$or"):
+        op = cast(LogicalOperator, where)
+
+        for operator in ("$and", "$or"):
+            if operator not in op:
+                continue
+
+            operands = [translate_filters(sub_filter) for sub_filter in op[operator]]  # type: ignore
+
+            if not operands:
+                clauses.append("1" if operator == "$and" else "0")
+                continue
+
+            joiner = " AND " if operator == "$and" else " OR "
+            clauses.append(joiner.join(f"({clause})" for clause, _ in operands))
+            params.extend(p for _, operand_params in operands for p in operand_params)
+    else:
+        field_filters = cast(WhereExpression, where)
+
+        for field_name, field_filter in field_filters.items():
+            expression = _field_expression(field_name)
+
+            for operator, filter_value in field_filter.items():
+                if operator in _COMPARISONS:
+                    clauses.append(f"{expression} {_COMPARISONS[operator]} ?")
+                    params.append(filter_value)
+                elif operator in ("$in", "$nin"):
+                    values = list(cast(list[Any], filter_value))
+
+                    if not values:
+                        clauses.append("0" if operator == "$in" else "1")
+                        continue
+
+                    placeholders = ", ".join("?" for _ in values)
+
+                    if operator == "$in":
+                        clauses.append(f"{expression} IN ({placeholders})")
+                    else:
+                        clauses.append(
+                            f"({expression} IS NULL OR {expression} NOT IN ({placeholders}))"
+                        )
+
+                    params.extend(values)
+                else:
+                    raise ValueError(f"Unsupported filter operator: {operator}")
+
+    if len(clauses) == 1:
+        return clauses[0], params
+
+    return " AND ".join(f"({clause})" for clause in clauses), params
+
+
+class SQLiteDocumentDatabase(DocumentDatabase):
+    """A document database stored in a single SQLite file.
+
+    Every collection is a table of JSON documents. Filters are translated into SQL over
+    JSON1 expressions, which are backed by expression indexes on the collection's indexed
+    fields. The file is opened in WAL mode, and all statements run on a dedicated worker
+    thread, so that the event loop is never blocked on disk I/O.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        file_path: Path,
+        indexed_fields: Sequence[str] = DEFAULT_INDEXED_FIELDS,
+    ) -> None:
+        self.file_path = file_path
+
+        self._logger = logger
+        self._indexed_fields = indexed_fields
+
+        # A single worker thread owns the connection, serializing all statements,
+        # so that every collection operation runs as one atomic transaction
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._connection: Optional[sqlite3.Connection] = None
+
+        self._collections: dict[str, SQLiteDocumentCollection[BaseDocument]] = {}
+
+    async def __aenter__(self) -> Self:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._connection = await self._run(self._connect)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[object],
+    ) -> bool:
+        if self._connection is not None:
+            await self._run(self._connection.close)
+            self._connection = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        return False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.file_path, check_same_thread=False)
+
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+
+        return connection
+
+    async def _run(self, func: Callable[..., TResult], *args: Any) -> TResult:
+        if self._executor is None:
+            raise Exception("Database must be entered before being used")
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            partial(func, *args),
+        )
+
+    async def execute(
+        self,
+        func: Callable[[sqlite3.Connection], TResult],
+    ) -> TResult:
+        """Runs the given function within a single transaction on the worker thread."""
+
+        def transaction() -> TResult:
+            assert self._connection is not None
+
+            with self._connection:
+                return func(self._connection)
+
+        return await self._run(transaction)
+
+    def _table_exists(self, connection: sqlite3.Connection, name: str) -> bool:
+        return (
+            connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (name,),
+            ).fetchone()
+            is not None
+        )
+
+    def _create_table(
+        self,
+        connection: sqlite3.Connection,
+        name: str,
+        schema: type[BaseDocument],
+    ) -> None:
+        table = _quote_identifier(name)
+
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (rowid INTEGER PRIMARY KEY, data TEXT NOT NULL)"
+        )
+
+        for field_name in IndexedDocuments.fields_for_schema(schema, self._indexed_fields):
+            index = _quote_identifier(f"{name}__{field_name}")
+
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({_field_expression(field_name)})"
+            )
+
+    async def load_documents_with_loader(
+        self,
+        name: str,
+        document_loader: Callable[[BaseDocument], Awaitable[Optional[TDocument]]],
+    ) -> None:
+        table = _quote_identifier(name)
+
+        rows = await self.execute(
+            lambda connection: connection.execute(
+                f"SELECT rowid, data FROM {table} ORDER BY rowid"
+            ).fetchall()
+        )
+
+        updates: list[tuple[str, int]] = []
+        failed_migrations: list[tuple[int, BaseDocument]] = []
+
+        for rowid, data in rows:
+            doc = cast(BaseDocument, json.loads(data))
+
+            try:
+                if loaded_doc := await document_loader(doc):
+                    if loaded_doc != doc:
+                        updates.append((json.dumps(loaded_doc, ensure_ascii=False), rowid))
+                else:
+                    self._logger.warning(f'Failed to load document "{doc}"')
+                    failed_migrations.append((rowid, doc))
+            except Exception as e:
+                self._logger.error(
+                    f"Failed to load document '{doc}' with error: {e}. Added to failed migrations collection."
+                )
+                failed_migrations.append((rowid, doc))
+
+        if updates or failed_migrations:
+
+            def apply(connection: sqlite3.Connection) -> None:
+                connection.executemany(f"UPDATE {table} SET data = ? WHERE rowid = ?", updates)
+                connection.executemany(
+                    f"DELETE FROM {table} WHERE rowid = ?",
+                    [(rowid,) for rowid, _ in failed_migrations],
+                )
+
+            await self.execute(apply)
+
+        if failed_migrations:
+            failed_migrations_collection = await self.get_or_create_collection(
+                "failed_migrations", BaseDocument, identity_loader
+            )
+
+            for _, doc in failed_migrations:
+                await failed_migrations_collection.insert_one(doc)
+
+    @override
+    async def create_collection(
+        self,
+        name: str,
+        schema: type[TDocument],
+    ) -> SQLiteDocumentCollection[TDocument]:
+        await self.execute(lambda connection: self._create_table(connection, name, schema))
+
+        self._collections[name] = SQLiteDocumentCollection(
+            database=self,
+            name=name,
+            schema=schema,
+        )
+
+        return cast(SQLiteDocumentCollection[TDocument], self._collections[name])
+
+    @override
+    async def get_collection(
+        self,
+        name: str,
+        schema: type[TDocument],
+        document_loader: Callable[[BaseDocument], Awaitable[Optional[TDocument]]],
+    ) -> SQLiteDocumentCollection[TDocument]:
+        if collection := self._collections.get(name):
+            return cast(SQLiteDocumentCollection[TDocument], collection)
+
+        elif await self.execute(lambda connection: self._table_exists(connection, name)):
+            return await self._load_collection(name, schema, document_loader)
+
+        raise ValueError(f'Collection "{name}" does not exists')
+
+    @override
+    async def get_or_create_collection(
+        self,
+        name: str,
+        schema: type[TDocument],
+        document_loader: Callable[[BaseDocument], Awaitable[Optional[TDocument]]],
+    ) -> SQLiteDocumentCollection[TDocument]:
+        if collection := self._collections.get(name):
+            return cast(SQLiteDocumentCollection[TDocument], collection)
+
+        elif await self.execute(lambda connection: self._table_exists(connection, name)):
+            return await self._load_collection(name, schema, document_loader)
+
+        return await self.create_collection(name, schema)
+
+    async def _load_collection(
+        self,
+        name: str,
+        schema: type[TDocument],
+        document_loader: Callable[[BaseDocument], Awaitable[Optional[TDocument]]],
+    ) -> SQLiteDocumentCollection[TDocument]:
+        # Indexes on newly indexed fields are added to existing tables as well
+        await self.execute(lambda connection: self._create_table(connection, name, schema))
+        await self.load_documents_with_loader(name, document_loader)
+
+        self._collections[name] = SQLiteDocumentCollection(
+            database=self,
+            name=name,
+            schema=schema,
+        )
+
+        return cast(SQLiteDocumentCollection[TDocument], self._collections[name])
+
+    @override
+    async def delete_collection(
+        self,
+        name: str,
+    ) -> None:
+        def drop(connection: sqlite3.Connection) -> bool:
+            if not self._table_exists(connection, name):
+                return False
+
+            connection.execute(f"DROP TABLE {_quote_identifier(name)}")
+            return True
+
+        if await self.execute(drop):
+            self._collections.pop(name, None)
+            return
+
+        raise ValueError(f'Collection "{name}" does not exists')
+
+
+class SQLiteDocumentCollection(DocumentCollection[TDocument]):
+    def __init__(
+        self,
+        database: SQLiteDocumentDatabase,
+        name: str,
+        schema: type[TDocument],
+    ) -> None:
+        self._database = database
+        self._name = name
+        self._schema = schema
+
+        self._table = _quote_identifier(name)
+
+    def _select(
+        self,
+        connection: sqlite3.Connection,
+        filters: Where,
+        limit: Optional[int] = None,
+    ) -> list[tuple[int, TDocument]]:
+        condition, params = translate_filters(filters)
+
+        query = f"SELECT rowid, data FROM {self._table} WHERE {condition} ORDER BY rowid"
+
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+
+        return [
+            (rowid, cast(TDocument, json.loads(data)))
+            for rowid, data in connection.execute(query, params)
+        ]
+
+    def _insert(self, connection: sqlite3.Connection, document: TDocument) -> None:
+        connection.execute(
+            f"INSERT INTO {self._table} (data) VALUES (?)",
+            (json.dumps(document, ensure_ascii=False),),
+        )
+
+    @override
+    async def find(
+        self,
+        filters: Where,
+    ) -> Sequence[TDocument]:
+        rows = await self._database.execute(lambda connection: self._select(connection, filters))
+        return [document for _, document in rows]
+
+    @override
+    async def find_one(
+        self,
+        filters: Where,
+    ) -> Optional[TDocument]:
+        rows = await self._database.execute(
+            lambda connection: self._select(connection, filters, limit=1)
+        )
+        return rows[0][1] if rows else None
+
+    @override
+    async def insert_one(
+        self,
+        document: TDocument,
+    ) -> InsertResult:
+        ensure_is_total(document, self._schema)
+
+        await self._database.execute(lambda connection: self._insert(connection, document))
+
+        return InsertResult(acknowledged=True)
+
+    @override
+    async def update_one(
+        self,
+        filters: Where,
+        params: TDocument,
+        upsert: bool = False,
+    ) -> UpdateResult[TDocument]:
+        def update(connection: sqlite3.Connection) -> UpdateResult[TDocument]:
+            if rows := self._select(connection, filters, limit=1):
+                rowid, document = rows[0]
+                updated_document = cast(TDocument, {**document, **params})
+
+                connection.execute(
+                    f"UPDATE {self._table} SET data = ? WHERE rowid = ?",
+                    (json.dumps(updated_document, ensure_ascii=False), rowid),
+                )
+
+                return UpdateResult(
+                    acknowledged=True,
+                    matched_count=1,
+                    modified_count=1,
+                    updated_document=updated_document,
+                )
+
+            if upsert:
+                self._insert(connection, params)
+
+                return UpdateResult(
+                    acknowledged=True,
+                    matched_count=0,
+                    modified_count=0,
+                    updated_document=params,
+                )
+
+            return UpdateResult(
+                acknowledged=True,
+                matched_count=0,
+                modified_count=0,
+                updated_document=None,
+            )
+
+        if upsert:
+            ensure_is_total(params, self._schema)
+
+        return await self._database.execute(update)
+
+    @override
+    async def delete_one(
+        self,
+        filters: Where,
+    ) -> DeleteResult[TDocument]:
+        def delete(connection: sqlite3.Connection) -> DeleteResult[TDocument]:
+            if rows := self._select(connection, filters, limit=1):
+                rowid, document = rows[0]
+
+                connection.execute(f"DELETE FROM {self._table} WHERE rowid = ?", (rowid,))
+
+                return DeleteResult(deleted_count=1, acknowledged=True, deleted_document=document)
+
+            return DeleteResult(
+                acknowledged=True,
+                deleted_count=0,
+                deleted_document=None,
+            )
+
+        return await self._database.execute(delete)
+
+    @override
+    async def insert_many(
+        self,
+        documents: Sequence[TDocument],
+    ) -> InsertResult:
+        for document in documents:
+            ensure_is_total(document, self._schema)
+
+        if documents:
+            await self._database.execute(
+                lambda connection: connection.executemany(
+                    f"INSERT INTO {self._table} (data) VALUES (?)",
+                    [(json.dumps(document, ensure_ascii=False),) for document in documents],
+                )
+            )
+
+        return InsertResult(acknowledged=True)
+
+    @override
+    async def update_many(
+        self,
+        filters: Where,
+        params: TDocument,
+    ) -> UpdateManyResult:
+        def update(connection: sqlite3.Connection) -> int:
+            rows = self._select(connection, filters)
+
+            connection.executemany(
+                f"UPDATE {self._table} SET data = ? WHERE rowid = ?",
+                [
+                    (json.dumps({**document, **params}, ensure_ascii=False), rowid)
+                    for rowid, document in rows
+                ],
+            )
+
+            return len(rows)
+
+        updated_count = await self._database.execute(update)
+
+        return UpdateManyResult(
+            acknowledged=True,
+            matched_count=updated_count,
+            modified_count=updated_count,
+        )
+
+    @override
+    async def delete_many(
+        self,
+        filters: Where,
+    ) -> DeleteManyResult:
+        condition, params = translate_filters(filters)
+
+        deleted_count = await self._database.execute(
+            lambda connection: connection.execute(
+                f"DELETE FROM {self._table} WHERE {condition}", params
+            ).rowcount
+        )
+
+        return DeleteManyResult(acknowledged=True, deleted_count=deleted_count)
@@ -17,16 +17,19 @@ from typing import Awaitable, Callable, Optional, Sequence, cast
 from typing_extensions import override
 from typing_extensions import get_type_hints
 
-from parlant.core.persistence.common import matches_filters, Where, ObjectId, ensure_is_total
+from parlant.core.persistence.common import Where, ObjectId, ensure_is_total
 from parlant.core.persistence.document_database import (
     BaseDocument,
+    DeleteManyResult,
     DeleteResult,
     DocumentCollection,
     DocumentDatabase,
     InsertResult,
     TDocument,
+    UpdateManyResult,
     UpdateResult,
 )
+from parlant.core.persistence.indexed_documents import IndexedDocuments
 
 
 class TransientDocumentDatabase(DocumentDatabase):
@@ -98,32 +101,24 @@ class TransientDocumentCollection(DocumentCollection[TDocument]):
     ) -> None:
         self._name = name
         self._schema = schema
-        self._documents = list(data) if data else []
+        self._documents = IndexedDocuments(
+            IndexedDocuments.fields_for_schema(schema),
+            data or [],
+        )
 
     @override
     async def find(
         self,
         filters: Where,
     ) -> Sequence[TDocument]:
-        result = []
-        for doc in filter(
-            lambda d: matches_filters(filters, d),
-            self._documents,
-        ):
-            result.append(doc)
-
-        return result
+        return self._documents.find(filters)
 
     @override
     async def find_one(
         self,
         filters: Where,
     ) -> Optional[TDocument]:
-        for doc in self._documents:
-            if matches_filters(filters, doc):
-                return doc
-
-        return None
+        return self._documents.find_one(filters)
 
     @override
     async def insert_one(
@@ -132,7 +127,7 @@ class TransientDocumentCollection(DocumentCollection[TDocument]):
     ) -> InsertResult:
         ensure_is_total(document, self._schema)
 
-        self._documents.append(document)
+        self._documents.add(document)
 
         return InsertResult(acknowledged=True)
 
@@ -143,16 +138,16 @@ class TransientDocumentCollection(DocumentCollection[TDocument]):
         params: TDocument,
         upsert: bool = False,
     ) -> UpdateResult[TDocument]:
-        for i, d in enumerate(self._documents):
-            if matches_filters(filters, d):
-                self._documents[i] = cast(TDocument, {**self._documents[i], **params})
+        if keys := self._documents.find_keys(filters, limit=1):
+            updated_document = cast(TDocument, {**self._documents.get(keys[0]), **params})
+            self._documents.replace(keys[0], updated_document)
 
-                return UpdateResult(
-                    acknowledged=True,
-                    matched_count=1,
-                    modified_count=1,
-                    updated_document=self._documents[i],
-                )
+            return UpdateResult(
+                acknowledged=True,
+                matched_count=1,
+                modified_count=1,
+                updated_document=updated_document,
+            )
 
         if upsert:
             await self.insert_one(params)
@@ -176,14 +171,55 @@ class TransientDocumentCollection(DocumentCollection[TDocument]):
         self,
         filters: Where,
     ) -> DeleteResult[TDocument]:
-        for i, d in enumerate(self._documents):
-            if matches_filters(filters, d):
-                document = self._documents.pop(i)
+        if keys := self._documents.find_keys(filters, limit=1):
+            document = self._documents.remove(keys[0])
 
-                return DeleteResult(deleted_count=1, acknowledged=True, deleted_document=document)
+            return DeleteResult(deleted_count=1, acknowledged=True, deleted_document=document)
 
         return DeleteResult(
             acknowledged=True,
             deleted_count=0,
             deleted_document=None,
         )
+
+    @override
+    async def insert_many(
+        self,
+        documents: Sequence[TDocument],
+    ) -> InsertResult:
+        for document in documents:
+            ensure_is_total(document, self._schema)
+
+        for document in documents:
+            self._documents.add(document)
+
+        return InsertResult(acknowledged=True)
+
+    @override
+    async def update_many(
+        self,
+        filters: Where,
+        params: TDocument,
+    ) -> UpdateManyResult:
+        keys = self._documents.find_keys(filters)
+
+        for key in keys:
+            self._documents.replace(key, cast(TDocument, {**self._documents.get(key), **params}))
+
+        return UpdateManyResult(
+            acknowledged=True,
+            matched_count=len(keys),
+            modified_count=len(keys),
+        )
+
+    @override
+    async def delete_many(
+        self,
+        filters: Where,
+    ) -> DeleteManyResult:
+        keys = self._documents.find_keys(filters)
+
+        for key in keys:
+            self._documents.remove(key)
+
+        return DeleteManyResult(acknowledged=True, deleted_count=len(keys))
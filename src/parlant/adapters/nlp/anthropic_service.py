@@ -19,6 +19,7 @@ from anthropic import (
     APIResponseValidationError,
     APITimeoutError,
     AsyncAnthropic,
+    DefaultAsyncHttpxClient,
     InternalServerError,
     RateLimitError,
 )  # type: ignore
@@ -27,7 +28,7 @@ from typing_extensions import override
 import jsonfinder  # type: ignore
 import os
 
-from parlant.adapters.nlp.common import normalize_json_output
+from parlant.adapters.nlp.common import HTTPClientSettings, normalize_json_output, shared_client
 from parlant.adapters.nlp.hugging_face import JinaAIEmbedder
 from parlant.core.engines.alpha.canned_response_generator import CannedResponseSelectionSchema
 from parlant.core.engines.alpha.guideline_matching.generic.disambiguation_batch import (
@@ -66,6 +67,19 @@ class AnthropicEstimatingTokenizer(EstimatingTokenizer):
         return result.input_tokens  # type: ignore[no-any-return]
 
 
+def _client() -> AsyncAnthropic:
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    settings = HTTPClientSettings.from_environment()
+
+    return shared_client(
+        ("anthropic", api_key, settings),
+        lambda: AsyncAnthropic(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(limits=settings.limits()),
+        ),
+    )
+
+
 class AnthropicAISchematicGenerator(SchematicGenerator[T]):
     supported_hints = ["temperature"]
 
@@ -77,7 +91,7 @@ class AnthropicAISchematicGenerator(SchematicGenerator[T]):
         self.model_name = model_name
         self._logger = logger
 
-        self._client = AsyncAnthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+        self._client = _client()
         self._estimating_tokenizer = AnthropicEstimatingTokenizer(self._client, model_name)
 
     @property
@@ -110,14 +124,32 @@ class AnthropicAISchematicGenerator(SchematicGenerator[T]):
         hints: Mapping[str, Any] = {},
     ) -> SchematicGenerationResult[T]:
         if isinstance(prompt, PromptBuilder):
-            prompt = prompt.build()
+            cacheable_prefix, rest = prompt.build_with_cacheable_prefix()
+        else:
+            cacheable_prefix, rest = "", prompt
+
+        content: list[dict[str, Any]] = []
+
+        # Anthropic only caches up to explicitly marked breakpoints,
+        # so the static prefix goes in its own block, marked as one
+        if cacheable_prefix:
+            content.append(
+                {
+                    "type": "text",
+                    "text": cacheable_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            )
+
+        if rest:
+            content.append({"type": "text", "text": rest})
 
         anthropic_api_arguments = {k: v for k, v in hints.items() if k in self.supported_hints}
 
         t_start = time.time()
         try:
             response = await self._client.messages.create(
-                messages=[{"role": "user", "content": prompt}],
+                messages=[{"role": "user", "content": content}],
                 model=self.model_name,
                 max_tokens=4096,
                 **anthropic_api_arguments,
@@ -154,6 +186,8 @@ class AnthropicAISchematicGenerator(SchematicGenerator[T]):
             )
             raise
 
+        cache_read_tokens = response.usage.cache_read_input_tokens or 0
+
         try:
             model_content = self.schema.model_validate(json_object)
             return SchematicGenerationResult(
@@ -163,8 +197,12 @@ class AnthropicAISchematicGenerator(SchematicGenerator[T]):
                     model=self.id,
                     duration=(t_end - t_start),
                     usage=UsageInfo(
-                        input_tokens=response.usage.input_tokens,
+                        # Anthropic counts cached input tokens separately from the rest
+                        input_tokens=response.usage.input_tokens
+                        + cache_read_tokens
+                        + (response.usage.cache_creation_input_tokens or 0),
                         output_tokens=response.usage.output_tokens,
+                        extra={"cached_input_tokens": cache_read_tokens},
                     ),
                 ),
             )
@@ -229,17 +267,23 @@ Please set ANTHROPIC_API_KEY in your environment before running Parlant.
 
     def __init__(self, logger: Logger) -> None:
         self._logger = logger
+        self._generators: dict[type, AnthropicAISchematicGenerator[Any]] = {}
+
         self._logger.info("Initialized AnthropicService")
 
     @override
     async def get_schematic_generator(self, t: type[T]) -> AnthropicAISchematicGenerator[T]:
-        if (
-            t == JourneyNodeSelectionSchema
-            or t == DisambiguationGuidelineMatchesSchema
-            or t == CannedResponseSelectionSchema
-        ):
-            return Claude_Opus_4_1[t](self._logger)  # type: ignore
-        return Claude_Sonnet_4[t](self._logger)  # type: ignore
+        if t not in self._generators:
+            if (
+                t == JourneyNodeSelectionSchema
+                or t == DisambiguationGuidelineMatchesSchema
+                or t == CannedResponseSelectionSchema
+            ):
+                self._generators[t] = Claude_Opus_4_1[t](self._logger)  # type: ignore
+            else:
+                self._generators[t] = Claude_Sonnet_4[t](self._logger)  # type: ignore
+
+        return self._generators[t]
 
     @override
     async def get_embedder(self) -> Embedder:
@@ -13,10 +13,12 @@
 # limitations under the License.
 
 from __future__ import annotations
+from functools import cache
 import time
 from openai import (
     AsyncAzureOpenAI,
     APIConnectionError,
+    DefaultAsyncHttpxClient,
     APIResponseValidationError,
     APITimeoutError,
     InternalServerError,
@@ -30,7 +32,7 @@ import os
 from pydantic import ValidationError
 import tiktoken
 
-from parlant.adapters.nlp.common import normalize_json_output
+from parlant.adapters.nlp.common import HTTPClientSettings, normalize_json_output, shared_client
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder
 from parlant.core.loggers import Logger
 from parlant.core.nlp.policies import policy, retry
@@ -56,6 +58,28 @@ class AzureEstimatingTokenizer(EstimatingTokenizer):
         return len(tokens)
 
 
+@cache
+def _tokenizer_for(model_name: str) -> AzureEstimatingTokenizer:
+    return AzureEstimatingTokenizer(model_name)
+
+
+def _azure_client(default_api_version: str) -> AsyncAzureOpenAI:
+    api_key = os.environ["AZURE_API_KEY"]
+    endpoint = os.environ["AZURE_ENDPOINT"]
+    api_version = os.environ.get("AZURE_API_VERSION", default_api_version)
+    settings = HTTPClientSettings.from_environment()
+
+    return shared_client(
+        ("azure", api_key, endpoint, api_version, settings),
+        lambda: AsyncAzureOpenAI(
+            api_key=api_key,
+            azure_endpoint=endpoint,
+            api_version=api_version,
+            http_client=DefaultAsyncHttpxClient(limits=settings.limits()),
+        ),
+    )
+
+
 class AzureSchematicGenerator(SchematicGenerator[T]):
     supported_azure_params = ["temperature", "logit_bias", "max_tokens"]
     supported_hints = supported_azure_params + ["strict"]
@@ -69,7 +93,7 @@ class AzureSchematicGenerator(SchematicGenerator[T]):
         self.model_name = model_name
         self._logger = logger
         self._client = client
-        self._tokenizer = AzureEstimatingTokenizer(model_name=self.model_name)
+        self._tokenizer = _tokenizer_for(self.model_name)
 
     @property
     def id(self) -> str:
@@ -236,11 +260,7 @@ class AzureSchematicGenerator(SchematicGenerator[T]):
 
 class CustomAzureSchematicGenerator(AzureSchematicGenerator[T]):
     def __init__(self, logger: Logger) -> None:
-        _client = AsyncAzureOpenAI(
-            api_key=os.environ["AZURE_API_KEY"],
-            azure_endpoint=os.environ["AZURE_ENDPOINT"],
-            api_version=os.environ.get("AZURE_API_VERSION", "2024-08-01-preview"),
-        )
+        _client = _azure_client(default_api_version="2024-08-01-preview")
 
         super().__init__(
             model_name=os.environ["AZURE_GENERATIVE_MODEL_NAME"],
@@ -255,11 +275,7 @@ class CustomAzureSchematicGenerator(AzureSchematicGenerator[T]):
 
 class GPT_4o(AzureSchematicGenerator[T]):
     def __init__(self, logger: Logger) -> None:
-        _client = AsyncAzureOpenAI(
-            api_key=os.environ["AZURE_API_KEY"],
-            azure_endpoint=os.environ["AZURE_ENDPOINT"],
-            api_version=os.environ.get("AZURE_API_VERSION", "2024-08-01-preview"),
-        )
+        _client = _azure_client(default_api_version="2024-08-01-preview")
         super().__init__(model_name="gpt-4o", logger=logger, client=_client)
 
     @property
@@ -269,13 +285,9 @@ class GPT_4o(AzureSchematicGenerator[T]):
 
 class GPT_4o_Mini(AzureSchematicGenerator[T]):
     def __init__(self, logger: Logger) -> None:
-        _client = AsyncAzureOpenAI(
-            api_key=os.environ["AZURE_API_KEY"],
-            azure_endpoint=os.environ["AZURE_ENDPOINT"],
-            api_version=os.environ.get("AZURE_API_VERSION", "2024-08-01-preview"),
-        )
+        _client = _azure_client(default_api_version="2024-08-01-preview")
         super().__init__(model_name="gpt-4o-mini", logger=logger, client=_client)
-        self._token_estimator = AzureEstimatingTokenizer(model_name=self.model_name)
+        self._token_estimator = _tokenizer_for(self.model_name)
 
     @property
     def max_tokens(self) -> int:
@@ -290,7 +302,7 @@ class AzureEmbedder(Embedder):
 
         self._logger = logger
         self._client = client
-        self._tokenizer = AzureEstimatingTokenizer(model_name=self.model_name)
+        self._tokenizer = _tokenizer_for(self.model_name)
 
     @property
     @override
@@ -335,11 +347,7 @@ class AzureEmbedder(Embedder):
 
 class CustomAzureEmbedder(AzureEmbedder):
     def __init__(self, logger: Logger) -> None:
-        _client = AsyncAzureOpenAI(
-            api_key=os.environ["AZURE_API_KEY"],
-            azure_endpoint=os.environ["AZURE_ENDPOINT"],
-            api_version=os.environ.get("AZURE_API_VERSION", "2023-05-15"),
-        )
+        _client = _azure_client(default_api_version="2023-05-15")
         super().__init__(
             model_name=os.environ["AZURE_EMBEDDING_MODEL_NAME"], logger=logger, client=_client
         )
@@ -356,11 +364,7 @@ class CustomAzureEmbedder(AzureEmbedder):
 
 class AzureTextEmbedding3Large(AzureEmbedder):
     def __init__(self, logger: Logger) -> None:
-        _client = AsyncAzureOpenAI(
-            api_key=os.environ["AZURE_API_KEY"],
-            azure_endpoint=os.environ["AZURE_ENDPOINT"],
-            api_version=os.environ.get("AZURE_API_VERSION", "2023-05-15"),
-        )
+        _client = _azure_client(default_api_version="2023-05-15")
         super().__init__(model_name="text-embedding-3-large", logger=logger, client=_client)
 
     @property
@@ -375,11 +379,7 @@ class AzureTextEmbedding3Large(AzureEmbedder):
 
 class AzureTextEmbedding3Small(AzureEmbedder):
     def __init__(self, logger: Logger) -> None:
-        _client = AsyncAzureOpenAI(
-            api_key=os.environ["AZURE_API_KEY"],
-            azure_endpoint=os.environ["AZURE_ENDPOINT"],
-            api_version=os.environ.get("AZURE_API_VERSION", "2023-05-15"),
-        )
+        _client = _azure_client(default_api_version="2023-05-15")
         super().__init__(model_name="text-embedding-3-small", logger=logger, client=_client)
 
     @property
@@ -420,11 +420,16 @@ You can also set any specific models you'd like to use, using a few more variabl
         logger: Logger,
     ) -> None:
         self._logger = logger
+        self._generators: dict[type, AzureSchematicGenerator[Any]] = {}
 
     async def get_schematic_generator(self, t: type[T]) -> AzureSchematicGenerator[T]:
-        if os.environ.get("AZURE_GENERATIVE_MODEL_NAME"):
-            return CustomAzureSchematicGenerator[t](logger=self._logger)  # type: ignore
-        return GPT_4o[t](self._logger)  # type: ignore
+        if t not in self._generators:
+            if os.environ.get("AZURE_GENERATIVE_MODEL_NAME"):
+                self._generators[t] = CustomAzureSchematicGenerator[t](logger=self._logger)  # type: ignore
+            else:
+                self._generators[t] = GPT_4o[t](self._logger)  # type: ignore
+
+        return self._generators[t]
 
     async def get_embedder(self) -> Embedder:
         if os.environ.get("AZURE_EMBEDDING_MODEL_NAME"):
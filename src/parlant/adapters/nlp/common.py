@@ -12,6 +12,74 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+import asyncio
+from dataclasses import dataclass
+import os
+from typing import Callable, Hashable, TypeVar
+from weakref import WeakKeyDictionary
+import httpx
+
+TClient = TypeVar("TClient")
+
+
+@dataclass(frozen=True)
+class HTTPClientSettings:
+    """Connection pooling settings for the HTTP clients through which adapters reach their providers."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+
+    @staticmethod
+    def from_environment() -> HTTPClientSettings:
+        defaults = HTTPClientSettings()
+
+        return HTTPClientSettings(
+            max_connections=int(
+                os.environ.get("PARLANT_NLP_MAX_CONNECTIONS", defaults.max_connections)
+            ),
+            max_keepalive_connections=int(
+                os.environ.get(
+                    "PARLANT_NLP_MAX_KEEPALIVE_CONNECTIONS",
+                    defaults.max_keepalive_connections,
+                )
+            ),
+            keepalive_expiry=float(
+                os.environ.get("PARLANT_NLP_KEEPALIVE_EXPIRY", defaults.keepalive_expiry)
+            ),
+        )
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+_clients_by_loop: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, object]] = (
+    WeakKeyDictionary()
+)
+_clients_outside_of_loops: dict[Hashable, object] = {}
+
+
+def shared_client(key: Hashable, factory: Callable[[], TClient]) -> TClient:
+    """Returns the client shared under the given key, creating it on first use.
+
+    A client's pooled connections belong to the event loop they were opened on,
+    so clients are only shared among the users of the same loop.
+    """
+    try:
+        clients = _clients_by_loop.setdefault(asyncio.get_running_loop(), {})
+    except RuntimeError:
+        clients = _clients_outside_of_loops
+
+    if key not in clients:
+        clients[key] = factory()
+
+    return clients[key]  # type: ignore
+
 
 def normalize_json_output(raw_output: str) -> str:
     json_start = raw_output.find("```json")
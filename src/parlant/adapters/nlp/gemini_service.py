@@ -22,7 +22,7 @@ from typing_extensions import override
 import jsonfinder  # type: ignore
 from pydantic import ValidationError
 
-from parlant.adapters.nlp.common import normalize_json_output
+from parlant.adapters.nlp.common import HTTPClientSettings, normalize_json_output, shared_client
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder
 from parlant.core.nlp.policies import policy, retry
 from parlant.core.nlp.tokenization import EstimatingTokenizer
@@ -71,6 +71,21 @@ class GoogleEstimatingTokenizer(EstimatingTokenizer):
         return int(result.total_tokens or 0)
 
 
+def _client() -> google.genai.Client:
+    api_key = os.environ.get("GEMINI_API_KEY")
+    settings = HTTPClientSettings.from_environment()
+
+    return shared_client(
+        ("gemini", api_key, settings),
+        lambda: google.genai.Client(
+            api_key=api_key,
+            http_options=google.genai.types.HttpOptions(
+                async_client_args={"limits": settings.limits()},
+            ),
+        ),
+    )
+
+
 class GeminiSchematicGenerator(SchematicGenerator[T]):
     supported_hints = ["temperature", "thinking_config"]
 
@@ -82,7 +97,7 @@ class GeminiSchematicGenerator(SchematicGenerator[T]):
         self.model_name = model_name
         self._logger = logger
 
-        self._client = google.genai.Client(api_key=os.environ.get("GEMINI_API_KEY"))
+        self._client = _client()
 
         self._tokenizer = GoogleEstimatingTokenizer(client=self._client, model_name=self.model_name)
 
@@ -286,7 +301,7 @@ class GoogleEmbedder(Embedder):
         self.model_name = model_name
 
         self._logger = logger
-        self._client = google.genai.Client(api_key=os.environ.get("GEMINI_API_KEY"))
+        self._client = _client()
         self._tokenizer = GoogleEstimatingTokenizer(client=self._client, model_name=self.model_name)
 
     @property
@@ -380,15 +395,20 @@ Please set GEMINI_API_KEY in your environment before running Parlant.
         logger: Logger,
     ) -> None:
         self._logger = logger
+        self._generators: dict[type, SchematicGenerator[Any]] = {}
+
         self._logger.info("Initialized GeminiService")
 
     @override
     async def get_schematic_generator(self, t: type[T]) -> GeminiSchematicGenerator[T]:
-        return FallbackSchematicGenerator[t](  # type: ignore
-            Gemini_2_5_Flash[t](self._logger),  # type: ignore
-            Gemini_2_5_Pro[t](self._logger),  # type: ignore
-            logger=self._logger,
-        )
+        if t not in self._generators:
+            self._generators[t] = FallbackSchematicGenerator[t](  # type: ignore
+                Gemini_2_5_Flash[t](self._logger),  # type: ignore
+                Gemini_2_5_Pro[t](self._logger),  # type: ignore
+                logger=self._logger,
+            )
+
+        return self._generators[t]  # type: ignore
 
     @override
     async def get_embedder(self) -> Embedder:
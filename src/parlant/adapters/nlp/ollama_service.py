@@ -14,6 +14,7 @@
 
 # Maintainer: Agam Dubey <hello.world.agam@gmail.com>
 
+from functools import cache
 import os
 import time
 from typing import Any, Callable, Mapping
@@ -25,7 +26,7 @@ import jsonfinder  # type: ignore
 from pydantic import ValidationError
 
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder
-from parlant.adapters.nlp.common import normalize_json_output
+from parlant.adapters.nlp.common import HTTPClientSettings, normalize_json_output, shared_client
 from parlant.core.nlp.policies import policy, retry
 from parlant.core.nlp.tokenization import EstimatingTokenizer
 from parlant.core.nlp.moderation import ModerationService, NoModeration
@@ -139,6 +140,20 @@ class OllamaEstimatingTokenizer(EstimatingTokenizer):
         return int(len(tokens) * 1.15)
 
 
+@cache
+def _tokenizer_for(model_name: str) -> OllamaEstimatingTokenizer:
+    return OllamaEstimatingTokenizer(model_name)
+
+
+def _client(base_url: str) -> ollama.AsyncClient:
+    settings = HTTPClientSettings.from_environment()
+
+    return shared_client(
+        ("ollama", base_url, settings),
+        lambda: ollama.AsyncClient(host=base_url, limits=settings.limits()),
+    )
+
+
 class OllamaSchematicGenerator(SchematicGenerator[T]):
     """Schematic generator that uses Ollama models."""
 
@@ -154,10 +169,10 @@ class OllamaSchematicGenerator(SchematicGenerator[T]):
         self.model_name = model_name
         self.base_url = base_url.rstrip("/")
         self._logger = logger
-        self._tokenizer = OllamaEstimatingTokenizer(model_name)
+        self._tokenizer = _tokenizer_for(model_name)
         self._default_timeout = default_timeout
 
-        self._client = ollama.AsyncClient(host=base_url)
+        self._client = _client(self.base_url)
 
     @property
     @override
@@ -422,8 +437,8 @@ class OllamaEmbedder(Embedder):
         self.model_name = model_name
         self.base_url = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434").rstrip("/")
         self._logger = logger
-        self._tokenizer = OllamaEstimatingTokenizer(self.model_name)
-        self._client = ollama.AsyncClient(host=self.base_url)
+        self._tokenizer = _tokenizer_for(self.model_name)
+        self._client = _client(self.base_url)
 
     @property
     @override
@@ -594,6 +609,8 @@ Please set these environment variables before running Parlant.
             os.environ.get("OLLAMA_API_TIMEOUT", 300)
         )  # always convert to int
         self._logger = logger
+        self._generators: dict[type, SchematicGenerator[Any]] = {}
+
         self._logger.info(f"Initialized OllamaService with {self.model_name} at {self.base_url}")
 
     def _get_specialized_generator_class(
@@ -635,6 +652,9 @@ Please set these environment variables before running Parlant.
     @override
     async def get_schematic_generator(self, t: type[T]) -> SchematicGenerator[T]:
         """Get a schematic generator for the specified type."""
+        if t in self._generators:
+            return self._generators[t]
+
         self._log_model_warnings(self.model_name)
 
         specialized_class = self._get_specialized_generator_class(self.model_name, schema_type=t)
@@ -649,6 +669,8 @@ Please set these environment variables before running Parlant.
             )
 
         generator._default_timeout = self.default_timeout
+        self._generators[t] = generator
+
         return generator
 
     @override
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 from __future__ import annotations
+from functools import cache
+import hashlib
 from itertools import chain
 import time
 from openai import (
@@ -21,10 +23,12 @@ from openai import (
     APITimeoutError,
     AsyncClient,
     ConflictError,
+    DefaultAsyncHttpxClient,
     InternalServerError,
     RateLimitError,
 )
-from typing import Any, Mapping
+from openai.types import CompletionUsage
+from typing import Any, Mapping, Optional
 from typing_extensions import override
 import json
 import jsonfinder  # type: ignore
@@ -33,7 +37,7 @@ import os
 from pydantic import ValidationError
 import tiktoken
 
-from parlant.adapters.nlp.common import normalize_json_output
+from parlant.adapters.nlp.common import HTTPClientSettings, normalize_json_output, shared_client
 from parlant.core.engines.alpha.canned_response_generator import (
     CannedResponseDraftSchema,
     CannedResponseSelectionSchema,
@@ -49,12 +53,14 @@ from parlant.core.nlp.tokenization import EstimatingTokenizer
 from parlant.core.nlp.service import NLPService
 from parlant.core.nlp.embedding import Embedder, EmbeddingResult
 from parlant.core.nlp.generation import (
+    PartialContentHandler,
     T,
     SchematicGenerator,
     SchematicGenerationResult,
 )
 from parlant.core.nlp.generation_info import GenerationInfo, UsageInfo
 from parlant.core.nlp.moderation import ModerationCheck, ModerationService, ModerationTag
+from parlant.core.nlp.partial_json import PartialJSONParser
 
 
 RATE_LIMIT_ERROR_MESSAGE = (
@@ -81,6 +87,24 @@ class OpenAIEstimatingTokenizer(EstimatingTokenizer):
         return len(tokens)
 
 
+@cache
+def _tokenizer_for(model_name: str) -> OpenAIEstimatingTokenizer:
+    return OpenAIEstimatingTokenizer(model_name)
+
+
+def _client() -> AsyncClient:
+    api_key = os.environ["OPENAI_API_KEY"]
+    settings = HTTPClientSettings.from_environment()
+
+    return shared_client(
+        ("openai", api_key, settings),
+        lambda: AsyncClient(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(limits=settings.limits()),
+        ),
+    )
+
+
 class OpenAISchematicGenerator(SchematicGenerator[T]):
     supported_openai_params = ["temperature", "logit_bias", "max_tokens"]
     supported_hints = supported_openai_params + ["strict"]
@@ -94,11 +118,9 @@ class OpenAISchematicGenerator(SchematicGenerator[T]):
         self.model_name = model_name
         self._logger = logger
 
-        self._client = AsyncClient(api_key=os.environ["OPENAI_API_KEY"])
+        self._client = _client()
 
-        self._tokenizer = OpenAIEstimatingTokenizer(
-            model_name=tokenizer_model_name or self.model_name
-        )
+        self._tokenizer = _tokenizer_for(tokenizer_model_name or self.model_name)
 
     @property
     @override
@@ -136,15 +158,51 @@ class OpenAISchematicGenerator(SchematicGenerator[T]):
             ):
                 return await self._do_generate(prompt, hints)
 
+    @policy(
+        [
+            retry(
+                exceptions=(
+                    APIConnectionError,
+                    APITimeoutError,
+                    ConflictError,
+                    RateLimitError,
+                    APIResponseValidationError,
+                ),
+            ),
+            retry(InternalServerError, max_exceptions=2, wait_times=(1.0, 5.0)),
+        ]
+    )
+    @override
+    async def generate_streaming(
+        self,
+        prompt: str | PromptBuilder,
+        on_partial_content: PartialContentHandler,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        with self._logger.scope("OpenAISchematicGenerator"):
+            with self._logger.operation(
+                f"LLM Request ({self.schema.__name__}, streaming)", level=LogLevel.TRACE
+            ):
+                return await self._do_generate(prompt, hints, on_partial_content)
+
     async def _do_generate(
         self,
         prompt: str | PromptBuilder,
         hints: Mapping[str, Any] = {},
+        on_partial_content: Optional[PartialContentHandler] = None,
     ) -> SchematicGenerationResult[T]:
+        openai_api_arguments = {k: v for k, v in hints.items() if k in self.supported_openai_params}
+
         if isinstance(prompt, PromptBuilder):
+            cacheable_prefix, _ = prompt.build_with_cacheable_prefix()
             prompt = prompt.build()
 
-        openai_api_arguments = {k: v for k, v in hints.items() if k in self.supported_openai_params}
+            # OpenAI caches prompt prefixes automatically. Keying requests by their
+            # static prefix routes those sharing it to the same cache.
+            if cacheable_prefix:
+                openai_api_arguments["prompt_cache_key"] = hashlib.sha256(
+                    cacheable_prefix.encode()
+                ).hexdigest()
 
         if hints.get("strict", False):
             t_start = time.time()
@@ -190,21 +248,29 @@ class OpenAISchematicGenerator(SchematicGenerator[T]):
         else:
             try:
                 t_start = time.time()
-                response = await self._client.chat.completions.create(
-                    messages=[{"role": "developer", "content": prompt}],
-                    model=self.model_name,
-                    response_format={"type": "json_object"},
-                    **openai_api_arguments,
-                )
+
+                # Strict generations aren't streamed, as their output is only usable once parsed
+                if on_partial_content:
+                    raw_content, usage = await self._stream_completion(
+                        prompt, openai_api_arguments, on_partial_content
+                    )
+                else:
+                    response = await self._client.chat.completions.create(
+                        messages=[{"role": "developer", "content": prompt}],
+                        model=self.model_name,
+                        response_format={"type": "json_object"},
+                        **openai_api_arguments,
+                    )
+                    raw_content = response.choices[0].message.content or "{}"
+                    usage = response.usage
+
                 t_end = time.time()
             except RateLimitError:
                 self._logger.error(RATE_LIMIT_ERROR_MESSAGE)
                 raise
 
-            if response.usage:
-                self._logger.trace(response.usage.model_dump_json(indent=2))
-
-            raw_content = response.choices[0].message.content or "{}"
+            if usage:
+                self._logger.trace(usage.model_dump_json(indent=2))
 
             try:
                 json_content = json.loads(normalize_json_output(raw_content))
@@ -216,8 +282,8 @@ class OpenAISchematicGenerator(SchematicGenerator[T]):
             try:
                 content = self.schema.model_validate(json_content)
 
-                assert response.usage
-                assert response.usage.prompt_tokens_details
+                assert usage
+                assert usage.prompt_tokens_details
 
                 return SchematicGenerationResult(
                     content=content,
@@ -226,10 +292,10 @@ class OpenAISchematicGenerator(SchematicGenerator[T]):
                         model=self.id,
                         duration=(t_end - t_start),
                         usage=UsageInfo(
-                            input_tokens=response.usage.prompt_tokens,
-                            output_tokens=response.usage.completion_tokens,
+                            input_tokens=usage.prompt_tokens,
+                            output_tokens=usage.completion_tokens,
                             extra={
-                                "cached_input_tokens": response.usage.prompt_tokens_details.cached_tokens
+                                "cached_input_tokens": usage.prompt_tokens_details.cached_tokens
                                 or 0
                             },
                         ),
@@ -242,6 +308,39 @@ class OpenAISchematicGenerator(SchematicGenerator[T]):
                 )
                 raise
 
+    async def _stream_completion(
+        self,
+        prompt: str,
+        openai_api_arguments: Mapping[str, Any],
+        on_partial_content: PartialContentHandler,
+    ) -> tuple[str, Optional[CompletionUsage]]:
+        parser = PartialJSONParser()
+        raw_chunks: list[str] = []
+        usage: Optional[CompletionUsage] = None
+
+        stream = await self._client.chat.completions.create(
+            messages=[{"role": "developer", "content": prompt}],
+            model=self.model_name,
+            response_format={"type": "json_object"},
+            stream=True,
+            stream_options={"include_usage": True},
+            **openai_api_arguments,
+        )
+
+        async for chunk in stream:
+            # Usage is reported on its own, in a final chunk with no choices
+            if chunk.usage:
+                usage = chunk.usage
+
+            if chunk.choices and (text := chunk.choices[0].delta.content):
+                raw_chunks.append(text)
+                parser.feed(text)
+
+                if parser.value is not None:
+                    await on_partial_content(parser.value)
+
+        return "".join(raw_chunks) or "{}", usage
+
 
 class GPT_4o(OpenAISchematicGenerator[T]):
     def __init__(self, logger: Logger) -> None:
@@ -280,7 +379,7 @@ class GPT_4_1(OpenAISchematicGenerator[T]):
 class GPT_4o_Mini(OpenAISchematicGenerator[T]):
     def __init__(self, logger: Logger) -> None:
         super().__init__(model_name="gpt-4o-mini", logger=logger)
-        self._token_estimator = OpenAIEstimatingTokenizer(model_name=self.model_name)
+        self._token_estimator = _tokenizer_for(self.model_name)
 
     @property
     @override
@@ -295,8 +394,8 @@ class OpenAIEmbedder(Embedder):
         self.model_name = model_name
 
         self._logger = logger
-        self._client = AsyncClient(api_key=os.environ["OPENAI_API_KEY"])
-        self._tokenizer = OpenAIEstimatingTokenizer(model_name=self.model_name)
+        self._client = _client()
+        self._tokenizer = _tokenizer_for(self.model_name)
 
     @property
     @override
@@ -376,7 +475,7 @@ class OpenAIModerationService(ModerationService):
         self.model_name = model_name
         self._logger = logger
 
-        self._client = AsyncClient(api_key=os.environ["OPENAI_API_KEY"])
+        self._client = _client()
 
     @override
     async def check(self, content: str) -> ModerationCheck:
@@ -444,16 +543,21 @@ Please set OPENAI_API_KEY in your environment before running Parlant.
         logger: Logger,
     ) -> None:
         self._logger = logger
+        self._generators: dict[type, OpenAISchematicGenerator[Any]] = {}
+
         self._logger.info("Initialized OpenAIService")
 
     @override
     async def get_schematic_generator(self, t: type[T]) -> OpenAISchematicGenerator[T]:
-        return {
-            SingleToolBatchSchema: GPT_4o[SingleToolBatchSchema],
-            JourneyNodeSelectionSchema: GPT_4_1[JourneyNodeSelectionSchema],
-            CannedResponseDraftSchema: GPT_4_1[CannedResponseDraftSchema],
-            CannedResponseSelectionSchema: GPT_4_1[CannedResponseSelectionSchema],
-        }.get(t, GPT_4o_24_08_06[t])(self._logger)  # type: ignore
+        if t not in self._generators:
+            self._generators[t] = {
+                SingleToolBatchSchema: GPT_4o[SingleToolBatchSchema],
+                JourneyNodeSelectionSchema: GPT_4_1[JourneyNodeSelectionSchema],
+                CannedResponseDraftSchema: GPT_4_1[CannedResponseDraftSchema],
+                CannedResponseSelectionSchema: GPT_4_1[CannedResponseSelectionSchema],
+            }.get(t, GPT_4o_24_08_06[t])(self._logger)  # type: ignore
+
+        return self._generators[t]
 
     @override
     async def get_embedder(self) -> Embedder:
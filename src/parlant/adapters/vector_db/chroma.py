@@ -13,9 +13,12 @@
 # limitations under the License.
 
 from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import json
 from pathlib import Path
-from typing import Awaitable, Callable, Generic, Optional, Sequence, cast
+from typing import Any, Awaitable, Callable, Generic, Optional, Sequence, TypeVar, cast
 from typing_extensions import override, Self
 import chromadb
 from chromadb.api.collection_configuration import (
@@ -32,28 +35,67 @@ from parlant.core.nlp.embedding import (
     EmbedderFactory,
     EmbeddingCacheProvider,
     NoOpEmbedder,
+    QueryEmbeddingMemo,
 )
 from parlant.core.persistence.common import Where, ensure_is_total
 from parlant.core.persistence.vector_database import (
     BaseDocument,
+    DeleteManyResult,
     DeleteResult,
     InsertResult,
     SimilarDocumentResult,
+    UpdateManyResult,
     UpdateResult,
     VectorCollection,
     VectorDatabase,
     TDocument,
     identity_loader,
 )
+from parlant.core.persistence.vector_database_helper import (
+    embed_with_cache,
+    embedding_batches,
+)
+
+TResult = TypeVar("TResult")
+
+
+async def _run_in_executor(
+    executor: Optional[ThreadPoolExecutor],
+    func: Callable[..., TResult],
+    *args: Any,
+    **kwargs: Any,
+) -> TResult:
+    if executor is None:
+        raise Exception("Database must be entered before being used")
+
+    return await asyncio.get_running_loop().run_in_executor(
+        executor,
+        partial(func, *args, **kwargs),
+    )
+
+
+def _write_batches(count: int, max_batch_size: int) -> list[range]:
+    return [
+        range(start, min(start + max_batch_size, count))
+        for start in range(0, count, max_batch_size)
+    ]
 
 
 class ChromaDatabase(VectorDatabase):
+    """A vector database backed by a persistent, local ChromaDB client.
+
+    chromadb's API is synchronous, and its operations hit the disk (and the HNSW index),
+    so they all run on a bounded pool of worker threads rather than on the event loop.
+    """
+
     def __init__(
         self,
         logger: Logger,
         dir_path: Path,
         embedder_factory: EmbedderFactory,
         embedding_cache_provider: EmbeddingCacheProvider,
+        query_embedding_memo: Optional[QueryEmbeddingMemo] = None,
+        max_workers: int = 4,
     ) -> None:
         self._dir_path = dir_path
         self._logger = logger
@@ -63,9 +105,19 @@ class ChromaDatabase(VectorDatabase):
         self._collections: dict[str, ChromaCollection[BaseDocument]] = {}
 
         self._embedding_cache_provider = embedding_cache_provider
+        self._query_embedding_memo = query_embedding_memo
+
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._max_batch_size = 1
 
     async def __aenter__(self) -> Self:
-        self.chroma_client = chromadb.PersistentClient(str(self._dir_path))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="chroma",
+        )
+        self.chroma_client = await self._run(chromadb.PersistentClient, str(self._dir_path))
+        self._max_batch_size = await self._run(self.chroma_client.get_max_batch_size)
         return self
 
     async def __aexit__(
@@ -74,7 +126,12 @@ class ChromaDatabase(VectorDatabase):
         exc_value: Optional[BaseException],
         traceback: Optional[object],
     ) -> None:
-        pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., TResult], *args: Any, **kwargs: Any) -> TResult:
+        return await _run_in_executor(self._executor, func, *args, **kwargs)
 
     def format_collection_name(
         self,
@@ -83,6 +140,47 @@ class ChromaDatabase(VectorDatabase):
     ) -> str:
         return f"{name}_{embedder_type.__name__}"
 
+    async def _find_chroma_collection(self, name: str) -> Optional[chromadb.Collection]:
+        return next(
+            (
+                col
+                for col in await self._run(self.chroma_client.list_collections)
+                if col.name == name
+            ),
+            None,
+        )
+
+    async def _get_or_create_embedded_collection(
+        self,
+        name: str,
+        embedder_type: type[Embedder],
+    ) -> chromadb.Collection:
+        if collection := await self._find_chroma_collection(
+            self.format_collection_name(name, embedder_type)
+        ):
+            return collection
+
+        return await self._run(
+            self.chroma_client.create_collection,
+            name=self.format_collection_name(name, embedder_type),
+            metadata={"version": 1},
+            embedding_function=None,
+            configuration=CreateCollectionConfiguration(
+                hnsw=CreateHNSWConfiguration(space="cosine")
+            ),
+        )
+
+    async def _get_or_create_unembedded_collection(self, name: str) -> chromadb.Collection:
+        if collection := await self._find_chroma_collection(f"{name}_unembedded"):
+            return collection
+
+        return await self._run(
+            self.chroma_client.create_collection,
+            name=f"{name}_unembedded",
+            metadata={"version": 1},
+            embedding_function=None,
+        )
+
     # Loads documents from unembedded collection, migrates them if needed, and ensures embedded collection is in sync
     async def _load_collection_documents(
         self,
@@ -92,10 +190,10 @@ class ChromaDatabase(VectorDatabase):
         document_loader: Callable[[BaseDocument], Awaitable[Optional[TDocument]]],
     ) -> chromadb.Collection:
         failed_migrations: list[BaseDocument] = []
-        embedder = self._embedder_factory.create_embedder(embedder_type)
+        migrated_docs: list[TDocument] = []
+        unloadable_doc_ids: list[str] = []
 
-        unembedded_docs = unembedded_collection.get()["metadatas"]
-        indexing_required = False
+        unembedded_docs = (await self._run(unembedded_collection.get))["metadatas"]
 
         if unembedded_docs:
             for doc in unembedded_docs:
@@ -103,22 +201,34 @@ class ChromaDatabase(VectorDatabase):
                 try:
                     if loaded_doc := await document_loader(prospective_doc):
                         if loaded_doc != prospective_doc:
-                            unembedded_collection.update(
-                                ids=[prospective_doc["id"]],
-                                documents=[loaded_doc["content"]],
-                                metadatas=[cast(chromadb.Metadata, loaded_doc)],
-                                embeddings=[0],
-                            )
-                            indexing_required = True
+                            migrated_docs.append(loaded_doc)
                     else:
                         self._logger.warning(f'Failed to load document "{doc}"')
-                        unembedded_collection.delete(where={"id": prospective_doc["id"]})
+                        unloadable_doc_ids.append(prospective_doc["id"])
                         failed_migrations.append(prospective_doc)
 
                 except Exception as e:
                     self._logger.error(f"Failed to load document '{doc}'. error: {e}.")
                     failed_migrations.append(prospective_doc)
 
+            # Write all of the migration's changes in bulk, rather than one document at a time
+            for batch in _write_batches(len(migrated_docs), self._max_batch_size):
+                batch_docs = migrated_docs[batch.start : batch.stop]
+
+                await self._run(
+                    unembedded_collection.update,
+                    ids=[d["id"] for d in batch_docs],
+                    documents=[d["content"] for d in batch_docs],
+                    metadatas=[cast(chromadb.Metadata, d) for d in batch_docs],
+                    embeddings=[[0]] * len(batch_docs),
+                )
+
+            for batch in _write_batches(len(unloadable_doc_ids), self._max_batch_size):
+                await self._run(
+                    unembedded_collection.delete,
+                    ids=unloadable_doc_ids[batch.start : batch.stop],
+                )
+
             # Store failed migrations in a separate collection for debugging
             if failed_migrations:
                 failed_migrations_collection = await self.get_or_create_collection(
@@ -128,19 +238,22 @@ class ChromaDatabase(VectorDatabase):
                     identity_loader,
                 )
 
-                for failed_doc in failed_migrations:
-                    failed_migrations_collection.embedded_collection.add(
-                        ids=[failed_doc["id"]],
-                        documents=[failed_doc["content"]],
-                        metadatas=[cast(chromadb.Metadata, failed_doc)],
-                        embeddings=[0],
+                for batch in _write_batches(len(failed_migrations), self._max_batch_size):
+                    batch_failures = failed_migrations[batch.start : batch.stop]
+
+                    await self._run(
+                        failed_migrations_collection.embedded_collection.add,
+                        ids=[d["id"] for d in batch_failures],
+                        documents=[d["content"] for d in batch_failures],
+                        metadatas=[cast(chromadb.Metadata, d) for d in batch_failures],
+                        embeddings=[[0]] * len(batch_failures),
                     )
 
         if (
-            indexing_required
+            migrated_docs
             or unembedded_collection.metadata["version"] != embedded_collection.metadata["version"]
         ):
-            await self._index_collection(embedded_collection, unembedded_collection, embedder)
+            await self._index_collection(embedded_collection, unembedded_collection, embedder_type)
 
         return embedded_collection
 
@@ -149,46 +262,92 @@ class ChromaDatabase(VectorDatabase):
         self,
         collection: chromadb.Collection,
         unembedded_collection: chromadb.Collection,
-        embedder: Embedder,
+        embedder_type: type[Embedder],
     ) -> None:
-        if docs := unembedded_collection.get()["metadatas"]:
-            unembedded_docs_by_id = {doc["id"]: doc for doc in docs}
+        unembedded_docs_by_id = {
+            doc["id"]: doc
+            for doc in (await self._run(unembedded_collection.get))["metadatas"] or []
+        }
+
+        embedded_checksums_by_id = {
+            doc["id"]: doc["checksum"]
+            for doc in (await self._run(collection.get))["metadatas"] or []
+        }
 
         # Remove docs from embedded collection that no longer exist in unembedded
-        # Update embeddings for changed docs
-        if docs := collection.get()["metadatas"]:
-            for doc in docs:
-                if doc["id"] not in unembedded_docs_by_id:
-                    collection.delete(where={"id": cast(str, doc["id"])})
-                else:
-                    if doc["checksum"] != unembedded_docs_by_id[doc["id"]]["checksum"]:
-                        embeddings = list(
-                            (
-                                await embedder.embed(
-                                    [cast(str, unembedded_docs_by_id[doc["id"]]["content"])]
-                                )
-                            ).vectors
-                        )
-
-                        collection.update(
-                            ids=[str(doc["id"])],
-                            documents=[cast(str, unembedded_docs_by_id[doc["id"]]["content"])],
-                            metadatas=unembedded_docs_by_id[doc["id"]],
-                            embeddings=embeddings,
-                        )
-                    unembedded_docs_by_id.pop(doc["id"])
-
-        # Add new docs from unembedded to embedded collection
-        for doc in unembedded_docs_by_id.values():
-            collection.add(
-                ids=[str(doc["id"])],
-                documents=[cast(str, doc["content"])],
-                metadatas=[doc],
-                embeddings=list((await embedder.embed([cast(str, doc["content"])])).vectors),
+        removed_ids = [
+            str(doc_id)
+            for doc_id in embedded_checksums_by_id
+            if doc_id not in unembedded_docs_by_id
+        ]
+
+        for batch in _write_batches(len(removed_ids), self._max_batch_size):
+            await self._run(collection.delete, ids=removed_ids[batch.start : batch.stop])
+
+        # Collect the docs that are either new or changed, and (re-)embed them all in bulk
+        stale_docs = [
+            doc
+            for doc_id, doc in unembedded_docs_by_id.items()
+            if doc_id not in embedded_checksums_by_id
+            or embedded_checksums_by_id[doc_id] != doc["checksum"]
+        ]
+
+        if stale_docs:
+            self._logger.debug(
+                f'Indexing {len(stale_docs)} document(s) in Chroma collection "{collection.name}"'
+            )
+
+            embedder = self._embedder_factory.create_embedder(embedder_type)
+            contents = [cast(str, doc["content"]) for doc in stale_docs]
+
+            batches = await embedding_batches(
+                embedder,
+                contents,
+                max_batch_size=self._max_batch_size,
             )
 
+            for batch in batches:
+                batch_docs = stale_docs[batch.start : batch.stop]
+                batch_contents = contents[batch.start : batch.stop]
+
+                await self._run(
+                    collection.upsert,
+                    ids=[str(doc["id"]) for doc in batch_docs],
+                    documents=batch_contents,
+                    metadatas=batch_docs,
+                    embeddings=await embed_with_cache(
+                        embedder,
+                        embedder_type,
+                        self._embedding_cache_provider(),
+                        batch_contents,
+                    ),
+                )
+
         collection.metadata.update({"version": unembedded_collection.metadata["version"]})
 
+    def _create_chroma_collection(
+        self,
+        name: str,
+        schema: type[TDocument],
+        embedded_collection: chromadb.Collection,
+        unembedded_collection: chromadb.Collection,
+        embedder_type: type[Embedder],
+    ) -> ChromaCollection[TDocument]:
+        return ChromaCollection(
+            self._logger,
+            embedded_collection=embedded_collection,
+            unembedded_collection=unembedded_collection,
+            name=name,
+            schema=schema,
+            embedder=self._embedder_factory.create_embedder(embedder_type),
+            embedder_type=embedder_type,
+            embedding_cache_provider=self._embedding_cache_provider,
+            version=1,
+            executor=self._executor,
+            max_batch_size=self._max_batch_size,
+            query_embedding_memo=self._query_embedding_memo,
+        )
+
     @override
     async def create_collection(
         self,
@@ -199,7 +358,8 @@ class ChromaDatabase(VectorDatabase):
         if name in self._collections:
             raise ValueError(f'Collection "{name}" already exists.')
 
-        embedded_collection = self.chroma_client.create_collection(
+        embedded_collection = await self._run(
+            self.chroma_client.create_collection,
             name=self.format_collection_name(name, embedder_type),
             metadata={"version": 1},
             embedding_function=None,
@@ -208,21 +368,19 @@ class ChromaDatabase(VectorDatabase):
             ),
         )
 
-        unembedded_collection = self.chroma_client.create_collection(
+        unembedded_collection = await self._run(
+            self.chroma_client.create_collection,
             name=f"{name}_unembedded",
             metadata={"version": 1},
             embedding_function=None,
         )
 
-        self._collections[name] = ChromaCollection(
-            self._logger,
+        self._collections[name] = self._create_chroma_collection(
+            name,
+            schema,
             embedded_collection=embedded_collection,
             unembedded_collection=unembedded_collection,
-            name=name,
-            schema=schema,
-            embedder=self._embedder_factory.create_embedder(embedder_type),
-            embedding_cache_provider=self._embedding_cache_provider,
-            version=1,
+            embedder_type=embedder_type,
         )
 
         return cast(ChromaCollection[TDocument], self._collections[name])
@@ -242,38 +400,18 @@ class ChromaDatabase(VectorDatabase):
         # Check if we have a corresponding embedded collection for the embedder type.
         # Whether we find an existing embedded collection or create a new one,
         # we reindex and sync it with the unembedded collection to ensure consistency
-        elif unembedded_collection := next(
-            (
-                col
-                for col in self.chroma_client.list_collections()
-                if col.name == f"{name}_unembedded"
-            ),
-            None,
-        ):
-            embedded_collection = next(
-                (
-                    col
-                    for col in self.chroma_client.list_collections()
-                    if col.name == self.format_collection_name(name, embedder_type)
-                ),
-                None,
-            ) or self.chroma_client.create_collection(
-                name=self.format_collection_name(name, embedder_type),
-                metadata={"version": 1},
-                embedding_function=None,
-                configuration=CreateCollectionConfiguration(
-                    hnsw=CreateHNSWConfiguration(space="cosine")
-                ),
-            )
+        elif unembedded_collection := await self._find_chroma_collection(f"{name}_unembedded"):
+            embedded_collection = await self._get_or_create_embedded_collection(name, embedder_type)
 
             await self._index_collection(
                 collection=embedded_collection,
                 unembedded_collection=unembedded_collection,
-                embedder=self._embedder_factory.create_embedder(embedder_type),
+                embedder_type=embedder_type,
             )
 
-            self._collections[name] = ChromaCollection(
-                self._logger,
+            self._collections[name] = self._create_chroma_collection(
+                name,
+                schema,
                 embedded_collection=await self._load_collection_documents(
                     embedded_collection=embedded_collection,
                     unembedded_collection=unembedded_collection,
@@ -281,11 +419,7 @@ class ChromaDatabase(VectorDatabase):
                     document_loader=document_loader,
                 ),
                 unembedded_collection=unembedded_collection,
-                name=name,
-                schema=schema,
-                embedder=self._embedder_factory.create_embedder(embedder_type),
-                embedding_cache_provider=self._embedding_cache_provider,
-                version=1,
+                embedder_type=embedder_type,
             )
             return cast(ChromaCollection[TDocument], self._collections[name])
 
@@ -305,36 +439,12 @@ class ChromaDatabase(VectorDatabase):
         # Get or create unembedded collection for storing raw documents
         # Then get or create embedded collection for storing embeddings
         # Load and migrate documents from unembedded collection, then reindex embedded collection to ensure it is in sync
-        unembedded_collection = next(
-            (
-                col
-                for col in self.chroma_client.list_collections()
-                if col.name == f"{name}_unembedded"
-            ),
-            None,
-        ) or self.chroma_client.create_collection(
-            name=f"{name}_unembedded",
-            metadata={"version": 1},
-            embedding_function=None,
-        )
-
-        embedded_collection = next(
-            (
-                col
-                for col in self.chroma_client.list_collections()
-                if col.name == self.format_collection_name(name, embedder_type)
-            ),
-            None,
-        ) or self.chroma_client.create_collection(
-            name=self.format_collection_name(name, embedder_type),
-            metadata={"version": 1},
-            configuration=CreateCollectionConfiguration(
-                hnsw=CreateHNSWConfiguration(space="cosine")
-            ),
-        )
+        unembedded_collection = await self._get_or_create_unembedded_collection(name)
+        embedded_collection = await self._get_or_create_embedded_collection(name, embedder_type)
 
-        self._collections[name] = ChromaCollection(
-            self._logger,
+        self._collections[name] = self._create_chroma_collection(
+            name,
+            schema,
             embedded_collection=await self._load_collection_documents(
                 embedded_collection=embedded_collection,
                 unembedded_collection=unembedded_collection,
@@ -342,11 +452,7 @@ class ChromaDatabase(VectorDatabase):
                 document_loader=document_loader,
             ),
             unembedded_collection=unembedded_collection,
-            name=name,
-            schema=schema,
-            embedder=self._embedder_factory.create_embedder(embedder_type),
-            embedding_cache_provider=self._embedding_cache_provider,
-            version=1,
+            embedder_type=embedder_type,
         )
 
         return cast(ChromaCollection[TDocument], self._collections[name])
@@ -359,32 +465,34 @@ class ChromaDatabase(VectorDatabase):
         if name not in self._collections:
             raise ValueError(f'Collection "{name}" not found.')
 
-        self.chroma_client.delete_collection(name=name)
-        self.chroma_client.delete_collection(name=f"{name}_unembedded")
+        await self._run(self.chroma_client.delete_collection, name=name)
+        await self._run(self.chroma_client.delete_collection, name=f"{name}_unembedded")
         del self._collections[name]
 
+    async def _get_or_create_metadata_collection(self) -> chromadb.Collection:
+        if collection := await self._find_chroma_collection("metadata"):
+            return collection
+
+        return await self._run(
+            self.chroma_client.create_collection,
+            name="metadata",
+            embedding_function=None,
+        )
+
     @override
     async def upsert_metadata(
         self,
         key: str,
         value: JSONSerializable,
     ) -> None:
-        if metadata_collection := next(
-            (col for col in self.chroma_client.list_collections() if col.name == "metadata"),
-            None,
-        ):
-            pass
-        else:
-            metadata_collection = self.chroma_client.create_collection(
-                name="metadata",
-                embedding_function=None,
-            )
+        metadata_collection = await self._get_or_create_metadata_collection()
 
-        if metadatas := metadata_collection.get()["metadatas"]:
+        if metadatas := (await self._run(metadata_collection.get))["metadatas"]:
             document = cast(dict[str, JSONSerializable], metadatas[0])
             document[key] = value
 
-            metadata_collection.update(
+            await self._run(
+                metadata_collection.update,
                 ids=["__metadata__"],
                 documents=["__metadata__"],
                 metadatas=[cast(chromadb.Metadata, document)],
@@ -393,7 +501,8 @@ class ChromaDatabase(VectorDatabase):
         else:
             document = {key: value}
 
-            metadata_collection.add(
+            await self._run(
+                metadata_collection.add,
                 ids=["__metadata__"],
                 documents=["__metadata__"],
                 metadatas=[cast(chromadb.Metadata, document)],
@@ -405,15 +514,13 @@ class ChromaDatabase(VectorDatabase):
         self,
         key: str,
     ) -> None:
-        if metadata_collection := next(
-            (col for col in self.chroma_client.list_collections() if col.name == "metadata"),
-            None,
-        ):
-            if metadatas := metadata_collection.get()["metadatas"]:
+        if metadata_collection := await self._find_chroma_collection("metadata"):
+            if metadatas := (await self._run(metadata_collection.get))["metadatas"]:
                 document = cast(dict[str, JSONSerializable], metadatas[0])
                 document.pop(key)
 
-                metadata_collection.update(
+                await self._run(
+                    metadata_collection.update,
                     ids=["__metadata__"],
                     documents=["__metadata__"],
                     metadatas=[cast(chromadb.Metadata, document)],
@@ -428,11 +535,8 @@ class ChromaDatabase(VectorDatabase):
     async def read_metadata(
         self,
     ) -> dict[str, JSONSerializable]:
-        if metadata_collection := next(
-            (col for col in self.chroma_client.list_collections() if col.name == "metadata"),
-            None,
-        ):
-            if metadatas := metadata_collection.get()["metadatas"]:
+        if metadata_collection := await self._find_chroma_collection("metadata"):
+            if metadatas := (await self._run(metadata_collection.get))["metadatas"]:
                 return cast(dict[str, JSONSerializable], metadatas[0])
             else:
                 return {}
@@ -449,28 +553,68 @@ class ChromaCollection(Generic[TDocument], VectorCollection[TDocument]):
         name: str,
         schema: type[TDocument],
         embedder: Embedder,
+        embedder_type: type[Embedder],
         embedding_cache_provider: EmbeddingCacheProvider,
         version: int,
+        executor: Optional[ThreadPoolExecutor],
+        max_batch_size: int,
+        query_embedding_memo: Optional[QueryEmbeddingMemo] = None,
     ) -> None:
         self._logger = logger
         self._name = name
         self._schema = schema
         self._embedder = embedder
+        self._embedder_type = embedder_type
         self._embedding_cache_provider = embedding_cache_provider
         self._version = version
+        self._executor = executor
+        self._max_batch_size = max_batch_size
+        self._query_embedding_memo = query_embedding_memo
 
         self._lock = ReaderWriterLock()
         self._unembedded_collection = unembedded_collection
         self.embedded_collection = embedded_collection
 
+    async def _run(self, func: Callable[..., TResult], *args: Any, **kwargs: Any) -> TResult:
+        return await _run_in_executor(self._executor, func, *args, **kwargs)
+
+    async def _embed_content(self, content: str) -> list[Sequence[float]]:
+        if e := await self._embedding_cache_provider().get(
+            embedder_type=self._embedder_type,
+            texts=[content],
+        ):
+            return list(e.vectors)
+
+        embeddings = list((await self._embedder.embed([content])).vectors)
+
+        await self._embedding_cache_provider().set(
+            embedder_type=self._embedder_type,
+            texts=[content],
+            vectors=embeddings,
+        )
+
+        return embeddings
+
+    def _bump_versions(self) -> None:
+        # Runs on a worker thread, as part of the write that changed the collections
+        self._unembedded_collection.modify(
+            metadata={**self._unembedded_collection.metadata, **{"version": self._version}}
+        )
+        self.embedded_collection.modify(
+            metadata={**self.embedded_collection.metadata, **{"version": self._version}}
+        )
+
     @override
     async def find(
         self,
         filters: Where,
     ) -> Sequence[TDocument]:
         async with self._lock.reader_lock:
-            if metadatas := self.embedded_collection.get(
-                where=cast(chromadb.Where, filters) or None
+            if metadatas := (
+                await self._run(
+                    self.embedded_collection.get,
+                    where=cast(chromadb.Where, filters) or None,
+                )
             )["metadatas"]:
                 return [cast(TDocument, m) for m in metadatas]
 
@@ -482,8 +626,11 @@ class ChromaCollection(Generic[TDocument], VectorCollection[TDocument]):
         filters: Where,
     ) -> Optional[TDocument]:
         async with self._lock.reader_lock:
-            if metadatas := self.embedded_collection.get(
-                where=cast(chromadb.Where, filters) or None
+            if metadatas := (
+                await self._run(
+                    self.embedded_collection.get,
+                    where=cast(chromadb.Where, filters) or None,
+                )
             )["metadatas"]:
                 return cast(TDocument, {k: v for k, v in metadatas[0].items()})
 
@@ -496,42 +643,26 @@ class ChromaCollection(Generic[TDocument], VectorCollection[TDocument]):
     ) -> InsertResult:
         ensure_is_total(document, self._schema)
 
-        if e := await self._embedding_cache_provider().get(
-            embedder_type=type(self._embedder),
-            texts=[document["content"]],
-        ):
-            embeddings = list(e.vectors)
-        else:
-            embeddings = list((await self._embedder.embed([document["content"]])).vectors)
-            await self._embedding_cache_provider().set(
-                embedder_type=type(self._embedder),
-                texts=[document["content"]],
-                vectors=embeddings,
-            )
-
-        async with self._lock.writer_lock:
-            self._version += 1
+        embeddings = await self._embed_content(document["content"])
 
+        def insert() -> None:
             self._unembedded_collection.add(
                 ids=[document["id"]],
                 documents=[document["content"]],
                 metadatas=[cast(chromadb.Metadata, document)],
                 embeddings=[0],
             )
-
-            self._unembedded_collection.modify(
-                metadata={**self._unembedded_collection.metadata, **{"version": self._version}}
-            )
-
             self.embedded_collection.add(
                 ids=[document["id"]],
                 documents=[document["content"]],
                 metadatas=[cast(chromadb.Metadata, document)],
                 embeddings=embeddings,
             )
-            self.embedded_collection.modify(
-                metadata={**self.embedded_collection.metadata, **{"version": self._version}}
-            )
+            self._bump_versions()
+
+        async with self._lock.writer_lock:
+            self._version += 1
+            await self._run(insert)
 
         return InsertResult(acknowledged=True)
 
@@ -543,54 +674,40 @@ class ChromaCollection(Generic[TDocument], VectorCollection[TDocument]):
         upsert: bool = False,
     ) -> UpdateResult[TDocument]:
         async with self._lock.writer_lock:
-            if docs := self.embedded_collection.get(where=cast(chromadb.Where, filters) or None)[
-                "metadatas"
-            ]:
+            if docs := (
+                await self._run(
+                    self.embedded_collection.get,
+                    where=cast(chromadb.Where, filters) or None,
+                )
+            )["metadatas"]:
                 doc = docs[0]
 
                 if "content" in params:
                     content = params["content"]
-                    document = params["content"]
                 else:
                     content = str(doc["content"])
-                    document = str(doc["content"])
 
-                if e := await self._embedding_cache_provider().get(
-                    embedder_type=type(self._embedder),
-                    texts=[content],
-                ):
-                    embeddings = list(e.vectors)
-                else:
-                    embeddings = list((await self._embedder.embed([content])).vectors)
-                    await self._embedding_cache_provider().set(
-                        embedder_type=type(self._embedder),
-                        texts=[content],
-                        vectors=embeddings,
-                    )
+                embeddings = await self._embed_content(content)
 
                 updated_document = {**doc, **params}
 
-                self._version += 1
-
-                self._unembedded_collection.update(
-                    ids=[str(doc["id"])],
-                    documents=[document],
-                    metadatas=[cast(chromadb.Metadata, updated_document)],
-                    embeddings=[0],
-                )
-                self._unembedded_collection.modify(
-                    metadata={**self._unembedded_collection.metadata, **{"version": self._version}}
-                )
+                def update() -> None:
+                    self._unembedded_collection.update(
+                        ids=[str(doc["id"])],
+                        documents=[content],
+                        metadatas=[cast(chromadb.Metadata, updated_document)],
+                        embeddings=[0],
+                    )
+                    self.embedded_collection.update(
+                        ids=[str(doc["id"])],
+                        documents=[content],
+                        metadatas=[cast(chromadb.Metadata, updated_document)],
+                        embeddings=embeddings,  # type: ignore
+                    )
+                    self._bump_versions()
 
-                self.embedded_collection.update(
-                    ids=[str(doc["id"])],
-                    documents=[document],
-                    metadatas=[cast(chromadb.Metadata, updated_document)],
-                    embeddings=embeddings,  # type: ignore
-                )
-                self.embedded_collection.modify(
-                    metadata={**self.embedded_collection.metadata, **{"version": self._version}}
-                )
+                self._version += 1
+                await self._run(update)
 
                 return UpdateResult(
                     acknowledged=True,
@@ -602,40 +719,25 @@ class ChromaCollection(Generic[TDocument], VectorCollection[TDocument]):
             elif upsert:
                 ensure_is_total(params, self._schema)
 
-                if e := await self._embedding_cache_provider().get(
-                    embedder_type=type(self._embedder),
-                    texts=[params["content"]],
-                ):
-                    embeddings = list(e.vectors)
-                else:
-                    embeddings = list((await self._embedder.embed([params["content"]])).vectors)
-                    await self._embedding_cache_provider().set(
-                        embedder_type=type(self._embedder),
-                        texts=[params["content"]],
-                        vectors=embeddings,
+                embeddings = await self._embed_content(params["content"])
+
+                def insert() -> None:
+                    self._unembedded_collection.add(
+                        ids=[params["id"]],
+                        documents=[params["content"]],
+                        metadatas=[cast(chromadb.Metadata, params)],
+                        embeddings=[0],
                     )
+                    self.embedded_collection.add(
+                        ids=[params["id"]],
+                        documents=[params["content"]],
+                        metadatas=[cast(chromadb.Metadata, params)],
+                        embeddings=embeddings,
+                    )
+                    self._bump_versions()
 
                 self._version += 1
-
-                self._unembedded_collection.add(
-                    ids=[params["id"]],
-                    documents=[params["content"]],
-                    metadatas=[cast(chromadb.Metadata, params)],
-                    embeddings=[0],
-                )
-                self._unembedded_collection.modify(
-                    metadata={**self._unembedded_collection.metadata, **{"version": self._version}}
-                )
-
-                self.embedded_collection.add(
-                    ids=[params["id"]],
-                    documents=[params["content"]],
-                    metadatas=[cast(chromadb.Metadata, params)],
-                    embeddings=embeddings,
-                )
-                self.embedded_collection.modify(
-                    metadata={**self.embedded_collection.metadata, **{"version": self._version}}
-                )
+                await self._run(insert)
 
                 return UpdateResult(
                     acknowledged=True,
@@ -657,26 +759,25 @@ class ChromaCollection(Generic[TDocument], VectorCollection[TDocument]):
         filters: Where,
     ) -> DeleteResult[TDocument]:
         async with self._lock.writer_lock:
-            if docs := self.embedded_collection.get(where=cast(chromadb.Where, filters) or None)[
-                "metadatas"
-            ]:
+            if docs := (
+                await self._run(
+                    self.embedded_collection.get,
+                    where=cast(chromadb.Where, filters) or None,
+                )
+            )["metadatas"]:
                 if len(docs) > 1:
                     raise ValueError(
                         f"ChromaCollection delete_one: detected more than one document with filters '{filters}'. Aborting..."
                     )
                 deleted_document = docs[0]
 
-                self._version += 1
-
-                self._unembedded_collection.delete(where=cast(chromadb.Where, filters) or None)
-                self._unembedded_collection.modify(
-                    metadata={**self._unembedded_collection.metadata, **{"version": self._version}}
-                )
+                def delete() -> None:
+                    self._unembedded_collection.delete(where=cast(chromadb.Where, filters) or None)
+                    self.embedded_collection.delete(where=cast(chromadb.Where, filters) or None)
+                    self._bump_versions()
 
-                self.embedded_collection.delete(where=cast(chromadb.Where, filters) or None)
-                self.embedded_collection.modify(
-                    metadata={**self.embedded_collection.metadata, **{"version": self._version}}
-                )
+                self._version += 1
+                await self._run(delete)
 
                 return DeleteResult(
                     deleted_count=1,
@@ -690,6 +791,146 @@ class ChromaCollection(Generic[TDocument], VectorCollection[TDocument]):
                 deleted_document=None,
             )
 
+    @override
+    async def insert_many(
+        self,
+        documents: Sequence[TDocument],
+    ) -> InsertResult:
+        for document in documents:
+            ensure_is_total(document, self._schema)
+
+        if not documents:
+            return InsertResult(acknowledged=True)
+
+        contents = [document["content"] for document in documents]
+
+        embeddings = await embed_with_cache(
+            self._embedder,
+            self._embedder_type,
+            self._embedding_cache_provider(),
+            contents,
+        )
+
+        def insert() -> None:
+            for batch in _write_batches(len(documents), self._max_batch_size):
+                ids = [str(documents[i]["id"]) for i in batch]
+                batch_contents = [contents[i] for i in batch]
+                metadatas = [cast(chromadb.Metadata, documents[i]) for i in batch]
+
+                self._unembedded_collection.add(
+                    ids=ids,
+                    documents=batch_contents,
+                    metadatas=metadatas,
+                    embeddings=[[0]] * len(batch),  # type: ignore
+                )
+                self.embedded_collection.add(
+                    ids=ids,
+                    documents=batch_contents,
+                    metadatas=metadatas,
+                    embeddings=[embeddings[i] for i in batch],
+                )
+
+            self._bump_versions()
+
+        async with self._lock.writer_lock:
+            self._version += 1
+            await self._run(insert)
+
+        return InsertResult(acknowledged=True)
+
+    @override
+    async def update_many(
+        self,
+        filters: Where,
+        params: TDocument,
+    ) -> UpdateManyResult:
+        async with self._lock.writer_lock:
+            docs = (
+                await self._run(
+                    self.embedded_collection.get,
+                    where=cast(chromadb.Where, filters) or None,
+                )
+            )["metadatas"] or []
+
+            if not docs:
+                return UpdateManyResult(acknowledged=True, matched_count=0, modified_count=0)
+
+            updated_documents = [{**doc, **params} for doc in docs]
+
+            # All matching documents get the same content (if any), so it's embedded only
+            # once, and documents whose content doesn't change keep their embeddings
+            content = params["content"] if "content" in params else None
+            embeddings = await self._embed_content(content) if content is not None else []
+
+            def update() -> None:
+                for batch in _write_batches(len(docs), self._max_batch_size):
+                    ids = [str(docs[i]["id"]) for i in batch]
+                    metadatas = [cast(chromadb.Metadata, updated_documents[i]) for i in batch]
+
+                    if content is None:
+                        self._unembedded_collection.update(ids=ids, metadatas=metadatas)
+                        self.embedded_collection.update(ids=ids, metadatas=metadatas)
+                        continue
+
+                    self._unembedded_collection.update(
+                        ids=ids,
+                        documents=[content] * len(batch),
+                        metadatas=metadatas,
+                        embeddings=[[0]] * len(batch),  # type: ignore
+                    )
+                    self.embedded_collection.update(
+                        ids=ids,
+                        documents=[content] * len(batch),
+                        metadatas=metadatas,
+                        embeddings=embeddings * len(batch),  # type: ignore
+                    )
+
+                self._bump_versions()
+
+            self._version += 1
+            await self._run(update)
+
+            return UpdateManyResult(
+                acknowledged=True,
+                matched_count=len(docs),
+                modified_count=len(docs),
+            )
+
+    @override
+    async def delete_many(
+        self,
+        filters: Where,
+    ) -> DeleteManyResult:
+        async with self._lock.writer_lock:
+            ids = (
+                await self._run(
+                    self.embedded_collection.get,
+                    where=cast(chromadb.Where, filters) or None,
+                    include=[],
+                )
+            )["ids"]
+
+            if not ids:
+                return DeleteManyResult(acknowledged=True, deleted_count=0)
+
+            def delete() -> None:
+                for batch in _write_batches(len(ids), self._max_batch_size):
+                    self._unembedded_collection.delete(ids=ids[batch.start : batch.stop])
+                    self.embedded_collection.delete(ids=ids[batch.start : batch.stop])
+
+                self._bump_versions()
+
+            self._version += 1
+            await self._run(delete)
+
+            return DeleteManyResult(acknowledged=True, deleted_count=len(ids))
+
+    async def _embed_queries(self, queries: Sequence[str]) -> Sequence[Sequence[float]]:
+        if self._query_embedding_memo:
+            return await self._query_embedding_memo.embed(self._embedder, queries)
+
+        return (await self._embedder.embed(list(queries))).vectors
+
     @override
     async def find_similar_documents(
         self,
@@ -697,24 +938,43 @@ class ChromaCollection(Generic[TDocument], VectorCollection[TDocument]):
         query: str,
         k: int,
     ) -> Sequence[SimilarDocumentResult[TDocument]]:
+        return (await self.find_similar_documents_for_queries(filters, [query], k))[0]
+
+    @override
+    async def find_similar_documents_for_queries(
+        self,
+        filters: Where,
+        queries: Sequence[str],
+        k: int,
+    ) -> Sequence[Sequence[SimilarDocumentResult[TDocument]]]:
+        if not queries:
+            return []
+
         async with self._lock.reader_lock:
-            query_embeddings = list((await self._embedder.embed([query])).vectors)
+            query_embeddings = await self._embed_queries(queries)
 
-            docs = self.embedded_collection.query(
+            docs = await self._run(
+                self.embedded_collection.query,
                 where=cast(chromadb.Where, filters) or None,
-                query_embeddings=query_embeddings,
+                query_embeddings=list(query_embeddings),
                 n_results=k,
             )
 
             if not docs["metadatas"]:
-                return []
-
-            self._logger.trace(
-                f"Similar documents found\n{json.dumps(docs['metadatas'][0], indent=2)}"
-            )
+                return [[] for _ in queries]
 
             assert docs["distances"]
-            return [
-                SimilarDocumentResult(document=cast(TDocument, m), distance=d)
-                for m, d in zip(docs["metadatas"][0], docs["distances"][0])
-            ]
+
+            results = []
+
+            for metadatas, distances in zip(docs["metadatas"], docs["distances"]):
+                self._logger.trace(f"Similar documents found\n{json.dumps(metadatas, indent=2)}")
+
+                results.append(
+                    [
+                        SimilarDocumentResult(document=cast(TDocument, m), distance=d)
+                        for m, d in zip(metadatas, distances)
+                    ]
+                )
+
+            return results
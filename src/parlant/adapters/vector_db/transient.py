@@ -16,42 +16,9 @@
 from __future__ import annotations
 import asyncio
 import json
-from typing import Any, Awaitable, Callable, Generic, Mapping, Optional, Sequence, cast
-import numpy as np
+from typing import Awaitable, Callable, Generic, Optional, Sequence, cast
 from typing_extensions import override
 
-import logging
-
-orig_basicConfig = logging.basicConfig
-orig_getLogger = logging.getLogger
-
-
-# nano_vectordb overrides logging's basicConfig and stuff... :S
-# So we need to protect it for a minute while importing
-def _null_basicConfig(*args: Any, **kwargs: Any) -> None:
-    pass
-
-
-class _NullLogger:
-    def info(self, *args: Any, **kwargs: Any) -> None:
-        pass
-
-    def debug(self, *args: Any, **kwargs: Any) -> None:
-        pass
-
-
-def _null_getLogger(*args: Any, **kwargs: Any) -> object:
-    return _NullLogger()
-
-
-logging.basicConfig = _null_basicConfig  # type: ignore
-logging.getLogger = _null_getLogger  # type: ignore
-
-import nano_vectordb  # type: ignore
-
-logging.basicConfig = orig_basicConfig
-logging.getLogger = orig_getLogger
-# Back to business
 
 from parlant.core.common import JSONSerializable
 from parlant.core.nlp.embedding import (
@@ -59,19 +26,24 @@ from parlant.core.nlp.embedding import (
     EmbedderFactory,
     EmbeddingCache,
     EmbeddingCacheProvider,
+    QueryEmbeddingMemo,
 )
 from parlant.core.loggers import Logger
-from parlant.core.persistence.common import ensure_is_total, matches_filters, Where
+from parlant.adapters.vector_db.vector_index import VectorIndex
+from parlant.core.persistence.common import ensure_is_total, Where
 from parlant.core.persistence.vector_database import (
     BaseDocument,
+    DeleteManyResult,
     DeleteResult,
     InsertResult,
     SimilarDocumentResult,
+    UpdateManyResult,
     UpdateResult,
     VectorCollection,
     VectorDatabase,
     TDocument,
 )
+from parlant.core.persistence.vector_database_helper import embed_with_cache
 
 
 class TransientVectorDatabase(VectorDatabase):
@@ -80,12 +52,13 @@ class TransientVectorDatabase(VectorDatabase):
         logger: Logger,
         embedder_factory: EmbedderFactory,
         embedding_cache_provider: EmbeddingCacheProvider,
+        query_embedding_memo: Optional[QueryEmbeddingMemo] = None,
     ) -> None:
         self._logger = logger
         self._embedder_factory = embedder_factory
         self._embedding_cache_provider = embedding_cache_provider
+        self._query_embedding_memo = query_embedding_memo
 
-        self._databases: dict[str, nano_vectordb.NanoVectorDB] = {}
         self._collections: dict[str, TransientVectorCollection[BaseDocument]] = {}
         self._metadata: dict[str, JSONSerializable] = {}
 
@@ -99,17 +72,14 @@ class TransientVectorDatabase(VectorDatabase):
         if name in self._collections:
             raise ValueError(f'Collection "{name}" already exists.')
 
-        embedder = self._embedder_factory.create_embedder(embedder_type)
-
-        self._databases[name] = nano_vectordb.NanoVectorDB(embedder.dimensions)
-
         self._collections[name] = TransientVectorCollection(
             self._logger,
-            nano_db=self._databases[name],
             name=name,
             schema=schema,
-            embedder=embedder,
+            embedder=self._embedder_factory.create_embedder(embedder_type),
+            embedder_type=embedder_type,
             embedding_cache_provider=self._embedding_cache_provider,
+            query_embedding_memo=self._query_embedding_memo,
         )
 
         return cast(TransientVectorCollection[TDocument], self._collections[name])
@@ -139,17 +109,14 @@ class TransientVectorDatabase(VectorDatabase):
             assert schema == collection._schema
             return cast(TransientVectorCollection[TDocument], collection)
 
-        embedder = self._embedder_factory.create_embedder(embedder_type)
-
-        self._databases[name] = nano_vectordb.NanoVectorDB(embedder.dimensions)
-
         self._collections[name] = TransientVectorCollection(
             self._logger,
-            nano_db=self._databases[name],
             name=name,
             schema=schema,
             embedder=self._embedder_factory.create_embedder(embedder_type),
+            embedder_type=embedder_type,
             embedding_cache_provider=self._embedding_cache_provider,
+            query_embedding_memo=self._query_embedding_memo,
         )
 
         return cast(TransientVectorCollection[TDocument], self._collections[name])
@@ -161,7 +128,6 @@ class TransientVectorDatabase(VectorDatabase):
     ) -> None:
         if name not in self._collections:
             raise ValueError(f'Collection "{name}" not found.')
-        del self._databases[name]
         del self._collections[name]
 
     @override
@@ -190,55 +156,57 @@ class TransientVectorCollection(Generic[TDocument], VectorCollection[TDocument])
     def __init__(
         self,
         logger: Logger,
-        nano_db: nano_vectordb.NanoVectorDB,
         name: str,
         schema: type[TDocument],
         embedder: Embedder,
+        embedder_type: type[Embedder],
         embedding_cache_provider: EmbeddingCacheProvider,
+        query_embedding_memo: Optional[QueryEmbeddingMemo] = None,
     ) -> None:
         self._logger = logger
         self._name = name
         self._schema = schema
         self._embedder = embedder
+        self._embedder_type = embedder_type
         self._embedding_cache_provider = embedding_cache_provider
+        self._query_embedding_memo = query_embedding_memo
 
         self._lock = asyncio.Lock()
-        self._nano_db = nano_db
-        self._documents: list[TDocument] = []
-
-    @staticmethod
-    def _build_filter_lambda(
-        filters: Where,
-    ) -> nano_vectordb.dbs.ConditionLambda:
-        def filter_lambda(candidate: Mapping[str, Any]) -> bool:
-            return matches_filters(filters, candidate)
-
-        return filter_lambda
+        self._index = VectorIndex[TDocument](
+            embedder.dimensions,
+            VectorIndex.fields_for_schema(schema),
+        )
 
     @override
     async def find(
         self,
         filters: Where,
     ) -> Sequence[TDocument]:
-        result = []
-        for doc in filter(
-            lambda d: matches_filters(filters, d),
-            self._documents,
-        ):
-            result.append(doc)
-
-        return result
+        return self._index.find(filters)
 
     @override
     async def find_one(
         self,
         filters: Where,
     ) -> Optional[TDocument]:
-        for doc in self._documents:
-            if matches_filters(filters, doc):
-                return doc
+        return self._index.find_one(filters)
 
-        return None
+    async def _embed(self, content: str) -> Sequence[float]:
+        if e := await self._embedding_cache_provider().get(
+            embedder_type=self._embedder_type,
+            texts=[content],
+        ):
+            return e.vectors[0]
+
+        embeddings = list((await self._embedder.embed([content])).vectors)
+
+        await self._embedding_cache_provider().set(
+            embedder_type=self._embedder_type,
+            texts=[content],
+            vectors=embeddings,
+        )
+
+        return embeddings[0]
 
     @override
     async def insert_one(
@@ -247,26 +215,13 @@ class TransientVectorCollection(Generic[TDocument], VectorCollection[TDocument])
     ) -> InsertResult:
         ensure_is_total(document, self._schema)
 
-        if e := await self._embedding_cache_provider().get(
-            embedder_type=type(self._embedder),
-            texts=[document["content"]],
-        ):
-            embeddings = list(e.vectors)
-        else:
-            embeddings = list((await self._embedder.embed([document["content"]])).vectors)
-            await self._embedding_cache_provider().set(
-                embedder_type=type(self._embedder),
-                texts=[document["content"]],
-                vectors=embeddings,
-            )
-
-        vector = np.array(embeddings[0], dtype=np.float32)
-
-        data = {**document, "__id__": document["id"], "__vector__": vector}
+        vector = await self._embed(document["content"])
 
         async with self._lock:
-            self._nano_db.upsert([data])
-            self._documents.append(document)
+            if existing := self._index.find_keys({"id": {"$eq": document["id"]}}, limit=1):
+                self._index.replace(existing[0], document, vector)
+            else:
+                self._index.add(document, vector)
 
         return InsertResult(acknowledged=True)
 
@@ -277,70 +232,64 @@ class TransientVectorCollection(Generic[TDocument], VectorCollection[TDocument])
         params: TDocument,
         upsert: bool = False,
     ) -> UpdateResult[TDocument]:
-        async with self._lock:
-            for i, doc in enumerate(self._documents):
-                if matches_filters(filters, doc):
-                    if "content" in params:
-                        content = params["content"]
-                    else:
-                        content = str(doc["content"])
-
-                    if e := await self._embedding_cache_provider().get(
-                        embedder_type=type(self._embedder),
-                        texts=[content],
-                    ):
-                        embeddings = list(e.vectors)
-                    else:
-                        embeddings = list((await self._embedder.embed([content])).vectors)
-                        await self._embedding_cache_provider().set(
-                            embedder_type=type(self._embedder),
-                            texts=[content],
-                            vectors=embeddings,
-                        )
-
-                    vector = np.array(embeddings[0], dtype=np.float32)
-                    data = {**params, "__id__": doc["id"], "__vector__": vector}
-
-                    self._nano_db.upsert([data])
-                    self._documents[i] = cast(TDocument, {**self._documents[i], **params})
+        # The content is embedded before taking the lock, so that a slow embedding
+        # doesn't hold up other operations on the collection
+        while True:
+            content = self._content_to_update(filters, params)
+            vector = await self._embed(content) if content is not None else None
+
+            async with self._lock:
+                # Should the matching document have changed while embedding, start over
+                if self._content_to_update(filters, params) != content:
+                    continue
+
+                if keys := self._index.find_keys(filters, limit=1):
+                    updated_document = cast(TDocument, {**self._index.get(keys[0]), **params})
+                    self._index.replace(keys[0], updated_document, vector)
 
                     return UpdateResult(
                         acknowledged=True,
                         matched_count=1,
                         modified_count=1,
-                        updated_document=self._documents[i],
+                        updated_document=updated_document,
                     )
 
-            if upsert:
-                ensure_is_total(params, self._schema)
-                await self.insert_one(params)
+                if upsert:
+                    ensure_is_total(params, self._schema)
+                    self._index.add(params, cast(Sequence[float], vector))
+
+                    return UpdateResult(
+                        acknowledged=True,
+                        matched_count=0,
+                        modified_count=0,
+                        updated_document=params,
+                    )
 
                 return UpdateResult(
                     acknowledged=True,
                     matched_count=0,
                     modified_count=0,
-                    updated_document=params,
+                    updated_document=None,
                 )
 
-            return UpdateResult(
-                acknowledged=True,
-                matched_count=0,
-                modified_count=0,
-                updated_document=None,
-            )
+    def _content_to_update(self, filters: Where, params: TDocument) -> Optional[str]:
+        if "content" in params:
+            return params["content"]
+
+        if keys := self._index.find_keys(filters, limit=1):
+            return str(self._index.get(keys[0])["content"])
+
+        return None
 
     @override
     async def delete_one(
         self,
         filters: Where,
     ) -> DeleteResult[TDocument]:
-        for i, d in enumerate(self._documents):
-            if matches_filters(filters, d):
-                document = self._documents.pop(i)
-
-                self._nano_db.delete([d["id"]])
+        if keys := self._index.find_keys(filters, limit=1):
+            document = self._index.remove(keys[0])
 
-                return DeleteResult(deleted_count=1, acknowledged=True, deleted_document=document)
+            return DeleteResult(deleted_count=1, acknowledged=True, deleted_document=document)
 
         return DeleteResult(
             acknowledged=True,
@@ -348,45 +297,108 @@ class TransientVectorCollection(Generic[TDocument], VectorCollection[TDocument])
             deleted_document=None,
         )
 
+    @override
+    async def insert_many(
+        self,
+        documents: Sequence[TDocument],
+    ) -> InsertResult:
+        for document in documents:
+            ensure_is_total(document, self._schema)
+
+        vectors = await embed_with_cache(
+            self._embedder,
+            self._embedder_type,
+            self._embedding_cache_provider(),
+            [document["content"] for document in documents],
+        )
+
+        async with self._lock:
+            for document, vector in zip(documents, vectors):
+                if existing := self._index.find_keys({"id": {"$eq": document["id"]}}, limit=1):
+                    self._index.replace(existing[0], document, vector)
+                else:
+                    self._index.add(document, vector)
+
+        return InsertResult(acknowledged=True)
+
+    @override
+    async def update_many(
+        self,
+        filters: Where,
+        params: TDocument,
+    ) -> UpdateManyResult:
+        # All matching documents get the same content (if any), so it's embedded only once,
+        # and before taking the lock, so that a slow embedding doesn't hold up other operations
+        vector = await self._embed(params["content"]) if "content" in params else None
+
+        async with self._lock:
+            keys = self._index.find_keys(filters)
+
+            for key in keys:
+                self._index.replace(
+                    key,
+                    cast(TDocument, {**self._index.get(key), **params}),
+                    vector,
+                )
+
+        return UpdateManyResult(
+            acknowledged=True,
+            matched_count=len(keys),
+            modified_count=len(keys),
+        )
+
+    @override
+    async def delete_many(
+        self,
+        filters: Where,
+    ) -> DeleteManyResult:
+        async with self._lock:
+            keys = self._index.find_keys(filters)
+
+            for key in keys:
+                self._index.remove(key)
+
+        return DeleteManyResult(acknowledged=True, deleted_count=len(keys))
+
+    async def _embed_queries(self, queries: Sequence[str]) -> Sequence[Sequence[float]]:
+        if self._query_embedding_memo:
+            return await self._query_embedding_memo.embed(self._embedder, queries)
+
+        return (await self._embedder.embed(list(queries))).vectors
+
+    @override
     async def find_similar_documents(
         self,
         filters: Where,
         query: str,
         k: int,
     ) -> Sequence[SimilarDocumentResult[TDocument]]:
-        if not self._documents:
-            return []
+        return (await self.find_similar_documents_for_queries(filters, [query], k))[0]
 
-        query_embeddings = list((await self._embedder.embed([query])).vectors)
-        vector = np.array(query_embeddings[0], dtype=np.float32)
+    @override
+    async def find_similar_documents_for_queries(
+        self,
+        filters: Where,
+        queries: Sequence[str],
+        k: int,
+    ) -> Sequence[Sequence[SimilarDocumentResult[TDocument]]]:
+        if not len(self._index) or not queries:
+            return [[] for _ in queries]
 
-        keys_to_exclude = {"__id__", "__metrics__"}
+        query_embeddings = await self._embed_queries(queries)
 
-        docs = [
-            {key: value for key, value in d.items() if key not in keys_to_exclude}
-            for d in self._nano_db.query(
-                query=vector,
-                top_k=k,
-                filter_lambda=self._build_filter_lambda(filters),
-            )
-        ]
+        results = []
 
-        self._logger.trace(f"Similar documents found\n{json.dumps(docs, indent=2)}")
+        for query_embedding in query_embeddings:
+            similar_documents = [
+                SimilarDocumentResult(document=document, distance=distance)
+                for document, distance in self._index.query(query_embedding, k, filters)
+            ]
 
-        # FIXME: Distances here are fake (rank → normalized 0–0.8).
-        # Proper cosine distance should be computed.
-        # Currently NanoDB doesn’t return similarity scores or embeddings, so
-        # this is only a placeholder for ordering. Replace once real scores
-        # are implemented in the database client.
-        n = len(docs)
+            self._logger.trace(
+                f"Similar documents found\n{json.dumps([r.document for r in similar_documents], indent=2)}"
+            )
 
-        def distance_formula(i: int) -> float:
-            return ((i / (n - 1)) * 0.8) if n > 1 else 0.8
+            results.append(similar_documents)
 
-        return [
-            SimilarDocumentResult(
-                document=cast(TDocument, d),
-                distance=distance_formula(i),
-            )
-            for i, d in enumerate(docs)
-        ]
+        return results
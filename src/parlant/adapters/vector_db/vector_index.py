@@ -0,0 +1,166 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from typing import Any, Generic, Iterable, Iterator, Mapping, Optional, Sequence
+import numpy as np
+from typing_extensions import get_type_hints
+
+from parlant.core.persistence.common import Where
+from parlant.core.persistence.indexed_documents import IndexedDocuments
+from parlant.core.persistence.vector_database import TDocument
+
+
+_INITIAL_CAPACITY = 64
+
+
+class VectorIndex(Generic[TDocument]):
+    """An in-memory index of documents along with their embedding vectors.
+
+    Vectors are normalized and kept in one contiguous float32 matrix, so that a query
+    is scored against all of its candidates with a single matrix product, yielding
+    true cosine distances. Filters on indexed fields narrow the candidates down through
+    hash indexes before any vector is scored.
+    """
+
+    def __init__(
+        self,
+        dimensions: int,
+        indexed_fields: Iterable[str],
+    ) -> None:
+        self.dimensions = dimensions
+
+        self._documents = IndexedDocuments[TDocument](indexed_fields)
+
+        self._vectors = np.zeros((_INITIAL_CAPACITY, dimensions), dtype=np.float32)
+        self._row_keys = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._rows: dict[int, int] = {}
+
+    @staticmethod
+    def fields_for_schema(schema: type[Mapping[str, Any]]) -> list[str]:
+        return [field for field in get_type_hints(schema) if field == "id" or field.endswith("_id")]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[TDocument]:
+        return iter(self._documents)
+
+    def get(self, key: int) -> TDocument:
+        return self._documents.get(key)
+
+    def find_keys(self, filters: Where, limit: Optional[int] = None) -> list[int]:
+        return self._documents.find_keys(filters, limit)
+
+    def find(self, filters: Where) -> list[TDocument]:
+        return self._documents.find(filters)
+
+    def find_one(self, filters: Where) -> Optional[TDocument]:
+        return self._documents.find_one(filters)
+
+    def add(self, document: TDocument, vector: Sequence[float]) -> int:
+        key = self._documents.add(document)
+        row = len(self._rows)
+
+        if row == len(self._vectors):
+            self._grow()
+
+        self._vectors[row] = self._normalize(vector)
+        self._row_keys[row] = key
+        self._rows[key] = row
+
+        return key
+
+    def replace(
+        self,
+        key: int,
+        document: TDocument,
+        vector: Optional[Sequence[float]] = None,
+    ) -> None:
+        self._documents.replace(key, document)
+
+        if vector is not None:
+            self._vectors[self._rows[key]] = self._normalize(vector)
+
+    def remove(self, key: int) -> TDocument:
+        document = self._documents.remove(key)
+
+        # Move the last row into the vacated one, to keep the matrix contiguous
+        row = self._rows.pop(key)
+        last_row = len(self._rows)
+
+        if row != last_row:
+            moved_key = int(self._row_keys[last_row])
+
+            self._vectors[row] = self._vectors[last_row]
+            self._row_keys[row] = moved_key
+            self._rows[moved_key] = row
+
+        return document
+
+    def query(
+        self,
+        vector: Sequence[float],
+        k: int,
+        filters: Where = {},
+    ) -> list[tuple[TDocument, float]]:
+        """Returns the k documents closest to the vector, along with their cosine distances."""
+
+        if k <= 0 or not self._rows:
+            return []
+
+        query = self._normalize(vector)
+
+        if filters:
+            rows = np.fromiter(
+                (self._rows[key] for key in self._documents.find_keys(filters)),
+                dtype=np.int64,
+            )
+            similarities = self._vectors[rows] @ query
+        else:
+            rows = np.arange(len(self._rows))
+            similarities = self._vectors[: len(self._rows)] @ query
+
+        if len(rows) > k:
+            top = np.argpartition(-similarities, k - 1)[:k]
+            top = top[np.argsort(-similarities[top], kind="stable")]
+        else:
+            top = np.argsort(-similarities, kind="stable")
+
+        return [
+            (
+                self._documents.get(int(self._row_keys[rows[i]])),
+                float(1.0 - similarities[i]),
+            )
+            for i in top
+        ]
+
+    def _normalize(self, vector: Sequence[float]) -> np.ndarray[Any, np.dtype[np.float32]]:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+
+        # A zero vector stays as is, and is thus equally distant from everything
+        return array / norm if norm > 0 else array
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._vectors)
+
+        vectors = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        vectors[: len(self._vectors)] = self._vectors
+
+        row_keys = np.zeros(capacity, dtype=np.int64)
+        row_keys[: len(self._row_keys)] = self._row_keys
+
+        self._vectors = vectors
+        self._row_keys = row_keys
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import asyncio
+import math
 import os
 import traceback
 from typing import Awaitable, Callable, TypeAlias
@@ -50,6 +51,7 @@ from parlant.core.capabilities import CapabilityStore
 from parlant.core.context_variables import ContextVariableStore
 from parlant.core.contextual_correlator import ContextualCorrelator
 from parlant.core.agents import AgentStore
+from parlant.core.admission import ServiceOverloadedError
 from parlant.core.common import ItemNotFoundError, generate_id
 from parlant.core.customers import CustomerStore
 from parlant.core.evaluations import EvaluationStore, EvaluationListener
@@ -60,6 +62,7 @@ from parlant.core.guidelines import GuidelineStore
 from parlant.core.guideline_tool_associations import GuidelineToolAssociationStore
 from parlant.core.nlp.service import NLPService
 from parlant.core.services.tools.service_registry import ServiceRegistry
+from parlant.core.emission.streamed_messages import StreamedMessageChannel
 from parlant.core.sessions import SessionListener, SessionStore
 from parlant.core.glossary import GlossaryStore
 from parlant.core.services.indexing.behavioral_change_evaluation import (
@@ -106,6 +109,7 @@ async def create_api_app(container: Container) -> ASGIApplication:
     tag_store = container[TagStore]
     session_store = container[SessionStore]
     session_listener = container[SessionListener]
+    streamed_message_channel = container[StreamedMessageChannel]
     evaluation_store = container[EvaluationStore]
     evaluation_listener = container[EvaluationListener]
     legacy_evaluation_service = container[LegacyBehavioralChangeEvaluator]
@@ -208,6 +212,18 @@ async def create_api_app(container: Container) -> ASGIApplication:
             detail=str(exc),
         )
 
+    @api_app.exception_handler(ServiceOverloadedError)
+    async def service_overloaded_error_handler(
+        request: Request, exc: ServiceOverloadedError
+    ) -> HTTPException:
+        logger.trace(f"Service overloaded: {exc}")
+
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": str(math.ceil(exc.retry_after))},
+        )
+
     @api_app.exception_handler(Exception)
     async def server_error_handler(request: Request, exc: ItemNotFoundError) -> HTTPException:
         logger.error(str(exc))
@@ -272,6 +288,7 @@ async def create_api_app(container: Container) -> ASGIApplication:
             customer_store=customer_store,
             session_store=session_store,
             session_listener=session_listener,
+            streamed_message_channel=streamed_message_channel,
             nlp_service=nlp_service,
         ),
     )
@@ -406,14 +406,12 @@ def create_router(
         """
         await authorization_policy.authorize(request=request, operation=Operation.CREATE_JOURNEY)
 
-        guidelines = [
-            await guideline_store.create_guideline(
-                condition=condition,
-                action=None,
-                tags=[],
-            )
-            for condition in params.conditions
-        ]
+        guidelines = await guideline_store.create_guidelines(
+            [
+                {"condition": condition, "action": None, "tags": []}
+                for condition in params.conditions
+            ]
+        )
 
         journey = await journey_store.create_journey(
             title=params.title,
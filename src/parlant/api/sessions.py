@@ -12,22 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from datetime import datetime
 from enum import Enum
-from fastapi import APIRouter, HTTPException, Path, Query, Request, status
+from fastapi import APIRouter, Header, HTTPException, Path, Query, Request, status
+from fastapi.responses import StreamingResponse
 from itertools import chain
 from pydantic import Field
-from typing import Annotated, Mapping, Optional, Sequence, Set, TypeAlias, cast
+from typing import (
+    Annotated,
+    AsyncIterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    TypeAlias,
+    cast,
+)
 
 
 from parlant.api.authorization import AuthorizationPolicy, Operation
-from parlant.api.common import GuidelineIdField, ExampleJson, JSONSerializableDTO, apigen_config
+from parlant.api.common import (
+    GuidelineIdField,
+    ExampleJson,
+    JSONSerializableDTO,
+    apigen_config,
+    apigen_skip_config,
+)
 from parlant.api.glossary import TermSynonymsField, TermIdPath, TermNameField, TermDescriptionField
 from parlant.core.agents import AgentId, AgentStore
 from parlant.core.application import Application
 from parlant.core.async_utils import Timeout
 from parlant.core.common import DefaultBaseModel
 from parlant.core.customers import CustomerId, CustomerStore
+from parlant.core.emission.streamed_messages import StreamedMessage, StreamedMessageChannel
 from parlant.core.engines.types import UtteranceRationale, UtteranceRequest
 from parlant.core.loggers import Logger
 from parlant.core.nlp.generation_info import GenerationInfo
@@ -102,6 +120,7 @@ class SessionStatusDTO(Enum):
     READY = "ready"
     TYPING = "typing"
     ERROR = "error"
+    BUSY = "busy"
 
 
 ConsumptionOffsetClientField: TypeAlias = Annotated[
@@ -378,6 +397,22 @@ class EventDTO(
     deleted: bool
 
 
+streamed_message_example: ExampleJson = {
+    "correlation_id": "corr_13xyz",
+    "message": "Your order is currently",
+}
+
+
+class StreamedMessageDTO(
+    DefaultBaseModel,
+    json_schema_extra={"example": streamed_message_example},
+):
+    """The text of an agent message generated so far, while it's still being generated."""
+
+    correlation_id: EventCorrelationIdField
+    message: str
+
+
 class ConsumptionOffsetsUpdateParamsDTO(
     DefaultBaseModel,
     json_schema_extra={"example": consumption_offsets_example},
@@ -1147,6 +1182,17 @@ KindsQuery: TypeAlias = Annotated[
     ),
 ]
 
+LastEventIdHeader: TypeAlias = Annotated[
+    Optional[int],
+    Header(
+        alias="Last-Event-ID",
+        description="Offset of the last event received, sent by clients when resuming a stream",
+        examples=[41],
+    ),
+]
+
+EVENT_STREAM_HEARTBEAT_INTERVAL = 15
+
 
 def _get_jailbreak_moderation_service(logger: Logger) -> ModerationService:
     from parlant.adapters.nlp.lakera import LakeraGuard
@@ -1229,6 +1275,7 @@ def create_router(
     customer_store: CustomerStore,
     session_store: SessionStore,
     session_listener: SessionListener,
+    streamed_message_channel: StreamedMessageChannel,
     nlp_service: NLPService,
 ) -> APIRouter:
     router = APIRouter()
@@ -1496,6 +1543,9 @@ def create_router(
             status.HTTP_422_UNPROCESSABLE_ENTITY: {
                 "description": "Validation error in event parameters"
             },
+            status.HTTP_503_SERVICE_UNAVAILABLE: {
+                "description": "The server is overloaded; retry after the time given in the Retry-After header"
+            },
         },
         **apigen_config(group_name=API_GROUP, method_name="create_event"),
     )
@@ -1574,6 +1624,8 @@ def create_router(
                     return "typing"
                 case SessionStatusDTO.ERROR:
                     return "error"
+                case SessionStatusDTO.BUSY:
+                    return "busy"
 
         if params.status is None:
             raise HTTPException(
@@ -1892,6 +1944,143 @@ def create_router(
             for e in events
         ]
 
+    @router.get(
+        "/{session_id}/events/stream",
+        operation_id="stream_events",
+        response_class=StreamingResponse,
+        responses={
+            status.HTTP_200_OK: {
+                "description": "Stream of events matching the specified criteria",
+                "content": {"text/event-stream": {}},
+            },
+            status.HTTP_404_NOT_FOUND: {
+                "description": "Session not found",
+            },
+            status.HTTP_422_UNPROCESSABLE_ENTITY: {
+                "description": "Validation error in request parameters"
+            },
+        },
+        **apigen_skip_config(),
+    )
+    async def stream_events(
+        request: Request,
+        session_id: SessionIdPath,
+        min_offset: Optional[MinOffsetQuery] = None,
+        source: Optional[EventSourceDTO] = None,
+        correlation_id: Optional[CorrelationIdQuery] = None,
+        kinds: Optional[KindsQuery] = None,
+        last_event_id: LastEventIdHeader = None,
+    ) -> StreamingResponse:
+        """Streams events from a session as Server-Sent Events, as they are created.
+
+        Each event is sent as a JSON-serialized event object, whose SSE ID is its offset.
+        The stream starts with any existing events that match the criteria,
+        and stays open until the client disconnects.
+
+        Notes:
+            Resumption:
+            - Reconnecting clients send a Last-Event-ID header, which takes precedence
+              over min_offset, so the stream resumes right after the last event received
+            - A comment line is sent periodically while idle, to keep the connection alive
+
+            Message Streaming:
+            - When enabled, the text of an agent message is streamed while it's being generated,
+              on "typing" SSE events (which have no ID), each carrying a StreamedMessageDTO
+              with the text so far
+            - Streamed text is never stored, so it isn't replayed on resumption, and it's only
+              sent along with status events from the AI agent
+            - The text may be replaced as the message is revised, and empty text means that
+              the text streamed so far was retracted (e.g., when the message is regenerated)
+            - The text is superseded by the message event of the same correlation ID
+        """
+        await authorization_policy.authorize(request=request, operation=Operation.LIST_EVENTS)
+
+        # Trigger exception if not found, before the response starts streaming
+        _ = await session_store.read_session(session_id)
+
+        kind_list: Sequence[EventKind] = [
+            _event_kind_dto_to_event_kind(EventKindDTO(k))
+            for k in (kinds.split(",") if kinds else [])
+        ]
+
+        event_source = _event_source_dto_to_event_source(source) if source else None
+
+        stream_messages = (not kind_list or EventKind.STATUS in kind_list) and (
+            event_source in (None, EventSource.AI_AGENT)
+        )
+
+        async def event_stream(next_offset: int) -> AsyncIterator[str]:
+            last_streamed_message: Optional[StreamedMessage] = None
+
+            while True:
+                # Take the signal before checking, so that text streamed
+                # in between can't slip by unnoticed.
+                streamed_message_signal = streamed_message_channel.update_signal(session_id)
+
+                if (
+                    stream_messages
+                    and (streamed_message := streamed_message_channel.get(session_id))
+                    and streamed_message is not last_streamed_message
+                    and correlation_id in (None, streamed_message.correlation_id)
+                ):
+                    last_streamed_message = streamed_message
+                    streamed_message_dto = StreamedMessageDTO(
+                        correlation_id=streamed_message.correlation_id,
+                        message=streamed_message.message,
+                    )
+                    yield f"event: typing\ndata: {streamed_message_dto.model_dump_json()}\n\n"
+
+                waiting_for_events = asyncio.ensure_future(
+                    session_listener.wait_for_events(
+                        session_id=session_id,
+                        min_offset=next_offset,
+                        source=event_source,
+                        kinds=kind_list,
+                        correlation_id=correlation_id,
+                        timeout=Timeout(EVENT_STREAM_HEARTBEAT_INTERVAL),
+                    )
+                )
+                waiting_for_streamed_message = asyncio.ensure_future(streamed_message_signal.wait())
+
+                try:
+                    await asyncio.wait(
+                        [waiting_for_events, waiting_for_streamed_message],
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                finally:
+                    waiting_for_events.cancel()
+                    waiting_for_streamed_message.cancel()
+
+                if not waiting_for_events.done():
+                    continue
+
+                if not waiting_for_events.result():
+                    yield ": keep-alive\n\n"
+                    continue
+
+                events = await session_store.list_events(
+                    session_id=session_id,
+                    min_offset=next_offset,
+                    source=event_source,
+                    kinds=kind_list,
+                    correlation_id=correlation_id,
+                )
+
+                for e in events:
+                    yield f"id: {e.offset}\ndata: {event_to_dto(e).model_dump_json()}\n\n"
+                    next_offset = e.offset + 1
+
+        return StreamingResponse(
+            event_stream(
+                last_event_id + 1 if last_event_id is not None else min_offset or 0,
+            ),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+            },
+        )
+
     @router.delete(
         "/{session_id}/events",
         status_code=status.HTTP_204_NO_CONTENT,
@@ -149,11 +149,13 @@ from parlant.core.persistence.common import MigrationRequired, ServerOutdated
 from parlant.core.shots import ShotCollection
 from parlant.core.tags import TagDocumentStore, TagStore
 from parlant.api.app import create_api_app, ASGIApplication
+from parlant.core.admission import AdmissionController, AdmissionLimits
 from parlant.core.background_tasks import BackgroundTaskService
 from parlant.core.contextual_correlator import ContextualCorrelator
 from parlant.core.agents import AgentDocumentStore, AgentStore
 from parlant.core.context_variables import ContextVariableDocumentStore, ContextVariableStore
 from parlant.core.emission.event_publisher import EventPublisherFactory
+from parlant.core.emission.streamed_messages import StreamedMessageChannel
 from parlant.core.emissions import EventEmitterFactory
 from parlant.core.customers import CustomerDocumentStore, CustomerStore
 from parlant.core.evaluations import (
@@ -173,21 +175,29 @@ from parlant.core.guidelines import (
     GuidelineStore,
 )
 from parlant.adapters.db.json_file import JSONFileDocumentDatabase
+from parlant.adapters.db.mmap_embedding_cache import MemoryMappedEmbeddingCache
 from parlant.core.nlp.embedding import (
-    BasicEmbeddingCache,
     Embedder,
     EmbedderFactory,
     EmbeddingCache,
     NullEmbeddingCache,
+    QueryEmbeddingMemo,
 )
 from parlant.core.nlp.generation import SchematicGenerator
+from parlant.core.nlp.generation_memo import GenerationMemo, MemoizingSchematicGenerator
+from parlant.core.nlp.response_cache import (
+    CachingSchematicGenerator,
+    LLMResponseCache,
+    LLMResponseCacheMode,
+)
+from parlant.core.nlp.scheduling import LLMRateLimits, LLMScheduler, ScheduledSchematicGenerator
 from parlant.core.persistence.data_collection import DataCollectingSchematicGenerator
 from parlant.core.services.tools.service_registry import (
     ServiceRegistry,
     ServiceDocumentRegistry,
 )
 from parlant.core.sessions import (
-    PollingSessionListener,
+    NotifyingSessionListener,
     SessionDocumentStore,
     SessionListener,
     SessionStore,
@@ -255,6 +265,8 @@ LOGGER = FileLogger(PARLANT_HOME_DIR / "parlant.log", CORRELATOR, LogLevel.INFO)
 
 BACKGROUND_TASK_SERVICE = BackgroundTaskService(LOGGER)
 
+METRICS_LOG_INTERVAL = float(os.environ.get("PARLANT_METRICS_LOG_INTERVAL", 60))
+
 
 class StartupError(Exception):
     def __init__(self, message: str) -> None:
@@ -453,6 +465,7 @@ async def setup_container() -> AsyncIterator[Container]:
     web_socket_logger = WebSocketLogger(CORRELATOR, LogLevel.INFO)
     c[WebSocketLogger] = web_socket_logger
     c[Logger] = CompositeLogger([LOGGER, web_socket_logger])
+    c[AdmissionController] = AdmissionController(c[Logger], AdmissionLimits.from_environment())
 
     _define_singleton(c, IdGenerator, IdGenerator)
 
@@ -489,6 +502,7 @@ async def setup_container() -> AsyncIterator[Container]:
     _define_singleton_value(c, EngineHooks, EngineHooks())
 
     _define_singleton(c, EventEmitterFactory, EventPublisherFactory)
+    _define_singleton(c, StreamedMessageChannel, StreamedMessageChannel)
 
     _define_singleton(c, EntityQueries, EntityQueries)
     _define_singleton(c, EntityCommands, EntityCommands)
@@ -605,8 +619,14 @@ async def initialize_container(
 
             args.extend([db, migrate])
 
+            kwargs: dict[str, Any] = {}
+
+            if "cache_event_offsets" in params:
+                # The file is only ever written by this process
+                kwargs["cache_event_offsets"] = True
+
             c[store_implementation] = await EXIT_STACK.enter_async_context(
-                store_implementation(*args)
+                store_implementation(*args, **kwargs)
             )
             c[store_interface] = lambda _c: c[store_implementation]
 
@@ -652,12 +672,29 @@ async def initialize_container(
     )
 
     await c[BackgroundTaskService].start(c[WebSocketLogger].start(), tag="websocket-logger")
+    await c[BackgroundTaskService].start(
+        c[AdmissionController].log_metrics(METRICS_LOG_INTERVAL),
+        tag="admission-metrics",
+    )
 
-    try_define(SessionListener, PollingSessionListener)
+    try_define(SessionListener, NotifyingSessionListener)
 
     nlp_service_name: str
     nlp_service_instance: NLPService
 
+    response_cache: Optional[LLMResponseCache] = None
+
+    if response_cache_mode := os.environ.get("PARLANT_LLM_RESPONSE_CACHE"):
+        response_cache = LLMResponseCache(
+            Path(
+                os.environ.get(
+                    "PARLANT_LLM_RESPONSE_CACHE_PATH",
+                    PARLANT_HOME_DIR / "llm_response_cache",
+                )
+            ),
+            LLMResponseCacheMode(response_cache_mode.lower()),
+        )
+
     if isinstance(nlp_service_descriptor, str):
         nlp_service_name = nlp_service_descriptor
         nlp_service_instance = NLP_SERVICE_INITIALIZERS[nlp_service_name]()
@@ -706,22 +743,39 @@ async def initialize_container(
 
         try_define(NLPService, nlp_service_instance)
 
-        embedder_factory = EmbedderFactory(c)
+        try_define(
+            LLMScheduler,
+            LLMScheduler(
+                c[ContextualCorrelator],
+                default_limits=LLMRateLimits.from_environment(),
+            ),
+        )
+
+        await c[BackgroundTaskService].start(
+            c[LLMScheduler].log_metrics(c[Logger], METRICS_LOG_INTERVAL),
+            tag="llm-scheduler-metrics",
+        )
+
+        embedder_factory = EmbedderFactory(
+            c,
+            scheduler=c[LLMScheduler],
+            response_cache=response_cache,
+        )
 
         shared_chroma_db: VectorDatabase | None = None
 
         if c[OptimizationPolicy].use_embedding_cache():
-            c[EmbeddingCache] = BasicEmbeddingCache(
-                await EXIT_STACK.enter_async_context(
-                    JSONFileDocumentDatabase(
-                        c[Logger],
-                        PARLANT_HOME_DIR / "cache_embeddings.json",
-                    )
+            c[EmbeddingCache] = await EXIT_STACK.enter_async_context(
+                MemoryMappedEmbeddingCache(
+                    c[Logger],
+                    PARLANT_HOME_DIR / "cache_embeddings",
                 )
             )
         else:
             c[EmbeddingCache] = NullEmbeddingCache()
 
+        c[QueryEmbeddingMemo] = QueryEmbeddingMemo(c[ContextualCorrelator], cross_turn=True)
+
         async def get_shared_chroma_db() -> VectorDatabase:
             nonlocal shared_chroma_db
             if shared_chroma_db is None:
@@ -733,6 +787,7 @@ async def initialize_container(
                         PARLANT_HOME_DIR,
                         embedder_factory,
                         lambda: c[EmbeddingCache],
+                        query_embedding_memo=c[QueryEmbeddingMemo],
                     ),
                 )
             return cast(VectorDatabase, shared_chroma_db)
@@ -764,6 +819,19 @@ async def initialize_container(
             "Your runtime data came from a higher server version and is not supported.\nPlease upgrade to the latest version of Parlant."
         )
 
+    generation_memo = GenerationMemo(c[ContextualCorrelator])
+
+    # The schemas with which responses are generated aren't memoized,
+    # as regenerating a response is exactly what a restarted turn is for
+    response_generation_schemas = (
+        MessageSchema,
+        CannedResponseDraftSchema,
+        CannedResponseSelectionSchema,
+        CannedResponsePreambleSchema,
+        CannedResponseRevisionSchema,
+        CannedResponseFieldExtractionSchema,
+    )
+
     for schema in (
         GenericResponseAnalysisSchema,
         GenericPreviouslyAppliedActionableGuidelineMatchesSchema,
@@ -790,7 +858,22 @@ async def initialize_container(
         JourneyNodeSelectionSchema,
         RelativeActionSchema,
     ):
-        generator = await nlp_service_instance.get_schematic_generator(schema)
+        generator = ScheduledSchematicGenerator[schema](  # type: ignore
+            await nlp_service_instance.get_schematic_generator(schema),
+            c[LLMScheduler],
+        )
+
+        if schema not in response_generation_schemas:
+            generator = MemoizingSchematicGenerator[schema](  # type: ignore
+                generator,
+                generation_memo,
+            )
+
+        if response_cache:
+            generator = CachingSchematicGenerator[schema](  # type: ignore
+                generator,
+                response_cache,
+            )
 
         if os.environ.get("PARLANT_DATA_COLLECTION", "false").lower() not in ["false", "no", "0"]:
             generator = DataCollectingSchematicGenerator[schema](  # type: ignore
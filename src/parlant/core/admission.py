@@ -0,0 +1,405 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+import contextvars
+from itertools import count
+import os
+from typing import AsyncIterator, Mapping, Optional
+
+from parlant.core.agents import AgentId
+from parlant.core.common import generate_id
+from parlant.core.loggers import Logger
+from parlant.core.sessions import SessionId
+
+
+class TurnPriority(Enum):
+    INTERACTIVE = 0
+    """Turns responding to a customer"""
+
+    BACKGROUND = 1
+    """Everything else, e.g., turns triggered by events posted on the agent's side"""
+
+
+class OverloadResponse(Enum):
+    REJECT = "reject"
+    """Refuse events that would start new turns, so that clients retry them later"""
+
+    NOTIFY = "notify"
+    """Accept such events, but emit a busy status event instead of processing them"""
+
+
+@dataclass(frozen=True)
+class AdmissionLimits:
+    max_concurrent_turns: int = 64
+    max_queued_turns: int = 512
+    agent_quotas: Mapping[AgentId, int] = field(default_factory=dict)
+    """The maximum number of concurrent turns for specific agents"""
+    overload_response: OverloadResponse = OverloadResponse.REJECT
+    retry_after: float = 5.0
+    """The number of seconds after which shed turns are suggested to be retried"""
+
+    @staticmethod
+    def from_environment() -> AdmissionLimits:
+        defaults = AdmissionLimits()
+
+        return AdmissionLimits(
+            max_concurrent_turns=int(
+                os.environ.get("PARLANT_MAX_CONCURRENT_TURNS", defaults.max_concurrent_turns)
+            ),
+            max_queued_turns=int(
+                os.environ.get("PARLANT_MAX_QUEUED_TURNS", defaults.max_queued_turns)
+            ),
+            # Given as comma-separated <agent_id>=<quota> pairs
+            agent_quotas={
+                AgentId(agent_id.strip()): int(quota)
+                for agent_id, quota in (
+                    entry.split("=", 1)
+                    for entry in os.environ.get("PARLANT_AGENT_TURN_QUOTAS", "").split(",")
+                    if entry.strip()
+                )
+            },
+            overload_response=OverloadResponse(
+                os.environ.get("PARLANT_OVERLOAD_RESPONSE", defaults.overload_response.value)
+            ),
+            retry_after=float(os.environ.get("PARLANT_OVERLOAD_RETRY_AFTER", defaults.retry_after)),
+        )
+
+
+@dataclass(frozen=True)
+class AdmissionMetrics:
+    running: int
+    queued: Mapping[TurnPriority, int]
+    rejected: int
+    average_queue_time: float
+    """The average time (in seconds) recently admitted turns have waited in the queue"""
+    max_queue_time: float
+
+
+@dataclass
+class _Turn:
+    agent_id: AgentId
+    priority: TurnPriority
+    sequence: int
+    admitted: bool
+
+
+@dataclass(frozen=True)
+class _Handover:
+    agent_id: AgentId
+    admitted: bool
+    """Whether the slot itself is handed over, or only the place in the queue"""
+    sequence: int
+    expiry: asyncio.TimerHandle
+
+
+class ServiceOverloadedError(Exception):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Too many turns are in progress; please retry in {retry_after} seconds")
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Bounds the number of session turns that are processed concurrently.
+
+    Turns beyond the limit wait in a bounded queue, where those responding to customers
+    are admitted first. An agent with a quota is held to it without holding up the turns
+    of other agents. Once the queue is full, new turns are shed according to the configured
+    overload response, so that a traffic spike slows down only the turns it brings,
+    rather than every session at once.
+
+    A session that already has a turn in progress is never shed, and when that turn is
+    restarted (see hand_over()), its slot or place in the queue goes to the session's next turn.
+    A turn that's only waiting (e.g., for more customer messages) can give up its slot meanwhile
+    (see suspended()).
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        limits: AdmissionLimits = AdmissionLimits(),
+        queue_time_samples: int = 1000,
+        handover_timeout: float = 5.0,
+    ) -> None:
+        self._logger = logger
+        self.limits = limits
+
+        self._sequence = count()
+        self._waiters: list[tuple[int, int, AgentId, asyncio.Future[None]]] = []
+        self._running = 0
+        self._running_by_agent = Counter[AgentId]()
+        self._sessions = Counter[SessionId]()
+        self._rejected = 0
+        self._queue_times: deque[float] = deque(maxlen=queue_time_samples)
+
+        self._handover_timeout = handover_timeout
+        self._handing_over: set[SessionId] = set()
+        self._handovers: dict[SessionId, _Handover] = {}
+
+        self._current_turn = contextvars.ContextVar[Optional[_Turn]](
+            f"admission_controller_{generate_id()}_current_turn",
+            default=None,
+        )
+
+    def check(self, agent_id: AgentId, session_id: Optional[SessionId] = None) -> None:
+        """Raises ServiceOverloadedError if a new turn would be shed, and overload is to be rejected.
+
+        This lets callers refuse a request before acting on it, rather than having its turn
+        shed afterwards. A session that already has a turn in progress is never refused,
+        as its new turn only replaces the one in progress.
+        """
+        if self.limits.overload_response != OverloadResponse.REJECT:
+            return
+
+        if session_id is not None and self._is_in_progress(session_id):
+            return
+
+        if self._is_overloaded(agent_id):
+            self._reject(f"Refusing a new turn for agent {agent_id}")
+
+    def hand_over(self, session_id: SessionId) -> None:
+        """Has the session's turn in progress, once it ends, pass its slot (or its place
+        in the queue) on to the session's next turn, rather than release it to others.
+
+        This is meant to be called right before restarting a session's turn, so that a customer
+        who follows up on their message doesn't lose their turn to the ones that came after it.
+        A slot that isn't claimed within the handover timeout is released.
+        """
+        if session_id in self._sessions:
+            self._handing_over.add(session_id)
+
+    @asynccontextmanager
+    async def turn(
+        self,
+        session_id: SessionId,
+        agent_id: AgentId,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
+        checked: bool = False,
+    ) -> AsyncIterator[None]:
+        """Waits for the turn to be admitted, and holds its slot for the duration of the context.
+
+        A turn that has already passed check() isn't shed when overload is to be rejected,
+        as it has already been let in; only its place in the queue remains to be waited for.
+        """
+        handover = self._claim_handover(session_id)
+
+        if (
+            handover is None
+            and not (checked and self.limits.overload_response == OverloadResponse.REJECT)
+            and not self._is_in_progress(session_id)
+            and self._is_overloaded(agent_id)
+        ):
+            self._reject(f"Shedding a turn for session {session_id}")
+
+        turn = _Turn(
+            agent_id=agent_id,
+            priority=priority,
+            sequence=handover.sequence if handover else next(self._sequence),
+            admitted=handover is not None and handover.admitted,
+        )
+
+        self._sessions[session_id] += 1
+        reset_token = self._current_turn.set(turn)
+
+        try:
+            if not turn.admitted:
+                await self._acquire(agent_id, priority, turn.sequence)
+                turn.admitted = True
+
+            yield
+        finally:
+            self._current_turn.reset(reset_token)
+            self._sessions[session_id] -= 1
+
+            if not self._sessions[session_id]:
+                del self._sessions[session_id]
+
+            if session_id in self._handing_over:
+                self._handing_over.discard(session_id)
+                self._start_handover(session_id, agent_id, turn.admitted, turn.sequence)
+            elif turn.admitted:
+                self._release(agent_id)
+
+    @asynccontextmanager
+    async def suspended(self) -> AsyncIterator[None]:
+        """Gives up the slot of the current turn for the duration of the context.
+
+        This is meant for idle waits within a turn, so that they don't take up a slot
+        that could be processing another turn. Once the context exits, the turn waits
+        to be admitted again, ahead of the turns that came after it.
+        """
+        turn = self._current_turn.get()
+
+        if turn is None or not turn.admitted:
+            yield
+            return
+
+        turn.admitted = False
+        self._release(turn.agent_id)
+
+        yield
+
+        await self._acquire(turn.agent_id, turn.priority, turn.sequence)
+        turn.admitted = True
+
+    def metrics(self) -> AdmissionMetrics:
+        queued = {p: 0 for p in TurnPriority}
+
+        for priority, _, _, future in self._waiters:
+            if not future.done():
+                queued[TurnPriority(priority)] += 1
+
+        return AdmissionMetrics(
+            running=self._running,
+            queued=queued,
+            rejected=self._rejected,
+            average_queue_time=(
+                sum(self._queue_times) / len(self._queue_times) if self._queue_times else 0.0
+            ),
+            max_queue_time=max(self._queue_times, default=0.0),
+        )
+
+    async def log_metrics(self, interval: float) -> None:
+        """Logs the metrics once every interval (in seconds), unless nothing has happened since."""
+        last_rejected = 0
+
+        while True:
+            await asyncio.sleep(interval)
+
+            metrics = self.metrics()
+
+            if (
+                not metrics.running
+                and not any(metrics.queued.values())
+                and metrics.rejected == last_rejected
+            ):
+                continue
+
+            last_rejected = metrics.rejected
+
+            self._logger.info(
+                f"{type(self).__name__}: {metrics.running} turns running, "
+                f"{metrics.queued[TurnPriority.INTERACTIVE]} interactive and "
+                f"{metrics.queued[TurnPriority.BACKGROUND]} background turns queued, "
+                f"{metrics.rejected} rejected so far; "
+                f"queue time averages {metrics.average_queue_time:.2f}s "
+                f"(max {metrics.max_queue_time:.2f}s)"
+            )
+
+    def _is_in_progress(self, session_id: SessionId) -> bool:
+        return session_id in self._sessions or session_id in self._handovers
+
+    def _start_handover(
+        self,
+        session_id: SessionId,
+        agent_id: AgentId,
+        admitted: bool,
+        sequence: int,
+    ) -> None:
+        self._handovers[session_id] = _Handover(
+            agent_id=agent_id,
+            admitted=admitted,
+            sequence=sequence,
+            expiry=asyncio.get_running_loop().call_later(
+                self._handover_timeout, self._expire_handover, session_id
+            ),
+        )
+
+    def _claim_handover(self, session_id: SessionId) -> Optional[_Handover]:
+        if handover := self._handovers.pop(session_id, None):
+            handover.expiry.cancel()
+        return handover
+
+    def _expire_handover(self, session_id: SessionId) -> None:
+        if (handover := self._handovers.pop(session_id, None)) and handover.admitted:
+            self._logger.warning(
+                f"{type(self).__name__}: Releasing the slot handed over by session {session_id}, "
+                "as no turn has claimed it"
+            )
+            self._release(handover.agent_id)
+
+    def _is_overloaded(self, agent_id: AgentId) -> bool:
+        return not self._can_admit(agent_id) and len(self._waiters) >= self.limits.max_queued_turns
+
+    def _reject(self, message: str) -> None:
+        self._rejected += 1
+
+        self._logger.warning(
+            f"{type(self).__name__}: {message}; {self._running} turns are running "
+            f"and {len(self._waiters)} are queued"
+        )
+
+        raise ServiceOverloadedError(self.limits.retry_after)
+
+    def _can_admit(self, agent_id: AgentId) -> bool:
+        if self._running >= self.limits.max_concurrent_turns:
+            return False
+
+        if (quota := self.limits.agent_quotas.get(agent_id)) is not None:
+            return self._running_by_agent[agent_id] < quota
+
+        return True
+
+    async def _acquire(self, agent_id: AgentId, priority: TurnPriority, sequence: int) -> None:
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+
+        future = loop.create_future()
+        self._waiters.append((priority.value, sequence, agent_id, future))
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # We were admitted just as we got cancelled, so give the slot back
+                self._release(agent_id)
+            else:
+                self._waiters = [w for w in self._waiters if w[3] is not future]
+                self._dispatch()
+            raise
+
+        queue_time = loop.time() - queued_at
+        self._queue_times.append(queue_time)
+
+        if queue_time >= 1.0:
+            self._logger.debug(
+                f"{type(self).__name__}: Turn was admitted after {queue_time:.2f} seconds in queue"
+            )
+
+    def _release(self, agent_id: AgentId) -> None:
+        self._running -= 1
+        self._running_by_agent[agent_id] -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        # Serve in order of priority and arrival, skipping over (but not dropping)
+        # turns of agents that are at their quota
+        for _, _, agent_id, future in sorted(self._waiters, key=lambda w: w[:2]):
+            if self._running >= self.limits.max_concurrent_turns:
+                break
+
+            if future.done() or not self._can_admit(agent_id):
+                continue
+
+            self._running += 1
+            self._running_by_agent[agent_id] += 1
+            future.set_result(None)
+
+        self._waiters = [w for w in self._waiters if not w[3].done()]
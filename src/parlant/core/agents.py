@@ -282,6 +282,11 @@ class AgentDocumentStore(AgentStore):
             composition_mode=CompositionMode(agent_document.get("composition_mode", "fluid")),
         )
 
+    @property
+    def revision(self) -> int:
+        """A number that increases whenever the store is written to."""
+        return self._lock.write_count
+
     @override
     async def create_agent(
         self,
@@ -19,6 +19,7 @@ from datetime import datetime, timezone
 from typing import Any, Iterable, Mapping, Optional, TypeAlias, cast
 from lagom import Container
 
+from parlant.core.admission import AdmissionController, ServiceOverloadedError, TurnPriority
 from parlant.core.async_utils import Timeout
 from parlant.core.background_tasks import BackgroundTaskService
 from parlant.core.contextual_correlator import ContextualCorrelator
@@ -70,6 +71,7 @@ class Application:
         self._engine = container[Engine]
         self._event_emitter_factory = container[EventEmitterFactory]
         self._background_task_service = container[BackgroundTaskService]
+        self._admission_controller = container[AdmissionController]
 
         self._lock = asyncio.Lock()
 
@@ -96,6 +98,9 @@ class Application:
         title: Optional[str] = None,
         allow_greeting: bool = False,
     ) -> Session:
+        if allow_greeting:
+            self._admission_controller.check(agent_id)
+
         session = await self._session_store.create_session(
             creation_utc=datetime.now(timezone.utc),
             customer_id=customer_id,
@@ -104,7 +109,7 @@ class Application:
         )
 
         if allow_greeting:
-            await self.dispatch_processing_task(session)
+            await self.dispatch_processing_task(session, checked=True)
 
         return session
 
@@ -116,6 +121,12 @@ class Application:
         source: EventSource = EventSource.CUSTOMER,
         trigger_processing: bool = True,
     ) -> Event:
+        if trigger_processing:
+            # Refuse the event up front if it can't be processed,
+            # rather than storing it and leaving it unanswered
+            session = await self._session_store.read_session(session_id)
+            self._admission_controller.check(session.agent_id, session.id)
+
         event = await self._session_store.create_event(
             session_id=session_id,
             source=source,
@@ -125,33 +136,69 @@ class Application:
         )
 
         if trigger_processing:
-            session = await self._session_store.read_session(session_id)
-            await self.dispatch_processing_task(session)
+            await self.dispatch_processing_task(
+                session,
+                priority=(
+                    TurnPriority.INTERACTIVE
+                    if source == EventSource.CUSTOMER
+                    else TurnPriority.BACKGROUND
+                ),
+                checked=True,
+            )
 
         return event
 
-    async def dispatch_processing_task(self, session: Session) -> str:
+    async def dispatch_processing_task(
+        self,
+        session: Session,
+        priority: TurnPriority = TurnPriority.INTERACTIVE,
+        checked: bool = False,
+    ) -> str:
+        # Admission is decided once, before anything is persisted: callers that have
+        # already checked it (before storing the event that triggered the turn) say so
+        if not checked:
+            self._admission_controller.check(session.agent_id, session.id)
+
+        # The restarted turn takes over the slot of the one it replaces
+        self._admission_controller.hand_over(session.id)
+
         with self._correlator.scope("process", {"session": session}):
             await self._background_task_service.restart(
-                self._process_session(session),
+                self._process_session(session, priority),
                 tag=f"process-session({session.id})",
             )
 
             return self._correlator.correlation_id
 
-    async def _process_session(self, session: Session) -> None:
+    async def _process_session(self, session: Session, priority: TurnPriority) -> None:
         event_emitter = await self._event_emitter_factory.create_event_emitter(
             emitting_agent_id=session.agent_id,
             session_id=session.id,
         )
 
-        await self._engine.process(
-            Context(
-                session_id=session.id,
-                agent_id=session.agent_id,
-            ),
-            event_emitter=event_emitter,
-        )
+        try:
+            # Admission was already checked when the turn was dispatched
+            async with self._admission_controller.turn(
+                session.id,
+                session.agent_id,
+                priority,
+                checked=True,
+            ):
+                await self._engine.process(
+                    Context(
+                        session_id=session.id,
+                        agent_id=session.agent_id,
+                    ),
+                    event_emitter=event_emitter,
+                )
+        except ServiceOverloadedError as exc:
+            await event_emitter.emit_status_event(
+                correlation_id=self._correlator.correlation_id,
+                data={
+                    "status": "busy",
+                    "data": {"retry_after": exc.retry_after},
+                },
+            )
 
     async def utter(
         self,
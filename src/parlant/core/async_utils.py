@@ -218,6 +218,9 @@ class ReaderWriterLock:
         self._reader_lock = _lock.reader
         self._writer_lock = _lock.writer
 
+        self.write_count = 0
+        """The number of writer sections entered so far"""
+
     @property
     def reader_lock(self) -> AsyncContextManager[None]:
         @asynccontextmanager
@@ -232,6 +235,9 @@ class ReaderWriterLock:
         @asynccontextmanager
         async def _writer_cm() -> AsyncIterator[None]:
             async with self._writer_lock:
-                yield
+                try:
+                    yield
+                finally:
+                    self.write_count += 1
 
         return _writer_cm()
@@ -15,6 +15,7 @@
 import asyncio
 import traceback
 from typing import Any, Coroutine, Optional, TypeAlias
+from weakref import WeakValueDictionary
 from typing_extensions import Self
 
 from parlant.core.loggers import Logger
@@ -31,6 +32,7 @@ class BackgroundTaskService:
         self._garbage_collection_interval = 5.0
         self._tasks = dict[str, Task]()
         self._lock = asyncio.Lock()
+        self._restart_locks = WeakValueDictionary[str, asyncio.Lock]()
 
     async def __aenter__(self) -> Self:
         return self
@@ -88,16 +90,24 @@ class BackgroundTaskService:
     async def restart(self, f: Coroutine[Any, Any, None], /, *, tag: str) -> Task:
         await self.collect()
 
-        async with self._lock:
-            if existing_task := self._tasks.get(tag):
-                if not existing_task.done():
-                    existing_task.cancel(f"Restarting task '{tag}'")
-                    await self._await_task(existing_task)
+        # Restarts are serialized per tag, so that waiting for a cancelled task
+        # to wind down doesn't hold up starting or restarting tasks under other tags
+        restart_lock = self._restart_locks.setdefault(tag, asyncio.Lock())
 
-            self._logger.trace(f"{type(self).__name__}: Starting task '{tag}'")
-            task = asyncio.create_task(f)
-            self._tasks[tag] = task
-            return task
+        async with restart_lock:
+            async with self._lock:
+                if existing_task := self._tasks.get(tag):
+                    if not existing_task.done():
+                        existing_task.cancel(f"Restarting task '{tag}'")
+
+            if existing_task:
+                await self._await_task(existing_task)
+
+            async with self._lock:
+                self._logger.trace(f"{type(self).__name__}: Starting task '{tag}'")
+                task = asyncio.create_task(f)
+                self._tasks[tag] = task
+                return task
 
     async def collect(self, *, force: bool = False) -> None:
         now = asyncio.get_event_loop().time()
@@ -41,6 +41,7 @@ from parlant.core.persistence.vector_database_helper import (
     calculate_min_vectors_for_max_item_count,
     query_chunks,
 )
+from parlant.core.persistence.tag_index import TagIndex
 from parlant.core.tags import TagId
 from parlant.core.common import ItemNotFoundError, UniqueId, Version, IdGenerator, md5_checksum
 from parlant.core.persistence.common import ObjectId, Where
@@ -252,6 +253,7 @@ class CannedResponseVectorStore(CannedResponseStore):
         self._canrep_tag_association_collection: DocumentCollection[
             CannedResponseTagAssociationDocument
         ]
+        self._tag_index = TagIndex()
         self._allow_migration = allow_migration
         self._lock = ReaderWriterLock()
         self._embedder_factory = embedder_factory
@@ -363,6 +365,14 @@ class CannedResponseVectorStore(CannedResponseStore):
                 document_loader=self._association_document_loader,
             )
 
+        self._tag_index = TagIndex(
+            entity_ids=[d["id"] for d in await self._canreps_collection.find({})],
+            associations=[
+                (d["canned_response_id"], d["tag_id"])
+                for d in await self._canrep_tag_association_collection.find({})
+            ],
+        )
+
         return self
 
     async def __aexit__(
@@ -394,12 +404,7 @@ class CannedResponseVectorStore(CannedResponseStore):
     async def _deserialize_canned_response(
         self, canned_response_document: CannedResponseDocument
     ) -> CannedResponse:
-        tags = [
-            doc["tag_id"]
-            for doc in await self._canrep_tag_association_collection.find(
-                {"canned_response_id": {"$eq": canned_response_document["id"]}}
-            )
-        ]
+        tags = [TagId(t) for t in self._tag_index.tags_of(canned_response_document["id"])]
 
         return CannedResponse(
             id=CannedResponseId(canned_response_document["id"]),
@@ -441,6 +446,11 @@ class CannedResponseVectorStore(CannedResponseStore):
 
         return doc
 
+    @property
+    def revision(self) -> int:
+        """A number that increases whenever the store is written to."""
+        return self._lock.write_count
+
     @override
     async def create_canned_response(
         self,
@@ -469,6 +479,8 @@ class CannedResponseVectorStore(CannedResponseStore):
 
             await self._insert_canned_response(canrep)
 
+            self._tag_index.add_entity(canrep.id)
+
             for tag_id in tags or []:
                 tag_checksum = md5_checksum(f"{canrep.id}{tag_id}")
 
@@ -482,6 +494,8 @@ class CannedResponseVectorStore(CannedResponseStore):
                     }
                 )
 
+                self._tag_index.add_tag(canrep.id, tag_id)
+
         return canrep
 
     def _validate_template(self, template: str) -> None:
@@ -548,29 +562,9 @@ class CannedResponseVectorStore(CannedResponseStore):
         self,
         tags: Optional[Sequence[TagId]] = None,
     ) -> Sequence[CannedResponse]:
-        filters: Where = {}
-
         async with self._lock.reader_lock:
-            if tags is not None:
-                if len(tags) == 0:
-                    canrep_ids = {
-                        doc["canned_response_id"]
-                        for doc in await self._canrep_tag_association_collection.find(filters={})
-                    }
-                    filters = (
-                        {"$and": [{"id": {"$ne": id}} for id in canrep_ids]} if canrep_ids else {}
-                    )
-                else:
-                    tag_filters: Where = {"$or": [{"tag_id": {"$eq": tag}} for tag in tags]}
-                    tag_associations = await self._canrep_tag_association_collection.find(
-                        filters=tag_filters
-                    )
-                    canrep_ids = {assoc["canned_response_id"] for assoc in tag_associations}
-
-                    if not canrep_ids:
-                        return []
-
-                    filters = {"$or": [{"id": {"$eq": id}} for id in canrep_ids]}
+            if (filters := self._tag_index.filters_for(tags)) is None:
+                return []
 
             canreps = await self._canreps_collection.find(filters=filters)
 
@@ -608,6 +602,8 @@ class CannedResponseVectorStore(CannedResponseStore):
 
             await async_utils.safe_gather(*tasks)
 
+            self._tag_index.remove_entity(canned_response_id)
+
     @override
     async def upsert_tag(
         self,
@@ -637,6 +633,8 @@ class CannedResponseVectorStore(CannedResponseStore):
                 document=association_document
             )
 
+            self._tag_index.add_tag(canned_response_id, tag_id)
+
         return True
 
     @override
@@ -656,6 +654,8 @@ class CannedResponseVectorStore(CannedResponseStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._tag_index.remove_tag(canned_response_id, tag_id)
+
     @override
     async def find_relevant_canned_responses(
         self,
@@ -672,20 +672,17 @@ class CannedResponseVectorStore(CannedResponseStore):
                 "canned_response_id": {"$in": [str(c.id) for c in available_canned_responses]}
             }
 
-            tasks = [
-                self._canreps_vector_collection.find_similar_documents(
-                    filters=filters,
-                    query=q,
-                    k=calculate_min_vectors_for_max_item_count(
-                        items=available_canned_responses,
-                        count_item_vectors=lambda c: len(self._list_canned_response_contents(c)),
-                        max_items_to_return=max_count,
-                    ),
-                )
-                for q in queries
-            ]
+            similar_documents = self._canreps_vector_collection.find_similar_documents_for_queries(
+                filters=filters,
+                queries=queries,
+                k=calculate_min_vectors_for_max_item_count(
+                    items=available_canned_responses,
+                    count_item_vectors=lambda c: len(self._list_canned_response_contents(c)),
+                    max_items_to_return=max_count,
+                ),
+            )
 
-        all_sdocs = chain.from_iterable(await async_utils.safe_gather(*tasks))
+        all_sdocs = chain.from_iterable(await similar_documents)
 
         unique_sdocs: dict[str, SimilarDocumentResult[CannedResponseVectorDocument]] = {}
 
@@ -15,7 +15,6 @@
 from abc import abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from itertools import chain
 from typing import Awaitable, Callable, NewType, Optional, Sequence, TypedDict, cast
 from typing_extensions import override, Self, Required
 
@@ -31,9 +30,11 @@ from parlant.core.persistence.vector_database import (
     VectorDatabase,
 )
 from parlant.core.persistence.vector_database_helper import (
+    RetrievalQuery,
     VectorDocumentStoreMigrationHelper,
     calculate_min_vectors_for_max_item_count,
-    query_chunks,
+    weigh_similar_documents,
+    weighted_query_chunks,
 )
 from parlant.core.persistence.document_database import (
     DocumentCollection,
@@ -41,6 +42,7 @@ from parlant.core.persistence.document_database import (
     BaseDocument,
 )
 from parlant.core.persistence.document_database_helper import DocumentStoreMigrationHelper
+from parlant.core.persistence.tag_index import TagIndex
 from parlant.core.tags import TagId
 
 
@@ -105,7 +107,7 @@ class CapabilityStore:
     @abstractmethod
     async def find_relevant_capabilities(
         self,
-        query: str,
+        query: RetrievalQuery,
         available_capabilities: Sequence[Capability],
         max_count: int,
     ) -> Sequence[Capability]: ...
@@ -183,6 +185,7 @@ class CapabilityVectorStore(CapabilityStore):
         self._vector_collection: VectorCollection[CapabilityVectorDocument]
         self._collection: DocumentCollection[CapabilityDocument]
         self._tag_association_collection: DocumentCollection[CapabilityTagAssociationDocument]
+        self._tag_index = TagIndex()
 
         self._embedder_factory = embedder_factory
         self._embedder_type_provider = embedder_type_provider
@@ -242,6 +245,14 @@ class CapabilityVectorStore(CapabilityStore):
                 document_loader=self._association_document_loader,
             )
 
+        self._tag_index = TagIndex(
+            entity_ids=[d["id"] for d in await self._collection.find({})],
+            associations=[
+                (d["capability_id"], d["tag_id"])
+                for d in await self._tag_association_collection.find({})
+            ],
+        )
+
         return self
 
     async def __aexit__(
@@ -266,12 +277,7 @@ class CapabilityVectorStore(CapabilityStore):
         )
 
     async def _deserialize(self, doc: CapabilityDocument) -> Capability:
-        tags = [
-            d["tag_id"]
-            for d in await self._tag_association_collection.find(
-                {"capability_id": {"$eq": doc["id"]}}
-            )
-        ]
+        tags = [TagId(t) for t in self._tag_index.tags_of(doc["id"])]
 
         return Capability(
             id=CapabilityId(doc["id"]),
@@ -308,6 +314,11 @@ class CapabilityVectorStore(CapabilityStore):
 
         return doc
 
+    @property
+    def revision(self) -> int:
+        """A number that increases whenever the store is written to."""
+        return self._lock.write_count
+
     @override
     async def create_capability(
         self,
@@ -337,6 +348,8 @@ class CapabilityVectorStore(CapabilityStore):
 
             await self._insert_capability(capability)
 
+            self._tag_index.add_entity(capability.id)
+
             for tag_id in tags:
                 tag_checksum = md5_checksum(f"{capability_id}{tag_id}")
 
@@ -350,6 +363,8 @@ class CapabilityVectorStore(CapabilityStore):
                     }
                 )
 
+                self._tag_index.add_tag(capability.id, tag_id)
+
         return capability
 
     @override
@@ -402,40 +417,9 @@ class CapabilityVectorStore(CapabilityStore):
         self,
         tags: Optional[Sequence[TagId]] = None,
     ) -> Sequence[Capability]:
-        filters: Where = {}
         async with self._lock.reader_lock:
-            if tags is not None:
-                if len(tags) == 0:
-                    capability_ids = {
-                        doc["id"] for doc in await self._tag_association_collection.find(filters={})
-                    }
-
-                    if not capability_ids:
-                        filters = {}
-
-                    elif len(capability_ids) == 1:
-                        filters = {"id": {"$ne": capability_ids.pop()}}
-
-                    else:
-                        filters = {"$and": [{"id": {"$ne": id}} for id in capability_ids]}
-
-                else:
-                    tag_filters: Where = {"$or": [{"tag_id": {"$eq": tag}} for tag in tags]}
-                    tag_associations = await self._tag_association_collection.find(
-                        filters=tag_filters
-                    )
-
-                    capability_ids = {
-                        ObjectId(assoc["capability_id"]) for assoc in tag_associations
-                    }
-                    if not capability_ids:
-                        return []
-
-                    if len(capability_ids) == 1:
-                        filters = {"id": {"$eq": capability_ids.pop()}}
-
-                    else:
-                        filters = {"$or": [{"id": {"$eq": id}} for id in capability_ids]}
+            if (filters := self._tag_index.filters_for(tags)) is None:
+                return []
 
             docs = {}
             for d in await self._collection.find(filters=filters):
@@ -452,25 +436,20 @@ class CapabilityVectorStore(CapabilityStore):
         async with self._lock.writer_lock:
             docs = await self._collection.find(filters={"id": {"$eq": capability_id}})
 
-            tag_associations = await self._tag_association_collection.find(
-                filters={"capability_id": {"$eq": capability_id}}
-            )
-
             if not docs:
                 raise ItemNotFoundError(item_id=UniqueId(capability_id))
 
-            for doc in docs:
-                await self._collection.delete_one(filters={"id": {"$eq": doc["id"]}})
+            await self._collection.delete_many(filters={"id": {"$eq": capability_id}})
+            await self._tag_association_collection.delete_many(
+                filters={"capability_id": {"$eq": capability_id}}
+            )
 
-            for tag_assoc in tag_associations:
-                await self._tag_association_collection.delete_one(
-                    filters={"id": {"$eq": tag_assoc["id"]}}
-                )
+            self._tag_index.remove_entity(capability_id)
 
     @override
     async def find_relevant_capabilities(
         self,
-        query: str,
+        query: RetrievalQuery,
         available_capabilities: Sequence[Capability],
         max_count: int,
     ) -> Sequence[Capability]:
@@ -478,23 +457,23 @@ class CapabilityVectorStore(CapabilityStore):
             return []
 
         async with self._lock.reader_lock:
-            queries = await query_chunks(query, self._embedder)
+            chunks = await weighted_query_chunks(query, self._embedder)
             filters: Where = {"capability_id": {"$in": [str(c.id) for c in available_capabilities]}}
 
-            tasks = [
-                self._vector_collection.find_similar_documents(
-                    filters=filters,
-                    query=q,
-                    k=calculate_min_vectors_for_max_item_count(
-                        items=available_capabilities,
-                        count_item_vectors=lambda c: len(self._list_capability_contents(c)),
-                        max_items_to_return=max_count,
-                    ),
-                )
-                for q in queries
-            ]
+            similar_documents = self._vector_collection.find_similar_documents_for_queries(
+                filters=filters,
+                queries=[chunk for chunk, _ in chunks],
+                k=calculate_min_vectors_for_max_item_count(
+                    items=available_capabilities,
+                    count_item_vectors=lambda c: len(self._list_capability_contents(c)),
+                    max_items_to_return=max_count,
+                ),
+            )
 
-        all_sdocs = chain.from_iterable(await async_utils.safe_gather(*tasks))
+        all_sdocs = sorted(
+            weigh_similar_documents(await similar_documents, [weight for _, weight in chunks]),
+            key=lambda r: r.distance,
+        )
 
         unique_sdocs: dict[str, SimilarDocumentResult[CapabilityVectorDocument]] = {}
 
@@ -547,6 +526,8 @@ class CapabilityVectorStore(CapabilityStore):
             }
 
             _ = await self._tag_association_collection.insert_one(document=assoc_doc)
+            self._tag_index.add_tag(capability_id, tag_id)
+
             doc = await self._collection.find_one({"id": {"$eq": capability_id}})
 
         if not doc:
@@ -571,6 +552,8 @@ class CapabilityVectorStore(CapabilityStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._tag_index.remove_tag(capability_id, tag_id)
+
             doc = await self._collection.find_one({"id": {"$eq": capability_id}})
 
         if not doc:
@@ -28,7 +28,7 @@ from parlant.core.common import (
     IdGenerator,
     md5_checksum,
 )
-from parlant.core.persistence.common import ObjectId, Where
+from parlant.core.persistence.common import ObjectId
 from parlant.core.persistence.document_database import (
     BaseDocument,
     DocumentDatabase,
@@ -38,6 +38,7 @@ from parlant.core.persistence.document_database_helper import (
     DocumentMigrationHelper,
     DocumentStoreMigrationHelper,
 )
+from parlant.core.persistence.tag_index import TagIndex
 from parlant.core.tags import TagId
 from parlant.core.tools import ToolId
 
@@ -218,6 +219,7 @@ class ContextVariableDocumentStore(ContextVariableStore):
             ContextVariableTagAssociationDocument
         ]
         self._value_collection: DocumentCollection[_ContextVariableValueDocument]
+        self._tag_index = TagIndex()
         self._allow_migration = allow_migration
 
         self._lock = ReaderWriterLock()
@@ -298,6 +300,15 @@ class ContextVariableDocumentStore(ContextVariableStore):
                 schema=_ContextVariableValueDocument,
                 document_loader=self._value_document_loader,
             )
+
+        self._tag_index = TagIndex(
+            entity_ids=[d["id"] for d in await self._variable_collection.find({})],
+            associations=[
+                (d["variable_id"], d["tag_id"])
+                for d in await self._variable_tag_association_collection.find({})
+            ],
+        )
+
         return self
 
     async def __aexit__(
@@ -340,12 +351,7 @@ class ContextVariableDocumentStore(ContextVariableStore):
         self,
         context_variable_document: _ContextVariableDocument,
     ) -> ContextVariable:
-        tags = [
-            d["tag_id"]
-            for d in await self._variable_tag_association_collection.find(
-                {"variable_id": {"$eq": context_variable_document["id"]}}
-            )
-        ]
+        tags = [TagId(t) for t in self._tag_index.tags_of(context_variable_document["id"])]
 
         return ContextVariable(
             id=ContextVariableId(context_variable_document["id"]),
@@ -395,6 +401,8 @@ class ContextVariableDocumentStore(ContextVariableStore):
                 self._serialize_context_variable(context_variable)
             )
 
+            self._tag_index.add_entity(context_variable.id)
+
             for tag_id in tags or []:
                 tag_checksum = md5_checksum(f"{context_variable.id}{tag_id}")
 
@@ -408,6 +416,8 @@ class ContextVariableDocumentStore(ContextVariableStore):
                     }
                 )
 
+                self._tag_index.add_tag(context_variable.id, tag_id)
+
         return context_variable
 
     @override
@@ -485,6 +495,8 @@ class ContextVariableDocumentStore(ContextVariableStore):
                     }
                 )
 
+            self._tag_index.remove_entity(id)
+
             for k, _ in await self.list_values(variable_id=id):
                 await self.delete_value(variable_id=id, key=k)
 
@@ -493,31 +505,9 @@ class ContextVariableDocumentStore(ContextVariableStore):
         self,
         tags: Optional[Sequence[TagId]] = None,
     ) -> Sequence[ContextVariable]:
-        filters: Where = {}
-
         async with self._lock.reader_lock:
-            if tags is not None:
-                if len(tags) == 0:
-                    variable_ids = {
-                        doc["variable_id"]
-                        for doc in await self._variable_tag_association_collection.find(filters={})
-                    }
-                    filters = (
-                        {"$and": [{"id": {"$ne": id}} for id in variable_ids]}
-                        if variable_ids
-                        else {}
-                    )
-                else:
-                    tag_filters: Where = {"$or": [{"tag_id": {"$eq": tag}} for tag in tags]}
-                    tag_associations = await self._variable_tag_association_collection.find(
-                        filters=tag_filters
-                    )
-                    variable_ids = {assoc["variable_id"] for assoc in tag_associations}
-
-                    if not variable_ids:
-                        return []
-
-                    filters = {"$or": [{"id": {"$eq": id}} for id in variable_ids]}
+            if (filters := self._tag_index.filters_for(tags)) is None:
+                return []
 
             return [
                 await self._deserialize_context_variable(d)
@@ -655,6 +645,8 @@ class ContextVariableDocumentStore(ContextVariableStore):
                 document=association_document
             )
 
+            self._tag_index.add_tag(variable_id, tag_id)
+
             variable_document = await self._variable_collection.find_one(
                 {"id": {"$eq": variable_id}}
             )
@@ -681,6 +673,8 @@ class ContextVariableDocumentStore(ContextVariableStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._tag_index.remove_tag(variable_id, tag_id)
+
             variable_document = await self._variable_collection.find_one(
                 {"id": {"$eq": variable_id}}
             )
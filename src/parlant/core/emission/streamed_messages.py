@@ -0,0 +1,67 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+from weakref import WeakValueDictionary
+
+from parlant.core.sessions import SessionId
+
+
+@dataclass(frozen=True)
+class StreamedMessage:
+    correlation_id: str
+    message: str
+    """The text generated so far"""
+
+
+class StreamedMessageChannel:
+    """Relays the text of agent messages while they're being generated.
+
+    Unlike events, streamed text is never persisted: only the latest text of each session's
+    message is held, and only until its generation is over, at which point the message event
+    itself takes over. Streamed text only reaches listeners within the same process.
+    """
+
+    def __init__(self) -> None:
+        self._messages: dict[SessionId, StreamedMessage] = {}
+        self._signals: WeakValueDictionary[SessionId, asyncio.Event] = WeakValueDictionary()
+
+    def publish(self, session_id: SessionId, correlation_id: str, message: str) -> None:
+        self._messages[session_id] = StreamedMessage(correlation_id, message)
+        self._notify(session_id)
+
+    def close(self, session_id: SessionId, correlation_id: str) -> None:
+        if (
+            streamed_message := self._messages.get(session_id)
+        ) and streamed_message.correlation_id == correlation_id:
+            del self._messages[session_id]
+            self._notify(session_id)
+
+    def get(self, session_id: SessionId) -> Optional[StreamedMessage]:
+        return self._messages.get(session_id)
+
+    def update_signal(self, session_id: SessionId) -> asyncio.Event:
+        """Returns a signal that is set once the session's streamed message next changes."""
+
+        if (signal := self._signals.get(session_id)) is None:
+            signal = asyncio.Event()
+            self._signals[session_id] = signal
+
+        return signal
+
+    def _notify(self, session_id: SessionId) -> None:
+        if signal := self._signals.pop(session_id, None):
+            signal.set()
@@ -45,6 +45,7 @@ from parlant.core.engines.alpha.message_event_composer import (
     MessageCompositionError,
     MessageEventComposer,
     MessageEventComposition,
+    MessageStream,
 )
 from parlant.core.engines.alpha.message_generator import MessageGenerator
 from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
@@ -60,6 +61,7 @@ from parlant.core.nlp.generation_info import GenerationInfo
 from parlant.core.engines.alpha.guideline_matching.guideline_match import GuidelineMatch
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder, BuiltInSection
 from parlant.core.glossary import Term
+from parlant.core.emission.streamed_messages import StreamedMessageChannel
 from parlant.core.emissions import EmittedEvent, EventEmitter
 from parlant.core.sessions import (
     Event,
@@ -72,7 +74,7 @@ from parlant.core.sessions import (
 )
 from parlant.core.common import CancellationSuppressionLatch, DefaultBaseModel, JSONSerializable
 from parlant.core.loggers import LogLevel, Logger
-from parlant.core.shots import Shot, ShotCollection
+from parlant.core.shots import Shot, ShotCollection, memoized_shot_formatting
 from parlant.core.tools import ToolId
 
 DEFAULT_NO_MATCH_CANREP = "Not sure I understand. Could you please say that another way?"
@@ -456,6 +458,7 @@ class CannedResponseGenerator(MessageEventComposer):
         canned_response_composition_generator: SchematicGenerator[CannedResponseRevisionSchema],
         canned_response_fluid_preamble_generator: SchematicGenerator[CannedResponsePreambleSchema],
         perceived_performance_policy: PerceivedPerformancePolicy,
+        streamed_message_channel: StreamedMessageChannel,
         canned_response_store: CannedResponseStore,
         field_extractor: CannedResponseFieldExtractor,
         message_generator: MessageGenerator,
@@ -472,6 +475,7 @@ class CannedResponseGenerator(MessageEventComposer):
         self._canrep_fluid_preamble_generator = canned_response_fluid_preamble_generator
         self._canned_response_store = canned_response_store
         self._perceived_performance_policy = perceived_performance_policy
+        self._streamed_message_channel = streamed_message_channel
         self._field_extractor = field_extractor
         self._message_generator = message_generator
         self._cached_response_fields: dict[CannedResponseId, set[str]] = {}
@@ -979,6 +983,7 @@ These guidelines have already been pre-filtered based on the interaction's conte
 """
         return guideline_instruction
 
+    @memoized_shot_formatting
     def _format_shots(
         self,
         shots: Sequence[CannedResponseGeneratorDraftShot],
@@ -1439,10 +1444,33 @@ Output a JSON object with three properties:
                 },
             )
 
-        draft_response = await self._canrep_draft_generator.generate(
-            prompt=draft_prompt,
-            hints={"temperature": temperature},
-        )
+        # The draft can only be streamed when it's sent as is
+        if direct_draft_output_mode and (
+            await self._perceived_performance_policy.is_message_streaming_enabled(loaded_context)
+        ):
+            message_stream = MessageStream(
+                self._streamed_message_channel,
+                loaded_context.session.id,
+                self._correlator.correlation_id,
+            )
+
+            async def stream_response_body(content: Mapping[str, Any]) -> None:
+                if isinstance(response_body := content.get("response_body"), str):
+                    message_stream.update(response_body)
+
+            try:
+                draft_response = await self._canrep_draft_generator.generate_streaming(
+                    prompt=draft_prompt,
+                    on_partial_content=stream_response_body,
+                    hints={"temperature": temperature},
+                )
+            finally:
+                message_stream.close()
+        else:
+            draft_response = await self._canrep_draft_generator.generate(
+                prompt=draft_prompt,
+                hints={"temperature": temperature},
+            )
 
         self._logger.trace(
             f"Canned Response Draft Completion:\n{draft_response.content.model_dump_json(indent=2)}"
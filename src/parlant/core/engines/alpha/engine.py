@@ -27,6 +27,7 @@ from croniter import croniter
 from typing_extensions import override
 
 from parlant.core import async_utils
+from parlant.core.admission import AdmissionController
 from parlant.core.agents import Agent, AgentId, CompositionMode
 from parlant.core.capabilities import Capability
 from parlant.core.common import CancellationSuppressionLatch, JSONSerializable
@@ -44,7 +45,9 @@ from parlant.core.engines.alpha.loaded_context import (
 )
 from parlant.core.engines.alpha.message_generator import MessageGenerator
 from parlant.core.engines.alpha.hooks import EngineHooks
+from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
 from parlant.core.engines.alpha.perceived_performance_policy import PerceivedPerformancePolicy
+from parlant.core.engines.alpha.prompt_builder import shared_prompt_rendering
 from parlant.core.engines.alpha.relational_guideline_resolver import RelationalGuidelineResolver
 from parlant.core.engines.alpha.tool_calling.tool_caller import (
     MissingToolData,
@@ -66,6 +69,7 @@ from parlant.core.sessions import (
     AgentState,
     ContextVariable as StoredContextVariable,
     EventKind,
+    EventSource,
     GuidelineMatch as StoredGuidelineMatch,
     GuidelineMatchingInspection,
     MessageGenerationInspection,
@@ -92,6 +96,7 @@ from parlant.core.emissions import EventEmitter, EmittedEvent
 from parlant.core.contextual_correlator import ContextualCorrelator
 from parlant.core.loggers import LogLevel, Logger
 from parlant.core.entity_cq import EntityQueries, EntityCommands
+from parlant.core.persistence.vector_database_helper import QueryPart
 from parlant.core.tools import ToolContext, ToolId
 
 
@@ -118,6 +123,10 @@ class _GuidelineAndJourneyMatchingResult:
     journeys: list[Journey]
 
 
+_HISTORY_RECENCY_DECAY = 0.05
+"""How much less each older history event weighs in retrieval queries"""
+
+
 class AlphaEngine(Engine):
     """The main AI processing engine (as of Feb 25, the latest and greatest processing engine)"""
 
@@ -133,6 +142,8 @@ class AlphaEngine(Engine):
         fluid_message_generator: MessageGenerator,
         canned_response_generator: CannedResponseGenerator,
         perceived_performance_policy: PerceivedPerformancePolicy,
+        optimization_policy: OptimizationPolicy,
+        admission_controller: AdmissionController,
         hooks: EngineHooks,
     ) -> None:
         self._logger = logger
@@ -147,6 +158,8 @@ class AlphaEngine(Engine):
         self._fluid_message_generator = fluid_message_generator
         self._canned_response_generator = canned_response_generator
         self._perceived_performance_policy = perceived_performance_policy
+        self._optimization_policy = optimization_policy
+        self._admission_controller = admission_controller
 
         self._hooks = hooks
 
@@ -165,10 +178,13 @@ class AlphaEngine(Engine):
             return True
 
         try:
-            with self._logger.operation(
-                f"Processing context for session {context.session_id}",
-                level=LogLevel.INFO,
-                create_scope=False,
+            with (
+                self._logger.operation(
+                    f"Processing context for session {context.session_id}",
+                    level=LogLevel.INFO,
+                    create_scope=False,
+                ),
+                shared_prompt_rendering(),
             ):
                 await self._do_process(loaded_context)
             return True
@@ -204,8 +220,11 @@ class AlphaEngine(Engine):
         )
 
         try:
-            with self._logger.operation(
-                f"Uttering in session {context.session_id}", create_scope=False
+            with (
+                self._logger.operation(
+                    f"Uttering in session {context.session_id}", create_scope=False
+                ),
+                shared_prompt_rendering(),
             ):
                 await self._do_utter(loaded_context, requests)
             return True
@@ -241,6 +260,10 @@ class AlphaEngine(Engine):
         self,
         context: LoadedContext,
     ) -> None:
+        # If another message comes in while we wait, this turn is restarted
+        # before any work (or any event) is wasted on it.
+        await self._wait_for_message_debounce(context)
+
         if not await self._hooks.call_on_acknowledging(context):
             return  # Hook requested to bail out
 
@@ -893,6 +916,30 @@ class AlphaEngine(Engine):
 
         return message_generation_inspections
 
+    async def _wait_for_message_debounce(self, context: LoadedContext) -> None:
+        debounce_window = await self._perceived_performance_policy.get_message_debounce_window(
+            context
+        )
+
+        if debounce_window <= 0:
+            return
+
+        last_message = next(
+            (e for e in reversed(context.interaction.history) if e.kind == EventKind.MESSAGE),
+            None,
+        )
+
+        # Only a customer message still awaiting a response is worth waiting on
+        if not last_message or last_message.source != EventSource.CUSTOMER:
+            return
+
+        elapsed = (datetime.now(timezone.utc) - last_message.creation_utc).total_seconds()
+
+        if elapsed < debounce_window:
+            # There's nothing to process while waiting, so the turn's slot is given up meanwhile
+            async with self._admission_controller.suspended():
+                await asyncio.sleep(debounce_window - elapsed)
+
     async def _emit_error_event(self, context: LoadedContext, exception_details: str) -> None:
         await context.session_event_emitter.emit_status_event(
             correlation_id=self._correlator.correlation_id,
@@ -1515,10 +1562,7 @@ class AlphaEngine(Engine):
         # the K most relevant terms are retrieved.
         #
         # We thus build an optimized query here based on our context.
-        query = ""
-
-        if context.interaction.history:
-            query += str([e.data for e in context.interaction.history])
+        query = self._history_query_parts(context)
 
         if query:
             return await self._entity_queries.find_capabilities_for_agent(
@@ -1540,9 +1584,6 @@ class AlphaEngine(Engine):
         if context.state.context_variables:
             query += f"\n{context_variables_to_json(context.state.context_variables)}"
 
-        if context.interaction.history:
-            query += str([e.data for e in context.interaction.history])
-
         if context.state.guidelines:
             query += str(
                 [
@@ -1556,10 +1597,13 @@ class AlphaEngine(Engine):
         if context.state.tool_events:
             query += str([e.data for e in context.state.tool_events])
 
-        if query:
+        query_parts = [QueryPart(query)] if query else []
+        query_parts += self._history_query_parts(context)
+
+        if query_parts:
             return await self._entity_queries.find_glossary_terms_for_context(
                 agent_id=context.agent.id,
-                query=query,
+                query=query_parts,
             )
 
         return []
@@ -1597,17 +1641,32 @@ class AlphaEngine(Engine):
         if context.state.glossary_terms:
             query += str([t.name for t in context.state.glossary_terms])
 
-        if context.interaction.history:
-            query += str([e.data for e in context.interaction.history])
+        query_parts = [QueryPart(query)] if query else []
+        query_parts += self._history_query_parts(context)
 
-        if query:
+        if query_parts:
             return await self._entity_queries.sort_journeys_by_contextual_relevance(
                 available_journeys=all_journeys,
-                query=query,
+                query=query_parts,
             )
 
         return []
 
+    def _history_query_parts(self, context: LoadedContext) -> list[QueryPart]:
+        # Only the most recent events are considered, and each one is chunked
+        # on its own, so its chunks (and their embeddings, which can thus be reused)
+        # don't change from one turn to the next. Older events weigh less.
+        window = self._optimization_policy.get_retrieval_history_window()
+        history = list(context.interaction.history)[-window:] if window > 0 else []
+
+        return [
+            QueryPart(
+                text=str(event.data),
+                weight=1 / (1 + _HISTORY_RECENCY_DECAY * age),
+            )
+            for age, event in enumerate(reversed(history))
+        ]
+
     async def _call_tools(
         self,
         context: LoadedContext,
@@ -31,13 +31,18 @@ from parlant.core.engines.alpha.guideline_matching.guideline_matcher import (
     GuidelineMatchingBatchError,
 )
 from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
-from parlant.core.engines.alpha.prompt_builder import BuiltInSection, PromptBuilder, SectionStatus
+from parlant.core.engines.alpha.prompt_builder import (
+    BuiltInSection,
+    PromptBuilder,
+    SectionStability,
+    SectionStatus,
+)
 from parlant.core.guidelines import Guideline, GuidelineContent, GuidelineId
 from parlant.core.journeys import JourneyId, JourneyStore
 from parlant.core.loggers import Logger
 from parlant.core.nlp.generation import SchematicGenerator
 from parlant.core.sessions import Event, EventId, EventKind, EventSource
-from parlant.core.shots import Shot, ShotCollection
+from parlant.core.shots import Shot, ShotCollection, memoized_shot_formatting
 from parlant.core.tags import Tag
 
 
@@ -201,6 +206,7 @@ class GenericDisambiguationGuidelineMatchingBatch(GuidelineMatchingBatch):
     async def shots(self) -> Sequence[DisambiguationGuidelineMatchingShot]:
         return await shot_collection.list()
 
+    @memoized_shot_formatting
     def _format_shots(
         self,
         shots: Sequence[DisambiguationGuidelineMatchingShot],
@@ -326,6 +332,7 @@ distinction is between:
 Always prioritize the customer's current request and intent over past ambiguities.
 """,
             props={},
+            stability=SectionStability.STATIC,
         )
         builder.add_section(
             name="guideline-ambiguity-evaluations-examples",
@@ -338,6 +345,7 @@ Examples of Guidelines Ambiguity Evaluation:
                 "formatted_shots": self._format_shots(shots),
                 "shots": shots,
             },
+            stability=SectionStability.STATIC,
         )
         builder.add_agent_identity(self._context.agent)
         builder.add_context_variables(self._context.context_variables)
@@ -35,14 +35,19 @@ from parlant.core.engines.alpha.guideline_matching.guideline_matcher import (
     GuidelineMatchingStrategy,
 )
 from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
-from parlant.core.engines.alpha.prompt_builder import BuiltInSection, PromptBuilder, SectionStatus
+from parlant.core.engines.alpha.prompt_builder import (
+    BuiltInSection,
+    PromptBuilder,
+    SectionStability,
+    SectionStatus,
+)
 from parlant.core.entity_cq import EntityQueries
 from parlant.core.guidelines import Guideline, GuidelineContent, GuidelineId
 from parlant.core.journeys import Journey
 from parlant.core.loggers import Logger
 from parlant.core.nlp.generation import SchematicGenerator
 from parlant.core.sessions import Event, EventId, EventKind, EventSource
-from parlant.core.shots import Shot, ShotCollection
+from parlant.core.shots import Shot, ShotCollection, memoized_shot_formatting
 
 
 class GenericActionableBatch(DefaultBaseModel):
@@ -142,6 +147,7 @@ class GenericActionableGuidelineMatchingBatch(GuidelineMatchingBatch):
     async def shots(self) -> Sequence[GenericActionableGuidelineGuidelineMatchingShot]:
         return await shot_collection.list()
 
+    @memoized_shot_formatting
     def _format_shots(
         self, shots: Sequence[GenericActionableGuidelineGuidelineMatchingShot]
     ) -> str:
@@ -245,6 +251,7 @@ The exact format of your response will be provided later in this prompt.
 
 """,
             props={},
+            stability=SectionStability.STATIC,
         )
         builder.add_section(
             name="guideline-matcher-examples-of-not-previously-applied-evaluations",
@@ -257,6 +264,7 @@ Examples of Guideline Match Evaluations:
                 "formatted_shots": self._format_shots(shots),
                 "shots": shots,
             },
+            stability=SectionStability.STATIC,
         )
         builder.add_agent_identity(self._context.agent)
         builder.add_context_variables(self._context.context_variables)
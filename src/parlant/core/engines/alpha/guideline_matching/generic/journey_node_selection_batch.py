@@ -21,14 +21,14 @@ from parlant.core.engines.alpha.guideline_matching.guideline_matcher import (
     GuidelineMatchingContext,
 )
 from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
-from parlant.core.engines.alpha.prompt_builder import PromptBuilder
+from parlant.core.engines.alpha.prompt_builder import PromptBuilder, SectionStability
 from parlant.core.guidelines import Guideline, GuidelineContent, GuidelineId, GuidelineStore
 from parlant.core.journeys import Journey
 from parlant.core.loggers import Logger
 from parlant.core.nlp.generation import SchematicGenerator
 from parlant.core.nlp.generation_info import GenerationInfo, UsageInfo
 from parlant.core.sessions import Event, EventId, EventKind, EventSource
-from parlant.core.shots import Shot, ShotCollection
+from parlant.core.shots import Shot, ShotCollection, memoized_shot_formatting
 
 PRE_ROOT_INDEX = "0"
 ROOT_INDEX = "1"
@@ -529,6 +529,7 @@ class GenericJourneyNodeSelectionBatch(GuidelineMatchingBatch):
     async def shots(self) -> Sequence[JourneyNodeSelectionShot]:
         return await shot_collection.list()
 
+    @memoized_shot_formatting
     def _format_shots(self, shots: Sequence[JourneyNodeSelectionShot]) -> str:
         return "\n".join(
             f"Example #{i}: {shot.journey_title}\n{self._format_shot(shot)}"
@@ -718,6 +719,7 @@ Each journey consists of:
 Analyze the current conversation state and determine the next appropriate journey step, based on the last step that was performed and the current state of the conversation.
 """,
             props={"agent_name": self._context.agent.name},
+            stability=SectionStability.STATIC,
         )
         builder.add_section(
             name="journey-step-selection-task_description",
@@ -775,6 +777,7 @@ Continue advancing until you encounter:
 - Include "None" in follow_ups arrays for steps that have EXIT JOURNEY transitions
 - Set next_step to "None" when the journey should exit (either due to transitions or being outside journey context)
 """,
+            stability=SectionStability.STATIC,
         )
         builder.add_section(
             name="journey-step-selection-examples",
@@ -790,6 +793,7 @@ Example section is over. The following is the real data you need to use for your
                 "formatted_shots": self._format_shots(shots),
                 "shots": shots,
             },
+            stability=SectionStability.STATIC,
         )
         builder.add_agent_identity(self._context.agent)
         builder.add_context_variables(self._context.context_variables)
@@ -33,14 +33,19 @@ from parlant.core.engines.alpha.guideline_matching.guideline_matcher import (
     GuidelineMatchingStrategy,
 )
 from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
-from parlant.core.engines.alpha.prompt_builder import BuiltInSection, PromptBuilder, SectionStatus
+from parlant.core.engines.alpha.prompt_builder import (
+    BuiltInSection,
+    PromptBuilder,
+    SectionStability,
+    SectionStatus,
+)
 from parlant.core.entity_cq import EntityQueries
 from parlant.core.guidelines import Guideline, GuidelineContent, GuidelineId
 from parlant.core.journeys import Journey
 from parlant.core.loggers import Logger
 from parlant.core.nlp.generation import SchematicGenerator
 from parlant.core.sessions import Event, EventId, EventKind, EventSource
-from parlant.core.shots import Shot, ShotCollection
+from parlant.core.shots import Shot, ShotCollection, memoized_shot_formatting
 
 
 class SegmentPreviouslyAppliedActionableRationale(DefaultBaseModel):
@@ -149,6 +154,7 @@ class GenericObservationalGuidelineMatchingBatch(GuidelineMatchingBatch):
         """This is a separate function to allow overriding in tests and other applications."""
         return match.applies
 
+    @memoized_shot_formatting
     def _format_shots(self, shots: Sequence[GenericObservationalGuidelineMatchingShot]) -> str:
         return "\n".join(
             f"Example #{i}: ###\n{self._format_shot(shot)}" for i, shot in enumerate(shots, start=1)
@@ -258,6 +264,7 @@ The exact format of your response will be provided later in this prompt.
 
 """,
             props={},
+            stability=SectionStability.STATIC,
         )
         builder.add_section(
             name="guideline-matcher-examples-of-condition-evaluations",
@@ -270,6 +277,7 @@ Examples of Condition Evaluations:
                 "formatted_shots": self._format_shots(shots),
                 "shots": shots,
             },
+            stability=SectionStability.STATIC,
         )
         builder.add_agent_identity(self._context.agent)
         builder.add_context_variables(self._context.context_variables)
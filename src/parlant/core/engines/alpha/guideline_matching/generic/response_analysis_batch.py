@@ -40,13 +40,17 @@ from parlant.core.engines.alpha.guideline_matching.guideline_matcher import (
     ResponseAnalysisContext,
 )
 from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
-from parlant.core.engines.alpha.prompt_builder import BuiltInSection, PromptBuilder
+from parlant.core.engines.alpha.prompt_builder import (
+    BuiltInSection,
+    PromptBuilder,
+    SectionStability,
+)
 from parlant.core.guidelines import Guideline, GuidelineContent, GuidelineId
 from parlant.core.loggers import Logger
 from parlant.core.nlp.generation import SchematicGenerator
 from parlant.core.nlp.generation_info import GenerationInfo, UsageInfo
 from parlant.core.sessions import Event, EventSource
-from parlant.core.shots import Shot, ShotCollection
+from parlant.core.shots import Shot, ShotCollection, memoized_shot_formatting
 
 
 class SegmentPreviouslyAppliedActionableRationale(DefaultBaseModel):
@@ -208,6 +212,7 @@ class GenericResponseAnalysisBatch(ResponseAnalysisBatch):
     async def shots(self) -> Sequence[GenericResponseAnalysisShot]:
         return await shot_collection.list()
 
+    @memoized_shot_formatting
     def _format_shots(self, shots: Sequence[GenericResponseAnalysisShot]) -> str:
         return "\n".join(
             f"Example #{i}: ###\n{self._format_shot(shot)}" for i, shot in enumerate(shots, start=1)
@@ -347,6 +352,7 @@ condition of a different guideline, or even offered spontaneously during the int
 
 """,
             props={},
+            stability=SectionStability.STATIC,
         )
         builder.add_section(
             name="guideline-previously-applied-examples",
@@ -359,6 +365,7 @@ Examples of ...:
                 "formatted_shots": self._format_shots(shots),
                 "shots": shots,
             },
+            stability=SectionStability.STATIC,
         )
         builder.add_agent_identity(self._context.agent)
         builder.add_context_variables(self._context.context_variables)
@@ -14,12 +14,16 @@
 
 from abc import abstractmethod
 from dataclasses import dataclass
+import math
+import time
 from typing import Mapping, Optional, Sequence
 
 from parlant.core.common import CancellationSuppressionLatch
 from parlant.core.engines.alpha.loaded_context import LoadedContext
+from parlant.core.emission.streamed_messages import StreamedMessageChannel
 from parlant.core.emissions import EmittedEvent
 from parlant.core.nlp.generation_info import GenerationInfo
+from parlant.core.sessions import SessionId
 
 
 @dataclass(frozen=True)
@@ -33,6 +37,60 @@ class MessageCompositionError(Exception):
         super().__init__(message)
 
 
+class MessageStream:
+    """Streams a message to the customer while it's being generated.
+
+    The text generated so far is relayed over the streamed message channel, rather than
+    on events, so that none of it is persisted. Updates are throttled, so that a quickly
+    streaming model doesn't flood listeners with them. The message event itself is still
+    emitted once the message is final, and supersedes whatever text was streamed.
+    """
+
+    def __init__(
+        self,
+        channel: StreamedMessageChannel,
+        session_id: SessionId,
+        correlation_id: str,
+        min_update_interval: float = 0.1,
+    ) -> None:
+        self._channel = channel
+        self._session_id = session_id
+        self._correlation_id = correlation_id
+        self._min_update_interval = min_update_interval
+
+        self._last_message = ""
+        self._last_update_time = -math.inf
+
+    def update(self, message: str) -> None:
+        if not message or message == self._last_message:
+            return
+
+        now = time.monotonic()
+
+        # Skipped updates aren't lost, since each one carries all of the text so far
+        if now - self._last_update_time < self._min_update_interval:
+            return
+
+        self._last_message = message
+        self._last_update_time = now
+
+        self._channel.publish(self._session_id, self._correlation_id, message)
+
+    def retract(self) -> None:
+        """Withdraws the text streamed so far, as it's not going to be sent."""
+        if not self._last_message:
+            return
+
+        self._last_message = ""
+        self._last_update_time = -math.inf
+
+        # Empty text tells listeners to discard whatever they were shown so far
+        self._channel.publish(self._session_id, self._correlation_id, "")
+
+    def close(self) -> None:
+        self._channel.close(self._session_id, self._correlation_id)
+
+
 class MessageEventComposer:
     @abstractmethod
     async def generate_preamble(
@@ -32,8 +32,10 @@ from parlant.core.engines.alpha.message_event_composer import (
     MessageCompositionError,
     MessageEventComposer,
     MessageEventComposition,
+    MessageStream,
 )
 from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
+from parlant.core.engines.alpha.perceived_performance_policy import PerceivedPerformancePolicy
 from parlant.core.engines.alpha.tool_calling.tool_caller import (
     MissingToolData,
     ToolInsights,
@@ -44,13 +46,14 @@ from parlant.core.journeys import Journey
 from parlant.core.nlp.generation import SchematicGenerator
 from parlant.core.nlp.generation_info import GenerationInfo
 from parlant.core.engines.alpha.guideline_matching.guideline_match import GuidelineMatch
-from parlant.core.engines.alpha.prompt_builder import PromptBuilder
+from parlant.core.engines.alpha.prompt_builder import PromptBuilder, SectionStability
 from parlant.core.glossary import Term
+from parlant.core.emission.streamed_messages import StreamedMessageChannel
 from parlant.core.emissions import EmittedEvent, EventEmitter
 from parlant.core.sessions import Event, EventKind, EventSource
 from parlant.core.common import CancellationSuppressionLatch, DefaultBaseModel
 from parlant.core.loggers import Logger
-from parlant.core.shots import Shot, ShotCollection
+from parlant.core.shots import Shot, ShotCollection, memoized_shot_formatting
 from parlant.core.tools import ToolId
 
 
@@ -127,11 +130,15 @@ class MessageGenerator(MessageEventComposer):
         logger: Logger,
         correlator: ContextualCorrelator,
         optimization_policy: OptimizationPolicy,
+        perceived_performance_policy: PerceivedPerformancePolicy,
+        streamed_message_channel: StreamedMessageChannel,
         schematic_generator: SchematicGenerator[MessageSchema],
     ) -> None:
         self._logger = logger
         self._correlator = correlator
         self._optimization_policy = optimization_policy
+        self._perceived_performance_policy = perceived_performance_policy
+        self._streamed_message_channel = streamed_message_channel
         self._schematic_generator = schematic_generator
 
     async def shots(self) -> Sequence[MessageGeneratorShot]:
@@ -150,25 +157,41 @@ class MessageGenerator(MessageEventComposer):
         context: LoadedContext,
         latch: Optional[CancellationSuppressionLatch] = None,
     ) -> Sequence[MessageEventComposition]:
-        with self._logger.scope("MessageEventComposer"):
-            with self._logger.scope("MessageGenerator"):
-                with self._logger.operation("Message generation"):
-                    return await self._do_generate_events(
-                        event_emitter=context.session_event_emitter,
-                        agent=context.agent,
-                        customer=context.customer,
-                        context_variables=context.state.context_variables,
-                        interaction_history=context.interaction.history,
-                        terms=list(context.state.glossary_terms),
-                        capabilities=context.state.capabilities,
-                        ordinary_guideline_matches=context.state.ordinary_guideline_matches,
-                        journeys=context.state.journeys,
-                        tool_enabled_guideline_matches=context.state.tool_enabled_guideline_matches,
-                        tool_insights=context.state.tool_insights,
-                        staged_tool_events=context.state.tool_events,
-                        staged_message_events=context.state.message_events,
-                        latch=latch,
-                    )
+        message_stream = (
+            MessageStream(
+                self._streamed_message_channel,
+                context.session.id,
+                self._correlator.correlation_id,
+            )
+            if await self._perceived_performance_policy.is_message_streaming_enabled(context)
+            else None
+        )
+
+        try:
+            with self._logger.scope("MessageEventComposer"):
+                with self._logger.scope("MessageGenerator"):
+                    with self._logger.operation("Message generation"):
+                        return await self._do_generate_events(
+                            event_emitter=context.session_event_emitter,
+                            agent=context.agent,
+                            customer=context.customer,
+                            context_variables=context.state.context_variables,
+                            interaction_history=context.interaction.history,
+                            terms=list(context.state.glossary_terms),
+                            capabilities=context.state.capabilities,
+                            ordinary_guideline_matches=context.state.ordinary_guideline_matches,
+                            journeys=context.state.journeys,
+                            tool_enabled_guideline_matches=context.state.tool_enabled_guideline_matches,
+                            tool_insights=context.state.tool_insights,
+                            staged_tool_events=context.state.tool_events,
+                            staged_message_events=context.state.message_events,
+                            message_stream=message_stream,
+                            latch=latch,
+                        )
+        finally:
+            # Whatever was streamed is superseded by the message event, if any
+            if message_stream:
+                message_stream.close()
 
     def _format_staged_events(
         self,
@@ -199,6 +222,7 @@ class MessageGenerator(MessageEventComposer):
         tool_insights: ToolInsights,
         staged_tool_events: Sequence[EmittedEvent],
         staged_message_events: Sequence[EmittedEvent],
+        message_stream: Optional[MessageStream] = None,
         latch: Optional[CancellationSuppressionLatch] = None,
     ) -> Sequence[MessageEventComposition]:
         if (
@@ -246,6 +270,7 @@ class MessageGenerator(MessageEventComposer):
                     prompt,
                     temperature=generation_attempt_temperatures[generation_attempt],
                     final_attempt=(generation_attempt + 1) == len(generation_attempt_temperatures),
+                    message_stream=message_stream,
                 )
 
                 if latch:
@@ -269,8 +294,13 @@ class MessageGenerator(MessageEventComposer):
                 )
                 last_generation_exception = exc
 
+                # The next attempt streams its own message from scratch
+                if message_stream:
+                    message_stream.retract()
+
         raise MessageCompositionError() from last_generation_exception
 
+    @memoized_shot_formatting
     def _format_shots(self, shots: Sequence[MessageGeneratorShot]) -> str:
         return "\n".join(
             f"""
@@ -324,6 +354,7 @@ Later in this prompt, you'll be provided with behavioral guidelines and other co
 
 """,
             props={},
+            stability=SectionStability.STATIC,
         )
 
         builder.add_agent_identity(agent)
@@ -346,6 +377,7 @@ Always abide by the following general principles (note these are not the "guidel
 8. OUTPUT FORMAT: In your generated reply to the customer, use markdown format when applicable.
 """,
             props={},
+            stability=SectionStability.STATIC,
         )
         if not interaction_history or all(
             [event.kind != EventKind.MESSAGE for event in interaction_history]
@@ -454,6 +486,7 @@ For instance, if a guideline explicitly prohibits a specific action (e.g., "neve
 In cases of conflict, prioritize the business's values and ensure your decisions align with their overarching goals.
 
 """,  # noqa
+            stability=SectionStability.STATIC,
         )
         builder.add_section(
             name="message-generator-examples",
@@ -466,6 +499,7 @@ EXAMPLES
                 "formatted_shots": self._format_shots(shots),
                 "shots": shots,
             },
+            stability=SectionStability.STATIC,
         )
         builder.add_section(
             name="message-generator-interaction-context",
@@ -699,11 +733,57 @@ Produce a valid JSON object in the following format: ###
         prompt: PromptBuilder,
         temperature: float,
         final_attempt: bool,
+        message_stream: Optional[MessageStream] = None,
     ) -> tuple[GenerationInfo, Optional[str]]:
-        message_event_response = await self._schematic_generator.generate(
-            prompt=prompt,
-            hints={"temperature": temperature},
-        )
+        if message_stream:
+
+            async def stream_revision(content: Mapping[str, Any]) -> None:
+                if content.get("produced_reply") is False:
+                    message_stream.retract()
+                    return
+
+                # Revisions that failed their evaluation are skipped, so what's streamed is the
+                # revision being generated, until one passes its evaluation. That revision is
+                # the one that would be sent (the first correct one, as chosen below), so any
+                # revisions after it aren't streamed.
+                for revision in content.get("revisions") or []:
+                    if not isinstance(revision, dict):
+                        return
+
+                    if "further_revisions_required" not in revision:
+                        if isinstance(message := revision.get("content"), str):
+                            message_stream.update(message)
+                        else:
+                            message_stream.retract()
+                        return
+
+                    if revision.get("is_repeat_message"):
+                        continue
+
+                    if revision.get("followed_all_instructions") or revision.get(
+                        "instructions_broken_only_due_to_prioritization"
+                    ):
+                        message_stream.update(str(revision.get("content", "")))
+                        return
+
+                    if revision.get("instructions_broken_due_to_missing_data"):
+                        # This revision would be chosen, but would then be retried
+                        message_stream.retract()
+                        return
+
+                # The last revision failed its evaluation, and the next one hasn't started yet
+                message_stream.retract()
+
+            message_event_response = await self._schematic_generator.generate_streaming(
+                prompt=prompt,
+                on_partial_content=stream_revision,
+                hints={"temperature": temperature},
+            )
+        else:
+            message_event_response = await self._schematic_generator.generate(
+                prompt=prompt,
+                hints={"temperature": temperature},
+            )
 
         self._logger.trace(
             f"Completion:\n{message_event_response.content.model_dump_json(indent=2)}"
@@ -61,6 +61,13 @@ class OptimizationPolicy(ABC):
         """Gets the retry temperatures (and number of generation attempts) for guideline propositions."""
         ...
 
+    def get_retrieval_history_window(
+        self,
+        hints: Mapping[str, Any] = {},
+    ) -> int:
+        """Gets the number of most recent interaction events used to retrieve relevant entities (e.g., glossary terms)."""
+        return 30
+
 
 class BasicOptimizationPolicy(OptimizationPolicy):
     """A basic optimization policy that defines default behaviors for the engine."""
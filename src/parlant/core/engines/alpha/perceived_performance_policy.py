@@ -91,6 +91,39 @@ class PerceivedPerformancePolicy(ABC):
         """
         ...
 
+    async def is_message_streaming_enabled(
+        self,
+        context: LoadedContext | None = None,
+    ) -> bool:
+        """
+        Determines if a message should be streamed to the customer while it's being generated.
+
+        Streaming is opt-in, as the streamed text is only provisional: it's relayed over the
+        event stream (but not stored) ahead of the message event itself, and the final message
+        may still differ from it (e.g., when it's split up, or held back by a hook).
+
+        :param context: The loaded context containing session and interaction details.
+        :return: True if the message should be streamed, False otherwise.
+        """
+        return False
+
+    async def get_message_debounce_window(
+        self,
+        context: LoadedContext | None = None,
+    ) -> float:
+        """
+        Returns how long to wait after a customer message before starting to respond to it.
+
+        Customers often send a thought in several quick messages. Waiting for a short quiet
+        window lets them all be answered in one turn, rather than having every new message
+        cancel (and waste) the processing of the previous one. As the context holds the
+        agent, this can be tuned per agent. Debouncing is opt-in, as it delays every response.
+
+        :param context: The loaded context containing session and interaction details.
+        :return: The debounce window in seconds, or 0 to respond right away.
+        """
+        return 0.0
+
 
 class BasicPerceivedPerformancePolicy(PerceivedPerformancePolicy):
     """A default implementation of the perceived performance policy that uses reasonable, randomized delays."""
@@ -13,11 +13,13 @@
 # limitations under the License.
 
 from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum, auto
 from itertools import chain
 import json
-from typing import Any, Callable, Mapping, Optional, Sequence, cast
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence, TypeVar, cast
 
 from parlant.core.agents import Agent
 from parlant.core.capabilities import Capability
@@ -37,6 +39,9 @@ from parlant.core.guidelines import Guideline, GuidelineId
 from parlant.core.tools import ToolId
 
 
+_T = TypeVar("_T")
+
+
 class BuiltInSection(Enum):
     AGENT_IDENTITY = auto()
     CUSTOMER_IDENTITY = auto()
@@ -62,11 +67,74 @@ class SectionStatus(Enum):
     """The section is not included in the prompt in any fashion"""
 
 
+class SectionStability(Enum):
+    STATIC = auto()
+    """The section renders identically across calls, and may thus be served from a provider's prompt cache"""
+
+    DYNAMIC = auto()
+    """The section may change from one call to the next"""
+
+
 @dataclass(frozen=True)
 class PromptSection:
     template: str
     props: dict[str, Any]
     status: Optional[SectionStatus]
+    stability: SectionStability = SectionStability.DYNAMIC
+
+
+class PromptRenderCache:
+    """Memoizes the rendering of prompt material by the identity of the objects rendered.
+
+    The entities and events that make up a prompt are immutable, and the same instances
+    are shared by every batch prompted within a turn. Keeping a reference to the rendered
+    objects guarantees that their identities aren't reused while the cache is alive.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, tuple[int, ...]], tuple[Sequence[object], Any]] = {}
+
+    def get_or_render(
+        self,
+        kind: str,
+        objects: Sequence[object],
+        render: Callable[[], _T],
+    ) -> _T:
+        key = (kind, tuple(map(id, objects)))
+
+        if entry := self._entries.get(key):
+            return cast(_T, entry[1])
+
+        result = render()
+        self._entries[key] = (tuple(objects), result)
+
+        return result
+
+
+_render_cache = ContextVar[Optional[PromptRenderCache]]("prompt_render_cache", default=None)
+
+
+@contextmanager
+def shared_prompt_rendering() -> Iterator[PromptRenderCache]:
+    """Shares the rendering of prompt material among all prompts built within the context,
+    including those built by tasks spawned from it."""
+    if cache := _render_cache.get():
+        yield cache
+        return
+
+    cache = PromptRenderCache()
+    reset_token = _render_cache.set(cache)
+
+    try:
+        yield cache
+    finally:
+        _render_cache.reset(reset_token)
+
+
+def _render_shared(kind: str, objects: Sequence[object], render: Callable[[], _T]) -> _T:
+    if cache := _render_cache.get():
+        return cache.get_or_render(kind, objects, render)
+    return render()
 
 
 class PromptBuilder:
@@ -76,6 +144,10 @@ class PromptBuilder:
         self._on_build = on_build
         self._cached_results: set[str] = set()
 
+        # Wrappers along the way (caches, schedulers) may each need the prompt's text
+        # before the generator builds it again, so it's only rendered once per change
+        self._built: Optional[str] = None
+
     def _call_on_build(self, prompt: str) -> None:
         if prompt in self._cached_results:
             return
@@ -85,20 +157,54 @@ class PromptBuilder:
 
         self._cached_results.add(prompt)
 
+    def _ordered_sections(self) -> list[PromptSection]:
+        # Static sections lead the prompt (keeping their relative order), so that they
+        # form a prefix that stays byte-identical across calls and can be cached by providers
+        return sorted(
+            self.sections.values(),
+            key=lambda s: s.stability != SectionStability.STATIC,
+        )
+
     def build(self) -> str:
-        section_contents = [s.template.format(**s.props) for s in self.sections.values()]
+        if self._built is not None:
+            return self._built
+
+        section_contents = [s.template.format(**s.props) for s in self._ordered_sections()]
         prompt = "\n\n".join(section_contents)
+        self._built = prompt
 
         self._call_on_build(prompt)
 
         return prompt
 
+    def build_with_cacheable_prefix(self) -> tuple[str, str]:
+        """Builds the prompt, split into its static prefix and the rest of it,
+        such that concatenating the two yields the full prompt."""
+        prompt = self.build()
+
+        static_contents = [
+            s.template.format(**s.props)
+            for s in self.sections.values()
+            if s.stability == SectionStability.STATIC
+        ]
+
+        if not static_contents:
+            return "", prompt
+
+        prefix_length = len("\n\n".join(static_contents))
+
+        if len(static_contents) < len(self.sections):
+            prefix_length += len("\n\n")
+
+        return prompt[:prefix_length], prompt[prefix_length:]
+
     def add_section(
         self,
         name: str | BuiltInSection,
         template: str,
         props: dict[str, Any] = {},
         status: Optional[SectionStatus] = None,
+        stability: SectionStability = SectionStability.DYNAMIC,
     ) -> PromptBuilder:
         if name in self.sections:
             raise ValueError(f"Section '{name}' was already added")
@@ -107,7 +213,9 @@ class PromptBuilder:
             template=template,
             props=props,
             status=status,
+            stability=stability,
         )
+        self._built = None
 
         return self
 
@@ -118,6 +226,7 @@ class PromptBuilder:
     ) -> PromptBuilder:
         if name in self.sections:
             self.sections[name] = editor_func(self.sections[name])
+            self._built = None
         return self
 
     def section_status(self, name: str | BuiltInSection) -> SectionStatus:
@@ -196,6 +305,7 @@ The following is a description of your background and personality: ###
                     "agent_description": agent.description,
                 },
                 status=SectionStatus.ACTIVE,
+                stability=SectionStability.STATIC,
             )
 
         return self
@@ -235,7 +345,10 @@ Proceed with your task accordingly.
         staged_events: Sequence[EmittedEvent],
     ) -> list[str]:
         combined = list(events) + list(staged_events)
-        return [self.adapt_event(e) for e in combined if e.kind != EventKind.STATUS]
+        return [self._adapt_event_shared(e) for e in combined if e.kind != EventKind.STATUS]
+
+    def _adapt_event_shared(self, e: Event | EmittedEvent) -> str:
+        return _render_shared("event", (e,), lambda: self.adapt_event(e))
 
     def _last_agent_message_note(
         self,
@@ -311,7 +424,11 @@ Proceed with your task accordingly.
         variables: Sequence[tuple[ContextVariable, ContextVariableValue]],
     ) -> PromptBuilder:
         if variables:
-            context_values = context_variables_to_json(variables)
+            context_values = _render_shared(
+                "context_variables",
+                list(chain.from_iterable(variables)),
+                lambda: context_variables_to_json(variables),
+            )
 
             self.add_section(
                 name=BuiltInSection.CONTEXT_VARIABLES,
@@ -331,7 +448,11 @@ The following is information that you're given about the user and context of the
         terms: Sequence[Term],
     ) -> PromptBuilder:
         if terms:
-            terms_string = "\n".join(f"{i}) {repr(t)}" for i, t in enumerate(terms, start=1))
+            terms_string = _render_shared(
+                "glossary",
+                terms,
+                lambda: "\n".join(f"{i}) {repr(t)}" for i, t in enumerate(terms, start=1)),
+            )
 
             self.add_section(
                 name=BuiltInSection.GLOSSARY,
@@ -356,7 +477,7 @@ and let the user know if/when you assume they meant a term by their typo: ###
     ) -> PromptBuilder:
         if events:
             staged_events_as_dict = [
-                self.adapt_event(e) for e in events if e.kind == EventKind.TOOL
+                self._adapt_event_shared(e) for e in events if e.kind == EventKind.TOOL
             ]
 
             self.add_section(
@@ -375,6 +496,13 @@ Prioritize their data over any other sources and use their details to complete y
         return self
 
     def _create_capabilities_string(self, capabilities: Sequence[Capability]) -> str:
+        return _render_shared(
+            "capabilities",
+            capabilities,
+            lambda: self._render_capabilities(capabilities),
+        )
+
+    def _render_capabilities(self, capabilities: Sequence[Capability]) -> str:
         return "\n\n".join(
             [
                 f"""
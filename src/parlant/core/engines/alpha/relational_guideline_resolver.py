@@ -14,13 +14,15 @@
 
 from collections import defaultdict
 from itertools import chain
-from typing import Optional, Sequence, cast
+from typing import Mapping, Optional, Sequence, cast
 
 from parlant.core.common import JSONSerializable
 from parlant.core.journeys import Journey, JourneyId
 from parlant.core.loggers import Logger
 from parlant.core.engines.alpha.guideline_matching.guideline_match import GuidelineMatch
 from parlant.core.relationships import (
+    Relationship,
+    RelationshipEntityId,
     RelationshipEntityKind,
     RelationshipKind,
     RelationshipStore,
@@ -59,6 +61,44 @@ class RelationalGuidelineResolver:
 
         return None
 
+    async def _list_relationships_of_matches(
+        self,
+        matches: Sequence[GuidelineMatch],
+        kind: RelationshipKind,
+        reverse: bool,
+    ) -> Mapping[GuidelineId, Sequence[Relationship]]:
+        # Fetches the relationships of all matches (and of their journeys) in a single batch,
+        # as sources of the relationships, or as their targets if reversed
+        journey_tag_ids = {
+            m.guideline.id: Tag.for_journey_id(journey_id)
+            for m in matches
+            if (journey_id := self._extract_journey_id_from_guideline(m.guideline))
+        }
+
+        entity_ids: list[RelationshipEntityId] = [
+            *(m.guideline.id for m in matches),
+            *journey_tag_ids.values(),
+        ]
+
+        relationships_by_entity = await self._relationship_store.list_relationships_for_many(
+            kind=kind,
+            indirect=True,
+            source_ids=[] if reverse else entity_ids,
+            target_ids=entity_ids if reverse else [],
+        )
+
+        return {
+            m.guideline.id: [
+                *relationships_by_entity[m.guideline.id],
+                *(
+                    relationships_by_entity[journey_tag_ids[m.guideline.id]]
+                    if m.guideline.id in journey_tag_ids
+                    else []
+                ),
+            ]
+            for m in matches
+        }
+
     async def resolve(
         self,
         usable_guidelines: Sequence[Guideline],
@@ -101,27 +141,18 @@ class RelationalGuidelineResolver:
         # and those are the ones we are loading here.
         match_guideline_ids = {m.guideline.id for m in matches}
 
+        priority_relationships_by_target = await self._list_relationships_of_matches(
+            matches,
+            kind=RelationshipKind.PRIORITY,
+            reverse=True,
+        )
+
         iterated_guidelines: set[GuidelineId] = set()
 
         result = []
 
         for match in matches:
-            priority_relationships = list(
-                await self._relationship_store.list_relationships(
-                    kind=RelationshipKind.PRIORITY,
-                    indirect=True,
-                    target_id=match.guideline.id,
-                )
-            )
-
-            if journey_id := self._extract_journey_id_from_guideline(match.guideline):
-                priority_relationships.extend(
-                    await self._relationship_store.list_relationships(
-                        kind=RelationshipKind.PRIORITY,
-                        indirect=True,
-                        target_id=Tag.for_journey_id(journey_id),
-                    )
-                )
+            priority_relationships = list(priority_relationships_by_target[match.guideline.id])
 
             if not priority_relationships:
                 result.append(match)
@@ -169,19 +200,21 @@ class RelationalGuidelineResolver:
                         deprioritized = True
                         break
 
-                    for g in guideline_associated_with_prioritized_tag:
-                        # In case we already iterated over this guideline,
-                        # we don't need to iterate over it again.
-                        if g.id in iterated_guidelines or g.id in match_guideline_ids:
-                            continue
-
-                        priority_relationships.extend(
-                            await self._relationship_store.list_relationships(
-                                kind=RelationshipKind.PRIORITY,
-                                indirect=True,
-                                target_id=g.id,
-                            )
+                    # In case we already iterated over a guideline,
+                    # we don't need to iterate over it again.
+                    for relationships in (
+                        await self._relationship_store.list_relationships_for_many(
+                            kind=RelationshipKind.PRIORITY,
+                            indirect=True,
+                            target_ids=[
+                                g.id
+                                for g in guideline_associated_with_prioritized_tag
+                                if g.id not in iterated_guidelines
+                                and g.id not in match_guideline_ids
+                            ],
                         )
+                    ).values():
+                        priority_relationships.extend(relationships)
 
                     iterated_guidelines.update(
                         g.id
@@ -231,14 +264,14 @@ class RelationalGuidelineResolver:
 
         match_guideline_ids = {m.guideline.id for m in matches}
 
+        entailments_by_source = await self._relationship_store.list_relationships_for_many(
+            kind=RelationshipKind.ENTAILMENT,
+            indirect=True,
+            source_ids=list(match_guideline_ids),
+        )
+
         for match in matches:
-            relationships = list(
-                await self._relationship_store.list_relationships(
-                    kind=RelationshipKind.ENTAILMENT,
-                    indirect=True,
-                    source_id=match.guideline.id,
-                )
-            )
+            relationships = list(entailments_by_source[match.guideline.id])
 
             while relationships:
                 relationship = relationships.pop()
@@ -263,14 +296,14 @@ class RelationalGuidelineResolver:
                     )
 
                     # Add all the relationships for the related guidelines to the stack
-                    for g in guidelines_associated_to_tag:
-                        relationships.extend(
-                            await self._relationship_store.list_relationships(
-                                kind=RelationshipKind.ENTAILMENT,
-                                indirect=True,
-                                source_id=g.id,
-                            )
+                    for related_relationships in (
+                        await self._relationship_store.list_relationships_for_many(
+                            kind=RelationshipKind.ENTAILMENT,
+                            indirect=True,
+                            source_ids=[g.id for g in guidelines_associated_to_tag],
                         )
+                    ).values():
+                        relationships.extend(related_relationships)
 
         match_and_inferred_guideline_pairs: list[tuple[GuidelineMatch, Guideline]] = []
 
@@ -331,25 +364,16 @@ class RelationalGuidelineResolver:
         # and S is depends on T, then S should not be activated unless T is activated.
         matched_guideline_ids = {m.guideline.id for m in matches}
 
+        dependencies_by_source = await self._list_relationships_of_matches(
+            matches,
+            kind=RelationshipKind.DEPENDENCY,
+            reverse=False,
+        )
+
         result: list[GuidelineMatch] = []
 
         for match in matches:
-            dependencies = list(
-                await self._relationship_store.list_relationships(
-                    kind=RelationshipKind.DEPENDENCY,
-                    indirect=True,
-                    source_id=match.guideline.id,
-                )
-            )
-
-            if journey_id := self._extract_journey_id_from_guideline(match.guideline):
-                dependencies.extend(
-                    await self._relationship_store.list_relationships(
-                        kind=RelationshipKind.DEPENDENCY,
-                        indirect=True,
-                        source_id=Tag.for_journey_id(journey_id),
-                    )
-                )
+            dependencies = list(dependencies_by_source[match.guideline.id])
 
             if not dependencies:
                 result.append(match)
@@ -388,14 +412,21 @@ class RelationalGuidelineResolver:
                             dependent_on_inactive_guidelines = True
                             break
 
-                        if g.id not in iterated_guidelines:
-                            dependencies.extend(
-                                await self._relationship_store.list_relationships(
-                                    kind=RelationshipKind.DEPENDENCY,
-                                    indirect=True,
-                                    source_id=g.id,
-                                )
-                            )
+                    if dependent_on_inactive_guidelines:
+                        break
+
+                    for tag_guideline_dependencies in (
+                        await self._relationship_store.list_relationships_for_many(
+                            kind=RelationshipKind.DEPENDENCY,
+                            indirect=True,
+                            source_ids=[
+                                g.id
+                                for g in guidelines_associated_to_tag
+                                if g.id not in iterated_guidelines
+                            ],
+                        )
+                    ).values():
+                        dependencies.extend(tag_guideline_dependencies)
 
                     iterated_guidelines.update(g.id for g in guidelines_associated_to_tag)
 
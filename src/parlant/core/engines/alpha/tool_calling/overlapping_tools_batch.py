@@ -24,7 +24,12 @@ from parlant.core.emissions import EmittedEvent
 from parlant.core.engines.alpha.guideline_matching.generic.common import internal_representation
 from parlant.core.engines.alpha.guideline_matching.guideline_match import GuidelineMatch
 from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
-from parlant.core.engines.alpha.prompt_builder import BuiltInSection, PromptBuilder, SectionStatus
+from parlant.core.engines.alpha.prompt_builder import (
+    BuiltInSection,
+    PromptBuilder,
+    SectionStability,
+    SectionStatus,
+)
 from parlant.core.glossary import Term
 from parlant.core.journeys import Journey
 from parlant.core.loggers import Logger
@@ -32,7 +37,7 @@ from parlant.core.nlp.generation import SchematicGenerator
 from parlant.core.nlp.generation_info import GenerationInfo
 from parlant.core.services.tools.service_registry import ServiceRegistry
 from parlant.core.sessions import Event, EventKind
-from parlant.core.shots import Shot, ShotCollection
+from parlant.core.shots import Shot, ShotCollection, memoized_shot_formatting
 from dataclasses import dataclass
 from parlant.core.engines.alpha.tool_calling.tool_caller import (
     ToolCallEvaluation,
@@ -362,6 +367,7 @@ Please be tolerant of possible typos by the user with regards to these terms,and
 ###
 """  # noqa
 
+    @memoized_shot_formatting
     def _format_shots(
         self,
         shots: Sequence[OverlappingToolsBatchShot],
@@ -421,6 +427,7 @@ These calls do not require to be re-run at this time, unless you identify a vali
 
 """,
             props={},
+            stability=SectionStability.STATIC,
         )
         builder.add_agent_identity(agent)
         builder.add_section(
@@ -454,6 +461,7 @@ Only the responses are provided, without the interaction history or tool descrip
 
 """,
             props={},
+            stability=SectionStability.STATIC,
         )
         builder.add_section(
             name="tool-caller-examples",
@@ -463,6 +471,7 @@ EXAMPLES
 {formatted_shots}
 """,
             props={"formatted_shots": self._format_shots(shots), "shots": shots},
+            stability=SectionStability.STATIC,
         )
         builder.add_context_variables(context_variables)
         if terms:
@@ -28,7 +28,12 @@ from parlant.core.emissions import EmittedEvent
 from parlant.core.engines.alpha.guideline_matching.generic.common import internal_representation
 from parlant.core.engines.alpha.guideline_matching.guideline_match import GuidelineMatch
 from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
-from parlant.core.engines.alpha.prompt_builder import BuiltInSection, PromptBuilder, SectionStatus
+from parlant.core.engines.alpha.prompt_builder import (
+    BuiltInSection,
+    PromptBuilder,
+    SectionStability,
+    SectionStatus,
+)
 from parlant.core.engines.alpha.tool_calling.tool_caller import (
     ToolCallEvaluation,
     MissingToolData,
@@ -48,7 +53,7 @@ from parlant.core.nlp.generation import SchematicGenerator
 from parlant.core.nlp.generation_info import GenerationInfo
 from parlant.core.services.tools.service_registry import ServiceRegistry
 from parlant.core.sessions import Event, EventKind
-from parlant.core.shots import Shot, ShotCollection
+from parlant.core.shots import Shot, ShotCollection, memoized_shot_formatting
 from parlant.core.tools import Tool, ToolId, ToolParameterDescriptor, ToolParameterOptions
 
 
@@ -389,6 +394,7 @@ Please be tolerant of possible typos by the user with regards to these terms,and
     async def shots(self) -> Sequence[SingleToolBatchShot]:
         return await shot_collection.list()
 
+    @memoized_shot_formatting
     def _format_shots(
         self,
         shots: Sequence[SingleToolBatchShot],
@@ -449,6 +455,7 @@ These calls do not require to be re-run at this time, unless you identify a vali
 
 """,
             props={},
+            stability=SectionStability.STATIC,
         )
         builder.add_agent_identity(agent)
         builder.add_section(
@@ -478,6 +485,7 @@ Only the responses are provided, without the interaction history or tool descrip
 
 """,
             props={},
+            stability=SectionStability.STATIC,
         )
         builder.add_section(
             name="tool-caller-examples",
@@ -487,6 +495,7 @@ EXAMPLES
 {formatted_shots}
 """,
             props={"formatted_shots": self._format_shots(shots), "shots": shots},
+            stability=SectionStability.STATIC,
         )
         builder.add_context_variables(context_variables)
         if terms:
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from itertools import chain
-from typing import Mapping, Optional, Sequence, cast
+from typing import Any, Awaitable, Callable, Hashable, Mapping, Optional, Sequence, TypeVar, cast
 
 from cachetools import TTLCache
 
@@ -49,6 +49,8 @@ from parlant.core.guideline_tool_associations import (
     GuidelineToolAssociationStore,
 )
 from parlant.core.glossary import GlossaryStore, Term
+from parlant.core.persistence.common import RevisionedStore
+from parlant.core.persistence.vector_database_helper import RetrievalQuery
 from parlant.core.sessions import (
     SessionId,
     Session,
@@ -63,6 +65,17 @@ from parlant.core.tags import Tag
 from parlant.core.tools import ToolId, ToolService
 from parlant.core.canned_responses import CannedResponse, CannedResponseStore
 
+R = TypeVar("R")
+
+
+class _ConfigurationSnapshot:
+    """Memoized configuration reads, valid for as long as the configuration stores aren't written to."""
+
+    def __init__(self, version: int, revisions: tuple[int, ...]) -> None:
+        self.version = version
+        self.revisions = revisions
+        self.entries: dict[Hashable, Any] = {}
+
 
 class EntityQueries:
     def __init__(
@@ -99,11 +112,105 @@ class EntityQueries:
             maxsize=1024, ttl=120
         )
 
+        self._configuration_stores = (
+            agent_store,
+            guideline_store,
+            relationship_store,
+            guideline_tool_association_store,
+            glossary_store,
+            journey_store,
+            canned_response_store,
+            capability_store,
+        )
+
+        # We can only tell that the configuration hasn't changed if every store reports its writes
+        self._snapshots_enabled = all(
+            isinstance(store, RevisionedStore) for store in self._configuration_stores
+        )
+        self._snapshot: Optional[_ConfigurationSnapshot] = None
+
+    @property
+    def configuration_version(self) -> Optional[int]:
+        """A number that increases whenever the agents' configuration changes, if it can be tracked."""
+        if snapshot := self._current_snapshot():
+            return snapshot.version
+        return None
+
+    def _current_snapshot(self) -> Optional[_ConfigurationSnapshot]:
+        if not self._snapshots_enabled:
+            return None
+
+        revisions = tuple(
+            cast(RevisionedStore, store).revision for store in self._configuration_stores
+        )
+
+        if self._snapshot is None:
+            self._snapshot = _ConfigurationSnapshot(version=1, revisions=revisions)
+        elif self._snapshot.revisions != revisions:
+            # Swap in a fresh snapshot; reads still in flight fill the stale one, which is dropped
+            self._snapshot = _ConfigurationSnapshot(
+                version=self._snapshot.version + 1,
+                revisions=revisions,
+            )
+
+        return self._snapshot
+
+    async def _memoized(self, key: Hashable, read: Callable[[], Awaitable[R]]) -> R:
+        if (snapshot := self._current_snapshot()) is None:
+            return await read()
+
+        if key not in snapshot.entries:
+            snapshot.entries[key] = await read()
+
+        return cast(R, snapshot.entries[key])
+
+    async def _list_guidelines_for_agent(self, agent_id: AgentId) -> Sequence[Guideline]:
+        async def read() -> Sequence[Guideline]:
+            agent = await self.read_agent(agent_id)
+
+            agent_guidelines = await self._guideline_store.list_guidelines(
+                tags=[Tag.for_agent_id(agent_id)],
+            )
+            global_guidelines = await self._guideline_store.list_guidelines(tags=[])
+            guidelines_for_agent_tags = await self._guideline_store.list_guidelines(
+                tags=[tag for tag in agent.tags]
+            )
+
+            return list(set(chain(agent_guidelines, global_guidelines, guidelines_for_agent_tags)))
+
+        return await self._memoized(("guidelines", agent_id), read)
+
+    async def _list_guidelines_for_journey(self, journey_id: JourneyId) -> Sequence[Guideline]:
+        return await self._memoized(
+            ("journey_guidelines", journey_id),
+            lambda: self._guideline_store.list_guidelines(tags=[Tag.for_journey_id(journey_id)]),
+        )
+
+    async def _list_canned_responses_for_journey(
+        self,
+        journey_id: JourneyId,
+    ) -> Sequence[CannedResponse]:
+        return await self._memoized(
+            ("journey_canned_responses", journey_id),
+            lambda: self._canned_response_store.list_canned_responses(
+                tags=[Tag.for_journey_id(journey_id)]
+            ),
+        )
+
+    async def _project_journey_to_guidelines(self, journey_id: JourneyId) -> Sequence[Guideline]:
+        return await self._memoized(
+            ("journey_projection", journey_id),
+            lambda: self._journey_guideline_projection.project_journey_to_guidelines(journey_id),
+        )
+
     async def read_agent(
         self,
         agent_id: AgentId,
     ) -> Agent:
-        return await self._agent_store.read_agent(agent_id)
+        return await self._memoized(
+            ("agent", agent_id),
+            lambda: self._agent_store.read_agent(agent_id),
+        )
 
     async def read_session(
         self,
@@ -122,32 +229,20 @@ class EntityQueries:
         agent_id: AgentId,
         journeys: Sequence[Journey],
     ) -> Sequence[Guideline]:
-        agent_guidelines = await self._guideline_store.list_guidelines(
-            tags=[Tag.for_agent_id(agent_id)],
-        )
-        global_guidelines = await self._guideline_store.list_guidelines(tags=[])
+        agent_guidelines = await self._list_guidelines_for_agent(agent_id)
 
-        agent = await self._agent_store.read_agent(agent_id)
-        guidelines_for_agent_tags = await self._guideline_store.list_guidelines(
-            tags=[tag for tag in agent.tags]
+        guidelines_for_journeys = await async_utils.safe_gather(
+            *(self._list_guidelines_for_journey(journey.id) for journey in journeys)
         )
 
-        guidelines_for_journeys = await self._guideline_store.list_guidelines(
-            tags=[Tag.for_journey_id(journey.id) for journey in journeys]
+        projected_journey_guidelines = await async_utils.safe_gather(
+            *(self._project_journey_to_guidelines(journey.id) for journey in journeys)
         )
 
-        tasks = [
-            self._journey_guideline_projection.project_journey_to_guidelines(journey.id)
-            for journey in journeys
-        ]
-        projected_journey_guidelines = await async_utils.safe_gather(*tasks)
-
         all_guidelines = set(
             chain(
                 agent_guidelines,
-                global_guidelines,
-                guidelines_for_agent_tags,
-                guidelines_for_journeys,
+                *guidelines_for_journeys,
                 *projected_journey_guidelines,
             )
         )
@@ -198,12 +293,7 @@ class EntityQueries:
 
             self.find_journeys_on_which_this_guideline_depends[id] = journeys
 
-        guideline_ids.update(
-            g.id
-            for g in await self._journey_guideline_projection.project_journey_to_guidelines(
-                journey.id
-            )
-        )
+        guideline_ids.update(g.id for g in await self._project_journey_to_guidelines(journey.id))
 
         return list(guideline_ids)
 
@@ -245,40 +335,53 @@ class EntityQueries:
     async def find_guideline_tool_associations(
         self,
     ) -> Sequence[GuidelineToolAssociation]:
-        return await self._guideline_tool_association_store.list_associations()
+        return await self._memoized(
+            "guideline_tool_associations",
+            self._guideline_tool_association_store.list_associations,
+        )
 
     async def find_journey_node_tool_associations(
         self,
         node_id: JourneyNodeId,
     ) -> Sequence[ToolId]:
-        return (await self._journey_store.read_node(node_id=node_id)).tools
+        node = await self._memoized(
+            ("journey_node", node_id),
+            lambda: self._journey_store.read_node(node_id=node_id),
+        )
+
+        return node.tools
 
     async def find_capabilities_for_agent(
         self,
         agent_id: AgentId,
-        query: str,
+        query: RetrievalQuery,
         max_count: int,
     ) -> Sequence[Capability]:
-        agent_capabilities = await self._capability_store.list_capabilities(
-            tags=[Tag.for_agent_id(agent_id)],
-        )
-        global_capabilities = await self._capability_store.list_capabilities(tags=[])
-        agent = await self._agent_store.read_agent(agent_id)
-        capabilities_for_agent_tags = await self._capability_store.list_capabilities(
-            tags=[tag for tag in agent.tags]
-        )
+        async def read() -> Sequence[Capability]:
+            agent_capabilities = await self._capability_store.list_capabilities(
+                tags=[Tag.for_agent_id(agent_id)],
+            )
+            global_capabilities = await self._capability_store.list_capabilities(tags=[])
+            agent = await self.read_agent(agent_id)
+            capabilities_for_agent_tags = await self._capability_store.list_capabilities(
+                tags=[tag for tag in agent.tags]
+            )
 
-        all_capabilities = set(
-            chain(
-                agent_capabilities,
-                global_capabilities,
-                capabilities_for_agent_tags,
+            return list(
+                set(
+                    chain(
+                        agent_capabilities,
+                        global_capabilities,
+                        capabilities_for_agent_tags,
+                    )
+                )
             )
-        )
+
+        all_capabilities = await self._memoized(("capabilities", agent_id), read)
 
         result = await self._capability_store.find_relevant_capabilities(
             query,
-            list(all_capabilities),
+            all_capabilities,
             max_count=max_count,
         )
 
@@ -287,20 +390,23 @@ class EntityQueries:
     async def find_glossary_terms_for_context(
         self,
         agent_id: AgentId,
-        query: str,
+        query: RetrievalQuery,
     ) -> Sequence[Term]:
-        agent_terms = await self._glossary_store.list_terms(
-            tags=[Tag.for_agent_id(agent_id)],
-        )
-        global_terms = await self._glossary_store.list_terms(tags=[])
-        agent = await self._agent_store.read_agent(agent_id)
-        glossary_for_agent_tags = await self._glossary_store.list_terms(
-            tags=[tag for tag in agent.tags]
-        )
+        async def read() -> Sequence[Term]:
+            agent_terms = await self._glossary_store.list_terms(
+                tags=[Tag.for_agent_id(agent_id)],
+            )
+            global_terms = await self._glossary_store.list_terms(tags=[])
+            agent = await self.read_agent(agent_id)
+            glossary_for_agent_tags = await self._glossary_store.list_terms(
+                tags=[tag for tag in agent.tags]
+            )
+
+            return list(set(chain(agent_terms, global_terms, glossary_for_agent_tags)))
 
-        all_terms = set(chain(agent_terms, global_terms, glossary_for_agent_tags))
+        all_terms = await self._memoized(("glossary", agent_id), read)
 
-        return await self._glossary_store.find_relevant_terms(query, list(all_terms))
+        return await self._glossary_store.find_relevant_terms(query, all_terms)
 
     async def read_tool_service(
         self,
@@ -312,24 +418,27 @@ class EntityQueries:
         self,
         agent_id: AgentId,
     ) -> Sequence[Journey]:
-        agent_journeys = await self._journey_store.list_journeys(
-            tags=[Tag.for_agent_id(agent_id)],
-        )
-        global_journeys = await self._journey_store.list_journeys(tags=[])
+        async def read() -> Sequence[Journey]:
+            agent_journeys = await self._journey_store.list_journeys(
+                tags=[Tag.for_agent_id(agent_id)],
+            )
+            global_journeys = await self._journey_store.list_journeys(tags=[])
 
-        agent = await self._agent_store.read_agent(agent_id)
-        journeys_for_agent_tags = (
-            await self._journey_store.list_journeys(tags=[tag for tag in agent.tags])
-            if agent.tags
-            else []
-        )
+            agent = await self.read_agent(agent_id)
+            journeys_for_agent_tags = (
+                await self._journey_store.list_journeys(tags=[tag for tag in agent.tags])
+                if agent.tags
+                else []
+            )
+
+            return list(set(chain(agent_journeys, global_journeys, journeys_for_agent_tags)))
 
-        return list(set(chain(agent_journeys, global_journeys, journeys_for_agent_tags)))
+        return list(await self._memoized(("journeys", agent_id), read))
 
     async def sort_journeys_by_contextual_relevance(
         self,
         available_journeys: Sequence[Journey],
-        query: str,
+        query: RetrievalQuery,
     ) -> Sequence[Journey]:
         return await self._journey_store.find_relevant_journeys(
             query=query,
@@ -343,17 +452,22 @@ class EntityQueries:
         journeys: Sequence[Journey],
         guidelines: Sequence[Guideline],
     ) -> Sequence[CannedResponse]:
-        agent_canreps = await self._canned_response_store.list_canned_responses(
-            tags=[Tag.for_agent_id(agent.id)],
-        )
-        global_canreps = await self._canned_response_store.list_canned_responses(tags=[])
+        async def read_agent_canreps() -> Sequence[CannedResponse]:
+            agent_canreps = await self._canned_response_store.list_canned_responses(
+                tags=[Tag.for_agent_id(agent.id)],
+            )
+            global_canreps = await self._canned_response_store.list_canned_responses(tags=[])
 
-        canreps_for_agent_tags = await self._canned_response_store.list_canned_responses(
-            tags=[tag for tag in agent.tags]
-        )
+            canreps_for_agent_tags = await self._canned_response_store.list_canned_responses(
+                tags=[tag for tag in agent.tags]
+            )
+
+            return list(set(chain(agent_canreps, global_canreps, canreps_for_agent_tags)))
+
+        agent_canreps = await self._memoized(("canned_responses", agent.id), read_agent_canreps)
 
-        journey_canreps = await self._canned_response_store.list_canned_responses(
-            tags=[Tag.for_journey_id(journey.id) for journey in journeys]
+        journey_canreps = await async_utils.safe_gather(
+            *(self._list_canned_responses_for_journey(journey.id) for journey in journeys)
         )
 
         guideline_canreps = await self.find_canned_responses_for_guidelines(guidelines)
@@ -361,9 +475,7 @@ class EntityQueries:
         all_canreps = set(
             chain(
                 agent_canreps,
-                global_canreps,
-                canreps_for_agent_tags,
-                journey_canreps,
+                *journey_canreps,
                 guideline_canreps,
             )
         )
@@ -472,10 +584,8 @@ class EntityQueries:
                     )
 
                     if journey_id in active_journeys_mapping:
-                        projected_journey_guidelines = (
-                            await self._journey_guideline_projection.project_journey_to_guidelines(
-                                journey_id
-                            )
+                        projected_journey_guidelines = await self._project_journey_to_guidelines(
+                            journey_id
                         )
 
                         guidelines.extend(projected_journey_guidelines)
@@ -15,11 +15,9 @@
 from abc import abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from itertools import chain
 from typing import Awaitable, Callable, NewType, Optional, Sequence, TypedDict, cast
 from typing_extensions import override, Self, Required
 
-from parlant.core import async_utils
 from parlant.core.async_utils import ReaderWriterLock
 from parlant.core.common import ItemNotFoundError, Version, IdGenerator, UniqueId, md5_checksum
 from parlant.core.persistence.common import ObjectId, Where
@@ -30,9 +28,12 @@ from parlant.core.persistence.vector_database import (
     VectorDatabase,
 )
 from parlant.core.persistence.vector_database_helper import (
+    RetrievalQuery,
     VectorDocumentMigrationHelper,
     VectorDocumentStoreMigrationHelper,
-    query_chunks,
+    closest_unique_documents,
+    weigh_similar_documents,
+    weighted_query_chunks,
 )
 from parlant.core.persistence.document_database import (
     DocumentCollection,
@@ -40,6 +41,7 @@ from parlant.core.persistence.document_database import (
     BaseDocument,
 )
 from parlant.core.persistence.document_database_helper import DocumentStoreMigrationHelper
+from parlant.core.persistence.tag_index import TagIndex
 from parlant.core.tags import TagId
 
 
@@ -110,7 +112,7 @@ class GlossaryStore:
     @abstractmethod
     async def find_relevant_terms(
         self,
-        query: str,
+        query: RetrievalQuery,
         available_terms: Sequence[Term],
         max_terms: int = 20,
     ) -> Sequence[Term]: ...
@@ -181,6 +183,7 @@ class GlossaryVectorStore(GlossaryStore):
 
         self._collection: VectorCollection[_TermDocument]
         self._association_collection: DocumentCollection[TermTagAssociationDocument]
+        self._tag_index = TagIndex()
 
         self._allow_migration = allow_migration
 
@@ -236,6 +239,13 @@ class GlossaryVectorStore(GlossaryStore):
                 document_loader=self._association_document_loader,
             )
 
+        self._tag_index = TagIndex(
+            entity_ids=[d["id"] for d in await self._collection.find({})],
+            associations=[
+                (d["term_id"], d["tag_id"]) for d in await self._association_collection.find({})
+            ],
+        )
+
         return self
 
     async def __aexit__(
@@ -264,19 +274,20 @@ class GlossaryVectorStore(GlossaryStore):
         )
 
     async def _deserialize(self, term_document: _TermDocument) -> Term:
-        tags = await self._association_collection.find(
-            filters={"term_id": {"$eq": term_document["id"]}}
-        )
-
         return Term(
             id=TermId(term_document["id"]),
             creation_utc=datetime.fromisoformat(term_document["creation_utc"]),
             name=term_document["name"],
             description=term_document["description"],
             synonyms=term_document["synonyms"].split(", ") if term_document["synonyms"] else [],
-            tags=[TagId(t["tag_id"]) for t in tags],
+            tags=[TagId(t) for t in self._tag_index.tags_of(term_document["id"])],
         )
 
+    @property
+    def revision(self) -> int:
+        """A number that increases whenever the store is written to."""
+        return self._lock.write_count
+
     @override
     async def create_term(
         self,
@@ -314,6 +325,8 @@ class GlossaryVectorStore(GlossaryStore):
                 )
             )
 
+            self._tag_index.add_entity(term.id)
+
             for tag_id in tags or []:
                 tag_checksum = md5_checksum(f"{term.id}{tag_id}")
 
@@ -326,6 +339,9 @@ class GlossaryVectorStore(GlossaryStore):
                         "tag_id": tag_id,
                     }
                 )
+
+                self._tag_index.add_tag(term.id, tag_id)
+
         return term
 
     @override
@@ -387,34 +403,9 @@ class GlossaryVectorStore(GlossaryStore):
         self,
         tags: Optional[Sequence[TagId]] = None,
     ) -> Sequence[Term]:
-        filters: Where = {}
-
         async with self._lock.reader_lock:
-            if tags is not None:
-                if len(tags) == 0:
-                    term_ids = {
-                        doc["term_id"]
-                        for doc in await self._association_collection.find(filters={})
-                    }
-                    if not term_ids:
-                        filters = {}
-                    elif len(term_ids) == 1:
-                        filters = {"id": {"$ne": term_ids.pop()}}
-                    else:
-                        filters = {"$and": [{"id": {"$ne": id}} for id in term_ids]}
-
-                else:
-                    tag_filters: Where = {"$or": [{"tag_id": {"$eq": tag}} for tag in tags]}
-                    tag_associations = await self._association_collection.find(filters=tag_filters)
-                    term_ids = {assoc["term_id"] for assoc in tag_associations}
-
-                    if not term_ids:
-                        return []
-
-                    if len(term_ids) == 1:
-                        filters = {"id": {"$eq": term_ids.pop()}}
-                    else:
-                        filters = {"$or": [{"id": {"$eq": id}} for id in term_ids]}
+            if (filters := self._tag_index.filters_for(tags)) is None:
+                return []
 
             return [
                 await self._deserialize(d) for d in await self._collection.find(filters=filters)
@@ -427,23 +418,19 @@ class GlossaryVectorStore(GlossaryStore):
     ) -> None:
         async with self._lock.writer_lock:
             term_document = await self._collection.find_one(filters={"id": {"$eq": term_id}})
-            term_tag_associations = await self._association_collection.find(
-                filters={"term_id": {"$eq": term_id}}
-            )
 
             if not term_document:
                 raise ItemNotFoundError(item_id=UniqueId(term_id))
 
             await self._collection.delete_one(filters={"id": {"$eq": term_id}})
-            for tag_association in term_tag_associations:
-                await self._association_collection.delete_one(
-                    filters={"id": {"$eq": tag_association["id"]}}
-                )
+            await self._association_collection.delete_many(filters={"term_id": {"$eq": term_id}})
+
+            self._tag_index.remove_entity(term_id)
 
     @override
     async def find_relevant_terms(
         self,
-        query: str,
+        query: RetrievalQuery,
         available_terms: Sequence[Term],
         max_terms: int = 20,
     ) -> Sequence[Term]:
@@ -451,22 +438,21 @@ class GlossaryVectorStore(GlossaryStore):
             return []
 
         async with self._lock.reader_lock:
-            queries = await query_chunks(query, self._embedder)
+            chunks = await weighted_query_chunks(query, self._embedder)
 
             filters: Where = {"id": {"$in": [str(t.id) for t in available_terms]}}
 
-            tasks = [
-                self._collection.find_similar_documents(
-                    filters=filters,
-                    query=q,
-                    k=max_terms,
-                )
-                for q in queries
-            ]
+            similar_documents = self._collection.find_similar_documents_for_queries(
+                filters=filters,
+                queries=[chunk for chunk, _ in chunks],
+                k=max_terms,
+            )
 
-        all_results = chain.from_iterable(await async_utils.safe_gather(*tasks))
-        unique_results = list(set(all_results))
-        top_results = sorted(unique_results, key=lambda r: r.distance)[:max_terms]
+        all_results = weigh_similar_documents(
+            await similar_documents,
+            [weight for _, weight in chunks],
+        )
+        top_results = closest_unique_documents(all_results)[:max_terms]
 
         return [await self._deserialize(r.document) for r in top_results]
 
@@ -511,6 +497,8 @@ class GlossaryVectorStore(GlossaryStore):
 
             _ = await self._association_collection.insert_one(document=association_document)
 
+            self._tag_index.add_tag(term_id, tag_id)
+
             term_document = await self._collection.find_one({"id": {"$eq": term_id}})
 
         if not term_document:
@@ -535,6 +523,8 @@ class GlossaryVectorStore(GlossaryStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._tag_index.remove_tag(term_id, tag_id)
+
             term_document = await self._collection.find_one({"id": {"$eq": term_id}})
 
         if not term_document:
@@ -147,6 +147,11 @@ class GuidelineToolAssociationDocumentStore(GuidelineToolAssociationStore):
             tool_id=ToolId.from_string(association_document["tool_id"]),
         )
 
+    @property
+    def revision(self) -> int:
+        """A number that increases whenever the store is written to."""
+        return self._lock.write_count
+
     @override
     async def create_association(
         self,
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from typing import Mapping, NewType, Optional, Sequence, cast
-from typing_extensions import override, TypedDict, Self
+from typing_extensions import override, Required, TypedDict, Self
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -37,6 +37,7 @@ from parlant.core.persistence.document_database_helper import (
     DocumentStoreMigrationHelper,
     DocumentMigrationHelper,
 )
+from parlant.core.persistence.tag_index import TagIndex
 from parlant.core.tags import TagId
 
 GuidelineId = NewType("GuidelineId", str)
@@ -71,6 +72,14 @@ class Guideline:
         return hash(self.id)
 
 
+class GuidelineCreationParams(TypedDict, total=False):
+    condition: Required[str]
+    action: Optional[str]
+    metadata: Mapping[str, JSONSerializable]
+    enabled: bool
+    tags: Sequence[TagId]
+
+
 class GuidelineUpdateParams(TypedDict, total=False):
     condition: str
     action: Optional[str]
@@ -90,6 +99,15 @@ class GuidelineStore(ABC):
         tags: Optional[Sequence[TagId]] = None,
     ) -> Guideline: ...
 
+    @abstractmethod
+    async def create_guidelines(
+        self,
+        guidelines: Sequence[GuidelineCreationParams],
+        creation_utc: Optional[datetime] = None,
+    ) -> Sequence[Guideline]:
+        """Creates all of the given guidelines at once, returning them in the same order."""
+        ...
+
     @abstractmethod
     async def list_guidelines(
         self,
@@ -225,6 +243,7 @@ class GuidelineDocumentStore(GuidelineStore):
         self._database = database
         self._collection: DocumentCollection[GuidelineDocument]
         self._tag_association_collection: DocumentCollection[GuidelineTagAssociationDocument]
+        self._tag_index = TagIndex()
 
         self._allow_migration = allow_migration
         self._lock = ReaderWriterLock()
@@ -292,6 +311,14 @@ class GuidelineDocumentStore(GuidelineStore):
                 document_loader=self._association_document_loader,
             )
 
+        self._tag_index = TagIndex(
+            entity_ids=[d["id"] for d in await self._collection.find({})],
+            associations=[
+                (d["guideline_id"], d["tag_id"])
+                for d in await self._tag_association_collection.find({})
+            ],
+        )
+
         return self
 
     async def __aexit__(
@@ -320,12 +347,7 @@ class GuidelineDocumentStore(GuidelineStore):
         self,
         guideline_document: GuidelineDocument,
     ) -> Guideline:
-        tag_ids = [
-            d["tag_id"]
-            for d in await self._tag_association_collection.find(
-                {"guideline_id": {"$eq": guideline_document["id"]}}
-            )
-        ]
+        tag_ids = self._tag_index.tags_of(guideline_document["id"])
 
         return Guideline(
             id=GuidelineId(guideline_document["id"]),
@@ -338,6 +360,11 @@ class GuidelineDocumentStore(GuidelineStore):
             metadata=guideline_document["metadata"],
         )
 
+    @property
+    def revision(self) -> int:
+        """A number that increases whenever the store is written to."""
+        return self._lock.write_count
+
     @override
     async def create_guideline(
         self,
@@ -348,74 +375,89 @@ class GuidelineDocumentStore(GuidelineStore):
         enabled: bool = True,
         tags: Optional[Sequence[TagId]] = None,
     ) -> Guideline:
+        guidelines = await self.create_guidelines(
+            [
+                {
+                    "condition": condition,
+                    "action": action,
+                    "metadata": metadata,
+                    "enabled": enabled,
+                    "tags": tags or [],
+                }
+            ],
+            creation_utc=creation_utc,
+        )
+
+        return guidelines[0]
+
+    @override
+    async def create_guidelines(
+        self,
+        guidelines: Sequence[GuidelineCreationParams],
+        creation_utc: Optional[datetime] = None,
+    ) -> Sequence[Guideline]:
         async with self._lock.writer_lock:
             creation_utc = creation_utc or datetime.now(timezone.utc)
 
-            guideline_checksum = md5_checksum(f"{condition}{action or ''}{enabled}{metadata}")
+            created_guidelines: list[Guideline] = []
+            tag_association_documents: list[GuidelineTagAssociationDocument] = []
+
+            for params in guidelines:
+                condition = params["condition"]
+                action = params.get("action")
+                metadata = params.get("metadata", {})
+                enabled = params.get("enabled", True)
+
+                guideline_checksum = md5_checksum(f"{condition}{action or ''}{enabled}{metadata}")
+
+                guideline = Guideline(
+                    id=GuidelineId(self._id_generator.generate(guideline_checksum)),
+                    creation_utc=creation_utc,
+                    content=GuidelineContent(
+                        condition=condition,
+                        action=action,
+                    ),
+                    enabled=enabled,
+                    tags=params.get("tags", []),
+                    metadata=metadata,
+                )
 
-            guideline = Guideline(
-                id=GuidelineId(self._id_generator.generate(guideline_checksum)),
-                creation_utc=creation_utc,
-                content=GuidelineContent(
-                    condition=condition,
-                    action=action,
-                ),
-                enabled=enabled,
-                tags=tags or [],
-                metadata=metadata,
-            )
+                created_guidelines.append(guideline)
 
-            await self._collection.insert_one(
-                document=self._serialize(
-                    guideline=guideline,
-                )
+                for tag_id in guideline.tags:
+                    tag_checksum = md5_checksum(f"{guideline.id}{tag_id}")
+
+                    tag_association_documents.append(
+                        {
+                            "id": ObjectId(self._id_generator.generate(tag_checksum)),
+                            "version": self.VERSION.to_string(),
+                            "creation_utc": creation_utc.isoformat(),
+                            "guideline_id": guideline.id,
+                            "tag_id": tag_id,
+                        }
+                    )
+
+            await self._collection.insert_many(
+                [self._serialize(guideline=guideline) for guideline in created_guidelines]
             )
+            await self._tag_association_collection.insert_many(tag_association_documents)
 
-            for tag_id in tags or []:
-                tag_checksum = md5_checksum(f"{guideline.id}{tag_id}")
-
-                await self._tag_association_collection.insert_one(
-                    document={
-                        "id": ObjectId(self._id_generator.generate(tag_checksum)),
-                        "version": self.VERSION.to_string(),
-                        "creation_utc": creation_utc.isoformat(),
-                        "guideline_id": guideline.id,
-                        "tag_id": tag_id,
-                    }
-                )
+            for guideline in created_guidelines:
+                self._tag_index.add_entity(guideline.id)
+
+                for tag_id in guideline.tags:
+                    self._tag_index.add_tag(guideline.id, tag_id)
 
-        return guideline
+        return created_guidelines
 
     @override
     async def list_guidelines(
         self,
         tags: Optional[Sequence[TagId]] = None,
     ) -> Sequence[Guideline]:
-        filters: Where = {}
-
         async with self._lock.reader_lock:
-            if tags is not None:
-                if len(tags) == 0:
-                    guideline_ids = {
-                        doc["guideline_id"]
-                        for doc in await self._tag_association_collection.find(filters={})
-                    }
-                    filters = (
-                        {"$and": [{"id": {"$ne": id}} for id in guideline_ids]}
-                        if guideline_ids
-                        else {}
-                    )
-                else:
-                    tag_filters: Where = {"$or": [{"tag_id": {"$eq": tag}} for tag in tags]}
-                    tag_associations = await self._tag_association_collection.find(
-                        filters=tag_filters
-                    )
-                    guideline_ids = {assoc["guideline_id"] for assoc in tag_associations}
-
-                    if not guideline_ids:
-                        return []
-
-                    filters = {"$or": [{"id": {"$eq": id}} for id in guideline_ids]}
+            if (filters := self._tag_index.filters_for(tags)) is None:
+                return []
 
             return [
                 await self._deserialize(d) for d in await self._collection.find(filters=filters)
@@ -459,6 +501,8 @@ class GuidelineDocumentStore(GuidelineStore):
                     filters={"id": {"$eq": doc["id"]}}
                 )
 
+            self._tag_index.remove_entity(guideline_id)
+
         if not result.deleted_document:
             raise ItemNotFoundError(item_id=UniqueId(guideline_id))
 
@@ -537,6 +581,8 @@ class GuidelineDocumentStore(GuidelineStore):
 
             _ = await self._tag_association_collection.insert_one(document=association_document)
 
+            self._tag_index.add_tag(guideline_id, tag_id)
+
             guideline_document = await self._collection.find_one({"id": {"$eq": guideline_id}})
 
         if not guideline_document:
@@ -561,6 +607,8 @@ class GuidelineDocumentStore(GuidelineStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._tag_index.remove_tag(guideline_id, tag_id)
+
             guideline_document = await self._collection.find_one({"id": {"$eq": guideline_id}})
 
         if not guideline_document:
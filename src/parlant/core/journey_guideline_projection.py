@@ -35,9 +35,34 @@ class JourneyGuidelineProjection:
         self._journey_store = journey_store
         self._guideline_store = guideline_store
 
+        # Projections by journey, along with the journey revision they were made from
+        self._projections: dict[JourneyId, tuple[int, Sequence[Guideline]]] = {}
+
     async def project_journey_to_guidelines(
         self,
         journey_id: JourneyId,
+    ) -> Sequence[Guideline]:
+        """Returns the guidelines projected from the journey's nodes and edges.
+
+        Projections are cached until the journey changes, and the same
+        (immutable) sequence is returned for as long as it doesn't.
+        """
+        # Take the revision before reading, so that a write made while
+        # we're projecting invalidates the projection we're about to cache
+        revision = self._journey_store.journey_revision(journey_id)
+
+        if (cached := self._projections.get(journey_id)) and cached[0] == revision:
+            return cached[1]
+
+        guidelines = tuple(await self._project(journey_id))
+
+        self._projections[journey_id] = (revision, guidelines)
+
+        return guidelines
+
+    async def _project(
+        self,
+        journey_id: JourneyId,
     ) -> Sequence[Guideline]:
         guidelines: dict[GuidelineId, Guideline] = {}
 
@@ -15,11 +15,11 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from itertools import chain
+from itertools import count
 from typing import Awaitable, Callable, Mapping, NewType, Optional, Sequence, cast
 from typing_extensions import override, TypedDict, Self, Required
 
-from parlant.core.async_utils import ReaderWriterLock, safe_gather
+from parlant.core.async_utils import ReaderWriterLock
 from parlant.core.common import JSONSerializable, md5_checksum
 from parlant.core.common import ItemNotFoundError, UniqueId, Version, IdGenerator, to_json_dict
 from parlant.core.guidelines import GuidelineId
@@ -43,9 +43,12 @@ from parlant.core.persistence.vector_database import (
     BaseDocument as VectorDocument,
 )
 from parlant.core.persistence.vector_database_helper import (
+    RetrievalQuery,
     VectorDocumentMigrationHelper,
     VectorDocumentStoreMigrationHelper,
-    query_chunks,
+    closest_unique_documents,
+    weigh_similar_documents,
+    weighted_query_chunks,
 )
 from parlant.core.tags import TagId
 from parlant.core.tools import ToolId
@@ -138,6 +141,15 @@ class JourneyStore(ABC):
         journey_id: JourneyId,
     ) -> Journey: ...
 
+    @abstractmethod
+    def journey_revision(
+        self,
+        journey_id: JourneyId,
+    ) -> int:
+        """Returns a number that changes whenever the journey, or any of its nodes,
+        edges, conditions or tags, is written to."""
+        ...
+
     @abstractmethod
     async def update_journey(
         self,
@@ -183,7 +195,7 @@ class JourneyStore(ABC):
     @abstractmethod
     async def find_relevant_journeys(
         self,
-        query: str,
+        query: RetrievalQuery,
         available_journeys: Sequence[Journey],
         max_journeys: int = 5,
     ) -> Sequence[Journey]: ...
@@ -394,6 +406,9 @@ class JourneyVectorStore(JourneyStore):
 
         self._lock = ReaderWriterLock()
 
+        self._journey_revisions: dict[JourneyId, int] = {}
+        self._revision_counter = count(1)
+
     async def _vector_document_loader(self, doc: VectorDocument) -> Optional[JourneyVectorDocument]:
         async def v0_1_0_to_v0_3_0(doc: VectorDocument) -> Optional[VectorDocument]:
             raise Exception(
@@ -645,6 +660,20 @@ class JourneyVectorStore(JourneyStore):
         # including how many vectors to generate and what content each vector should contain.
         return f"{title}\n{description}\nNodes: {', '.join(n.action for n in nodes if n.action)}\nEdges: {', '.join(e.condition for e in edges if e.condition)}"
 
+    @property
+    def revision(self) -> int:
+        """A number that increases whenever the store is written to."""
+        return self._lock.write_count
+
+    @override
+    def journey_revision(self, journey_id: JourneyId) -> int:
+        return self._journey_revisions.get(journey_id, 0)
+
+    def _touch_journey(self, journey_id: JourneyId) -> None:
+        # Revisions are drawn from a single counter, so that a journey that's
+        # deleted and then re-created never gets back a revision it had before
+        self._journey_revisions[journey_id] = next(self._revision_counter)
+
     @override
     async def create_journey(
         self,
@@ -728,6 +757,8 @@ class JourneyVectorStore(JourneyStore):
                     }
                 )
 
+            self._touch_journey(journey.id)
+
         return journey
 
     @override
@@ -777,6 +808,8 @@ class JourneyVectorStore(JourneyStore):
                 },
             )
 
+            self._touch_journey(journey_id)
+
         assert result.updated_document
 
         return await self._deserialize(result.updated_document)
@@ -888,6 +921,8 @@ class JourneyVectorStore(JourneyStore):
 
             result = await self._collection.delete_one({"id": {"$eq": journey_id}})
 
+            self._touch_journey(journey_id)
+
         if result.deleted_count == 0:
             raise ItemNotFoundError(item_id=UniqueId(journey_id))
 
@@ -915,6 +950,8 @@ class JourneyVectorStore(JourneyStore):
                 }
             )
 
+            self._touch_journey(journey_id)
+
             return True
 
     @override
@@ -931,6 +968,8 @@ class JourneyVectorStore(JourneyStore):
                 }
             )
 
+            self._touch_journey(journey_id)
+
             return True
 
     @override
@@ -960,6 +999,8 @@ class JourneyVectorStore(JourneyStore):
 
             _ = await self._tag_association_collection.insert_one(document=association_document)
 
+            self._touch_journey(journey_id)
+
         return True
 
     @override
@@ -979,10 +1020,12 @@ class JourneyVectorStore(JourneyStore):
             if delete_result.deleted_count == 0:
                 raise ItemNotFoundError(item_id=UniqueId(tag_id))
 
+            self._touch_journey(journey_id)
+
     @override
     async def find_relevant_journeys(
         self,
-        query: str,
+        query: RetrievalQuery,
         available_journeys: Sequence[Journey],
         max_journeys: int = 5,
     ) -> Sequence[Journey]:
@@ -990,21 +1033,20 @@ class JourneyVectorStore(JourneyStore):
             return []
 
         async with self._lock.reader_lock:
-            queries = await query_chunks(query, self._embedder)
+            chunks = await weighted_query_chunks(query, self._embedder)
             filters: Where = {"journey_id": {"$in": [str(j.id) for j in available_journeys]}}
 
-            tasks = [
-                self._vector_collection.find_similar_documents(
-                    filters=filters,
-                    query=q,
-                    k=max_journeys,
-                )
-                for q in queries
-            ]
+            similar_documents = self._vector_collection.find_similar_documents_for_queries(
+                filters=filters,
+                queries=[chunk for chunk, _ in chunks],
+                k=max_journeys,
+            )
 
-        all_results = chain.from_iterable(await safe_gather(*tasks))
-        unique_results = list(set(all_results))
-        top_vectors = sorted(unique_results, key=lambda r: r.distance)[:max_journeys]
+        all_results = weigh_similar_documents(
+            await similar_documents,
+            [weight for _, weight in chunks],
+        )
+        top_vectors = closest_unique_documents(all_results)[:max_journeys]
 
         return [
             await self._deserialize(doc)
@@ -1038,6 +1080,8 @@ class JourneyVectorStore(JourneyStore):
                 document=self._serialize_node(node, journey_id)
             )
 
+            self._touch_journey(journey_id)
+
         return node
 
     @override
@@ -1072,6 +1116,8 @@ class JourneyVectorStore(JourneyStore):
                 params=cast(JourneyNodeAssociationDocument, to_json_dict(updated)),
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_node(result.updated_document)
@@ -1098,6 +1144,8 @@ class JourneyVectorStore(JourneyStore):
                 filters={"node_id": {"$eq": node_id}}
             )
 
+            self._touch_journey(node_doc["journey_id"])
+
         if result.deleted_count == 0:
             raise ItemNotFoundError(item_id=UniqueId(node_id))
 
@@ -1148,6 +1196,8 @@ class JourneyVectorStore(JourneyStore):
                 },
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_node(result.updated_document)
@@ -1173,6 +1223,8 @@ class JourneyVectorStore(JourneyStore):
                 },
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_node(result.updated_document)
@@ -1201,6 +1253,8 @@ class JourneyVectorStore(JourneyStore):
                 document=self._serialize_edge(edge, journey_id)
             )
 
+            self._touch_journey(journey_id)
+
         return edge
 
     @override
@@ -1235,6 +1289,8 @@ class JourneyVectorStore(JourneyStore):
                 params=cast(JourneyEdgeAssociationDocument, to_json_dict(updated)),
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_edge(result.updated_document)
@@ -1276,6 +1332,9 @@ class JourneyVectorStore(JourneyStore):
                 filters={"id": {"$eq": edge_id}}
             )
 
+            if result.deleted_document:
+                self._touch_journey(result.deleted_document["journey_id"])
+
         if result.deleted_count == 0:
             raise ItemNotFoundError(item_id=UniqueId(edge_id))
 
@@ -1301,6 +1360,8 @@ class JourneyVectorStore(JourneyStore):
                 },
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_edge(result.updated_document)
@@ -1326,6 +1387,8 @@ class JourneyVectorStore(JourneyStore):
                 },
             )
 
+            self._touch_journey(doc["journey_id"])
+
         assert result.updated_document
 
         return self._deserialize_edge(result.updated_document)
@@ -13,15 +13,18 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+import asyncio
 from collections.abc import Mapping
 from dataclasses import dataclass
 import hashlib
 import json
+from cachetools import LRUCache
 from lagom import Container
-from typing import Any, Callable, Optional, Sequence, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, TypedDict, cast
 from typing_extensions import override
 
 from parlant.core.common import Version
+from parlant.core.contextual_correlator import ContextualCorrelator
 from parlant.core.nlp.tokenization import EstimatingTokenizer, ZeroEstimatingTokenizer
 from parlant.core.persistence.common import ObjectId
 from parlant.core.persistence.document_database import (
@@ -30,6 +33,10 @@ from parlant.core.persistence.document_database import (
     DocumentDatabase,
 )
 
+if TYPE_CHECKING:
+    from parlant.core.nlp.response_cache import LLMResponseCache
+    from parlant.core.nlp.scheduling import LLMScheduler
+
 
 @dataclass(frozen=True)
 class EmbeddingResult:
@@ -68,14 +75,34 @@ class Embedder(ABC):
 class EmbedderFactory:
     """Factory for creating embedder instances."""
 
-    def __init__(self, container: Container):
+    def __init__(
+        self,
+        container: Container,
+        scheduler: Optional["LLMScheduler"] = None,
+        response_cache: Optional["LLMResponseCache"] = None,
+    ):
         self._container = container
+        self._scheduler = scheduler
+        self._response_cache = response_cache
 
     def create_embedder(self, embedder_type: type[Embedder]) -> Embedder:
         if embedder_type == NoOpEmbedder:
             return NoOpEmbedder()
-        else:
-            return self._container[embedder_type]
+
+        embedder = self._container[embedder_type]
+
+        if self._scheduler:
+            from parlant.core.nlp.scheduling import ScheduledEmbedder
+
+            embedder = ScheduledEmbedder(embedder, self._scheduler)
+
+        # Responses served from the cache needn't wait for a scheduling slot
+        if self._response_cache:
+            from parlant.core.nlp.response_cache import CachingEmbedder
+
+            embedder = CachingEmbedder(embedder, self._response_cache)
+
+        return embedder
 
 
 class NoOpEmbedder(Embedder):
@@ -140,6 +167,37 @@ class EmbeddingCache(ABC):
     ) -> None:
         pass
 
+    async def get_many(
+        self,
+        embedder_type: type[Embedder],
+        texts: Sequence[str],
+        hints: Mapping[str, Any] = {},
+        embedder: Optional[Embedder] = None,
+    ) -> Sequence[Optional[Sequence[float]]]:
+        """Returns the cached vector of each text, or None for texts that aren't cached.
+
+        When given, the embedder itself lets a cache tell apart embedders of the same type
+        that use different models or dimensions."""
+        results: list[Optional[Sequence[float]]] = []
+
+        for text in texts:
+            result = await self.get(embedder_type, [text], hints)
+            results.append(result.vectors[0] if result else None)
+
+        return results
+
+    async def set_many(
+        self,
+        embedder_type: type[Embedder],
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        hints: Mapping[str, Any] = {},
+        embedder: Optional[Embedder] = None,
+    ) -> None:
+        """Caches each text's vector on its own, so it can later be looked up individually."""
+        for text, vector in zip(texts, vectors, strict=True):
+            await self.set(embedder_type, [text], [vector], hints)
+
 
 EmbeddingCacheProvider = Callable[[], EmbeddingCache]
 
@@ -251,3 +309,92 @@ class NullEmbeddingCache(EmbeddingCache):
         hints: Mapping[str, Any] = {},
     ) -> None:
         pass
+
+
+class QueryEmbeddingMemo:
+    """Memoizes the embeddings of search queries.
+
+    Within a correlation scope (e.g., a single request and the engine turn it triggers),
+    each distinct query text is embedded at most once, however many stores search with it.
+    When cross_turn is set, memoized embeddings are shared across scopes as well.
+    """
+
+    def __init__(
+        self,
+        correlator: ContextualCorrelator,
+        max_entries: int = 4096,
+        cross_turn: bool = False,
+    ) -> None:
+        self._correlator = correlator
+        self._cross_turn = cross_turn
+
+        self._embeddings = LRUCache[tuple[str, str, str], asyncio.Future[Sequence[float]]](
+            maxsize=max_entries
+        )
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def _scope(self) -> str:
+        if self._cross_turn:
+            return ""
+
+        # Nested scopes within the same request share its outermost scope
+        return self._correlator.correlation_id.split("::", 1)[0]
+
+    async def embed(
+        self,
+        embedder: Embedder,
+        texts: Sequence[str],
+    ) -> Sequence[Sequence[float]]:
+        """Embeds the given texts, embedding all those not memoized yet in a single batch."""
+        scope = self._scope()
+
+        futures: list[asyncio.Future[Sequence[float]]] = []
+        missing: dict[str, asyncio.Future[Sequence[float]]] = {}
+
+        for text in texts:
+            key = (scope, embedder.id, text)
+
+            if (future := self._embeddings.get(key)) is None:
+                future = asyncio.get_running_loop().create_future()
+                self._embeddings[key] = future
+                missing[text] = future
+
+            futures.append(future)
+
+        if missing:
+            # The batch is embedded in a task of its own, and its futures are only ever awaited
+            # through a shield, since other callers may be awaiting the same futures. That way,
+            # a caller that gets cancelled (e.g., by a restarted turn) doesn't fail the others.
+            task = asyncio.create_task(self._embed_missing(embedder, scope, missing))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return [await asyncio.shield(f) for f in futures]
+
+    async def _embed_missing(
+        self,
+        embedder: Embedder,
+        scope: str,
+        missing: Mapping[str, asyncio.Future[Sequence[float]]],
+    ) -> None:
+        try:
+            result = await embedder.embed(list(missing.keys()))
+        except BaseException as exc:
+            for text, future in missing.items():
+                # Let a later call retry, rather than memoizing the failure
+                self._embeddings.pop((scope, embedder.id, text), None)
+
+                if isinstance(exc, Exception):
+                    future.set_exception(exc)
+                    # Mark the exception as retrieved, in case nobody else awaits it
+                    future.exception()
+                else:
+                    future.cancel()
+
+            if not isinstance(exc, Exception):
+                raise
+
+            return
+
+        for future, vector in zip(missing.values(), result.vectors, strict=True):
+            future.set_result(vector)
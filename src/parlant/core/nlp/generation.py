@@ -15,7 +15,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Any, Generic, Mapping, TypeVar, cast, get_args
+from typing import Any, Awaitable, Callable, Generic, Mapping, TypeAlias, TypeVar, cast, get_args
 from typing_extensions import override
 
 from parlant.core.common import DefaultBaseModel
@@ -27,6 +27,10 @@ from parlant.core.nlp.tokenization import EstimatingTokenizer
 T = TypeVar("T", bound=DefaultBaseModel)
 
 
+PartialContentHandler: TypeAlias = Callable[[Mapping[str, Any]], Awaitable[None]]
+"""Receives the content generated so far, as partially parsed JSON, while it streams in."""
+
+
 @dataclass(frozen=True)
 class SchematicGenerationResult(Generic[T]):
     """Result of a schematic generation operation."""
@@ -55,6 +59,20 @@ class SchematicGenerator(ABC, Generic[T]):
         """Generate content based on the provided prompt and hints."""
         ...
 
+    async def generate_streaming(
+        self,
+        prompt: str | PromptBuilder,
+        on_partial_content: PartialContentHandler,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        """Generate content like generate(), reporting the content generated so far as it streams in.
+
+        Partial content is only a preview: it isn't validated against the schema,
+        and if the generation is retried it may start over.
+        Generators that can't stream their output don't report any partial content.
+        """
+        return await self.generate(prompt=prompt, hints=hints)
+
     @property
     @abstractmethod
     def id(self) -> str:
@@ -107,6 +125,30 @@ class FallbackSchematicGenerator(SchematicGenerator[T]):
 
         raise last_exception
 
+    @override
+    async def generate_streaming(
+        self,
+        prompt: str | PromptBuilder,
+        on_partial_content: PartialContentHandler,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        last_exception: Exception
+
+        for index, generator in enumerate(self._generators):
+            try:
+                return await generator.generate_streaming(
+                    prompt=prompt,
+                    on_partial_content=on_partial_content,
+                    hints=hints,
+                )
+            except Exception as e:
+                self._logger.warning(
+                    f"Generator {index + 1}/{len(self._generators)} failed: {type(generator).__name__}: {e}"
+                )
+                last_exception = e
+
+        raise last_exception
+
     @property
     @override
     def id(self) -> str:
@@ -22,6 +22,11 @@ class UsageInfo:
     output_tokens: int
     extra: Optional[Mapping[str, int]] = None
 
+    @property
+    def cached_input_tokens(self) -> int:
+        """The number of input tokens that were served from the provider's prompt cache"""
+        return (self.extra or {}).get("cached_input_tokens", 0)
+
 
 @dataclass(frozen=True)
 class GenerationInfo:
@@ -0,0 +1,136 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import hashlib
+import json
+from typing import Any, Mapping, Optional
+from cachetools import LRUCache
+from typing_extensions import override
+
+from parlant.core.contextual_correlator import ContextualCorrelator
+from parlant.core.engines.alpha.prompt_builder import PromptBuilder
+from parlant.core.nlp.generation import (
+    PartialContentHandler,
+    SchematicGenerationResult,
+    SchematicGenerator,
+    T,
+)
+from parlant.core.nlp.tokenization import EstimatingTokenizer
+
+
+class GenerationMemo:
+    """Memoizes the results of schematic generations within each session.
+
+    When a session's processing is restarted (e.g., because another customer message
+    came in mid-turn), the new turn issues many of the same prompts the cancelled one
+    already got results for, such as those matching guidelines against parts of the
+    interaction that didn't change. Since a result is only ever reused for the very same
+    prompt, it's exactly as valid for the new turn as it was for the old one.
+    """
+
+    def __init__(
+        self,
+        correlator: ContextualCorrelator,
+        max_entries: int = 1024,
+    ) -> None:
+        self._correlator = correlator
+        self._results = LRUCache[tuple[str, str], SchematicGenerationResult[Any]](
+            maxsize=max_entries
+        )
+
+    def _scope(self) -> Optional[str]:
+        if session := self._correlator.get("session"):
+            return str(session.id)
+        return None
+
+    async def generate(
+        self,
+        generator: SchematicGenerator[T],
+        prompt: str | PromptBuilder,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        if (scope := self._scope()) is None:
+            return await generator.generate(prompt=prompt, hints=hints)
+
+        request = json.dumps(
+            {
+                "model": generator.id,
+                "schema": generator.schema.__name__,
+                "prompt": prompt.build() if isinstance(prompt, PromptBuilder) else prompt,
+                "hints": hints,
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+        key = (scope, hashlib.sha256(request.encode()).hexdigest())
+
+        if (result := self._results.get(key)) is not None:
+            return result
+
+        # Only completed generations are memoized, so a cancelled one is simply redone
+        result = await generator.generate(prompt=prompt, hints=hints)
+        self._results[key] = result
+
+        return result
+
+
+class MemoizingSchematicGenerator(SchematicGenerator[T]):
+    """A generator whose results are reused, within a session, for repeated prompts."""
+
+    def __init__(
+        self,
+        wrapped_generator: SchematicGenerator[T],
+        memo: GenerationMemo,
+    ) -> None:
+        self._wrapped_generator = wrapped_generator
+        self._memo = memo
+
+    @override
+    async def generate(
+        self,
+        prompt: str | PromptBuilder,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        return await self._memo.generate(self._wrapped_generator, prompt, hints)
+
+    @override
+    async def generate_streaming(
+        self,
+        prompt: str | PromptBuilder,
+        on_partial_content: PartialContentHandler,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        # Streamed content is shown as it's generated, so there's nothing to replay
+        return await self._wrapped_generator.generate_streaming(
+            prompt=prompt,
+            on_partial_content=on_partial_content,
+            hints=hints,
+        )
+
+    @property
+    @override
+    def id(self) -> str:
+        return self._wrapped_generator.id
+
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return self._wrapped_generator.max_tokens
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return self._wrapped_generator.tokenizer
@@ -0,0 +1,223 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from enum import Enum, auto
+import json
+import re
+from typing import Any, Optional
+
+
+class _Expecting(Enum):
+    START = auto()
+    VALUE = auto()
+    KEY = auto()
+    COLON = auto()
+    SEPARATOR = auto()
+    STRING = auto()
+    SCALAR = auto()
+    END = auto()
+
+
+_STRING_SPECIAL_CHARACTERS = re.compile(r'["\\]')
+_SCALAR_TERMINATORS = frozenset(",}] \t\r\n")
+_WHITESPACE = frozenset(" \t\r\n")
+
+
+class PartialJSONParser:
+    """Parses a JSON object incrementally, as its text streams in from a model.
+
+    At any point, `value` holds everything that was parsed so far: open objects and
+    arrays hold the members received so far, and a string value that's still streaming
+    holds the characters received so far. Keys, numbers and literals only show up once
+    they're complete. Any text before the opening brace (e.g., a markdown code fence)
+    and after the closing one is ignored.
+    """
+
+    def __init__(self) -> None:
+        self._expecting = _Expecting.START
+        self._root: Optional[dict[str, Any]] = None
+        self._stack: list[dict[str, Any] | list[Any]] = []
+        self._key: Optional[str] = None
+
+        self._string_chunks: list[str] = []
+        self._string_is_key = False
+        self._string_slot: tuple[dict[str, Any] | list[Any], str | int] | None = None
+        self._escaping = False
+
+        self._scalar_chunks: list[str] = []
+
+    @property
+    def value(self) -> Optional[dict[str, Any]]:
+        """The object parsed so far, or None if it hasn't started yet."""
+        return self._root
+
+    @property
+    def done(self) -> bool:
+        return self._expecting == _Expecting.END
+
+    def feed(self, text: str) -> None:
+        i = 0
+
+        while i < len(text) and self._expecting != _Expecting.END:
+            if self._expecting == _Expecting.STRING:
+                i = self._consume_string(text, i)
+                continue
+
+            char = text[i]
+            i += 1
+
+            if self._expecting == _Expecting.SCALAR:
+                if char not in _SCALAR_TERMINATORS:
+                    self._scalar_chunks.append(char)
+                    continue
+
+                self._end_scalar()
+
+            if char in _WHITESPACE:
+                continue
+
+            match self._expecting:
+                case _Expecting.START:
+                    if char == "{":
+                        self._open({})
+                case _Expecting.VALUE:
+                    self._consume_value(char)
+                case _Expecting.KEY:
+                    if char == '"':
+                        self._start_string(is_key=True)
+                    elif char == "}":
+                        self._close()
+                case _Expecting.COLON:
+                    if char == ":":
+                        self._expecting = _Expecting.VALUE
+                case _Expecting.SEPARATOR:
+                    if char == ",":
+                        self._expecting = (
+                            _Expecting.KEY
+                            if isinstance(self._stack[-1], dict)
+                            else _Expecting.VALUE
+                        )
+                    elif char in "}]":
+                        self._close()
+
+        if self._expecting == _Expecting.STRING and not self._string_is_key:
+            self._update_string_slot(final=False)
+
+    def _consume_value(self, char: str) -> None:
+        if char == '"':
+            self._start_string(is_key=False)
+        elif char == "{":
+            self._open({})
+        elif char == "[":
+            self._open([])
+        elif char == "]" and isinstance(self._stack[-1], list):
+            # An empty array, or a trailing comma
+            self._close()
+        else:
+            self._scalar_chunks = [char]
+            self._expecting = _Expecting.SCALAR
+
+    def _consume_string(self, text: str, start: int) -> int:
+        i = start
+
+        if self._escaping:
+            self._escaping = False
+            i += 1
+
+        while match := _STRING_SPECIAL_CHARACTERS.search(text, i):
+            if match.group() == '"':
+                self._string_chunks.append(text[start : match.start()])
+                self._end_string()
+                return match.end()
+
+            # Skip whatever character is being escaped, even if it's yet to arrive
+            if match.end() == len(text):
+                self._escaping = True
+                break
+
+            i = match.end() + 1
+
+        self._string_chunks.append(text[start:])
+        return len(text)
+
+    def _start_string(self, is_key: bool) -> None:
+        self._string_chunks = []
+        self._string_is_key = is_key
+        self._expecting = _Expecting.STRING
+
+        if not is_key:
+            self._string_slot = self._attach("")
+
+    def _end_string(self) -> None:
+        if self._string_is_key:
+            self._key = self._decode_string("".join(self._string_chunks), final=True)
+            self._expecting = _Expecting.COLON
+        else:
+            self._update_string_slot(final=True)
+            self._string_slot = None
+            self._expecting = _Expecting.SEPARATOR
+
+    def _update_string_slot(self, final: bool) -> None:
+        assert self._string_slot is not None
+
+        container, position = self._string_slot
+        container[position] = self._decode_string("".join(self._string_chunks), final)  # type: ignore
+
+    def _decode_string(self, raw: str, final: bool) -> str:
+        # Models tend to put raw control characters (e.g., newlines) in strings,
+        # so those are tolerated. A string that's still streaming may also end with
+        # part of an escape sequence, which is left out until the rest of it arrives.
+        for trimmed in range(1 if final else min(len(raw), 6) + 1):
+            try:
+                return str(json.loads(f'"{raw[: len(raw) - trimmed]}"', strict=False))
+            except json.JSONDecodeError:
+                continue
+
+        return raw if final else ""
+
+    def _end_scalar(self) -> None:
+        try:
+            self._attach(json.loads("".join(self._scalar_chunks)))
+        except json.JSONDecodeError:
+            pass
+
+        self._expecting = _Expecting.SEPARATOR
+
+    def _open(self, container: dict[str, Any] | list[Any]) -> None:
+        if self._expecting == _Expecting.START:
+            assert isinstance(container, dict)
+            self._root = container
+        else:
+            self._attach(container)
+
+        self._stack.append(container)
+        self._expecting = _Expecting.KEY if isinstance(container, dict) else _Expecting.VALUE
+
+    def _close(self) -> None:
+        self._stack.pop()
+        self._expecting = _Expecting.SEPARATOR if self._stack else _Expecting.END
+
+    def _attach(self, value: Any) -> tuple[dict[str, Any] | list[Any], str | int]:
+        container = self._stack[-1]
+
+        if isinstance(container, list):
+            container.append(value)
+            return container, len(container) - 1
+
+        key = self._key or ""
+        container[key] = value
+        self._key = None
+
+        return container, key
@@ -0,0 +1,270 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from enum import Enum
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Mapping, Optional, cast
+import aiofiles
+from typing_extensions import override
+
+from parlant.core.common import JSONSerializable, generate_id
+from parlant.core.engines.alpha.prompt_builder import PromptBuilder
+from parlant.core.nlp.embedding import Embedder, EmbeddingResult
+from parlant.core.nlp.generation import (
+    PartialContentHandler,
+    SchematicGenerationResult,
+    SchematicGenerator,
+    T,
+)
+from parlant.core.nlp.generation_info import GenerationInfo, UsageInfo
+from parlant.core.nlp.tokenization import EstimatingTokenizer
+
+
+class LLMResponseCacheMode(Enum):
+    RECORD = "record"
+    """Always call the model, and store (or overwrite) its response"""
+
+    REPLAY = "replay"
+    """Only serve stored responses, failing on any request that wasn't recorded"""
+
+    READ_THROUGH = "read-through"
+    """Serve stored responses, calling the model (and storing its response) on a miss"""
+
+
+class LLMResponseCacheMiss(Exception):
+    def __init__(self, key: str, description: str) -> None:
+        super().__init__(f"No recorded response for {description} (key: {key})")
+        self.key = key
+
+
+class LLMResponseCache:
+    """A content-addressed store of model responses on the local file system.
+
+    Every response is kept in a file named by the hash of the request it answers,
+    so that identical requests made across runs are served the same response.
+    """
+
+    def __init__(self, path: Path, mode: LLMResponseCacheMode) -> None:
+        self.path = path
+        self.mode = mode
+
+    @staticmethod
+    def key_for(request: Mapping[str, Any]) -> str:
+        serialized = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def _file_for(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    async def get(self, key: str) -> Optional[JSONSerializable]:
+        file = self._file_for(key)
+
+        if not file.exists():
+            return None
+
+        async with aiofiles.open(file, "r") as f:
+            return cast(JSONSerializable, json.loads(await f.read()))
+
+    async def set(self, key: str, value: JSONSerializable) -> None:
+        file = self._file_for(key)
+        file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so that a concurrent reader never sees a partial response
+        temporary_file = file.with_suffix(f".{generate_id()}.tmp")
+
+        async with aiofiles.open(temporary_file, "w") as f:
+            await f.write(json.dumps(value, indent=2))
+
+        os.replace(temporary_file, file)
+
+
+class CachingSchematicGenerator(SchematicGenerator[T]):
+    """A generator whose responses are recorded to, or replayed from, an LLM response cache."""
+
+    def __init__(
+        self,
+        wrapped_generator: SchematicGenerator[T],
+        cache: LLMResponseCache,
+    ) -> None:
+        self._wrapped_generator = wrapped_generator
+        self._cache = cache
+
+        # Changing the schema changes what a valid response is, so it's part of the key
+        self._schema_json = json.dumps(wrapped_generator.schema.model_json_schema(), sort_keys=True)
+
+    @override
+    async def generate(
+        self,
+        prompt: str | PromptBuilder,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        return await self._generate(prompt, hints, on_partial_content=None)
+
+    @override
+    async def generate_streaming(
+        self,
+        prompt: str | PromptBuilder,
+        on_partial_content: PartialContentHandler,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        # Replayed responses are returned whole, without streaming them
+        return await self._generate(prompt, hints, on_partial_content)
+
+    async def _generate(
+        self,
+        prompt: str | PromptBuilder,
+        hints: Mapping[str, Any],
+        on_partial_content: Optional[PartialContentHandler],
+    ) -> SchematicGenerationResult[T]:
+        schema = self._wrapped_generator.schema
+
+        key = self._cache.key_for(
+            {
+                "model": self.id,
+                "schema": self._schema_json,
+                "prompt": prompt.build() if isinstance(prompt, PromptBuilder) else prompt,
+                "hints": hints,
+            }
+        )
+
+        if self._cache.mode != LLMResponseCacheMode.RECORD:
+            if recorded := await self._cache.get(key):
+                return self._deserialize_result(cast(Mapping[str, Any], recorded))
+
+            if self._cache.mode == LLMResponseCacheMode.REPLAY:
+                raise LLMResponseCacheMiss(key, f"{schema.__name__} generation by {self.id}")
+
+        if on_partial_content:
+            result = await self._wrapped_generator.generate_streaming(
+                prompt=prompt,
+                on_partial_content=on_partial_content,
+                hints=hints,
+            )
+        else:
+            result = await self._wrapped_generator.generate(prompt=prompt, hints=hints)
+
+        await self._cache.set(key, self._serialize_result(result))
+
+        return result
+
+    def _serialize_result(self, result: SchematicGenerationResult[T]) -> JSONSerializable:
+        return {
+            "content": result.content.model_dump(mode="json"),
+            "info": {
+                "schema_name": result.info.schema_name,
+                "model": result.info.model,
+                "duration": result.info.duration,
+                "usage": {
+                    "input_tokens": result.info.usage.input_tokens,
+                    "output_tokens": result.info.usage.output_tokens,
+                    "extra": (
+                        dict(result.info.usage.extra)
+                        if result.info.usage.extra is not None
+                        else None
+                    ),
+                },
+            },
+        }
+
+    def _deserialize_result(self, recorded: Mapping[str, Any]) -> SchematicGenerationResult[T]:
+        info = recorded["info"]
+
+        return SchematicGenerationResult[T](
+            content=self._wrapped_generator.schema.model_validate(recorded["content"]),
+            info=GenerationInfo(
+                schema_name=info["schema_name"],
+                model=info["model"],
+                duration=info["duration"],
+                usage=UsageInfo(
+                    input_tokens=info["usage"]["input_tokens"],
+                    output_tokens=info["usage"]["output_tokens"],
+                    extra=info["usage"]["extra"],
+                ),
+            ),
+        )
+
+    @property
+    @override
+    def id(self) -> str:
+        return self._wrapped_generator.id
+
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return self._wrapped_generator.max_tokens
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return self._wrapped_generator.tokenizer
+
+
+class CachingEmbedder(Embedder):
+    """An embedder whose responses are recorded to, or replayed from, an LLM response cache."""
+
+    def __init__(
+        self,
+        wrapped_embedder: Embedder,
+        cache: LLMResponseCache,
+    ) -> None:
+        self._wrapped_embedder = wrapped_embedder
+        self._cache = cache
+
+    @override
+    async def embed(
+        self,
+        texts: list[str],
+        hints: Mapping[str, Any] = {},
+    ) -> EmbeddingResult:
+        key = self._cache.key_for({"model": self.id, "texts": texts, "hints": hints})
+
+        if self._cache.mode != LLMResponseCacheMode.RECORD:
+            if recorded := await self._cache.get(key):
+                return EmbeddingResult(vectors=cast(Mapping[str, Any], recorded)["vectors"])
+
+            if self._cache.mode == LLMResponseCacheMode.REPLAY:
+                raise LLMResponseCacheMiss(key, f"embedding of {len(texts)} text(s) by {self.id}")
+
+        result = await self._wrapped_embedder.embed(texts, hints)
+
+        await self._cache.set(
+            key,
+            {"vectors": [[float(x) for x in vector] for vector in result.vectors]},
+        )
+
+        return result
+
+    @property
+    @override
+    def id(self) -> str:
+        return self._wrapped_embedder.id
+
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return self._wrapped_embedder.max_tokens
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return self._wrapped_embedder.tokenizer
+
+    @property
+    @override
+    def dimensions(self) -> int:
+        return self._wrapped_embedder.dimensions
@@ -0,0 +1,386 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+import heapq
+from itertools import count
+import os
+from typing import Any, AsyncIterator, Mapping, Optional
+from typing_extensions import override
+
+from parlant.core.contextual_correlator import ContextualCorrelator
+from parlant.core.engines.alpha.prompt_builder import PromptBuilder
+from parlant.core.loggers import Logger
+from parlant.core.nlp.embedding import Embedder, EmbeddingResult
+from parlant.core.nlp.generation import (
+    PartialContentHandler,
+    SchematicGenerationResult,
+    SchematicGenerator,
+    T,
+)
+from parlant.core.nlp.tokenization import EstimatingTokenizer
+
+_TOKEN_WINDOW_SECONDS = 60.0
+
+
+class LLMPriority(Enum):
+    INTERACTIVE = 0
+    """Requests serving a live customer interaction"""
+
+    BACKGROUND = 1
+    """Everything else, e.g., evaluations and indexing"""
+
+
+@dataclass(frozen=True)
+class LLMRateLimits:
+    max_concurrency: Optional[int] = None
+    """The maximum number of requests in flight at once, or None for no limit"""
+    tokens_per_minute: Optional[int] = None
+
+    @staticmethod
+    def from_environment() -> LLMRateLimits:
+        max_concurrency = os.environ.get("PARLANT_LLM_MAX_CONCURRENCY")
+        tokens_per_minute = os.environ.get("PARLANT_LLM_TOKENS_PER_MINUTE")
+
+        return LLMRateLimits(
+            max_concurrency=int(max_concurrency) if max_concurrency else None,
+            tokens_per_minute=int(tokens_per_minute) if tokens_per_minute else None,
+        )
+
+
+@dataclass(frozen=True)
+class LLMQueueMetrics:
+    in_flight: int
+    queued: Mapping[LLMPriority, int]
+    tokens_in_last_minute: int
+
+
+class LLMUsage:
+    """Lets a scheduled request report the number of tokens it has actually used."""
+
+    def __init__(self, estimated_tokens: int) -> None:
+        self.tokens = estimated_tokens
+
+    def report(self, tokens: int) -> None:
+        self.tokens = tokens
+
+
+class _ModelQueue:
+    def __init__(self, limits: LLMRateLimits) -> None:
+        self.limits = limits
+        self.in_flight = 0
+
+        self._sequence = count()
+        self._waiters: list[tuple[int, int, LLMUsage, asyncio.Future[None]]] = []
+        self._usage: deque[tuple[float, LLMUsage]] = deque()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def queued(self) -> dict[LLMPriority, int]:
+        result = {p: 0 for p in LLMPriority}
+
+        for priority, _, _, future in self._waiters:
+            if not future.done():
+                result[LLMPriority(priority)] += 1
+
+        return result
+
+    def tokens_in_window(self) -> int:
+        now = asyncio.get_running_loop().time()
+
+        while self._usage and self._usage[0][0] + _TOKEN_WINDOW_SECONDS <= now:
+            self._usage.popleft()
+
+        return sum(usage.tokens for _, usage in self._usage)
+
+    async def acquire(self, priority: LLMPriority, usage: LLMUsage) -> None:
+        if not self._waiters and self._try_admit(usage):
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters,
+            (priority.value, next(self._sequence), usage, future),
+        )
+
+        # We may have just come ahead of a request that's waiting for more tokens than we need
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # We were admitted just as we got cancelled, so give the slot back
+                self.release()
+            else:
+                self._waiters = [w for w in self._waiters if w[3] is not future]
+                heapq.heapify(self._waiters)
+                self._dispatch()
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._dispatch()
+
+    def _try_admit(self, usage: LLMUsage) -> bool:
+        if (
+            self.limits.max_concurrency is not None
+            and self.in_flight >= self.limits.max_concurrency
+        ):
+            return False
+
+        if self.limits.tokens_per_minute is not None:
+            used = self.tokens_in_window()
+
+            # A request exceeding the whole budget is still let through on an idle window,
+            # or else it would never be served
+            if used and used + usage.tokens > self.limits.tokens_per_minute:
+                self._wake_up_when_tokens_expire()
+                return False
+
+        self.in_flight += 1
+        self._usage.append((asyncio.get_running_loop().time(), usage))
+
+        return True
+
+    def _dispatch(self) -> None:
+        while self._waiters:
+            _, _, usage, future = self._waiters[0]
+
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+
+            # Serve strictly in order of priority and arrival,
+            # so that large requests at the head aren't starved by smaller ones
+            if not self._try_admit(usage):
+                break
+
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+
+    def _wake_up_when_tokens_expire(self) -> None:
+        if self._timer or not self._usage:
+            return
+
+        loop = asyncio.get_running_loop()
+        delay = self._usage[0][0] + _TOKEN_WINDOW_SECONDS - loop.time()
+
+        def on_timer() -> None:
+            self._timer = None
+            self._dispatch()
+
+        self._timer = loop.call_later(max(delay, 0.0), on_timer)
+
+
+class LLMScheduler:
+    """Schedules requests to NLP models, so as to stay within each model's rate limits.
+
+    Every model (by its generator or embedder ID) gets its own queue, bounded by a
+    maximum number of concurrent requests and, optionally, a tokens-per-minute budget.
+    Queued requests serving a live customer interaction are admitted before background ones.
+    """
+
+    def __init__(
+        self,
+        correlator: ContextualCorrelator,
+        limits: Mapping[str, LLMRateLimits] = {},
+        default_limits: LLMRateLimits = LLMRateLimits(),
+    ) -> None:
+        self._correlator = correlator
+        self._limits = limits
+        self._default_limits = default_limits
+
+        self._queues: dict[str, _ModelQueue] = {}
+
+    def limits_for(self, model_id: str) -> LLMRateLimits:
+        return self._limits.get(model_id, self._default_limits)
+
+    def current_priority(self) -> LLMPriority:
+        if self._correlator.get("session"):
+            return LLMPriority.INTERACTIVE
+        return LLMPriority.BACKGROUND
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        model_id: str,
+        estimated_tokens: int = 0,
+        priority: Optional[LLMPriority] = None,
+    ) -> AsyncIterator[LLMUsage]:
+        """Waits for a free slot for the given model, and holds it for the duration of the context."""
+        if model_id not in self._queues:
+            self._queues[model_id] = _ModelQueue(self.limits_for(model_id))
+
+        queue = self._queues[model_id]
+        usage = LLMUsage(estimated_tokens)
+
+        await queue.acquire(priority or self.current_priority(), usage)
+
+        try:
+            yield usage
+        finally:
+            queue.release()
+
+    def metrics(self) -> Mapping[str, LLMQueueMetrics]:
+        return {
+            model_id: LLMQueueMetrics(
+                in_flight=queue.in_flight,
+                queued=queue.queued,
+                tokens_in_last_minute=queue.tokens_in_window(),
+            )
+            for model_id, queue in self._queues.items()
+        }
+
+    async def log_metrics(self, logger: Logger, interval: float) -> None:
+        """Logs the metrics of every model that's in use, once every interval (in seconds)."""
+        while True:
+            await asyncio.sleep(interval)
+
+            for model_id, metrics in self.metrics().items():
+                if (
+                    not metrics.in_flight
+                    and not any(metrics.queued.values())
+                    and not metrics.tokens_in_last_minute
+                ):
+                    continue
+
+                logger.info(
+                    f"LLM queue of {model_id}: {metrics.in_flight} in flight, "
+                    f"{metrics.queued[LLMPriority.INTERACTIVE]} interactive and "
+                    f"{metrics.queued[LLMPriority.BACKGROUND]} background requests queued, "
+                    f"{metrics.tokens_in_last_minute} tokens used in the last minute"
+                )
+
+
+class ScheduledSchematicGenerator(SchematicGenerator[T]):
+    """A generator whose requests go through an LLM scheduler."""
+
+    def __init__(
+        self,
+        wrapped_generator: SchematicGenerator[T],
+        scheduler: LLMScheduler,
+    ) -> None:
+        self._wrapped_generator = wrapped_generator
+        self._scheduler = scheduler
+
+    @override
+    async def generate(
+        self,
+        prompt: str | PromptBuilder,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        async with self._slot(prompt) as usage:
+            result = await self._wrapped_generator.generate(prompt=prompt, hints=hints)
+            usage.report(result.info.usage.input_tokens + result.info.usage.output_tokens)
+
+        return result
+
+    @override
+    async def generate_streaming(
+        self,
+        prompt: str | PromptBuilder,
+        on_partial_content: PartialContentHandler,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        async with self._slot(prompt) as usage:
+            result = await self._wrapped_generator.generate_streaming(
+                prompt=prompt,
+                on_partial_content=on_partial_content,
+                hints=hints,
+            )
+            usage.report(result.info.usage.input_tokens + result.info.usage.output_tokens)
+
+        return result
+
+    @asynccontextmanager
+    async def _slot(self, prompt: str | PromptBuilder) -> AsyncIterator[LLMUsage]:
+        estimated_tokens = 0
+
+        # Estimating is only worth its cost when there's a token budget to enforce
+        if self._scheduler.limits_for(self.id).tokens_per_minute is not None:
+            # The builder itself is passed on, so that the generator can still tell its cacheable prefix
+            # (building it here costs nothing extra, as the builder keeps the text it has built)
+            text = prompt.build() if isinstance(prompt, PromptBuilder) else prompt
+            estimated_tokens = await self.tokenizer.estimate_token_count(text)
+
+        async with self._scheduler.slot(self.id, estimated_tokens) as usage:
+            yield usage
+
+    @property
+    @override
+    def id(self) -> str:
+        return self._wrapped_generator.id
+
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return self._wrapped_generator.max_tokens
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return self._wrapped_generator.tokenizer
+
+
+class ScheduledEmbedder(Embedder):
+    """An embedder whose requests go through an LLM scheduler."""
+
+    def __init__(
+        self,
+        wrapped_embedder: Embedder,
+        scheduler: LLMScheduler,
+    ) -> None:
+        self._wrapped_embedder = wrapped_embedder
+        self._scheduler = scheduler
+
+    @override
+    async def embed(
+        self,
+        texts: list[str],
+        hints: Mapping[str, Any] = {},
+    ) -> EmbeddingResult:
+        estimated_tokens = 0
+
+        if self._scheduler.limits_for(self.id).tokens_per_minute is not None:
+            for text in texts:
+                estimated_tokens += await self.tokenizer.estimate_token_count(text)
+
+        async with self._scheduler.slot(self.id, estimated_tokens):
+            return await self._wrapped_embedder.embed(texts, hints)
+
+    @property
+    @override
+    def id(self) -> str:
+        return self._wrapped_embedder.id
+
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return self._wrapped_embedder.max_tokens
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return self._wrapped_embedder.tokenizer
+
+    @property
+    @override
+    def dimensions(self) -> int:
+        return self._wrapped_embedder.dimensions
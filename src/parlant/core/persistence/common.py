@@ -12,7 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Mapping, NewType, Protocol, Union, cast, get_type_hints
+from typing import (
+    Any,
+    Callable,
+    Mapping,
+    NewType,
+    Protocol,
+    Union,
+    cast,
+    get_type_hints,
+    runtime_checkable,
+)
 from typing_extensions import Literal, TypedDict
 
 from parlant.core.common import Version
@@ -35,6 +45,14 @@ class VersionedStore(Protocol):
     VERSION: Version
 
 
+@runtime_checkable
+class RevisionedStore(Protocol):
+    """A store whose revision increases whenever it is written to."""
+
+    @property
+    def revision(self) -> int: ...
+
+
 # Metadata Query Grammar
 LiteralValue = Union[str, int, float, bool]
 
@@ -76,66 +94,82 @@ LogicalOperator = TypedDict(
 Where = Union[WhereExpression, LogicalOperator]
 
 
-def _evaluate_filter(
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "$eq": lambda field_value, filter_value: field_value == filter_value,
+    "$ne": lambda field_value, filter_value: field_value != filter_value,
+    "$gt": lambda field_value, filter_value: field_value > filter_value,
+    "$gte": lambda field_value, filter_value: field_value >= filter_value,
+    "$lt": lambda field_value, filter_value: field_value < filter_value,
+    "$lte": lambda field_value, filter_value: field_value <= filter_value,
+    "$in": lambda field_value, filter_value: any(field_value == v for v in filter_value),
+    "$nin": lambda field_value, filter_value: not any(field_value == v for v in filter_value),
+}
+
+
+def _compile_field_test(
+    field_name: str,
     operator: str,
-    field_value: LiteralValue,
-    filter_value: LiteralValue,
-) -> bool:
-    tests: dict[str, Callable[[Any, Any], bool]] = {
-        "$eq": lambda field_value, filter_value: field_value == filter_value,
-        "$ne": lambda field_value, filter_value: field_value != filter_value,
-        "$gt": lambda field_value, filter_value: field_value > filter_value,
-        "$gte": lambda field_value, filter_value: field_value >= filter_value,
-        "$lt": lambda field_value, filter_value: field_value < filter_value,
-        "$lte": lambda field_value, filter_value: field_value <= filter_value,
-    }
+    filter_value: Any,
+) -> Callable[[Mapping[str, Any]], bool]:
+    test = _OPERATORS[operator]
+    return lambda candidate: test(candidate[field_name], filter_value)
 
-    return tests[operator](field_value, filter_value)
 
+def _all_of(
+    tests: list[Callable[[Mapping[str, Any]], bool]],
+) -> Callable[[Mapping[str, Any]], bool]:
+    return lambda candidate: all(t(candidate) for t in tests)
+
+
+def _any_of(
+    tests: list[Callable[[Mapping[str, Any]], bool]],
+) -> Callable[[Mapping[str, Any]], bool]:
+    return lambda candidate: any(t(candidate) for t in tests)
+
+
+def compile_filters(where: Where) -> Callable[[Mapping[str, Any]], bool]:
+    """Compiles a filter into a predicate, so that it can be evaluated against
+    many candidates without re-interpreting the filter for each one of them."""
 
-def matches_filters(
-    where: Where,
-    candidate: Mapping[str, Any],
-) -> bool:
     if not where:
-        return True
+        return lambda candidate: True
+
+    tests: list[Callable[[Mapping[str, Any]], bool]] = []
 
     if next(iter(where.keys())) in ("$and", "$or"):
         op = cast(LogicalOperator, where)
+
         for operator in op:
-            operands: list[Union[WhereExpression, LogicalOperator]] = op[
-                cast(Literal["$and", "$or"], operator)
+            if operator not in ("$and", "$or"):
+                continue
+
+            operand_tests = [
+                compile_filters(sub_filter)
+                for sub_filter in op[cast(Literal["$and", "$or"], operator)]
             ]
-            if operator == "$and":
-                if not all(matches_filters(sub_filter, candidate) for sub_filter in operands):
-                    return False
-            elif operator == "$or":
-                if not any(matches_filters(sub_filter, candidate) for sub_filter in operands):
-                    return False
 
+            if operator == "$and":
+                tests.append(_all_of(operand_tests))
+            else:
+                tests.append(_any_of(operand_tests))
     else:
         field_filters = cast(WhereExpression, where)
+
         for field_name, field_filter in field_filters.items():
             for operator, filter_value in field_filter.items():
-                if operator == "$in":
-                    if not any(
-                        candidate[field_name] == val
-                        for val in cast(list[LiteralValue], filter_value)
-                    ):
-                        return False
-                elif operator == "$nin":
-                    if any(
-                        candidate[field_name] == val
-                        for val in cast(list[LiteralValue], filter_value)
-                    ):
-                        return False
-                else:
-                    if not _evaluate_filter(
-                        operator, candidate[field_name], cast(LiteralValue, filter_value)
-                    ):
-                        return False
-
-    return True
+                tests.append(_compile_field_test(field_name, operator, filter_value))
+
+    if len(tests) == 1:
+        return tests[0]
+
+    return _all_of(tests)
+
+
+def matches_filters(
+    where: Where,
+    candidate: Mapping[str, Any],
+) -> bool:
+    return compile_filters(where)(candidate)
 
 
 def ensure_is_total(document: Mapping[str, Any], schema: type[Mapping[str, Any]]) -> None:
@@ -9,7 +9,12 @@ from parlant.core.async_utils import safe_gather
 from parlant.core.common import generate_id
 from parlant.core.contextual_correlator import ContextualCorrelator
 from parlant.core.engines.alpha.prompt_builder import PromptBuilder
-from parlant.core.nlp.generation import T, SchematicGenerationResult, SchematicGenerator
+from parlant.core.nlp.generation import (
+    PartialContentHandler,
+    SchematicGenerationResult,
+    SchematicGenerator,
+    T,
+)
 from parlant.core.nlp.tokenization import EstimatingTokenizer
 from parlant.core.sessions import Session
 
@@ -37,7 +42,29 @@ class DataCollectingSchematicGenerator(SchematicGenerator[T]):
         hints: Mapping[str, Any] = {},
     ) -> SchematicGenerationResult[T]:
         result = await self._wrapped_generator.generate(prompt=prompt, hints=hints)
+        await self._collect(prompt, result)
+        return result
+
+    @override
+    async def generate_streaming(
+        self,
+        prompt: str | PromptBuilder,
+        on_partial_content: PartialContentHandler,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[T]:
+        result = await self._wrapped_generator.generate_streaming(
+            prompt=prompt,
+            on_partial_content=on_partial_content,
+            hints=hints,
+        )
+        await self._collect(prompt, result)
+        return result
 
+    async def _collect(
+        self,
+        prompt: str | PromptBuilder,
+        result: SchematicGenerationResult[T],
+    ) -> None:
         path = self._base_path
 
         if scope := self._correlator.get("scope"):
@@ -90,8 +117,6 @@ class DataCollectingSchematicGenerator(SchematicGenerator[T]):
                 usage_file.write(usage_info),
             )
 
-        return result
-
     @property
     @override
     def id(self) -> str:
@@ -58,6 +58,19 @@ class DeleteResult(Generic[TDocument]):
     deleted_document: Optional[TDocument]
 
 
+@dataclass(frozen=True)
+class UpdateManyResult:
+    acknowledged: bool
+    matched_count: int
+    modified_count: int
+
+
+@dataclass(frozen=True)
+class DeleteManyResult:
+    acknowledged: bool
+    deleted_count: int
+
+
 async def identity_loader(doc: BaseDocument) -> BaseDocument:
     return doc
 
@@ -161,3 +174,48 @@ class DocumentCollection(ABC, Generic[TDocument]):
     ) -> DeleteResult[TDocument]:
         """Deletes the first document that matches the query criteria."""
         ...
+
+    async def insert_many(
+        self,
+        documents: Sequence[TDocument],
+    ) -> InsertResult:
+        """Inserts the given documents into the collection.
+
+        Implementations may override this to write all documents at once."""
+        for document in documents:
+            await self.insert_one(document)
+
+        return InsertResult(acknowledged=True)
+
+    async def update_many(
+        self,
+        filters: Where,
+        params: TDocument,
+    ) -> UpdateManyResult:
+        """Updates all documents that match the query criteria with the given params.
+
+        Implementations may override this to write all documents at once."""
+        documents = await self.find(filters)
+
+        for document in documents:
+            await self.update_one({"id": {"$eq": document["id"]}}, params)
+
+        return UpdateManyResult(
+            acknowledged=True,
+            matched_count=len(documents),
+            modified_count=len(documents),
+        )
+
+    async def delete_many(
+        self,
+        filters: Where,
+    ) -> DeleteManyResult:
+        """Deletes all documents that match the query criteria.
+
+        Implementations may override this to delete all documents at once."""
+        deleted_count = 0
+
+        while (await self.delete_one(filters)).deleted_count:
+            deleted_count += 1
+
+        return DeleteManyResult(acknowledged=True, deleted_count=deleted_count)
@@ -0,0 +1,202 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from typing import Any, Collection, Generic, Iterable, Iterator, Mapping, Optional, Sequence, cast
+from typing_extensions import get_type_hints
+
+from parlant.core.persistence.common import (
+    LiteralValue,
+    LogicalOperator,
+    Where,
+    WhereExpression,
+    compile_filters,
+)
+from parlant.core.persistence.document_database import TDocument
+
+
+DEFAULT_INDEXED_FIELDS = (
+    "id",
+    "session_id",
+    "correlation_id",
+    "source",
+    "target",
+    "tag_id",
+)
+
+
+class IndexedDocuments(Generic[TDocument]):
+    """An insertion-ordered set of in-memory documents with hash indexes on selected fields.
+
+    Filters that constrain an indexed field with `$eq` or `$in` are answered by looking up
+    the matching candidates in the index, rather than by testing every single document.
+    """
+
+    def __init__(
+        self,
+        indexed_fields: Iterable[str],
+        documents: Iterable[TDocument] = (),
+    ) -> None:
+        self._documents: dict[int, TDocument] = {}
+        self._indexes: dict[str, dict[Any, dict[int, None]]] = {
+            field: {} for field in indexed_fields
+        }
+        self._next_key = 0
+
+        for document in documents:
+            self.add(document)
+
+    @staticmethod
+    def fields_for_schema(
+        schema: type[Mapping[str, Any]],
+        candidates: Sequence[str] = DEFAULT_INDEXED_FIELDS,
+    ) -> list[str]:
+        annotations = get_type_hints(schema)
+        return [field for field in candidates if field in annotations]
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __iter__(self) -> Iterator[TDocument]:
+        return iter(self._documents.values())
+
+    def get(self, key: int) -> TDocument:
+        return self._documents[key]
+
+    def add(self, document: TDocument) -> int:
+        key = self._next_key
+        self._next_key += 1
+
+        self._documents[key] = document
+        self._index(key, document)
+
+        return key
+
+    def replace(self, key: int, document: TDocument) -> None:
+        self._unindex(key, self._documents[key])
+        self._documents[key] = document
+        self._index(key, document)
+
+    def remove(self, key: int) -> TDocument:
+        document = self._documents.pop(key)
+        self._unindex(key, document)
+        return document
+
+    def find(self, filters: Where) -> list[TDocument]:
+        return [self._documents[key] for key in self.find_keys(filters)]
+
+    def find_one(self, filters: Where) -> Optional[TDocument]:
+        keys = self.find_keys(filters, limit=1)
+        return self._documents[keys[0]] if keys else None
+
+    def find_keys(self, filters: Where, limit: Optional[int] = None) -> list[int]:
+        predicate = compile_filters(filters)
+
+        candidates: Iterable[int]
+
+        if (indexed_keys := self._plan(filters)) is not None:
+            candidates = sorted(indexed_keys)
+        else:
+            candidates = self._documents.keys()
+
+        result = []
+
+        for key in candidates:
+            if predicate(self._documents[key]):
+                result.append(key)
+
+                if limit is not None and len(result) == limit:
+                    break
+
+        return result
+
+    def _plan(self, filters: Where) -> Optional[Collection[int]]:
+        """Returns the keys of a superset of the documents matching the filters,
+        or None if the filters cannot be narrowed down using the indexes."""
+
+        if not filters:
+            return None
+
+        if next(iter(filters.keys())) in ("$and", "$or"):
+            op = cast(LogicalOperator, filters)
+            plans: list[Collection[int]] = []
+
+            if "$and" in op:
+                and_plans = [
+                    p
+                    for p in (self._plan(sub_filter) for sub_filter in op["$and"])
+                    if p is not None
+                ]
+
+                if and_plans:
+                    plans.append(min(and_plans, key=len))
+
+            if "$or" in op:
+                or_plans = [self._plan(sub_filter) for sub_filter in op["$or"]]
+
+                if all(p is not None for p in or_plans):
+                    plans.append(set().union(*cast(list[Collection[int]], or_plans)))
+
+            return min(plans, key=len) if plans else None
+
+        field_plans: list[Collection[int]] = []
+
+        for field_name, field_filter in cast(WhereExpression, filters).items():
+            if (index := self._indexes.get(field_name)) is None:
+                continue
+
+            if "$eq" in field_filter:
+                field_plans.append(
+                    self._lookup(index, field_filter["$eq"])  # type: ignore[typeddict-item]
+                )
+            elif "$in" in field_filter:
+                values = cast(list[LiteralValue], field_filter["$in"])  # type: ignore[typeddict-item]
+                field_plans.append({key for value in values for key in self._lookup(index, value)})
+
+        return min(field_plans, key=len) if field_plans else None
+
+    def _lookup(self, index: dict[Any, dict[int, None]], value: Any) -> Collection[int]:
+        try:
+            return index.get(value, {}).keys()
+        except TypeError:
+            return ()
+
+    def _index(self, key: int, document: TDocument) -> None:
+        for field, index in self._indexes.items():
+            if field not in document:
+                continue
+
+            try:
+                index.setdefault(cast(Mapping[str, Any], document)[field], {})[key] = None
+            except TypeError:
+                # Unhashable values can never equal a literal filter value
+                pass
+
+    def _unindex(self, key: int, document: TDocument) -> None:
+        for field, index in self._indexes.items():
+            if field not in document:
+                continue
+
+            value = cast(Mapping[str, Any], document)[field]
+
+            try:
+                bucket = index.get(value)
+            except TypeError:
+                continue
+
+            if bucket is not None:
+                bucket.pop(key, None)
+
+                if not bucket:
+                    del index[value]
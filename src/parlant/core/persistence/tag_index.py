@@ -0,0 +1,108 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+from typing import Iterable, Optional, Sequence
+
+from parlant.core.persistence.common import Where
+
+
+class TagIndex:
+    """An inverted index from tags to the IDs of the entities associated with them.
+
+    Stores keep their tag associations in a separate collection. Rather than scanning
+    that collection whenever entities are listed by their tags, a store loads its
+    associations into this index once, keeps it up to date as it writes, and answers
+    tag-scoped listings with set lookups.
+    """
+
+    def __init__(
+        self,
+        entity_ids: Iterable[str] = (),
+        associations: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        # Dicts are used as ordered sets, so that tags are listed in the order they were added
+        self._tags_by_entity: dict[str, dict[str, None]] = {}
+        self._entities_by_tag: dict[str, dict[str, None]] = {}
+        self._untagged: dict[str, None] = {}
+
+        for entity_id in entity_ids:
+            self.add_entity(entity_id)
+
+        for entity_id, tag_id in associations:
+            self.add_tag(entity_id, tag_id)
+
+    def add_entity(self, entity_id: str) -> None:
+        if entity_id not in self._tags_by_entity:
+            self._tags_by_entity[entity_id] = {}
+            self._untagged[entity_id] = None
+
+    def remove_entity(self, entity_id: str) -> None:
+        for tag_id in self._tags_by_entity.pop(entity_id, {}):
+            self._discard(self._entities_by_tag, tag_id, entity_id)
+
+        self._untagged.pop(entity_id, None)
+
+    def add_tag(self, entity_id: str, tag_id: str) -> None:
+        self.add_entity(entity_id)
+
+        self._tags_by_entity[entity_id][tag_id] = None
+        self._entities_by_tag.setdefault(tag_id, {})[entity_id] = None
+        self._untagged.pop(entity_id, None)
+
+    def remove_tag(self, entity_id: str, tag_id: str) -> None:
+        if tags := self._tags_by_entity.get(entity_id):
+            tags.pop(tag_id, None)
+            self._discard(self._entities_by_tag, tag_id, entity_id)
+
+            if not tags:
+                self._untagged[entity_id] = None
+
+    def tags_of(self, entity_id: str) -> list[str]:
+        return list(self._tags_by_entity.get(entity_id, {}))
+
+    def find_entity_ids(self, tags: Sequence[str]) -> list[str]:
+        """Returns the entities associated with any of the given tags,
+        or the untagged entities if no tags are given."""
+        if not tags:
+            return list(self._untagged)
+
+        if len(tags) == 1:
+            return list(self._entities_by_tag.get(tags[0], {}))
+
+        result: dict[str, None] = {}
+
+        for tag_id in tags:
+            result.update(self._entities_by_tag.get(tag_id, {}))
+
+        return list(result)
+
+    def filters_for(self, tags: Optional[Sequence[str]]) -> Optional[Where]:
+        """Returns the filters selecting the entities listed by the given tags,
+        or None if no entity matches them."""
+        if tags is None:
+            return {}
+
+        if entity_ids := self.find_entity_ids(tags):
+            return {"id": {"$in": list(entity_ids)}}
+
+        return None
+
+    @staticmethod
+    def _discard(index: dict[str, dict[str, None]], key: str, entity_id: str) -> None:
+        if entities := index.get(key):
+            entities.pop(entity_id, None)
+
+            if not entities:
+                del index[key]
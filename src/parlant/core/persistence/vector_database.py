@@ -18,6 +18,7 @@ from dataclasses import dataclass
 from typing import Awaitable, Callable, Generic, Optional, Sequence, TypeVar, TypedDict
 from typing_extensions import Required
 
+from parlant.core import async_utils
 from parlant.core.common import JSONSerializable, Version
 from parlant.core.nlp.embedding import Embedder
 from parlant.core.persistence.common import ObjectId, Where
@@ -57,6 +58,19 @@ class DeleteResult(Generic[TDocument]):
     deleted_document: Optional[TDocument]
 
 
+@dataclass(frozen=True)
+class UpdateManyResult:
+    acknowledged: bool
+    matched_count: int
+    modified_count: int
+
+
+@dataclass(frozen=True)
+class DeleteManyResult:
+    acknowledged: bool
+    deleted_count: int
+
+
 @dataclass(frozen=True)
 class SimilarDocumentResult(Generic[TDocument]):
     document: TDocument
@@ -156,6 +170,51 @@ class VectorCollection(ABC, Generic[TDocument]):
         filters: Where,
     ) -> DeleteResult[TDocument]: ...
 
+    async def insert_many(
+        self,
+        documents: Sequence[TDocument],
+    ) -> InsertResult:
+        """Inserts the given documents into the collection.
+
+        Implementations may override this to embed and write all documents at once."""
+        for document in documents:
+            await self.insert_one(document)
+
+        return InsertResult(acknowledged=True)
+
+    async def update_many(
+        self,
+        filters: Where,
+        params: TDocument,
+    ) -> UpdateManyResult:
+        """Updates all documents that match the query criteria with the given params.
+
+        Implementations may override this to embed and write all documents at once."""
+        documents = await self.find(filters)
+
+        for document in documents:
+            await self.update_one({"id": {"$eq": document["id"]}}, params)
+
+        return UpdateManyResult(
+            acknowledged=True,
+            matched_count=len(documents),
+            modified_count=len(documents),
+        )
+
+    async def delete_many(
+        self,
+        filters: Where,
+    ) -> DeleteManyResult:
+        """Deletes all documents that match the query criteria.
+
+        Implementations may override this to delete all documents at once."""
+        deleted_count = 0
+
+        while (await self.delete_one(filters)).deleted_count:
+            deleted_count += 1
+
+        return DeleteManyResult(acknowledged=True, deleted_count=deleted_count)
+
     @abstractmethod
     async def find_similar_documents(
         self,
@@ -163,3 +222,19 @@ class VectorCollection(ABC, Generic[TDocument]):
         query: str,
         k: int,
     ) -> Sequence[SimilarDocumentResult[TDocument]]: ...
+
+    async def find_similar_documents_for_queries(
+        self,
+        filters: Where,
+        queries: Sequence[str],
+        k: int,
+    ) -> Sequence[Sequence[SimilarDocumentResult[TDocument]]]:
+        """Finds the documents most similar to each of the queries, in the order given.
+
+        Implementations may override this to embed all queries in a single batch.
+        """
+        return list(
+            await async_utils.safe_gather(
+                *(self.find_similar_documents(filters, q, k) for q in queries)
+            )
+        )
@@ -12,13 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from dataclasses import dataclass, replace
 import heapq
 from typing import Awaitable, Callable, Generic, Mapping, Optional, Sequence, TypeVar, cast
 from typing_extensions import Self
 from parlant.core.common import Version
-from parlant.core.nlp.embedding import Embedder
+from parlant.core.nlp.embedding import Embedder, EmbeddingCache
 from parlant.core.persistence.common import MigrationRequired, ServerOutdated, VersionedStore
-from parlant.core.persistence.vector_database import BaseDocument, TDocument, VectorDatabase
+from parlant.core.persistence.vector_database import (
+    BaseDocument,
+    SimilarDocumentResult,
+    TDocument,
+    VectorDatabase,
+)
 
 
 async def query_chunks(query: str, embedder: Embedder) -> list[str]:
@@ -41,6 +47,113 @@ async def query_chunks(query: str, embedder: Embedder) -> list[str]:
     return [text if await embedder.tokenizer.estimate_token_count(text) else "" for text in chunks]
 
 
+async def embedding_batches(
+    embedder: Embedder,
+    texts: Sequence[str],
+    max_batch_size: Optional[int] = None,
+) -> list[range]:
+    """Splits the given texts into consecutive batches (as ranges of their indices),
+    each small enough to be embedded in a single request to the given embedder."""
+    batches = []
+    batch_start = 0
+    batch_token_count = 0
+
+    for i, text in enumerate(texts):
+        token_count = await embedder.tokenizer.estimate_token_count(text)
+
+        if i > batch_start and (
+            batch_token_count + token_count > embedder.max_tokens
+            or (max_batch_size is not None and i - batch_start >= max_batch_size)
+        ):
+            batches.append(range(batch_start, i))
+            batch_start = i
+            batch_token_count = 0
+
+        batch_token_count += token_count
+
+    if batch_start < len(texts):
+        batches.append(range(batch_start, len(texts)))
+
+    return batches
+
+
+async def embed_with_cache(
+    embedder: Embedder,
+    embedder_type: type[Embedder],
+    cache: EmbeddingCache,
+    texts: Sequence[str],
+) -> list[Sequence[float]]:
+    """Embeds the given texts, sending only those that aren't cached to the embedder
+    (in as few requests as it allows), and caches the vectors it returns."""
+    vectors = list(await cache.get_many(embedder_type, texts, embedder=embedder))
+
+    missing = [i for i, v in enumerate(vectors) if v is None]
+    missing_texts = [texts[i] for i in missing]
+
+    for batch in await embedding_batches(embedder, missing_texts):
+        batch_texts = [missing_texts[i] for i in batch]
+        batch_vectors = (await embedder.embed(batch_texts)).vectors
+
+        await cache.set_many(embedder_type, batch_texts, batch_vectors, embedder=embedder)
+
+        for i, vector in zip(batch, batch_vectors):
+            vectors[missing[i]] = vector
+
+    return cast(list[Sequence[float]], vectors)
+
+
+@dataclass(frozen=True)
+class QueryPart:
+    """A part of a retrieval query, which is chunked separately from the other parts.
+
+    The distances of documents found for the part's chunks are divided by its weight,
+    so parts with lower weights (e.g., older messages) count for less.
+    """
+
+    text: str
+    weight: float = 1.0
+
+
+RetrievalQuery = str | Sequence[QueryPart]
+
+
+async def weighted_query_chunks(
+    query: RetrievalQuery,
+    embedder: Embedder,
+) -> list[tuple[str, float]]:
+    parts = [QueryPart(query)] if isinstance(query, str) else query
+
+    weights: dict[str, float] = {}
+
+    for part in parts:
+        if not part.text.strip():
+            continue
+
+        for chunk in await query_chunks(part.text, embedder):
+            weights[chunk] = max(weights.get(chunk, 0.0), part.weight)
+
+    return list(weights.items())
+
+
+def weigh_similar_documents(
+    results: Sequence[Sequence[SimilarDocumentResult[TDocument]]],
+    weights: Sequence[float],
+) -> list[SimilarDocumentResult[TDocument]]:
+    return [
+        replace(r, distance=r.distance / weight)
+        for chunk_results, weight in zip(results, weights, strict=True)
+        for r in chunk_results
+    ]
+
+
+def closest_unique_documents(
+    results: Sequence[SimilarDocumentResult[TDocument]],
+) -> list[SimilarDocumentResult[TDocument]]:
+    # Results are equal when their documents are, so this keeps
+    # the closest result for each document
+    return list(dict.fromkeys(sorted(results, key=lambda r: r.distance)))
+
+
 T = TypeVar("T")
 
 
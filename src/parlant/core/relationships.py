@@ -13,14 +13,13 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import NewType, Optional, Sequence, Union, cast
+from typing import Mapping, NewType, Optional, Sequence, Union, cast
 from typing_extensions import override, TypedDict, Self
 
-import networkx  # type: ignore
-
 from parlant.core.async_utils import ReaderWriterLock
 from parlant.core.common import ItemNotFoundError, UniqueId, Version, IdGenerator
 from parlant.core.guidelines import GuidelineId
@@ -133,6 +132,21 @@ class RelationshipStore(ABC):
         target_id: Optional[RelationshipEntityId] = None,
     ) -> Sequence[Relationship]: ...
 
+    @abstractmethod
+    async def list_relationships_for_many(
+        self,
+        kind: Optional[RelationshipKind] = None,
+        indirect: bool = True,
+        source_ids: Sequence[RelationshipEntityId] = [],
+        target_ids: Sequence[RelationshipEntityId] = [],
+    ) -> Mapping[RelationshipEntityId, Sequence[Relationship]]:
+        """Lists the relationships of many entities at once, returning for each of them
+        the relationships it would get from list_relationships() as a source or a target."""
+        ...
+
+
+_Adjacency = dict[RelationshipEntityId, dict[RelationshipEntityId, Relationship]]
+
 
 class GuidelineRelationshipDocument_v0_1_0(TypedDict, total=False):
     id: ObjectId
@@ -175,7 +189,17 @@ class RelationshipDocumentStore(RelationshipStore):
 
         self._database = database
         self._collection: DocumentCollection[RelationshipDocument]
-        self._graphs: dict[RelationshipKind | RelationshipKind, networkx.DiGraph] = {}
+
+        # Relationships by kind, indexed from both of their ends
+        self._successors: dict[RelationshipKind, _Adjacency] = {k: {} for k in RelationshipKind}
+        self._predecessors: dict[RelationshipKind, _Adjacency] = {k: {} for k in RelationshipKind}
+
+        # Relationships reachable from an entity (or reaching it, when reversed),
+        # computed on first use and dropped whenever relationships of their kind change
+        self._closures: dict[
+            RelationshipKind, dict[tuple[RelationshipEntityId, bool], list[Relationship]]
+        ] = {k: {} for k in RelationshipKind}
+
         self._allow_migration = allow_migration
         self._lock = ReaderWriterLock()
 
@@ -206,6 +230,9 @@ class RelationshipDocumentStore(RelationshipStore):
                 document_loader=self._document_loader,
             )
 
+        for d in await self._collection.find({}):
+            self._index(self._deserialize(d))
+
         return self
 
     async def __aexit__(
@@ -275,37 +302,68 @@ class RelationshipDocumentStore(RelationshipStore):
             kind=kind,
         )
 
-    async def _get_relationships_graph(self, kind: RelationshipKind) -> networkx.DiGraph:
-        if kind not in self._graphs:
-            g = networkx.DiGraph()
-            g.graph["strict"] = True  # Ensure no loops are allowed
-
-            relationships = [
-                self._deserialize(d)
-                for d in await self._collection.find(filters={"kind": {"$eq": kind.value}})
-            ]
-
-            nodes = set()
-            edges = list()
-
-            for r in relationships:
-                nodes.add(r.source.id)
-                nodes.add(r.target.id)
-                edges.append(
-                    (
-                        r.source.id,
-                        r.target.id,
-                        {
-                            "id": r.id,
-                        },
-                    )
-                )
+    def _index(self, relationship: Relationship) -> None:
+        source_id, target_id = relationship.source.id, relationship.target.id
+
+        self._successors[relationship.kind].setdefault(source_id, {})[target_id] = relationship
+        self._predecessors[relationship.kind].setdefault(target_id, {})[source_id] = relationship
 
-            g.update(edges=edges, nodes=nodes)
+        self._closures[relationship.kind].clear()
 
-            self._graphs[kind] = g
+    def _unindex(self, relationship: Relationship) -> None:
+        source_id, target_id = relationship.source.id, relationship.target.id
 
-        return self._graphs[kind]
+        self._successors[relationship.kind].get(source_id, {}).pop(target_id, None)
+        self._predecessors[relationship.kind].get(target_id, {}).pop(source_id, None)
+
+        self._closures[relationship.kind].clear()
+
+    def _reachable_relationships(
+        self,
+        kind: RelationshipKind,
+        entity_id: RelationshipEntityId,
+        reverse: bool,
+    ) -> list[Relationship]:
+        # Walks the relationships breadth-first, following each one
+        # only to an entity that hasn't been reached yet
+        closures = self._closures[kind]
+
+        if (entity_id, reverse) not in closures:
+            adjacency = self._predecessors[kind] if reverse else self._successors[kind]
+
+            reached = {entity_id}
+            queue = deque([entity_id])
+            relationships = []
+
+            while queue:
+                for neighbor_id, relationship in adjacency.get(queue.popleft(), {}).items():
+                    if neighbor_id not in reached:
+                        reached.add(neighbor_id)
+                        queue.append(neighbor_id)
+                        relationships.append(relationship)
+
+            closures[(entity_id, reverse)] = relationships
+
+        return closures[(entity_id, reverse)]
+
+    def _list_entity_relationships(
+        self,
+        kinds: Sequence[RelationshipKind],
+        entity_id: RelationshipEntityId,
+        reverse: bool,
+        indirect: bool,
+    ) -> list[Relationship]:
+        if indirect:
+            return [r for k in kinds for r in self._reachable_relationships(k, entity_id, reverse)]
+
+        adjacencies = self._predecessors if reverse else self._successors
+
+        return [r for k in kinds for r in adjacencies[k].get(entity_id, {}).values()]
+
+    @property
+    def revision(self) -> int:
+        """A number that increases whenever the store is written to."""
+        return self._lock.write_count
 
     @override
     async def create_relationship(
@@ -340,16 +398,7 @@ class RelationshipDocumentStore(RelationshipStore):
 
             assert result.updated_document
 
-            graph = await self._get_relationships_graph(kind)
-
-            graph.add_node(source.id)
-            graph.add_node(target.id)
-
-            graph.add_edge(
-                source.id,
-                target.id,
-                id=relationship.id,
-            )
+            self._index(relationship)
 
         return relationship
 
@@ -377,14 +426,10 @@ class RelationshipDocumentStore(RelationshipStore):
             if not relationship_document:
                 raise ItemNotFoundError(item_id=UniqueId(id))
 
-            relationship = self._deserialize(relationship_document)
-
-            graph = await self._get_relationships_graph(relationship.kind)
-
-            graph.remove_edge(relationship.source.id, relationship.target.id)
-
             await self._collection.delete_one(filters={"id": {"$eq": id}})
 
+            self._unindex(self._deserialize(relationship_document))
+
     @override
     async def list_relationships(
         self,
@@ -393,32 +438,6 @@ class RelationshipDocumentStore(RelationshipStore):
         source_id: Optional[RelationshipEntityId] = None,
         target_id: Optional[RelationshipEntityId] = None,
     ) -> Sequence[Relationship]:
-        async def get_node_relationships_by_kind(
-            source_id: RelationshipEntityId,
-            reversed_graph: bool = False,
-        ) -> Sequence[Relationship]:
-            if not graph.has_node(source_id):
-                return []
-
-            _graph = graph.reverse() if reversed_graph else graph
-
-            descendant_edges = networkx.bfs_edges(_graph, source_id)
-            relationships = []
-
-            for edge_source, edge_target in descendant_edges:
-                edge_data = _graph.get_edge_data(edge_source, edge_target)
-
-                relationship_document = await self._collection.find_one(
-                    filters={"id": {"$eq": edge_data["id"]}},
-                )
-
-                if not relationship_document:
-                    raise ItemNotFoundError(item_id=UniqueId(edge_data["id"]))
-
-                relationships.append(self._deserialize(relationship_document))
-
-            return relationships
-
         async with self._lock.reader_lock:
             if not source_id and not target_id:
                 filters = {**({"kind": {"$eq": kind.value}} if kind else {})}
@@ -427,59 +446,39 @@ class RelationshipDocumentStore(RelationshipStore):
                     for d in await self._collection.find(filters=cast(Where, filters))
                 ]
 
+            kinds = [kind] if kind else list(RelationshipKind)
             relationships: list[Relationship] = []
 
-            if indirect:
-                for _kind in (
-                    [kind]
-                    if kind
-                    else [
-                        *list(RelationshipKind),
-                        *list(RelationshipKind),
-                    ]
-                ):
-                    graph = await self._get_relationships_graph(_kind)
-
-                    if source_id:
-                        relationships.extend(
-                            await get_node_relationships_by_kind(source_id, reversed_graph=False)
-                        )
-                    if target_id:
-                        relationships.extend(
-                            await get_node_relationships_by_kind(target_id, reversed_graph=True)
-                        )
-
-                return relationships
-            else:
-                if source_id:
-                    relationships.extend(
-                        [
-                            self._deserialize(d)
-                            for d in await self._collection.find(
-                                filters={
-                                    "source": {
-                                        "$eq": source_id.to_string()
-                                        if isinstance(source_id, ToolId)
-                                        else str(source_id)
-                                    }
-                                }
-                            )
-                        ]
-                    )
-                if target_id:
-                    relationships.extend(
-                        [
-                            self._deserialize(d)
-                            for d in await self._collection.find(
-                                filters={
-                                    "target": {
-                                        "$eq": target_id.to_string()
-                                        if isinstance(target_id, ToolId)
-                                        else str(target_id)
-                                    }
-                                }
-                            )
-                        ]
-                    )
+            if source_id:
+                relationships.extend(
+                    self._list_entity_relationships(kinds, source_id, False, indirect)
+                )
+            if target_id:
+                relationships.extend(
+                    self._list_entity_relationships(kinds, target_id, True, indirect)
+                )
 
         return relationships
+
+    @override
+    async def list_relationships_for_many(
+        self,
+        kind: Optional[RelationshipKind] = None,
+        indirect: bool = True,
+        source_ids: Sequence[RelationshipEntityId] = [],
+        target_ids: Sequence[RelationshipEntityId] = [],
+    ) -> Mapping[RelationshipEntityId, Sequence[Relationship]]:
+        kinds = [kind] if kind else list(RelationshipKind)
+        result: dict[RelationshipEntityId, list[Relationship]] = {}
+
+        async with self._lock.reader_lock:
+            for entity_id in dict.fromkeys(source_ids):
+                result.setdefault(entity_id, []).extend(
+                    self._list_entity_relationships(kinds, entity_id, False, indirect)
+                )
+            for entity_id in dict.fromkeys(target_ids):
+                result.setdefault(entity_id, []).extend(
+                    self._list_entity_relationships(kinds, entity_id, True, indirect)
+                )
+
+        return result
@@ -15,6 +15,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
+import math
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -28,8 +30,9 @@ from typing import (
     cast,
 )
 from typing_extensions import override, TypedDict, NotRequired, Self
+from weakref import WeakValueDictionary
+from cachetools import LRUCache
 
-from parlant.core import async_utils
 from parlant.core.async_utils import ReaderWriterLock, Timeout
 from parlant.core.common import (
     ItemNotFoundError,
@@ -180,6 +183,7 @@ SessionStatus: TypeAlias = Literal[
     "ready",
     "typing",
     "error",
+    "busy",
 ]
 
 
@@ -553,7 +557,13 @@ class _ToolEventData_v0_5_0(TypedDict):
 class SessionDocumentStore(SessionStore):
     VERSION = Version.from_string("0.6.0")
 
-    def __init__(self, database: DocumentDatabase, allow_migration: bool = False):
+    def __init__(
+        self,
+        database: DocumentDatabase,
+        allow_migration: bool = False,
+        cache_event_offsets: bool = False,
+        max_cached_event_offsets: int = 10_000,
+    ):
         self._database = database
         self._session_collection: DocumentCollection[_SessionDocument]
         self._event_collection: DocumentCollection[_EventDocument]
@@ -562,6 +572,15 @@ class SessionDocumentStore(SessionStore):
 
         self._lock = ReaderWriterLock()
 
+        # Events are appended under a per-session lock (alongside a shared hold of the
+        # store-wide lock), so that concurrent sessions don't contend with each other.
+        self._session_locks: WeakValueDictionary[SessionId, asyncio.Lock] = WeakValueDictionary()
+        # Tracking each session's next event offset in memory, rather than counting its events
+        # on every write, is only correct when no other process writes to the same database.
+        self._cache_event_offsets = cache_event_offsets
+        self._next_event_offsets = LRUCache[SessionId, int](maxsize=max_cached_event_offsets)
+        self._event_signals: WeakValueDictionary[SessionId, asyncio.Event] = WeakValueDictionary()
+
     async def _session_document_loader(self, doc: BaseDocument) -> Optional[_SessionDocument]:
         async def v0_1_0_to_v0_4_0(doc: BaseDocument) -> Optional[BaseDocument]:
             doc = cast(_SessionDocument_v0_4_0, doc)
@@ -1102,16 +1121,12 @@ class SessionDocumentStore(SessionStore):
         session_id: SessionId,
     ) -> None:
         async with self._lock.writer_lock:
-            events = await self._event_collection.find(filters={"session_id": {"$eq": session_id}})
-            await async_utils.safe_gather(
-                *(
-                    self._event_collection.delete_one(filters={"id": {"$eq": e["id"]}})
-                    for e in events
-                )
-            )
+            await self._event_collection.delete_many(filters={"session_id": {"$eq": session_id}})
 
             await self._session_collection.delete_one({"id": {"$eq": session_id}})
 
+            self._next_event_offsets.pop(session_id, None)
+
     @override
     async def read_session(
         self,
@@ -1177,33 +1192,69 @@ class SessionDocumentStore(SessionStore):
         data: JSONSerializable,
         creation_utc: Optional[datetime] = None,
     ) -> Event:
-        async with self._lock.writer_lock:
+        async with self._lock.reader_lock:
             if not await self._session_collection.find_one(filters={"id": {"$eq": session_id}}):
                 raise ItemNotFoundError(item_id=UniqueId(session_id), message="Session not found")
 
-            session_events = await self.list_events(
-                session_id
-            )  # FIXME: we need a more efficient way to do this
-            creation_utc = creation_utc or datetime.now(timezone.utc)
-            offset = len(list(session_events))
+            async with self._session_lock(session_id):
+                creation_utc = creation_utc or datetime.now(timezone.utc)
+                offset = await self._next_event_offset(session_id)
+
+                event = Event(
+                    id=EventId(generate_id()),
+                    source=source,
+                    kind=kind,
+                    offset=offset,
+                    creation_utc=creation_utc,
+                    correlation_id=correlation_id,
+                    data=data,
+                    deleted=False,
+                )
 
-            event = Event(
-                id=EventId(generate_id()),
-                source=source,
-                kind=kind,
-                offset=offset,
-                creation_utc=creation_utc,
-                correlation_id=correlation_id,
-                data=data,
-                deleted=False,
-            )
+                await self._event_collection.insert_one(
+                    document=self._serialize_event(event, session_id)
+                )
 
-            await self._event_collection.insert_one(
-                document=self._serialize_event(event, session_id)
-            )
+                if self._cache_event_offsets:
+                    self._next_event_offsets[session_id] = offset + 1
+
+            if signal := self._event_signals.pop(session_id, None):
+                signal.set()
 
         return event
 
+    def event_creation_signal(self, session_id: SessionId) -> asyncio.Event:
+        """Returns a signal that is set once the next event is created in the session."""
+
+        if (signal := self._event_signals.get(session_id)) is None:
+            signal = asyncio.Event()
+            self._event_signals[session_id] = signal
+
+        return signal
+
+    def _session_lock(self, session_id: SessionId) -> asyncio.Lock:
+        if (lock := self._session_locks.get(session_id)) is None:
+            lock = asyncio.Lock()
+            self._session_locks[session_id] = lock
+
+        return lock
+
+    async def _next_event_offset(self, session_id: SessionId) -> int:
+        # An event's offset is the number of non-deleted events preceding it.
+        # When caching, this is counted once per session, and then tracked as events
+        # are created and deleted, so it doesn't depend on the session's length.
+        if (offset := self._next_event_offsets.get(session_id)) is not None:
+            return offset
+
+        return len(
+            await self._event_collection.find(
+                filters={
+                    "session_id": {"$eq": session_id},
+                    "deleted": {"$eq": False},
+                }
+            )
+        )
+
     @override
     async def read_event(
         self,
@@ -1226,14 +1277,24 @@ class SessionDocumentStore(SessionStore):
         self,
         event_id: EventId,
     ) -> None:
-        async with self._lock.writer_lock:
-            result = await self._event_collection.update_one(
-                filters={"id": {"$eq": event_id}},
-                params={"deleted": True},
+        async with self._lock.reader_lock:
+            event_document = await self._event_collection.find_one(
+                filters={"id": {"$eq": event_id}}
             )
 
-        if result.matched_count == 0:
-            raise ItemNotFoundError(item_id=UniqueId(event_id), message="Event not found")
+            if not event_document:
+                raise ItemNotFoundError(item_id=UniqueId(event_id), message="Event not found")
+
+            session_id = event_document["session_id"]
+
+            async with self._session_lock(session_id):
+                result = await self._event_collection.update_one(
+                    filters={"id": {"$eq": event_id}, "deleted": {"$eq": False}},
+                    params={"deleted": True},
+                )
+
+                if result.matched_count and session_id in self._next_event_offsets:
+                    self._next_event_offsets[session_id] -= 1
 
     @override
     async def list_events(
@@ -1376,3 +1437,67 @@ class PollingSessionListener(SessionListener):
                 return False
             else:
                 await timeout.wait_up_to(0.25)
+
+
+class NotifyingSessionListener(SessionListener):
+    """Wakes up as soon as a matching event is created, without polling the store meanwhile.
+
+    Notifications only cover events created through this process's SessionDocumentStore.
+    Any other store is polled instead, and so should a store whose database is shared
+    with other server instances (use PollingSessionListener for that).
+    """
+
+    def __init__(self, session_store: SessionStore) -> None:
+        self._session_store = session_store
+        self._polling_listener = PollingSessionListener(session_store)
+
+    @override
+    async def wait_for_events(
+        self,
+        session_id: SessionId,
+        kinds: Sequence[EventKind] = [],
+        min_offset: Optional[int] = None,
+        source: Optional[EventSource] = None,
+        correlation_id: Optional[str] = None,
+        timeout: Timeout = Timeout.infinite(),
+    ) -> bool:
+        if not isinstance(self._session_store, SessionDocumentStore):
+            return await self._polling_listener.wait_for_events(
+                session_id,
+                kinds=kinds,
+                min_offset=min_offset,
+                source=source,
+                correlation_id=correlation_id,
+                timeout=timeout,
+            )
+
+        # Trigger exception if not found
+        _ = await self._session_store.read_session(session_id)
+
+        while True:
+            # Take the signal before checking, so that an event
+            # created in between can't slip by unnoticed.
+            signal = self._session_store.event_creation_signal(session_id)
+
+            events = await self._session_store.list_events(
+                session_id,
+                min_offset=min_offset,
+                source=source,
+                kinds=kinds,
+                correlation_id=correlation_id,
+            )
+
+            if events:
+                return True
+            elif timeout.expired():
+                return False
+
+            remaining = timeout.remaining()
+
+            try:
+                await asyncio.wait_for(
+                    signal.wait(),
+                    timeout=None if remaining == math.inf else remaining,
+                )
+            except asyncio.TimeoutError:
+                return False
@@ -14,7 +14,8 @@
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import TypeVar, Generic, Sequence, cast
+from functools import wraps
+from typing import Any, Callable, TypeVar, Generic, Sequence, cast
 
 from parlant.core.common import generate_id, JSONSerializable
 from parlant.core.sessions import (
@@ -60,6 +61,39 @@ class Shot:
 
 
 TShot = TypeVar("TShot", bound=Shot)
+TFormatter = TypeVar("TFormatter")
+
+_MAX_FORMATTED_SHOT_SETS = 1024
+
+
+def memoized_shot_formatting(
+    format_shots: Callable[[TFormatter, Sequence[TShot]], str],
+) -> Callable[[TFormatter, Sequence[TShot]], str]:
+    """Memoizes a method formatting shots into prompt text, per formatter class.
+
+    Shots are static once created, so the text of a given sequence of shots is
+    only ever produced once, rather than on every prompt that includes them.
+    """
+    formatted: dict[tuple[type, tuple[int, ...]], tuple[Sequence[Any], str]] = {}
+
+    @wraps(format_shots)
+    def wrapper(self: TFormatter, shots: Sequence[TShot]) -> str:
+        key = (type(self), tuple(map(id, shots)))
+
+        if entry := formatted.get(key):
+            return entry[1]
+
+        if len(formatted) >= _MAX_FORMATTED_SHOT_SETS:
+            formatted.clear()
+
+        text = format_shots(self, shots)
+
+        # Holding on to the shots keeps their IDs from being reused by other objects
+        formatted[key] = (tuple(shots), text)
+
+        return text
+
+    return wrapper
 
 
 class ShotCollection(Generic[TShot]):
@@ -59,6 +59,8 @@ from lagom import Container
 
 
 from parlant.adapters.db.json_file import JSONFileDocumentCollection, JSONFileDocumentDatabase
+from parlant.adapters.db.json_log import JSONLogDocumentDatabase
+from parlant.adapters.db.sqlite import SQLiteDocumentDatabase
 from parlant.adapters.db.transient import TransientDocumentDatabase
 from parlant.adapters.vector_db.transient import TransientVectorDatabase
 from parlant.api.authorization import (
@@ -72,6 +74,7 @@ from parlant.api.authorization import (
     RateLimiter,
 )
 from parlant.core import async_utils
+from parlant.core.admission import AdmissionController, AdmissionLimits, OverloadResponse
 from parlant.core.agents import (
     AgentDocumentStore,
     AgentId,
@@ -109,12 +112,14 @@ from parlant.core.nlp.embedding import (
     EmbedderFactory,
     EmbeddingCache,
     EmbeddingResult,
+    QueryEmbeddingMemo,
 )
 from parlant.core.nlp.generation import (
     FallbackSchematicGenerator,
     SchematicGenerationResult,
     SchematicGenerator,
 )
+from parlant.core.nlp.scheduling import LLMPriority, LLMRateLimits, LLMScheduler
 from parlant.core.nlp.tokenization import EstimatingTokenizer
 from parlant.core.persistence.common import ObjectId
 from parlant.core.persistence.document_database import DocumentDatabase, identity_loader_for
@@ -133,9 +138,11 @@ from parlant.core.sessions import (
     EventKind,
     EventSource,
     MessageEventData,
+    PollingSessionListener,
     Session,
     SessionId,
     SessionDocumentStore,
+    SessionListener,
     SessionStore,
     StatusEventData,
     ToolCall as _SessionToolCall,
@@ -2025,6 +2032,9 @@ class Server:
         tool_service_port: The port for the integrated tool service.
         nlp_service: A factory function to create an NLP service instance. See `NLPServiceFactories` for available options.
         session_store: The session store to use for managing sessions.
+            Use "local-log" to persist to an append-only log rather than a JSON file,
+            which keeps writes cheap as the session history grows,
+            or "local-sqlite" to persist to an indexed SQLite database file.
         customer_store: The customer store to use for managing customers.
         log_level: The logging level for the server.
         modules: A list of module names to load for the server.
@@ -2039,8 +2049,12 @@ class Server:
         port: int = 8800,
         tool_service_port: int = 8818,
         nlp_service: Callable[[Container], NLPService] = NLPServices.openai,
-        session_store: Literal["transient", "local"] | str | SessionStore = "transient",
-        customer_store: Literal["transient", "local"] | str | CustomerStore = "transient",
+        session_store: Literal["transient", "local", "local-log", "local-sqlite"]
+        | str
+        | SessionStore = "transient",
+        customer_store: Literal["transient", "local", "local-log", "local-sqlite"]
+        | str
+        | CustomerStore = "transient",
         log_level: LogLevel = LogLevel.INFO,
         modules: list[str] = [],
         migrate: bool = False,
@@ -2686,11 +2700,11 @@ class Server:
 
         str_conditions = [c for c in conditions if isinstance(c, str)]
 
-        for str_condition in str_conditions:
-            guideline = await self._container[GuidelineStore].create_guideline(
-                condition=str_condition,
-            )
+        str_condition_guidelines = await self._container[GuidelineStore].create_guidelines(
+            [{"condition": str_condition} for str_condition in str_conditions]
+        )
 
+        for str_condition, guideline in zip(str_conditions, str_condition_guidelines):
             self._add_guideline_evaluation(
                 guideline.id,
                 GuidelineContent(condition=str_condition, action=None),
@@ -2804,6 +2818,22 @@ class Server:
                     ),
                 )
 
+            def make_json_log_db(file_path: Path) -> Awaitable[DocumentDatabase]:
+                return self._exit_stack.enter_async_context(
+                    JSONLogDocumentDatabase(
+                        c()[Logger],
+                        file_path,
+                    ),
+                )
+
+            def make_sqlite_db(file_path: Path) -> Awaitable[DocumentDatabase]:
+                return self._exit_stack.enter_async_context(
+                    SQLiteDocumentDatabase(
+                        c()[Logger],
+                        file_path,
+                    ),
+                )
+
             mongo_client: object | None = None
 
             async def make_mongo_db(url: str, name: str) -> DocumentDatabase:
@@ -2816,11 +2846,11 @@ class Server:
                     )
 
                 from pymongo import AsyncMongoClient
-                from parlant.adapters.db.mongo_db import MongoDocumentDatabase
+                from parlant.adapters.db.mongo_db import MongoClientSettings, MongoDocumentDatabase
 
                 if mongo_client is None:
                     mongo_client = await self._exit_stack.enter_async_context(
-                        AsyncMongoClient[Any](url)
+                        MongoClientSettings.from_environment().create_client(url)
                     )
 
                 db = await self._exit_stack.enter_async_context(
@@ -2828,6 +2858,8 @@ class Server:
                         mongo_client=cast(AsyncMongoClient[Any], mongo_client),
                         database_name=f"parlant_{name}",
                         logger=c()[Logger],
+                        # Polling for new events filters them by both of these
+                        collection_indexes={"events": [("session_id", "offset")]},
                     )
                 )
 
@@ -2836,7 +2868,7 @@ class Server:
             async def make_persistable_store(t: type[T], spec: str, name: str, **kwargs: Any) -> T:
                 store: T
 
-                if spec in ["transient", "local"]:
+                if spec in ["transient", "local", "local-log", "local-sqlite"]:
                     store = await self._exit_stack.enter_async_context(
                         t(
                             database=await cast(
@@ -2846,6 +2878,12 @@ class Server:
                                     "local": lambda: make_json_db(
                                         PARLANT_HOME_DIR / f"{name}.json"
                                     ),
+                                    "local-log": lambda: make_json_log_db(
+                                        PARLANT_HOME_DIR / f"{name}.jsonl"
+                                    ),
+                                    "local-sqlite": lambda: make_sqlite_db(
+                                        PARLANT_HOME_DIR / f"{name}.sqlite"
+                                    ),
                                 },
                             )[spec](),
                             allow_migration=self._migrate,
@@ -2867,16 +2905,28 @@ class Server:
                 else:
                     raise SDKError(
                         f"Invalid session store type: {self._session_store}. "
-                        "Expected 'transient', 'local', or a MongoDB connection string."
+                        "Expected 'transient', 'local', 'local-log', 'local-sqlite', "
+                        "or a MongoDB connection string."
                     )
 
             if isinstance(self._session_store, SessionStore):
                 c()[SessionStore] = self._session_store
             else:
                 c()[SessionStore] = await make_persistable_store(
-                    SessionDocumentStore, self._session_store, "sessions"
+                    SessionDocumentStore,
+                    self._session_store,
+                    "sessions",
+                    # Other processes may share an SQLite file or a MongoDB database
+                    cache_event_offsets=self._session_store in ["transient", "local", "local-log"],
                 )
 
+                if self._session_store == "local-sqlite" or self._session_store.startswith(
+                    ("mongodb://", "mongodb+srv://")
+                ):
+                    # Other processes may write events to the same SQLite file or MongoDB
+                    # database, and those can only be picked up by polling it.
+                    c()[SessionListener] = PollingSessionListener(c()[SessionStore])
+
             if isinstance(self._customer_store, CustomerStore):
                 c()[CustomerStore] = self._customer_store
             else:
@@ -2898,7 +2948,13 @@ class Server:
                 )
             )
 
-            embedder_factory = EmbedderFactory(c())
+            if LLMScheduler not in c().defined_types:
+                c()[LLMScheduler] = LLMScheduler(
+                    c()[ContextualCorrelator],
+                    default_limits=LLMRateLimits.from_environment(),
+                )
+
+            embedder_factory = EmbedderFactory(c(), scheduler=c()[LLMScheduler])
 
             async def get_embedder_type() -> type[Embedder]:
                 return type(await c()[NLPService].get_embedder())
@@ -2916,6 +2972,7 @@ class Server:
                             c()[Logger],
                             embedder_factory,
                             lambda: c()[EmbeddingCache],
+                            query_embedding_memo=c()[QueryEmbeddingMemo],
                         ),
                         document_db=TransientDocumentDatabase(),
                         embedder_factory=embedder_factory,
@@ -2991,6 +3048,8 @@ class Server:
 
 
 __all__ = [
+    "AdmissionController",
+    "AdmissionLimits",
     "Agent",
     "AgentId",
     "AuthorizationException",
@@ -3031,6 +3090,9 @@ __all__ = [
     "JourneyTransitionId",
     "JSONSerializable",
     "Lifespan",
+    "LLMPriority",
+    "LLMRateLimits",
+    "LLMScheduler",
     "LoadedContext",
     "LogLevel",
     "Logger",
@@ -3042,6 +3104,7 @@ __all__ = [
     "NLPService",
     "NLPServices",
     "OptimizationPolicy",
+    "OverloadResponse",
     "PromptBuilder",
     "PromptSection",
     "BasicOptimizationPolicy",
@@ -833,3 +833,35 @@ async def test_that_in_filter_works_with_single_tag(
             assert len(terms) == 1
             assert terms[0].id == first_term.id
             assert terms[0].name == "Bazoo"
+
+
+async def test_that_many_documents_are_inserted_updated_and_deleted_at_once(
+    chroma_collection: ChromaCollection[_TestDocument],
+    doc_version: Version.String,
+) -> None:
+    await chroma_collection.insert_many(
+        [
+            _TestDocument(
+                id=ObjectId(str(i)),
+                version=doc_version,
+                content=f"content {i}",
+                name="original",
+                checksum=md5_checksum(f"content {i}"),
+            )
+            for i in range(5)
+        ]
+    )
+
+    update_result = await chroma_collection.update_many(
+        {"id": {"$in": ["0", "1", "2"]}},
+        {"name": "updated"},  # type: ignore
+    )
+    delete_result = await chroma_collection.delete_many({"name": {"$eq": "original"}})
+
+    assert update_result.matched_count == 3
+    assert delete_result.deleted_count == 2
+
+    remaining = await chroma_collection.find({})
+
+    assert sorted(d["id"] for d in remaining) == ["0", "1", "2"]
+    assert all(d["name"] == "updated" and d["content"].startswith("content") for d in remaining)
@@ -0,0 +1,288 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+from typing import AsyncIterator, Optional
+import tempfile
+from lagom import Container
+from pytest import fixture, raises
+
+from parlant.adapters.db.json_log import JSONLogDocumentDatabase
+from parlant.core.agents import AgentId
+from parlant.core.common import Version
+from parlant.core.customers import CustomerId
+from parlant.core.loggers import Logger
+from parlant.core.persistence.common import ObjectId
+from parlant.core.persistence.document_database import (
+    BaseDocument,
+    identity_loader,
+    identity_loader_for,
+)
+from parlant.core.sessions import EventKind, EventSource, SessionDocumentStore
+
+
+class _TestDocument(BaseDocument, total=False):
+    name: str
+
+
+@fixture
+async def new_file() -> AsyncIterator[Path]:
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory) / "test.jsonl"
+
+
+def read_records(file_path: Path) -> list[dict[str, object]]:
+    return [json.loads(line) for line in file_path.read_text().splitlines()]
+
+
+async def test_that_each_write_appends_a_single_record(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+
+        await collection.insert_one(
+            {"id": ObjectId("1"), "version": Version.String("0.1.0"), "name": "a"}
+        )
+        records_after_first_insert = len(read_records(new_file))
+
+        await collection.insert_one(
+            {"id": ObjectId("2"), "version": Version.String("0.1.0"), "name": "b"}
+        )
+        await collection.update_one({"id": {"$eq": "1"}}, {"name": "c"})
+        await collection.delete_one({"id": {"$eq": "2"}})
+
+        records = read_records(new_file)
+
+    assert len(records) == records_after_first_insert + 3
+    assert records[-2] == {
+        "op": "put",
+        "collection": "things",
+        "document": {"id": "1", "version": Version.String("0.1.0"), "name": "c"},
+    }
+    assert records[-1] == {"op": "delete", "collection": "things", "id": "2"}
+
+
+async def test_that_sessions_and_events_are_replayed_when_reopened(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as session_db:
+        async with SessionDocumentStore(session_db) as session_store:
+            session = await session_store.create_session(
+                creation_utc=datetime.now(timezone.utc),
+                customer_id=CustomerId("test_customer"),
+                agent_id=AgentId("test_agent"),
+            )
+
+            event = await session_store.create_event(
+                session_id=session.id,
+                source=EventSource.CUSTOMER,
+                kind=EventKind.MESSAGE,
+                correlation_id="<main>",
+                data={"message": "Hello, world!"},
+                creation_utc=datetime.now(timezone.utc),
+            )
+
+            await session_store.update_session(session.id, {"title": "Greetings"})
+
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as session_db:
+        async with SessionDocumentStore(session_db) as session_store:
+            loaded_session = await session_store.read_session(session.id)
+            loaded_events = await session_store.list_events(session.id)
+
+    assert loaded_session.title == "Greetings"
+    assert len(loaded_events) == 1
+    assert loaded_events[0].id == event.id
+    assert loaded_events[0].data == event.data
+
+
+async def test_that_an_incomplete_trailing_record_is_discarded_on_replay(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+        await collection.insert_one(
+            {"id": ObjectId("1"), "version": Version.String("0.1.0"), "name": "a"}
+        )
+
+    with open(new_file, "a") as f:
+        f.write('{"op":"put","collection":"things","document":{"id":"2"')
+
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+        documents = await collection.find({})
+
+        await collection.insert_one(
+            {"id": ObjectId("3"), "version": Version.String("0.1.0"), "name": "c"}
+        )
+
+    assert [d["id"] for d in documents] == ["1"]
+
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+        assert [d["id"] for d in await collection.find({})] == ["1", "3"]
+
+
+async def test_that_log_is_compacted_once_superseded_records_accumulate(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with JSONLogDocumentDatabase(
+        container[Logger],
+        new_file,
+        compaction_threshold=10,
+    ) as db:
+        collection = await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+        await collection.insert_one(
+            {"id": ObjectId("1"), "version": Version.String("0.1.0"), "name": "v0"}
+        )
+
+        for i in range(1, 25):
+            await collection.update_one({"id": {"$eq": "1"}}, {"name": f"v{i}"})
+
+        assert len(read_records(new_file)) < 10
+
+    records = read_records(new_file)
+
+    assert records == [
+        {"op": "create", "collection": "things"},
+        {
+            "op": "put",
+            "collection": "things",
+            "document": {"id": "1", "version": Version.String("0.1.0"), "name": "v24"},
+        },
+    ]
+
+
+async def test_that_migrated_documents_are_persisted_and_failed_ones_are_moved(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+        await collection.insert_one(
+            {"id": ObjectId("1"), "version": Version.String("0.1.0"), "name": "ok"}
+        )
+        await collection.insert_one(
+            {"id": ObjectId("2"), "version": Version.String("0.1.0"), "name": "bad"}
+        )
+
+    async def loader(doc: BaseDocument) -> Optional[_TestDocument]:
+        if doc.get("name") == "bad":
+            return None
+        return {"id": doc["id"], "version": Version.String("0.2.0"), "name": "ok"}
+
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_collection("things", _TestDocument, loader)
+        assert len(await collection.find({})) == 1
+
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+        failed_migrations = await db.get_collection(
+            "failed_migrations", BaseDocument, identity_loader
+        )
+
+        assert await collection.find({}) == [
+            {"id": "1", "version": Version.String("0.2.0"), "name": "ok"}
+        ]
+        assert [d["id"] for d in await failed_migrations.find({})] == ["2"]
+
+
+async def test_that_bulk_writes_append_one_record_per_document(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+
+        await collection.insert_many(
+            [
+                {"id": ObjectId(str(i)), "version": Version.String("0.1.0"), "name": "a"}
+                for i in range(4)
+            ]
+        )
+        records_after_insert = len(read_records(new_file))
+
+        await collection.update_many({"id": {"$in": ["0", "1"]}}, {"name": "b"})
+        await collection.delete_many({"name": {"$eq": "a"}})
+
+        records = read_records(new_file)
+
+    assert len(records) == records_after_insert + 4
+    assert records[-2:] == [
+        {"op": "delete", "collection": "things", "id": "2"},
+        {"op": "delete", "collection": "things", "id": "3"},
+    ]
+
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+
+        assert [d["name"] for d in await collection.find({})] == ["b", "b"]
+
+
+async def test_that_a_failed_write_leaves_the_documents_in_memory_unchanged(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with JSONLogDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+
+        await collection.insert_one(
+            {"id": ObjectId("1"), "version": Version.String("0.1.0"), "name": "a"}
+        )
+
+        async def fail_to_append(records: object) -> None:
+            raise OSError("Disk is full")
+
+        db._append_records_unlocked = fail_to_append  # type: ignore
+
+        with raises(OSError):
+            await collection.insert_one(
+                {"id": ObjectId("2"), "version": Version.String("0.1.0"), "name": "b"}
+            )
+
+        with raises(OSError):
+            await collection.update_one({"id": {"$eq": "1"}}, {"name": "c"})
+
+        with raises(OSError):
+            await collection.delete_one({"id": {"$eq": "1"}})
+
+        assert await collection.find({}) == [
+            {"id": "1", "version": Version.String("0.1.0"), "name": "a"}
+        ]
@@ -0,0 +1,130 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+import tempfile
+from typing import AsyncIterator
+from lagom import Container
+from pytest import approx, fixture
+from typing_extensions import override
+
+from parlant.adapters.db.mmap_embedding_cache import MemoryMappedEmbeddingCache
+from parlant.core.loggers import Logger
+from parlant.core.nlp.embedding import NoOpEmbedder
+
+
+class _ModelEmbedder(NoOpEmbedder):
+    def __init__(self, model_name: str, dimensions: int) -> None:
+        super().__init__()
+        self._model_name = model_name
+        self._dimensions = dimensions
+
+    @property
+    @override
+    def id(self) -> str:
+        return f"test/{self._model_name}"
+
+    @property
+    @override
+    def dimensions(self) -> int:
+        return self._dimensions
+
+
+@fixture
+async def new_directory() -> AsyncIterator[Path]:
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory)
+
+
+async def test_that_cached_vectors_survive_reopening_the_cache(
+    container: Container,
+    new_directory: Path,
+) -> None:
+    async with MemoryMappedEmbeddingCache(container[Logger], new_directory) as cache:
+        await cache.set(NoOpEmbedder, ["hello"], [[0.25, 0.5, 0.75]])
+
+    async with MemoryMappedEmbeddingCache(container[Logger], new_directory) as cache:
+        result = await cache.get(NoOpEmbedder, ["hello"])
+
+    assert result
+    assert list(result.vectors[0]) == approx([0.25, 0.5, 0.75])
+
+
+async def test_that_get_many_returns_none_for_texts_that_are_not_cached(
+    container: Container,
+    new_directory: Path,
+) -> None:
+    async with MemoryMappedEmbeddingCache(container[Logger], new_directory) as cache:
+        await cache.set_many(NoOpEmbedder, ["a", "c"], [[1.0, 0.0], [0.0, 1.0]])
+
+        vectors = await cache.get_many(NoOpEmbedder, ["a", "b", "c"])
+
+        assert vectors[0] == approx([1.0, 0.0])
+        assert vectors[1] is None
+        assert vectors[2] == approx([0.0, 1.0])
+
+        assert await cache.get(NoOpEmbedder, ["a", "b"]) is None
+
+
+async def test_that_hints_are_part_of_the_cache_key(
+    container: Container,
+    new_directory: Path,
+) -> None:
+    async with MemoryMappedEmbeddingCache(container[Logger], new_directory) as cache:
+        await cache.set(NoOpEmbedder, ["hello"], [[1.0]], hints={"task": "query"})
+
+        assert await cache.get(NoOpEmbedder, ["hello"]) is None
+        assert await cache.get(NoOpEmbedder, ["hello"], hints={"task": "query"})
+
+
+async def test_that_least_recently_used_vectors_are_evicted_beyond_max_entries(
+    container: Container,
+    new_directory: Path,
+) -> None:
+    async with MemoryMappedEmbeddingCache(container[Logger], new_directory, max_entries=2) as cache:
+        await cache.set(NoOpEmbedder, ["a"], [[1.0]])
+        await cache.set(NoOpEmbedder, ["b"], [[2.0]])
+        await cache.get(NoOpEmbedder, ["a"])
+        await cache.set(NoOpEmbedder, ["c"], [[3.0]])
+
+    async with MemoryMappedEmbeddingCache(container[Logger], new_directory, max_entries=2) as cache:
+        assert await cache.get_many(NoOpEmbedder, ["a", "b", "c"]) == [[1.0], None, [3.0]]
+
+
+async def test_that_changing_dimensions_discards_previously_cached_vectors(
+    container: Container,
+    new_directory: Path,
+) -> None:
+    async with MemoryMappedEmbeddingCache(container[Logger], new_directory) as cache:
+        await cache.set(NoOpEmbedder, ["a"], [[1.0, 2.0]])
+        await cache.set(NoOpEmbedder, ["b"], [[1.0, 2.0, 3.0]])
+
+        assert await cache.get(NoOpEmbedder, ["a"]) is None
+        assert await cache.get(NoOpEmbedder, ["b"])
+
+
+async def test_that_embedders_of_the_same_type_with_different_models_do_not_collide(
+    container: Container,
+    new_directory: Path,
+) -> None:
+    small = _ModelEmbedder("small", dimensions=2)
+    large = _ModelEmbedder("large", dimensions=3)
+
+    async with MemoryMappedEmbeddingCache(container[Logger], new_directory) as cache:
+        await cache.set_many(_ModelEmbedder, ["a"], [[1.0, 2.0]], embedder=small)
+        await cache.set_many(_ModelEmbedder, ["a"], [[1.0, 2.0, 3.0]], embedder=large)
+
+    async with MemoryMappedEmbeddingCache(container[Logger], new_directory) as cache:
+        assert await cache.get_many(_ModelEmbedder, ["a"], embedder=small) == [[1.0, 2.0]]
+        assert await cache.get_many(_ModelEmbedder, ["a"], embedder=large) == [[1.0, 2.0, 3.0]]
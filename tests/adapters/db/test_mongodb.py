@@ -48,12 +48,17 @@ from parlant.core.guidelines import (
     GuidelineDocumentStore,
     GuidelineId,
 )
-from parlant.adapters.db.mongo_db import MongoDocumentDatabase
-from parlant.core.persistence.common import MigrationRequired
+from parlant.adapters.db.mongo_db import (
+    MongoClientSettings,
+    MongoDocumentCollection,
+    MongoDocumentDatabase,
+)
+from parlant.core.persistence.common import MigrationRequired, ObjectId
 from parlant.core.persistence.document_database import (
     BaseDocument,
     DocumentCollection,
     identity_loader,
+    identity_loader_for,
 )
 from parlant.core.persistence.document_database_helper import DocumentStoreMigrationHelper
 from parlant.core.sessions import Event, EventKind, EventSource, Session, SessionDocumentStore
@@ -1070,3 +1075,129 @@ async def test_delete_collection(
 
         collections = await test_mongo_client[test_database_name].list_collection_names()
         assert "guidelines" not in collections
+
+
+class _DummyDocument(BaseDocument):
+    session_id: str
+    offset: int
+    data: str
+
+
+async def test_that_indexes_are_created_for_indexed_fields_and_declared_collection_indexes(
+    context: _TestContext,
+    test_mongo_client: AsyncMongoClient[Any],
+    test_database_name: str,
+) -> None:
+    await test_mongo_client.drop_database(test_database_name)
+
+    for _ in range(2):
+        async with MongoDocumentDatabase(
+            test_mongo_client,
+            test_database_name,
+            context.container[Logger],
+            collection_indexes={"dummy": [("session_id", "offset")]},
+        ) as mongo_db:
+            await mongo_db.get_or_create_collection(
+                "dummy", _DummyDocument, identity_loader_for(_DummyDocument)
+            )
+
+    index_information = await test_mongo_client[test_database_name]["dummy"].index_information()
+    index_keys = [index["key"] for index in index_information.values()]
+
+    assert [("id", 1)] in index_keys
+    assert [("session_id", 1)] in index_keys
+    assert [("session_id", 1), ("offset", 1)] in index_keys
+    assert [("data", 1)] not in index_keys
+
+
+async def test_that_update_and_delete_report_whether_a_document_was_matched(
+    context: _TestContext,
+    test_mongo_client: AsyncMongoClient[Any],
+    test_database_name: str,
+) -> None:
+    await test_mongo_client.drop_database(test_database_name)
+
+    async with MongoDocumentDatabase(
+        test_mongo_client, test_database_name, context.container[Logger]
+    ) as mongo_db:
+        collection = await mongo_db.get_or_create_collection(
+            "dummy", _DummyDocument, identity_loader_for(_DummyDocument)
+        )
+
+        def make_document(data: str) -> _DummyDocument:
+            return _DummyDocument(
+                id=ObjectId("1"),
+                version=Version.String("1.0.0"),
+                session_id="s",
+                offset=0,
+                data=data,
+            )
+
+        await collection.insert_one(make_document("a"))
+
+        missed_update = await collection.update_one({"id": {"$eq": "2"}}, make_document("b"))
+        assert missed_update.matched_count == 0
+        assert missed_update.updated_document is None
+
+        update = await collection.update_one({"id": {"$eq": "1"}}, make_document("b"))
+        assert update.matched_count == 1
+        assert update.updated_document
+        assert update.updated_document["data"] == "b"
+
+        deletion = await collection.delete_one({"id": {"$eq": "1"}})
+        assert deletion.deleted_count == 1
+        assert deletion.deleted_document
+        assert deletion.deleted_document["data"] == "b"
+
+        missed_deletion = await collection.delete_one({"id": {"$eq": "1"}})
+        assert missed_deletion.deleted_count == 0
+        assert missed_deletion.deleted_document is None
+
+
+async def test_that_many_documents_are_inserted_at_once(
+    context: _TestContext,
+    test_mongo_client: AsyncMongoClient[Any],
+    test_database_name: str,
+) -> None:
+    await test_mongo_client.drop_database(test_database_name)
+
+    async with MongoDocumentDatabase(
+        test_mongo_client, test_database_name, context.container[Logger]
+    ) as mongo_db:
+        collection = cast(
+            MongoDocumentCollection[_DummyDocument],
+            await mongo_db.get_or_create_collection(
+                "dummy", _DummyDocument, identity_loader_for(_DummyDocument)
+            ),
+        )
+
+        await collection.insert_many(
+            [
+                _DummyDocument(
+                    id=ObjectId(str(i)),
+                    version=Version.String("1.0.0"),
+                    session_id="s",
+                    offset=i,
+                    data="a",
+                )
+                for i in range(10)
+            ]
+        )
+
+        assert len(await collection.find({"session_id": {"$eq": "s"}})) == 10
+
+
+def test_that_mongo_pool_settings_are_read_from_the_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("PARLANT_MONGO_MAX_POOL_SIZE", "7")
+    monkeypatch.setenv("PARLANT_MONGO_MAX_IDLE_TIME_MS", "5000")
+
+    settings = MongoClientSettings.from_environment()
+
+    assert settings.client_options() == {
+        "maxPoolSize": 7,
+        "minPoolSize": MongoClientSettings().min_pool_size,
+        "maxIdleTimeMS": 5000,
+        "waitQueueTimeoutMS": None,
+    }
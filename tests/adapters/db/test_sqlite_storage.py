@@ -0,0 +1,229 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+from pathlib import Path
+import sqlite3
+from typing import AsyncIterator, Optional
+import tempfile
+from lagom import Container
+from pytest import fixture
+
+from parlant.adapters.db.sqlite import SQLiteDocumentDatabase, translate_filters
+from parlant.core.agents import AgentId
+from parlant.core.common import Version
+from parlant.core.customers import CustomerId
+from parlant.core.loggers import Logger
+from parlant.core.persistence.common import ObjectId, Where
+from parlant.core.persistence.document_database import (
+    BaseDocument,
+    identity_loader,
+    identity_loader_for,
+)
+from parlant.core.sessions import EventKind, EventSource, SessionDocumentStore
+
+
+class _TestDocument(BaseDocument, total=False):
+    session_id: str
+    name: str
+    rank: int
+
+
+@fixture
+async def new_file() -> AsyncIterator[Path]:
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory) / "test.sqlite"
+
+
+def make_document(id: str, name: str, rank: int = 0, session_id: str = "s1") -> _TestDocument:
+    return {
+        "id": ObjectId(id),
+        "version": Version.String("0.1.0"),
+        "session_id": session_id,
+        "name": name,
+        "rank": rank,
+    }
+
+
+async def test_that_filters_are_evaluated_by_the_database(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+
+        for i, name in enumerate(["a", "b", "c", "d"]):
+            await collection.insert_one(make_document(str(i), name, rank=i))
+
+        async def names(filters: Where) -> list[str]:
+            return [d["name"] for d in await collection.find(filters)]
+
+        assert await names({}) == ["a", "b", "c", "d"]
+        assert await names({"name": {"$eq": "b"}}) == ["b"]
+        assert await names({"name": {"$ne": "b"}}) == ["a", "c", "d"]
+        assert await names({"rank": {"$gte": 1, "$lt": 3}}) == ["b", "c"]
+        assert await names({"id": {"$in": ["0", "3", "9"]}}) == ["a", "d"]
+        assert await names({"id": {"$nin": ["0", "3"]}}) == ["b", "c"]
+        assert await names({"id": {"$in": []}}) == []
+        assert await names(
+            {
+                "$or": [
+                    {"name": {"$eq": "a"}},
+                    {"$and": [{"rank": {"$gt": 1}}, {"id": {"$ne": "3"}}]},
+                ]
+            }
+        ) == ["a", "c"]
+
+
+async def test_that_documents_are_updated_and_deleted_in_place(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+
+        await collection.insert_one(make_document("1", "a"))
+        await collection.insert_one(make_document("2", "b"))
+
+        update_result = await collection.update_one({"id": {"$eq": "1"}}, {"name": "c"})
+        missed_update_result = await collection.update_one({"id": {"$eq": "9"}}, {"name": "x"})
+        delete_result = await collection.delete_one({"id": {"$eq": "2"}})
+
+        assert update_result.updated_document == make_document("1", "c")
+        assert missed_update_result.matched_count == 0
+        assert delete_result.deleted_document == make_document("2", "b")
+
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+
+        assert await collection.find({}) == [make_document("1", "c")]
+
+
+async def test_that_sessions_and_events_persist_when_reopened(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as session_db:
+        async with SessionDocumentStore(session_db) as session_store:
+            session = await session_store.create_session(
+                creation_utc=datetime.now(timezone.utc),
+                customer_id=CustomerId("test_customer"),
+                agent_id=AgentId("test_agent"),
+            )
+
+            event = await session_store.create_event(
+                session_id=session.id,
+                source=EventSource.CUSTOMER,
+                kind=EventKind.MESSAGE,
+                correlation_id="<main>",
+                data={"message": "Hello, world!"},
+                creation_utc=datetime.now(timezone.utc),
+            )
+
+            await session_store.update_session(session.id, {"title": "Greetings"})
+
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as session_db:
+        async with SessionDocumentStore(session_db) as session_store:
+            loaded_session = await session_store.read_session(session.id)
+            loaded_events = await session_store.list_events(session.id)
+
+    assert loaded_session.title == "Greetings"
+    assert len(loaded_events) == 1
+    assert loaded_events[0].id == event.id
+    assert loaded_events[0].data == event.data
+
+
+async def test_that_indexed_fields_are_queried_through_expression_indexes(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as db:
+        await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+
+    condition, params = translate_filters({"session_id": {"$eq": "s1"}})
+
+    with sqlite3.connect(new_file) as connection:
+        plan = connection.execute(
+            f'EXPLAIN QUERY PLAN SELECT data FROM "things" WHERE {condition}',
+            params,
+        ).fetchall()
+
+    assert any("things__session_id" in str(row) for row in plan)
+
+
+async def test_that_migrated_documents_are_persisted_and_failed_ones_are_moved(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+        await collection.insert_one(make_document("1", "ok"))
+        await collection.insert_one(make_document("2", "bad"))
+
+    async def loader(doc: BaseDocument) -> Optional[_TestDocument]:
+        if doc.get("name") == "bad":
+            return None
+        return {**make_document("1", "ok"), "version": Version.String("0.2.0")}
+
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_collection("things", _TestDocument, loader)
+        assert len(await collection.find({})) == 1
+
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+        failed_migrations = await db.get_collection(
+            "failed_migrations", BaseDocument, identity_loader
+        )
+
+        assert await collection.find({}) == [
+            {**make_document("1", "ok"), "version": Version.String("0.2.0")}
+        ]
+        assert [d["id"] for d in await failed_migrations.find({})] == ["2"]
+
+
+async def test_that_many_documents_are_inserted_updated_and_deleted_at_once(
+    container: Container,
+    new_file: Path,
+) -> None:
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_or_create_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+
+        await collection.insert_many([make_document(str(i), "a", rank=i) for i in range(5)])
+
+        update_result = await collection.update_many({"rank": {"$lt": 3}}, {"name": "b"})
+        delete_result = await collection.delete_many({"name": {"$eq": "a"}})
+
+        assert update_result.matched_count == 3
+        assert delete_result.deleted_count == 2
+
+    async with SQLiteDocumentDatabase(container[Logger], new_file) as db:
+        collection = await db.get_collection(
+            "things", _TestDocument, identity_loader_for(_TestDocument)
+        )
+
+        assert await collection.find({}) == [make_document(str(i), "b", rank=i) for i in range(3)]
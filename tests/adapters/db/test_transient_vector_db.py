@@ -0,0 +1,94 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Any, Mapping, TypedDict
+from lagom import Container
+from typing_extensions import Required
+
+from parlant.adapters.vector_db.transient import TransientVectorDatabase
+from parlant.core.common import Version
+from parlant.core.contextual_correlator import ContextualCorrelator
+from parlant.core.loggers import StdoutLogger
+from parlant.core.nlp.embedding import (
+    EmbedderFactory,
+    EmbeddingResult,
+    NoOpEmbedder,
+    NullEmbeddingCache,
+)
+from parlant.core.persistence.common import ObjectId
+
+
+class _TestDocument(TypedDict, total=False):
+    id: ObjectId
+    version: Version.String
+    content: str
+    checksum: Required[str]
+
+
+class _GatedEmbedder(NoOpEmbedder):
+    """Holds off on embedding the content "slow" until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def embed(
+        self,
+        texts: list[str],
+        hints: Mapping[str, Any] = {},
+    ) -> EmbeddingResult:
+        if "slow" in texts:
+            await self.release.wait()
+
+        return await super().embed(texts, hints)
+
+
+def _make_document(id: str, content: str) -> _TestDocument:
+    return {
+        "id": ObjectId(id),
+        "version": Version.String("0.1.0"),
+        "content": content,
+        "checksum": id,
+    }
+
+
+async def test_that_a_slow_embedding_in_update_one_does_not_block_other_writes() -> None:
+    embedder = _GatedEmbedder()
+
+    container = Container()
+    container[_GatedEmbedder] = embedder
+
+    db = TransientVectorDatabase(
+        StdoutLogger(ContextualCorrelator()),
+        EmbedderFactory(container),
+        lambda: NullEmbeddingCache(),
+    )
+
+    collection = await db.create_collection("test", _TestDocument, _GatedEmbedder)
+    await collection.insert_one(_make_document("1", "fast"))
+
+    update_task = asyncio.create_task(
+        collection.update_one({"id": {"$eq": "1"}}, {"content": "slow", "checksum": "1"})
+    )
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(collection.insert_one(_make_document("2", "fast")), timeout=1)
+
+    embedder.release.set()
+    result = await update_task
+
+    assert result.updated_document
+    assert result.updated_document["content"] == "slow"
+    assert len(await collection.find({})) == 2
@@ -0,0 +1,102 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import TypedDict
+from typing_extensions import Required
+from pytest import approx
+
+from parlant.adapters.vector_db.vector_index import VectorIndex
+from parlant.core.common import Version
+from parlant.core.persistence.common import ObjectId
+
+
+class _TestDocument(TypedDict, total=False):
+    id: ObjectId
+    version: Version.String
+    content: str
+    checksum: Required[str]
+    agent_id: str
+
+
+def make_document(id: str, agent_id: str = "a1") -> _TestDocument:
+    return {
+        "id": ObjectId(id),
+        "version": Version.String("0.1.0"),
+        "content": id,
+        "checksum": id,
+        "agent_id": agent_id,
+    }
+
+
+def make_index() -> VectorIndex[_TestDocument]:
+    return VectorIndex[_TestDocument](2, VectorIndex.fields_for_schema(_TestDocument))
+
+
+def test_that_ids_are_indexed_for_a_schema() -> None:
+    assert VectorIndex.fields_for_schema(_TestDocument) == ["id", "agent_id"]
+
+
+def test_that_query_results_carry_true_cosine_distances() -> None:
+    index = make_index()
+    index.add(make_document("same"), [2.0, 0.0])
+    index.add(make_document("orthogonal"), [0.0, 3.0])
+    index.add(make_document("opposite"), [-1.0, 0.0])
+
+    results = index.query([1.0, 0.0], k=3)
+
+    assert [d["id"] for d, _ in results] == ["same", "orthogonal", "opposite"]
+    assert [distance for _, distance in results] == approx([0.0, 1.0, 2.0])
+
+
+def test_that_query_returns_only_the_k_closest_documents() -> None:
+    index = make_index()
+
+    for i in range(100):
+        index.add(make_document(str(i)), [1.0, float(i)])
+
+    results = index.query([1.0, 0.0], k=3)
+
+    assert [d["id"] for d, _ in results] == ["0", "1", "2"]
+
+
+def test_that_query_only_scores_documents_matching_the_filters() -> None:
+    index = make_index()
+    index.add(make_document("x", agent_id="a1"), [1.0, 0.0])
+    index.add(make_document("y", agent_id="a2"), [1.0, 0.1])
+
+    results = index.query([1.0, 0.0], k=2, filters={"agent_id": {"$eq": "a2"}})
+
+    assert [d["id"] for d, _ in results] == ["y"]
+
+
+def test_that_removed_documents_are_no_longer_returned() -> None:
+    index = make_index()
+    keys = [index.add(make_document(str(i)), [1.0, float(i)]) for i in range(3)]
+
+    index.remove(keys[0])
+
+    assert len(index) == 2
+    assert [d["id"] for d, _ in index.query([1.0, 0.0], k=3)] == ["1", "2"]
+    assert index.find_one({"id": {"$eq": "0"}}) is None
+
+
+def test_that_replacing_a_document_updates_its_vector() -> None:
+    index = make_index()
+    key = index.add(make_document("x"), [1.0, 0.0])
+    index.add(make_document("y"), [0.0, 1.0])
+
+    index.replace(key, make_document("x"), [-1.0, 0.0])
+
+    assert [d["id"] for d, _ in index.query([0.0, 1.0], k=1)] == ["y"]
+    assert index.query([-1.0, 0.0], k=1)[0][1] == approx(0.0)
@@ -0,0 +1,61 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from pytest import MonkeyPatch
+
+from parlant.adapters.nlp.common import HTTPClientSettings, shared_client
+from parlant.adapters.nlp.openai_service import OpenAIService
+from parlant.core.contextual_correlator import ContextualCorrelator
+from parlant.core.engines.alpha.message_generator import MessageSchema
+from parlant.core.loggers import LogLevel, StdoutLogger
+
+
+async def test_that_a_client_is_shared_within_an_event_loop() -> None:
+    first = shared_client(("test", "a"), object)
+
+    assert shared_client(("test", "a"), object) is first
+    assert shared_client(("test", "b"), object) is not first
+
+
+def test_that_clients_are_not_shared_across_event_loops() -> None:
+    async def get_client() -> object:
+        return shared_client(("test", "a"), object)
+
+    assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+
+def test_that_pool_settings_are_read_from_the_environment(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("PARLANT_NLP_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("PARLANT_NLP_KEEPALIVE_EXPIRY", "2.5")
+
+    settings = HTTPClientSettings.from_environment()
+
+    assert settings.max_connections == 7
+    assert settings.max_keepalive_connections == HTTPClientSettings().max_keepalive_connections
+    assert settings.keepalive_expiry == 2.5
+
+
+async def test_that_the_openai_service_reuses_its_generators_and_client(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "not-a-real-key")
+
+    service = OpenAIService(StdoutLogger(ContextualCorrelator(), LogLevel.WARNING))
+
+    generator = await service.get_schematic_generator(MessageSchema)
+    embedder = await service.get_embedder()
+
+    assert await service.get_schematic_generator(MessageSchema) is generator
+    assert generator._client is embedder._client  # type: ignore
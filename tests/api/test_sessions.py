@@ -13,11 +13,12 @@
 # limitations under the License.
 
 import asyncio
+import json
 import os
 import time
 from typing import Any
 import dateutil
-from fastapi import status
+from fastapi import FastAPI, status
 import httpx
 from lagom import Container
 from pytest import fixture, mark
@@ -29,6 +30,7 @@ from parlant.core.tools import ToolResult
 from parlant.core.agents import AgentId, AgentStore, AgentUpdateParams, CompositionMode
 from parlant.core.async_utils import Timeout
 from parlant.core.customers import CustomerId
+from parlant.core.emission.streamed_messages import StreamedMessageChannel
 from parlant.core.sessions import (
     AgentState,
     EventKind,
@@ -114,6 +116,74 @@ async def populate_session_id(
         )
 
 
+async def read_event_stream(
+    api_app: FastAPI,
+    path: str,
+    event_count: int,
+    query_string: str = "",
+    headers: dict[str, str] = {},
+) -> list[dict[str, Any]]:
+    # httpx's ASGI transport buffers the whole response,
+    # so the app is driven directly until enough events have been streamed.
+    sent_messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    disconnected = asyncio.Event()
+
+    async def receive() -> dict[str, Any]:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        await sent_messages.put(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string.encode(),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+
+    app_task = asyncio.create_task(api_app(scope, receive, send))  # type: ignore
+
+    start_message = await asyncio.wait_for(sent_messages.get(), timeout=10)
+    assert start_message["type"] == "http.response.start"
+    assert start_message["status"] == status.HTTP_200_OK
+
+    body = ""
+    records: list[str] = []
+
+    while len(records) < event_count:
+        message = await asyncio.wait_for(sent_messages.get(), timeout=10)
+        body += message.get("body", b"").decode()
+        *complete_records, body = body.split("\n\n")
+        records.extend(r for r in complete_records if not r.startswith(":"))
+
+    disconnected.set()
+    await asyncio.wait_for(app_task, timeout=10)
+
+    events = []
+
+    for record in records:
+        fields = dict(line.split(": ", maxsplit=1) for line in record.splitlines())
+
+        if fields.get("event") == "typing":
+            events.append({"typing": json.loads(fields["data"])})
+            continue
+
+        event = json.loads(fields["data"])
+        assert int(fields["id"]) == event["offset"]
+        events.append(event)
+
+    return events
+
+
 def event_is_according_to_params(
     event: dict[str, Any],
     params: dict[str, Any],
@@ -531,6 +601,78 @@ async def test_that_events_can_be_filtered_by_offset(
         assert event_is_according_to_params(event=listed_event, params=event_params)
 
 
+async def test_that_events_can_be_streamed_as_they_are_created(
+    api_app: FastAPI,
+    container: Container,
+    session_id: SessionId,
+) -> None:
+    session_events = [
+        make_event_params(EventSource.CUSTOMER),
+        make_event_params(EventSource.AI_AGENT),
+        make_event_params(EventSource.CUSTOMER),
+    ]
+
+    await populate_session_id(container, session_id, session_events[:1])
+
+    stream_task = asyncio.create_task(
+        read_event_stream(api_app, f"/sessions/{session_id}/events/stream", event_count=3)
+    )
+
+    await asyncio.sleep(0.1)
+    await populate_session_id(container, session_id, session_events[1:])
+
+    streamed_events = await stream_task
+
+    assert [e["offset"] for e in streamed_events] == [0, 1, 2]
+
+    for event_params, streamed_event in zip(session_events, streamed_events):
+        assert event_is_according_to_params(event=streamed_event, params=event_params)
+
+
+async def test_that_an_event_stream_resumes_after_the_last_event_id_and_is_filtered(
+    api_app: FastAPI,
+    long_session_id: SessionId,
+) -> None:
+    streamed_events = await read_event_stream(
+        api_app,
+        f"/sessions/{long_session_id}/events/stream",
+        event_count=2,
+        query_string="source=ai_agent&min_offset=0",
+        headers={"Last-Event-ID": "1"},
+    )
+
+    assert [e["offset"] for e in streamed_events] == [3, 4]
+    assert all(e["source"] == "ai_agent" for e in streamed_events)
+
+
+async def test_that_streamed_message_text_is_sent_on_the_event_stream_without_being_stored(
+    api_app: FastAPI,
+    container: Container,
+    session_id: SessionId,
+) -> None:
+    stream_task = asyncio.create_task(
+        read_event_stream(api_app, f"/sessions/{session_id}/events/stream", event_count=2)
+    )
+
+    await asyncio.sleep(0.1)
+    container[StreamedMessageChannel].publish(session_id, "corr", "Hello")
+    await populate_session_id(container, session_id, [make_event_params(EventSource.AI_AGENT)])
+
+    streamed_events = await stream_task
+
+    assert streamed_events[0] == {"typing": {"correlation_id": "corr", "message": "Hello"}}
+    assert streamed_events[1]["offset"] == 0
+
+    assert len(await container[SessionStore].list_events(session_id)) == 1
+
+
+async def test_that_streaming_events_of_a_nonexistent_session_returns_404(
+    async_client: httpx.AsyncClient,
+) -> None:
+    response = await async_client.get("/sessions/nonexistent/events/stream")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @mark.skipif(not os.environ.get("LAKERA_API_KEY", False), reason="Lakera API key is missing")
 async def test_that_a_jailbreak_message_is_flagged_and_tagged_as_such(
     async_client: httpx.AsyncClient,
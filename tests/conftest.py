@@ -29,12 +29,14 @@ from parlant.adapters.nlp.openai_service import OpenAIService
 from parlant.adapters.vector_db.transient import TransientVectorDatabase
 from parlant.api.app import create_api_app, ASGIApplication
 from parlant.api.authorization import AuthorizationPolicy, DevelopmentAuthorizationPolicy
+from parlant.core.admission import AdmissionController
 from parlant.core.background_tasks import BackgroundTaskService
 from parlant.core.capabilities import CapabilityStore, CapabilityVectorStore
 from parlant.core.common import IdGenerator
 from parlant.core.contextual_correlator import ContextualCorrelator
 from parlant.core.context_variables import ContextVariableDocumentStore, ContextVariableStore
 from parlant.core.emission.event_publisher import EventPublisherFactory
+from parlant.core.emission.streamed_messages import StreamedMessageChannel
 from parlant.core.emissions import EventEmitterFactory
 from parlant.core.customers import CustomerDocumentStore, CustomerStore
 from parlant.core.engines.alpha.guideline_matching.generic import (
@@ -144,6 +146,7 @@ from parlant.core.nlp.embedding import (
     EmbedderFactory,
     EmbeddingCache,
     NullEmbeddingCache,
+    QueryEmbeddingMemo,
 )
 from parlant.core.nlp.generation import T, SchematicGenerator
 from parlant.core.relationships import (
@@ -160,7 +163,7 @@ from parlant.core.services.tools.service_registry import (
     ServiceRegistry,
 )
 from parlant.core.sessions import (
-    PollingSessionListener,
+    NotifyingSessionListener,
     SessionDocumentStore,
     SessionListener,
     SessionStore,
@@ -348,7 +351,7 @@ async def container(
             RelationshipDocumentStore(container[IdGenerator], TransientDocumentDatabase())
         )
         container[SessionStore] = await stack.enter_async_context(
-            SessionDocumentStore(TransientDocumentDatabase())
+            SessionDocumentStore(TransientDocumentDatabase(), cache_event_offsets=True)
         )
         container[ContextVariableStore] = await stack.enter_async_context(
             ContextVariableDocumentStore(container[IdGenerator], TransientDocumentDatabase())
@@ -364,13 +367,14 @@ async def container(
                 container[IdGenerator], TransientDocumentDatabase()
             )
         )
-        container[SessionListener] = PollingSessionListener
+        container[SessionListener] = NotifyingSessionListener
         container[EvaluationStore] = await stack.enter_async_context(
             EvaluationDocumentStore(TransientDocumentDatabase())
         )
         container[EvaluationListener] = PollingEvaluationListener
         container[LegacyBehavioralChangeEvaluator] = LegacyBehavioralChangeEvaluator
         container[EventEmitterFactory] = Singleton(EventPublisherFactory)
+        container[StreamedMessageChannel] = Singleton(StreamedMessageChannel)
 
         container[ServiceRegistry] = await stack.enter_async_context(
             ServiceDocumentRegistry(
@@ -398,6 +402,8 @@ async def container(
         else:
             embedding_cache = NullEmbeddingCache()
 
+        container[QueryEmbeddingMemo] = QueryEmbeddingMemo(container[ContextualCorrelator])
+
         container[JourneyStore] = await stack.enter_async_context(
             JourneyVectorStore(
                 container[IdGenerator],
@@ -405,6 +411,7 @@ async def container(
                     container[Logger],
                     embedder_factory,
                     lambda: embedding_cache,
+                    query_embedding_memo=container[QueryEmbeddingMemo],
                 ),
                 document_db=TransientDocumentDatabase(),
                 embedder_factory=embedder_factory,
@@ -419,6 +426,7 @@ async def container(
                     container[Logger],
                     embedder_factory,
                     lambda: embedding_cache,
+                    query_embedding_memo=container[QueryEmbeddingMemo],
                 ),
                 document_db=TransientDocumentDatabase(),
                 embedder_factory=embedder_factory,
@@ -430,7 +438,10 @@ async def container(
             CannedResponseVectorStore(
                 container[IdGenerator],
                 vector_db=TransientVectorDatabase(
-                    container[Logger], embedder_factory, lambda: embedding_cache
+                    container[Logger],
+                    embedder_factory,
+                    lambda: embedding_cache,
+                    query_embedding_memo=container[QueryEmbeddingMemo],
                 ),
                 document_db=TransientDocumentDatabase(),
                 embedder_factory=embedder_factory,
@@ -445,6 +456,7 @@ async def container(
                     container[Logger],
                     embedder_factory,
                     lambda: embedding_cache,
+                    query_embedding_memo=container[QueryEmbeddingMemo],
                 ),
                 document_db=TransientDocumentDatabase(),
                 embedder_factory=embedder_factory,
@@ -566,6 +578,7 @@ async def container(
 
         container[Engine] = Singleton(AlphaEngine)
 
+        container[AdmissionController] = AdmissionController(container[Logger])
         container[Application] = Application(container)
 
         yield container
@@ -0,0 +1,122 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Any, Mapping
+from typing_extensions import override
+
+from pytest import raises
+
+from parlant.core.contextual_correlator import ContextualCorrelator
+from parlant.core.nlp.embedding import EmbeddingResult, NoOpEmbedder, QueryEmbeddingMemo
+
+
+class CountingEmbedder(NoOpEmbedder):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[list[str]] = []
+
+    @override
+    async def embed(
+        self,
+        texts: list[str],
+        hints: Mapping[str, Any] = {},
+    ) -> EmbeddingResult:
+        self.calls.append(texts)
+        await asyncio.sleep(0)
+        return EmbeddingResult(vectors=[[float(len(t))] for t in texts])
+
+
+class FailingEmbedder(CountingEmbedder):
+    @override
+    async def embed(
+        self,
+        texts: list[str],
+        hints: Mapping[str, Any] = {},
+    ) -> EmbeddingResult:
+        self.calls.append(texts)
+        raise RuntimeError("embedding failed")
+
+
+async def test_that_missing_query_embeddings_are_computed_in_a_single_batch() -> None:
+    memo = QueryEmbeddingMemo(ContextualCorrelator())
+    embedder = CountingEmbedder()
+
+    vectors = await memo.embed(embedder, ["a", "bb", "a"])
+
+    assert vectors == [[1.0], [2.0], [1.0]]
+    assert embedder.calls == [["a", "bb"]]
+
+
+async def test_that_query_embeddings_are_memoized_within_a_correlation_scope() -> None:
+    correlator = ContextualCorrelator()
+    memo = QueryEmbeddingMemo(correlator)
+    embedder = CountingEmbedder()
+
+    with correlator.scope("R1"):
+        await memo.embed(embedder, ["a", "bb"])
+
+        with correlator.scope("process"):
+            await asyncio.gather(
+                memo.embed(embedder, ["bb", "ccc"]),
+                memo.embed(embedder, ["ccc"]),
+            )
+
+    with correlator.scope("R2"):
+        await memo.embed(embedder, ["a"])
+
+    assert embedder.calls == [["a", "bb"], ["ccc"], ["a"]]
+
+
+async def test_that_cross_turn_memo_shares_query_embeddings_across_scopes() -> None:
+    correlator = ContextualCorrelator()
+    memo = QueryEmbeddingMemo(correlator, cross_turn=True)
+    embedder = CountingEmbedder()
+
+    with correlator.scope("R1"):
+        await memo.embed(embedder, ["a"])
+
+    with correlator.scope("R2"):
+        await memo.embed(embedder, ["a"])
+
+    assert embedder.calls == [["a"]]
+
+
+async def test_that_failed_query_embeddings_are_not_memoized() -> None:
+    memo = QueryEmbeddingMemo(ContextualCorrelator())
+    embedder = FailingEmbedder()
+
+    for _ in range(2):
+        with raises(RuntimeError):
+            await memo.embed(embedder, ["a"])
+
+    assert embedder.calls == [["a"], ["a"]]
+
+
+async def test_that_cancelling_one_caller_does_not_fail_others_awaiting_the_same_query() -> None:
+    memo = QueryEmbeddingMemo(ContextualCorrelator(), cross_turn=True)
+    embedder = CountingEmbedder()
+
+    cancelled_caller = asyncio.create_task(memo.embed(embedder, ["a"]))
+    await asyncio.sleep(0)
+    other_caller = asyncio.create_task(memo.embed(embedder, ["a"]))
+    await asyncio.sleep(0)
+
+    cancelled_caller.cancel()
+
+    with raises(asyncio.CancelledError):
+        await cancelled_caller
+
+    assert await other_caller == [[1.0]]
+    assert embedder.calls == [["a"]]
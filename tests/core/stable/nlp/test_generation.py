@@ -13,19 +13,28 @@
 # limitations under the License.
 
 import asyncio
-from typing import Any, Mapping, cast
+import json
+from typing import Any, Mapping, Sequence, cast
 from typing_extensions import override
 from lagom import Container
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 from pytest import raises
 
 from parlant.core.common import DefaultBaseModel
+from parlant.core.contextual_correlator import ContextualCorrelator
+from parlant.core.emission.streamed_messages import StreamedMessage, StreamedMessageChannel
+from parlant.core.engines.alpha.message_event_composer import MessageStream
+from parlant.core.engines.alpha.message_generator import MessageGenerator, MessageSchema
+from parlant.core.engines.alpha.optimization_policy import OptimizationPolicy
+from parlant.core.engines.alpha.perceived_performance_policy import PerceivedPerformancePolicy
 from parlant.core.engines.alpha.prompt_builder import (
     BuiltInSection,
     PromptBuilder,
     PromptSection,
+    SectionStability,
     SectionStatus,
+    shared_prompt_rendering,
 )
 from parlant.core.loggers import Logger
 from parlant.core.nlp.embedding import EmbeddingResult
@@ -35,8 +44,11 @@ from parlant.core.nlp.generation import (
     SchematicGenerator,
 )
 from parlant.core.nlp.generation_info import GenerationInfo, UsageInfo
+from parlant.core.nlp.partial_json import PartialJSONParser
 from parlant.core.nlp.policies import policy, retry
 from parlant.core.nlp.tokenization import EstimatingTokenizer, ZeroEstimatingTokenizer
+from parlant.core.sessions import SessionId
+from parlant.core.shots import Shot, memoized_shot_formatting
 
 
 class DummySchema(DefaultBaseModel):
@@ -356,6 +368,116 @@ async def test_that_prompt_builder_edits_are_reflected_in_generation() -> None:
     assert result.content.result == "You are Bob"
 
 
+def test_that_static_prompt_sections_are_built_ahead_of_dynamic_ones() -> None:
+    builder = PromptBuilder()
+
+    builder.add_section(name="instructions", template="Be nice")
+    builder.add_section(name="history", template="Hi {name}", props={"name": "Bob"})
+    builder.add_section(
+        name="shots",
+        template="Example: hello",
+        stability=SectionStability.STATIC,
+    )
+    builder.add_section(
+        name="identity",
+        template="You are Alice",
+        stability=SectionStability.STATIC,
+    )
+
+    assert builder.build() == "Example: hello\n\nYou are Alice\n\nBe nice\n\nHi Bob"
+
+
+def test_that_the_cacheable_prefix_holds_exactly_the_static_sections() -> None:
+    builder = PromptBuilder()
+
+    builder.add_section(name="history", template="Hi Bob")
+    builder.add_section(
+        name="instructions",
+        template="Be nice",
+        stability=SectionStability.STATIC,
+    )
+
+    prefix, rest = builder.build_with_cacheable_prefix()
+
+    assert prefix == "Be nice\n\n"
+    assert rest == "Hi Bob"
+    assert prefix + rest == builder.build()
+
+    assert PromptBuilder().add_section(
+        name="history", template="Hi Bob"
+    ).build_with_cacheable_prefix() == ("", "Hi Bob")
+
+
+def test_that_a_built_prompt_is_rebuilt_only_after_its_sections_change() -> None:
+    class CountingName:
+        def __init__(self) -> None:
+            self.renders = 0
+
+        def __format__(self, format_spec: str) -> str:
+            self.renders += 1
+            return "Bob"
+
+    name = CountingName()
+    builder = PromptBuilder()
+    builder.add_section(name="identity", template="You are {name}", props={"name": name})
+
+    assert builder.build() == builder.build() == "You are Bob"
+    assert name.renders == 1
+
+    builder.edit_section(
+        "identity",
+        lambda s: PromptSection(template="You are NOT {name}", props=s.props, status=s.status),
+    )
+    assert builder.build() == "You are NOT Bob"
+
+    builder.add_section(name="history", template="Hi")
+    assert builder.build() == "You are NOT Bob\n\nHi"
+    assert name.renders == 3
+
+
+async def test_that_prompts_built_within_a_shared_rendering_render_the_same_objects_once() -> None:
+    renders = []
+    first, second = object(), object()
+
+    def render(name: str) -> str:
+        renders.append(name)
+        return name
+
+    with shared_prompt_rendering() as cache:
+        assert cache.get_or_render("thing", [first], lambda: render("first")) == "first"
+
+        async def render_in_task() -> str:
+            with shared_prompt_rendering() as nested_cache:
+                assert nested_cache is cache
+                return cache.get_or_render("thing", [first], lambda: render("again"))
+
+        assert await asyncio.create_task(render_in_task()) == "first"
+        assert cache.get_or_render("thing", [second], lambda: render("second")) == "second"
+
+    assert renders == ["first", "second"]
+
+
+def test_that_shot_formatting_is_memoized_per_sequence_of_shots() -> None:
+    class Formatter:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @memoized_shot_formatting
+        def format_shots(self, shots: Sequence[Shot]) -> str:
+            self.calls += 1
+            return "\n".join(shot.description for shot in shots)
+
+    formatter = Formatter()
+    shots = [Shot(description="first"), Shot(description="second")]
+
+    assert formatter.format_shots(shots) == "first\nsecond"
+    assert formatter.format_shots(list(shots)) == "first\nsecond"
+    assert formatter.calls == 1
+
+    assert formatter.format_shots(shots[:1]) == "first"
+    assert formatter.calls == 2
+
+
 async def test_that_retry_succeeds_after_failures_with_higher_concurrency(
     container: Container,
 ) -> None:
@@ -406,3 +528,215 @@ async def test_that_retry_succeeds_after_failures_with_higher_concurrency(
         assert mock_generators[i].generate.await_count == 3
         mock_generators[i].generate.assert_awaited_with(prompt="test prompt", hints={"a": i})
         assert results[i].content.result == "Success"
+
+
+def test_that_partial_json_holds_the_string_being_streamed_so_far() -> None:
+    document = {
+        "insights": ['Be "brief"', "Be kind"],
+        "produced_reply": True,
+        "revisions": [{"revision_number": 1, "content": "Hi there!\nHow can I help? \u00e9"}],
+    }
+    text = f"```json\n{json.dumps(document)}\n```"
+
+    parser = PartialJSONParser()
+    streamed_contents = []
+
+    for i in range(0, len(text), 3):
+        parser.feed(text[i : i + 3])
+
+        if parser.value and (revisions := parser.value.get("revisions")):
+            if isinstance(content := revisions[-1].get("content"), str):
+                streamed_contents.append(content)
+
+    assert parser.done
+    assert parser.value == document
+
+    final_content = document["revisions"][0]["content"]  # type: ignore
+    assert len(streamed_contents) > 2
+    assert all(final_content.startswith(c) for c in streamed_contents)
+    assert streamed_contents[-1] == final_content
+
+
+async def test_that_generating_with_streaming_falls_back_to_a_whole_generation() -> None:
+    result = SchematicGenerationResult(
+        content=DummySchema(result="Success"),
+        info=GenerationInfo(
+            schema_name="DummySchema",
+            model="not-real-model",
+            duration=1,
+            usage=UsageInfo(input_tokens=1, output_tokens=1),
+        ),
+    )
+
+    class WholeGenerator(SchematicGenerator[DummySchema]):
+        @override
+        async def generate(
+            self,
+            prompt: str | PromptBuilder,
+            hints: Mapping[str, Any] = {},
+        ) -> SchematicGenerationResult[DummySchema]:
+            return result
+
+        @property
+        @override
+        def id(self) -> str:
+            return "whole"
+
+        @property
+        @override
+        def max_tokens(self) -> int:
+            return 1000
+
+        @property
+        @override
+        def tokenizer(self) -> EstimatingTokenizer:
+            return ZeroEstimatingTokenizer()
+
+    on_partial_content = AsyncMock()
+
+    assert (
+        await WholeGenerator().generate_streaming("prompt", on_partial_content=on_partial_content)
+        is result
+    )
+    on_partial_content.assert_not_called()
+
+
+async def test_that_a_message_stream_relays_the_text_so_far_without_emitting_events() -> None:
+    channel = StreamedMessageChannel()
+    session_id = SessionId("session")
+    stream = MessageStream(channel, session_id, correlation_id="corr", min_update_interval=0)
+
+    streamed_messages = []
+
+    for message in ["", "Hello", "Hello", "Hello there"]:
+        signal = channel.update_signal(session_id)
+        stream.update(message)
+
+        if signal.is_set():
+            streamed_messages.append(channel.get(session_id))
+
+    assert streamed_messages == [
+        StreamedMessage(correlation_id="corr", message="Hello"),
+        StreamedMessage(correlation_id="corr", message="Hello there"),
+    ]
+
+    stream.close()
+    assert channel.get(session_id) is None
+
+
+async def test_that_a_message_stream_throttles_its_updates() -> None:
+    channel = StreamedMessageChannel()
+    stream = MessageStream(
+        channel, SessionId("session"), correlation_id="corr", min_update_interval=60
+    )
+
+    for message in ["H", "He", "Hel"]:
+        stream.update(message)
+
+    assert channel.get(SessionId("session")) == StreamedMessage(correlation_id="corr", message="H")
+
+
+async def test_that_a_message_stream_can_retract_the_text_streamed_so_far() -> None:
+    channel = StreamedMessageChannel()
+    session_id = SessionId("session")
+    stream = MessageStream(channel, session_id, correlation_id="corr", min_update_interval=60)
+
+    stream.update("Hello")
+    stream.retract()
+
+    assert channel.get(session_id) == StreamedMessage(correlation_id="corr", message="")
+
+    # Retracting isn't throttled, and neither is the first update after it
+    stream.update("Hi")
+
+    assert channel.get(session_id) == StreamedMessage(correlation_id="corr", message="Hi")
+
+
+async def test_that_fluid_message_generation_streams_each_revision_until_one_passes_evaluation() -> (
+    None
+):
+    channel = StreamedMessageChannel()
+    session_id = SessionId("session")
+    streamed_messages: list[str] = []
+
+    draft = {"revision_number": 1, "content": "Sure, that's free"}
+    failed_evaluation = {
+        "followed_all_instructions": False,
+        "is_repeat_message": False,
+        "further_revisions_required": True,
+    }
+    revision = {"revision_number": 2, "content": "Sure, that costs $5"}
+    passed_evaluation = {
+        "followed_all_instructions": True,
+        "is_repeat_message": False,
+        "further_revisions_required": False,
+    }
+    extra_revision = {"revision_number": 3, "content": "Sure"}
+
+    async def generate_streaming(
+        prompt: str | PromptBuilder,
+        on_partial_content: Any,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[MessageSchema]:
+        for revisions in [
+            [{"revision_number": 1, "content": "Sure, that"}],
+            [draft],
+            [{**draft, **failed_evaluation}],
+            [{**draft, **failed_evaluation}, {"revision_number": 2}],
+            [{**draft, **failed_evaluation}, revision],
+            [{**draft, **failed_evaluation}, {**revision, **passed_evaluation}],
+            [{**draft, **failed_evaluation}, {**revision, **passed_evaluation}, extra_revision],
+        ]:
+            await on_partial_content({"produced_reply": True, "revisions": revisions})
+
+            if streamed_message := channel.get(session_id):
+                streamed_messages.append(streamed_message.message)
+
+        return SchematicGenerationResult(
+            content=MessageSchema.model_validate(
+                {
+                    "produced_reply": True,
+                    "revisions": [
+                        {**draft, **failed_evaluation},
+                        {**revision, **passed_evaluation},
+                        extra_revision,
+                    ],
+                }
+            ),
+            info=GenerationInfo(
+                schema_name="MessageSchema",
+                model="mock-model",
+                duration=1,
+                usage=UsageInfo(input_tokens=1, output_tokens=1),
+            ),
+        )
+
+    schematic_generator = AsyncMock(spec=SchematicGenerator[MessageSchema])
+    schematic_generator.generate_streaming.side_effect = generate_streaming
+
+    message_generator = MessageGenerator(
+        logger=Mock(spec=Logger),
+        correlator=ContextualCorrelator(),
+        optimization_policy=Mock(spec=OptimizationPolicy),
+        perceived_performance_policy=Mock(spec=PerceivedPerformancePolicy),
+        streamed_message_channel=channel,
+        schematic_generator=schematic_generator,
+    )
+
+    _, message = await message_generator._generate_response_message(
+        PromptBuilder(),
+        temperature=0,
+        final_attempt=True,
+        message_stream=MessageStream(channel, session_id, "corr", min_update_interval=0),
+    )
+
+    assert message == "Sure, that costs $5"
+    assert streamed_messages == [
+        "Sure, that",
+        "Sure, that's free",
+        "",
+        "",
+        "Sure, that costs $5",
+        "Sure, that costs $5",
+        "Sure, that costs $5",
+    ]
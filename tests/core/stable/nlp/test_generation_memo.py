@@ -0,0 +1,71 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+
+from parlant.core.contextual_correlator import ContextualCorrelator
+from parlant.core.nlp.generation_memo import GenerationMemo, MemoizingSchematicGenerator
+from tests.core.stable.nlp.utils import CountingGenerator, DummySchema
+
+
+@dataclass(frozen=True)
+class _Session:
+    id: str
+
+
+def memoizing_generator(
+    correlator: ContextualCorrelator,
+) -> tuple[CountingGenerator, MemoizingSchematicGenerator[DummySchema]]:
+    generator = CountingGenerator()
+    return generator, MemoizingSchematicGenerator[DummySchema](
+        generator,
+        GenerationMemo(correlator),
+    )
+
+
+async def test_that_a_repeated_prompt_within_a_session_is_generated_once() -> None:
+    correlator = ContextualCorrelator()
+    model, generator = memoizing_generator(correlator)
+
+    with correlator.scope("process", {"session": _Session("s1")}):
+        first = await generator.generate("hello", hints={"temperature": 0.1})
+
+    with correlator.scope("process", {"session": _Session("s1")}):
+        second = await generator.generate("hello", hints={"temperature": 0.1})
+        await generator.generate("hello", hints={"temperature": 0.5})
+        await generator.generate("goodbye", hints={"temperature": 0.1})
+
+    assert model.calls == 3
+    assert second.content == first.content
+
+
+async def test_that_results_are_not_shared_across_sessions() -> None:
+    correlator = ContextualCorrelator()
+    model, generator = memoizing_generator(correlator)
+
+    for session_id in ["s1", "s2"]:
+        with correlator.scope("process", {"session": _Session(session_id)}):
+            await generator.generate("hello")
+
+    assert model.calls == 2
+
+
+async def test_that_nothing_is_memoized_outside_of_a_session() -> None:
+    correlator = ContextualCorrelator()
+    model, generator = memoizing_generator(correlator)
+
+    await generator.generate("hello")
+    await generator.generate("hello")
+
+    assert model.calls == 2
@@ -0,0 +1,108 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from typing import Any, Mapping
+from pytest import raises
+from typing_extensions import override
+
+from parlant.core.nlp.embedding import EmbeddingResult, NoOpEmbedder
+from parlant.core.nlp.response_cache import (
+    CachingEmbedder,
+    CachingSchematicGenerator,
+    LLMResponseCache,
+    LLMResponseCacheMiss,
+    LLMResponseCacheMode,
+)
+from tests.core.stable.nlp.utils import CountingGenerator, DummySchema
+
+
+class CountingEmbedder(NoOpEmbedder):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    @override
+    async def embed(
+        self,
+        texts: list[str],
+        hints: Mapping[str, Any] = {},
+    ) -> EmbeddingResult:
+        self.calls += 1
+        return EmbeddingResult(vectors=[[float(len(t))] * self.dimensions for t in texts])
+
+
+def caching_generator(
+    path: Path,
+    mode: LLMResponseCacheMode,
+) -> tuple[CountingGenerator, CachingSchematicGenerator[DummySchema]]:
+    generator = CountingGenerator()
+    return generator, CachingSchematicGenerator[DummySchema](
+        generator,
+        LLMResponseCache(path, mode),
+    )
+
+
+async def test_that_recorded_responses_are_replayed_without_calling_the_model(
+    tmp_path: Path,
+) -> None:
+    recording_model, recorder = caching_generator(tmp_path, LLMResponseCacheMode.RECORD)
+    recorded = await recorder.generate("hello", hints={"temperature": 0.1})
+
+    replaying_model, replayer = caching_generator(tmp_path, LLMResponseCacheMode.REPLAY)
+    replayed = await replayer.generate("hello", hints={"temperature": 0.1})
+
+    assert recording_model.calls == 1
+    assert replaying_model.calls == 0
+    assert replayed.content == recorded.content
+    assert replayed.info == recorded.info
+
+
+async def test_that_replaying_an_unrecorded_request_fails(tmp_path: Path) -> None:
+    _, recorder = caching_generator(tmp_path, LLMResponseCacheMode.RECORD)
+    await recorder.generate("hello", hints={"temperature": 0.1})
+
+    _, replayer = caching_generator(tmp_path, LLMResponseCacheMode.REPLAY)
+
+    with raises(LLMResponseCacheMiss):
+        await replayer.generate("hello", hints={"temperature": 0.5})
+
+
+async def test_that_read_through_calls_the_model_only_on_a_miss(tmp_path: Path) -> None:
+    model, generator = caching_generator(tmp_path, LLMResponseCacheMode.READ_THROUGH)
+
+    first = await generator.generate("hello")
+    second = await generator.generate("hello")
+    await generator.generate("goodbye")
+
+    assert model.calls == 2
+    assert second.content == first.content
+
+
+async def test_that_embeddings_are_recorded_and_replayed(tmp_path: Path) -> None:
+    recording_embedder = CountingEmbedder()
+    recorded = await CachingEmbedder(
+        recording_embedder,
+        LLMResponseCache(tmp_path, LLMResponseCacheMode.READ_THROUGH),
+    ).embed(["hi", "there"])
+
+    replaying_embedder = CountingEmbedder()
+    replayed = await CachingEmbedder(
+        replaying_embedder,
+        LLMResponseCache(tmp_path, LLMResponseCacheMode.REPLAY),
+    ).embed(["hi", "there"])
+
+    assert recording_embedder.calls == 1
+    assert replaying_embedder.calls == 0
+    assert replayed.vectors == recorded.vectors
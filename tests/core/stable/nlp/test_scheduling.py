@@ -0,0 +1,177 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import Mock
+from pytest import MonkeyPatch
+
+from parlant.core.contextual_correlator import ContextualCorrelator
+from parlant.core.loggers import Logger
+from parlant.core.nlp.scheduling import LLMPriority, LLMRateLimits, LLMScheduler
+
+
+async def test_that_requests_beyond_max_concurrency_are_queued() -> None:
+    scheduler = LLMScheduler(ContextualCorrelator(), default_limits=LLMRateLimits(2))
+    release = asyncio.Event()
+    peak = 0
+
+    async def request() -> None:
+        nonlocal peak
+        async with scheduler.slot("model"):
+            peak = max(peak, scheduler.metrics()["model"].in_flight)
+            await release.wait()
+
+    tasks = [asyncio.create_task(request()) for _ in range(5)]
+    await asyncio.sleep(0)
+
+    metrics = scheduler.metrics()["model"]
+    assert metrics.in_flight == 2
+    assert metrics.queued[LLMPriority.BACKGROUND] == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert peak == 2
+    assert scheduler.metrics()["model"].in_flight == 0
+
+
+async def test_that_concurrency_is_unlimited_unless_configured() -> None:
+    scheduler = LLMScheduler(ContextualCorrelator())
+    release = asyncio.Event()
+
+    async def request() -> None:
+        async with scheduler.slot("model"):
+            await release.wait()
+
+    tasks = [asyncio.create_task(request()) for _ in range(100)]
+    await asyncio.sleep(0)
+
+    assert scheduler.metrics()["model"].in_flight == 100
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+async def test_that_interactive_requests_are_admitted_before_background_ones() -> None:
+    correlator = ContextualCorrelator()
+    scheduler = LLMScheduler(correlator, default_limits=LLMRateLimits(1))
+    order: list[str] = []
+
+    async def request(name: str) -> None:
+        async with scheduler.slot("model"):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async def interactive_request(name: str) -> None:
+        with correlator.properties({"session": object()}):
+            await request(name)
+
+    await asyncio.gather(
+        request("first"),
+        request("background"),
+        interactive_request("interactive"),
+    )
+
+    assert order == ["first", "interactive", "background"]
+
+
+async def test_that_requests_beyond_the_token_budget_wait_for_reported_usage() -> None:
+    scheduler = LLMScheduler(
+        ContextualCorrelator(),
+        default_limits=LLMRateLimits(max_concurrency=10, tokens_per_minute=100),
+    )
+    release = asyncio.Event()
+
+    async def first_request() -> None:
+        async with scheduler.slot("model", estimated_tokens=80) as usage:
+            await release.wait()
+            usage.report(10)
+
+    first = asyncio.create_task(first_request())
+    await asyncio.sleep(0)
+
+    second = asyncio.create_task(scheduler.slot("model", estimated_tokens=50).__aenter__())
+    await asyncio.sleep(0)
+
+    assert not second.done()
+    assert scheduler.metrics()["model"].queued[LLMPriority.BACKGROUND] == 1
+
+    release.set()
+    await first
+    await second
+
+    assert scheduler.metrics()["model"].tokens_in_last_minute == 60
+
+
+async def test_that_cancelled_queued_requests_do_not_block_the_queue() -> None:
+    scheduler = LLMScheduler(ContextualCorrelator(), default_limits=LLMRateLimits(1))
+    release = asyncio.Event()
+
+    async def request() -> None:
+        async with scheduler.slot("model"):
+            await release.wait()
+
+    first = asyncio.create_task(request())
+    second = asyncio.create_task(request())
+    await asyncio.sleep(0)
+
+    second.cancel()
+    await asyncio.gather(second, return_exceptions=True)
+
+    release.set()
+    await first
+
+    async with scheduler.slot("model"):
+        assert scheduler.metrics()["model"].in_flight == 1
+
+
+def test_that_rate_limits_are_read_from_the_environment(monkeypatch: MonkeyPatch) -> None:
+    assert LLMRateLimits.from_environment() == LLMRateLimits()
+
+    monkeypatch.setenv("PARLANT_LLM_MAX_CONCURRENCY", "8")
+    monkeypatch.setenv("PARLANT_LLM_TOKENS_PER_MINUTE", "100000")
+
+    assert LLMRateLimits.from_environment() == LLMRateLimits(
+        max_concurrency=8,
+        tokens_per_minute=100000,
+    )
+
+
+async def test_that_metrics_are_logged_only_for_models_in_use() -> None:
+    scheduler = LLMScheduler(ContextualCorrelator(), default_limits=LLMRateLimits(1))
+    logger = Mock(spec=Logger)
+    release = asyncio.Event()
+
+    async with scheduler.slot("idle-model"):
+        pass
+
+    async def request() -> None:
+        async with scheduler.slot("busy-model"):
+            await release.wait()
+
+    tasks = [asyncio.create_task(request()) for _ in range(2)]
+    logging_task = asyncio.create_task(scheduler.log_metrics(logger, interval=0))
+
+    await asyncio.sleep(0.01)
+    logging_task.cancel()
+
+    release.set()
+    await asyncio.gather(*tasks, logging_task, return_exceptions=True)
+
+    logged_messages = [call.args[0] for call in logger.info.call_args_list]
+
+    assert logged_messages
+    assert all(
+        "busy-model: 1 in flight, 0 interactive and 1 background" in m for m in logged_messages
+    )
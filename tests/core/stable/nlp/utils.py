@@ -0,0 +1,69 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Mapping
+from typing_extensions import override
+
+from parlant.core.common import DefaultBaseModel
+from parlant.core.engines.alpha.prompt_builder import PromptBuilder
+from parlant.core.nlp.generation import SchematicGenerationResult, SchematicGenerator
+from parlant.core.nlp.generation_info import GenerationInfo, UsageInfo
+from parlant.core.nlp.tokenization import EstimatingTokenizer, ZeroEstimatingTokenizer
+
+
+class DummySchema(DefaultBaseModel):
+    result: str
+
+
+class CountingGenerator(SchematicGenerator[DummySchema]):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    @override
+    def schema(self) -> type[DummySchema]:
+        return DummySchema
+
+    @override
+    async def generate(
+        self,
+        prompt: str | PromptBuilder,
+        hints: Mapping[str, Any] = {},
+    ) -> SchematicGenerationResult[DummySchema]:
+        self.calls += 1
+
+        return SchematicGenerationResult(
+            content=DummySchema(result=f"call #{self.calls}"),
+            info=GenerationInfo(
+                schema_name="DummySchema",
+                model="dummy-model",
+                duration=1,
+                usage=UsageInfo(input_tokens=10, output_tokens=2),
+            ),
+        )
+
+    @property
+    @override
+    def id(self) -> str:
+        return "dummy-model"
+
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return 1000
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return ZeroEstimatingTokenizer()
@@ -0,0 +1,88 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+from typing_extensions import TypedDict
+
+from parlant.core.persistence.common import ObjectId, Where, matches_filters
+from parlant.core.persistence.indexed_documents import IndexedDocuments
+
+
+class _EventDocument(TypedDict, total=False):
+    id: ObjectId
+    session_id: str
+    offset: int
+
+
+def make_documents() -> IndexedDocuments[Any]:
+    return IndexedDocuments(
+        ["id", "session_id"],
+        [
+            {"id": "e1", "session_id": "s1", "offset": 0},
+            {"id": "e2", "session_id": "s2", "offset": 0},
+            {"id": "e3", "session_id": "s1", "offset": 1},
+            {"id": "e4", "session_id": "s2", "offset": 1},
+        ],
+    )
+
+
+def test_that_only_known_fields_of_the_schema_are_indexed() -> None:
+    assert IndexedDocuments.fields_for_schema(_EventDocument) == ["id", "session_id"]
+
+
+def test_that_indexed_results_match_a_full_scan_in_insertion_order() -> None:
+    documents = make_documents()
+
+    filters: list[Where] = [
+        {},
+        {"session_id": {"$eq": "s1"}},
+        {"session_id": {"$in": ["s2", "s1"]}},
+        {"session_id": {"$eq": "s2"}, "offset": {"$gte": 1}},
+        {"$and": [{"session_id": {"$eq": "s1"}}, {"offset": {"$eq": 1}}]},
+        {"$or": [{"id": {"$eq": "e4"}}, {"id": {"$eq": "e1"}}]},
+        {"$or": [{"id": {"$eq": "e4"}}, {"offset": {"$eq": 0}}]},
+        {"offset": {"$lt": 1}},
+        {"id": {"$eq": "missing"}},
+    ]
+
+    for f in filters:
+        assert documents.find(f) == [d for d in documents if matches_filters(f, d)]
+
+
+def test_that_index_follows_replaced_and_removed_documents() -> None:
+    documents = make_documents()
+
+    [key] = documents.find_keys({"id": {"$eq": "e1"}})
+    documents.replace(key, {"id": "e1", "session_id": "s3", "offset": 0})
+
+    assert [d["id"] for d in documents.find({"session_id": {"$eq": "s1"}})] == ["e3"]
+    assert [d["id"] for d in documents.find({"session_id": {"$eq": "s3"}})] == ["e1"]
+
+    [key] = documents.find_keys({"id": {"$eq": "e3"}})
+    documents.remove(key)
+
+    assert documents.find({"session_id": {"$eq": "s1"}}) == []
+    assert len(documents) == 3
+
+
+def test_that_find_one_returns_the_earliest_inserted_match() -> None:
+    documents = make_documents()
+
+    [key] = documents.find_keys({"id": {"$eq": "e1"}})
+    documents.replace(key, {"id": "e1", "session_id": "s2", "offset": 2})
+
+    match = documents.find_one({"session_id": {"$eq": "s2"}})
+
+    assert match is not None
+    assert match["id"] == "e1"
@@ -0,0 +1,61 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from parlant.core.persistence.tag_index import TagIndex
+
+
+def test_that_untagged_entities_are_found_when_no_tags_are_given() -> None:
+    index = TagIndex(entity_ids=["a", "b", "c"], associations=[("b", "t1")])
+
+    assert index.find_entity_ids([]) == ["a", "c"]
+
+
+def test_that_entities_with_any_of_the_given_tags_are_found() -> None:
+    index = TagIndex(
+        entity_ids=["a", "b", "c"],
+        associations=[("a", "t1"), ("b", "t2"), ("b", "t1")],
+    )
+
+    assert index.find_entity_ids(["t1"]) == ["a", "b"]
+    assert index.find_entity_ids(["t2", "t3"]) == ["b"]
+    assert index.tags_of("b") == ["t2", "t1"]
+
+
+def test_that_an_entity_becomes_untagged_when_its_last_tag_is_removed() -> None:
+    index = TagIndex(entity_ids=["a"], associations=[("a", "t1"), ("a", "t2")])
+
+    index.remove_tag("a", "t1")
+    assert index.find_entity_ids([]) == []
+
+    index.remove_tag("a", "t2")
+    assert index.find_entity_ids([]) == ["a"]
+    assert index.find_entity_ids(["t2"]) == []
+
+
+def test_that_removed_entities_are_no_longer_found() -> None:
+    index = TagIndex(entity_ids=["a", "b"], associations=[("a", "t1")])
+
+    index.remove_entity("a")
+    index.remove_entity("b")
+
+    assert index.find_entity_ids(["t1"]) == []
+    assert index.find_entity_ids([]) == []
+
+
+def test_that_filters_are_none_when_no_entity_matches_the_tags() -> None:
+    index = TagIndex(entity_ids=["a"], associations=[("a", "t1")])
+
+    assert index.filters_for(None) == {}
+    assert index.filters_for(["t1"]) == {"id": {"$in": ["a"]}}
+    assert index.filters_for(["t2"]) is None
@@ -0,0 +1,115 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing_extensions import override
+
+from parlant.core.common import Version
+from parlant.core.nlp.embedding import NoOpEmbedder
+from parlant.core.nlp.tokenization import EstimatingTokenizer
+from parlant.core.persistence.common import ObjectId
+from parlant.core.persistence.vector_database import BaseDocument, SimilarDocumentResult
+from parlant.core.persistence.vector_database_helper import (
+    QueryPart,
+    closest_unique_documents,
+    embedding_batches,
+    weigh_similar_documents,
+    weighted_query_chunks,
+)
+
+
+class WordTokenizer(EstimatingTokenizer):
+    @override
+    async def estimate_token_count(self, prompt: str) -> int:
+        return len(prompt.split())
+
+
+class SmallEmbedder(NoOpEmbedder):
+    @property
+    @override
+    def max_tokens(self) -> int:
+        return 10
+
+    @property
+    @override
+    def tokenizer(self) -> EstimatingTokenizer:
+        return WordTokenizer()
+
+
+def make_result(id: str, distance: float) -> SimilarDocumentResult[BaseDocument]:
+    return SimilarDocumentResult(
+        document={
+            "id": ObjectId(id),
+            "version": Version.String("0.1.0"),
+            "content": id,
+            "checksum": id,
+        },
+        distance=distance,
+    )
+
+
+async def test_that_query_parts_are_chunked_separately() -> None:
+    chunks = await weighted_query_chunks(
+        [
+            QueryPart("one two three", weight=1.0),
+            QueryPart("four", weight=0.5),
+            QueryPart("   ", weight=0.1),
+        ],
+        SmallEmbedder(),
+    )
+
+    assert chunks == [("one two", 1.0), ("three", 1.0), ("four", 0.5)]
+
+
+async def test_that_a_chunk_shared_by_parts_keeps_its_highest_weight() -> None:
+    chunks = await weighted_query_chunks(
+        [QueryPart("hi", weight=0.5), QueryPart("hi", weight=0.8)],
+        SmallEmbedder(),
+    )
+
+    assert chunks == [("hi", 0.8)]
+
+
+async def test_that_a_plain_string_query_is_a_single_part_of_full_weight() -> None:
+    assert await weighted_query_chunks("hello", SmallEmbedder()) == [("hello", 1.0)]
+
+
+def test_that_weighing_divides_distances_by_the_weight_of_their_chunk() -> None:
+    results = weigh_similar_documents(
+        [[make_result("a", 0.2)], [make_result("b", 0.2)]],
+        [1.0, 0.5],
+    )
+
+    assert [(r.document["id"], r.distance) for r in results] == [("a", 0.2), ("b", 0.4)]
+
+
+def test_that_closest_unique_documents_keeps_the_closest_result_per_document() -> None:
+    results = closest_unique_documents(
+        [make_result("a", 0.5), make_result("b", 0.3), make_result("a", 0.1)]
+    )
+
+    assert [(r.document["id"], r.distance) for r in results] == [("a", 0.1), ("b", 0.3)]
+
+
+async def test_that_embedding_batches_fit_within_the_token_limit_of_the_embedder() -> None:
+    texts = ["one two three", "four five six seven", "eight", "nine ten eleven twelve thirteen"]
+
+    batches = await embedding_batches(SmallEmbedder(), texts)
+
+    assert batches == [range(0, 3), range(3, 4)]
+
+
+async def test_that_embedding_batches_are_capped_by_the_max_batch_size() -> None:
+    batches = await embedding_batches(SmallEmbedder(), ["a", "b", "c", "d", "e"], max_batch_size=2)
+
+    assert batches == [range(0, 2), range(2, 4), range(4, 5)]
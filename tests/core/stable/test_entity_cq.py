@@ -590,3 +590,43 @@ async def test_that_canned_responses_can_be_found_for_a_guideline(
     assert any(canrep_4.id == r.id for r in results)
 
     assert all(canrep_3.id != r.id for r in results)
+
+
+async def test_that_configuration_version_is_stable_until_a_store_is_written_to(
+    container: Container,
+    agent: Agent,
+) -> None:
+    entity_queries = container[EntityQueries]
+    guideline_store = container[GuidelineStore]
+
+    await entity_queries.find_guidelines_for_context(agent.id, [])
+    version = entity_queries.configuration_version
+
+    await entity_queries.find_guidelines_for_context(agent.id, [])
+    assert entity_queries.configuration_version == version
+
+    await guideline_store.create_guideline(
+        condition="condition 1",
+        action="action 1",
+    )
+
+    assert entity_queries.configuration_version != version
+
+
+async def test_that_guidelines_written_after_a_read_are_returned_by_the_next_read(
+    container: Container,
+    agent: Agent,
+) -> None:
+    entity_queries = container[EntityQueries]
+    guideline_store = container[GuidelineStore]
+
+    assert await entity_queries.find_guidelines_for_context(agent.id, []) == []
+
+    guideline = await guideline_store.create_guideline(
+        condition="condition 1",
+        action="action 1",
+    )
+
+    result = await entity_queries.find_guidelines_for_context(agent.id, [])
+
+    assert [g.id for g in result] == [guideline.id]
@@ -53,3 +53,42 @@ async def test_that_projection_yields_followup_for_existing_guideline(container:
             assert (
                 f_id in all_ids
             ), f"Bug: follow-up ID {f_id} listed in {g.id} but no guideline was created for it"
+
+
+async def test_that_projection_is_reused_until_the_journey_changes(container: Container) -> None:
+    journey_store = container[JourneyStore]
+
+    projection = JourneyGuidelineProjection(
+        journey_store=journey_store,
+        guideline_store=container[GuidelineStore],
+    )
+
+    journey = await journey_store.create_journey(
+        title="Signup Journey",
+        description="Sign the customer up",
+        conditions=[],
+    )
+
+    other_journey = await journey_store.create_journey(
+        title="Other Journey",
+        description="Something else",
+        conditions=[],
+    )
+
+    node = await journey_store.create_node(journey.id, action="ask_name", tools=[])
+    await journey_store.create_edge(
+        journey.id, source=journey.root_id, target=node.id, condition=None
+    )
+
+    first_projection = await projection.project_journey_to_guidelines(journey.id)
+
+    await journey_store.create_node(other_journey.id, action="ask_email", tools=[])
+
+    assert await projection.project_journey_to_guidelines(journey.id) is first_projection
+
+    await journey_store.update_node(node.id, {"action": "ask_full_name"})
+
+    updated_projection = await projection.project_journey_to_guidelines(journey.id)
+
+    assert updated_projection is not first_projection
+    assert any(g.content.action == "ask_full_name" for g in updated_projection)
@@ -477,3 +477,69 @@ async def test_that_relationships_can_be_listed_with_both_source_and_target_filt
     unique_pairs = {(rel.source.id, rel.target.id) for rel in relationships}
 
     assert unique_pairs == {(a_id, b_id), (c_id, a_id)}
+
+
+async def test_that_indirect_relationships_reflect_deleted_relationships(
+    relationship_store: RelationshipStore,
+) -> None:
+    a_id = GuidelineId("a")
+    b_id = GuidelineId("b")
+    c_id = GuidelineId("c")
+
+    await relationship_store.create_relationship(
+        source=RelationshipEntity(id=a_id, kind=RelationshipEntityKind.GUIDELINE),
+        target=RelationshipEntity(id=b_id, kind=RelationshipEntityKind.GUIDELINE),
+        kind=RelationshipKind.ENTAILMENT,
+    )
+
+    b_to_c = await relationship_store.create_relationship(
+        source=RelationshipEntity(id=b_id, kind=RelationshipEntityKind.GUIDELINE),
+        target=RelationshipEntity(id=c_id, kind=RelationshipEntityKind.GUIDELINE),
+        kind=RelationshipKind.ENTAILMENT,
+    )
+
+    assert len(await relationship_store.list_relationships(source_id=a_id, indirect=True)) == 2
+
+    await relationship_store.delete_relationship(b_to_c.id)
+
+    relationships = await relationship_store.list_relationships(source_id=a_id, indirect=True)
+
+    assert len(relationships) == 1
+    assert has_relationship(relationships, (a_id, b_id))
+
+
+async def test_that_relationships_of_many_entities_can_be_listed_at_once(
+    relationship_store: RelationshipStore,
+) -> None:
+    a_id = GuidelineId("a")
+    b_id = GuidelineId("b")
+    c_id = GuidelineId("c")
+    d_id = GuidelineId("d")
+
+    for source, target in [(a_id, b_id), (b_id, c_id), (d_id, c_id)]:
+        await relationship_store.create_relationship(
+            source=RelationshipEntity(id=source, kind=RelationshipEntityKind.GUIDELINE),
+            target=RelationshipEntity(id=target, kind=RelationshipEntityKind.GUIDELINE),
+            kind=RelationshipKind.ENTAILMENT,
+        )
+
+    by_source = await relationship_store.list_relationships_for_many(
+        kind=RelationshipKind.ENTAILMENT,
+        source_ids=[a_id, c_id, d_id],
+    )
+
+    assert len(by_source[a_id]) == 2
+    assert has_relationship(by_source[a_id], (b_id, c_id))
+    assert by_source[c_id] == []
+    assert len(by_source[d_id]) == 1
+
+    by_target = await relationship_store.list_relationships_for_many(
+        kind=RelationshipKind.ENTAILMENT,
+        target_ids=[c_id],
+    )
+
+    assert {(r.source.id, r.target.id) for r in by_target[c_id]} == {
+        (b_id, c_id),
+        (d_id, c_id),
+        (a_id, b_id),
+    }
@@ -0,0 +1,176 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from typing import AsyncIterator
+from pytest import FixtureRequest, fixture
+
+from parlant.adapters.db.transient import TransientDocumentDatabase
+from parlant.core.agents import AgentId
+from parlant.core.async_utils import Timeout
+from parlant.core.customers import CustomerId
+from parlant.core.sessions import (
+    EventKind,
+    EventSource,
+    NotifyingSessionListener,
+    Session,
+    SessionDocumentStore,
+    SessionStore,
+)
+
+
+@fixture(params=[False, True], ids=["counted_offsets", "cached_offsets"])
+async def session_store(request: FixtureRequest) -> AsyncIterator[SessionStore]:
+    async with SessionDocumentStore(
+        TransientDocumentDatabase(),
+        cache_event_offsets=request.param,
+    ) as store:
+        yield store
+
+
+async def create_session(session_store: SessionStore) -> Session:
+    return await session_store.create_session(
+        customer_id=CustomerId("test_customer"),
+        agent_id=AgentId("test_agent"),
+    )
+
+
+async def create_status_event(session_store: SessionStore, session: Session) -> int:
+    event = await session_store.create_event(
+        session_id=session.id,
+        source=EventSource.AI_AGENT,
+        kind=EventKind.STATUS,
+        correlation_id="<main>",
+        data={"status": "ready"},
+    )
+
+    return event.offset
+
+
+async def test_that_concurrently_created_events_get_consecutive_offsets_per_session(
+    session_store: SessionStore,
+) -> None:
+    first_session = await create_session(session_store)
+    second_session = await create_session(session_store)
+
+    offsets = await asyncio.gather(
+        *(
+            create_status_event(session_store, session)
+            for _ in range(10)
+            for session in (first_session, second_session)
+        )
+    )
+
+    assert sorted(offsets) == sorted([*range(10), *range(10)])
+
+    for session in (first_session, second_session):
+        events = await session_store.list_events(session.id)
+        assert [e.offset for e in events] == list(range(10))
+
+
+async def test_that_offsets_of_deleted_events_are_reused(
+    session_store: SessionStore,
+) -> None:
+    session = await create_session(session_store)
+
+    for _ in range(3):
+        await create_status_event(session_store, session)
+
+    events = await session_store.list_events(session.id)
+
+    await session_store.delete_event(events[-1].id)
+    await session_store.delete_event(events[-1].id)
+
+    assert await create_status_event(session_store, session) == 2
+    assert await create_status_event(session_store, session) == 3
+
+
+async def test_that_offsets_are_counted_from_existing_events_in_a_reopened_store() -> None:
+    database = TransientDocumentDatabase()
+
+    async with SessionDocumentStore(database) as session_store:
+        session = await create_session(session_store)
+
+        for _ in range(3):
+            await create_status_event(session_store, session)
+
+    async with SessionDocumentStore(database) as session_store:
+        assert await create_status_event(session_store, session) == 3
+
+
+async def test_that_notifying_listener_wakes_up_as_soon_as_an_event_is_created(
+    session_store: SessionStore,
+) -> None:
+    listener = NotifyingSessionListener(session_store)
+    session = await create_session(session_store)
+
+    waiter = asyncio.create_task(
+        listener.wait_for_events(session.id, min_offset=0, timeout=Timeout(10))
+    )
+
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    started = time.monotonic()
+    await create_status_event(session_store, session)
+
+    assert await waiter
+    assert time.monotonic() - started < 0.2
+
+
+async def test_that_notifying_listener_returns_false_when_timing_out(
+    session_store: SessionStore,
+) -> None:
+    listener = NotifyingSessionListener(session_store)
+    session = await create_session(session_store)
+
+    await create_status_event(session_store, session)
+
+    assert not await listener.wait_for_events(session.id, min_offset=1, timeout=Timeout(0.1))
+
+
+async def test_that_stores_sharing_a_database_allocate_consecutive_offsets() -> None:
+    database = TransientDocumentDatabase()
+
+    async with (
+        SessionDocumentStore(database) as first_store,
+        SessionDocumentStore(database) as second_store,
+    ):
+        session = await create_session(first_store)
+
+        offsets = [
+            await create_status_event(store, session)
+            for store in (first_store, second_store, first_store, second_store)
+        ]
+
+    assert offsets == [0, 1, 2, 3]
+
+
+async def test_that_offsets_stay_consecutive_when_cached_offsets_are_evicted() -> None:
+    async with SessionDocumentStore(
+        TransientDocumentDatabase(),
+        cache_event_offsets=True,
+        max_cached_event_offsets=1,
+    ) as session_store:
+        first_session = await create_session(session_store)
+        second_session = await create_session(session_store)
+
+        for _ in range(3):
+            for session in (first_session, second_session):
+                await create_status_event(session_store, session)
+
+        for session in (first_session, second_session):
+            events = await session_store.list_events(session.id)
+            assert [e.offset for e in events] == [0, 1, 2]
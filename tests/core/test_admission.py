@@ -0,0 +1,364 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import Mock
+from pytest import MonkeyPatch, raises
+
+from parlant.core.admission import (
+    AdmissionController,
+    AdmissionLimits,
+    OverloadResponse,
+    ServiceOverloadedError,
+    TurnPriority,
+)
+from parlant.core.agents import AgentId
+from parlant.core.contextual_correlator import ContextualCorrelator
+from parlant.core.loggers import Logger, LogLevel, StdoutLogger
+from parlant.core.sessions import SessionId
+
+
+def create_controller(limits: AdmissionLimits) -> AdmissionController:
+    return AdmissionController(StdoutLogger(ContextualCorrelator(), LogLevel.ERROR), limits)
+
+
+async def test_that_queued_turns_are_admitted_by_priority_and_arrival() -> None:
+    controller = create_controller(AdmissionLimits(max_concurrent_turns=1))
+    release = asyncio.Event()
+    admitted = []
+
+    async def run_turn(session_id: str, priority: TurnPriority) -> None:
+        async with controller.turn(SessionId(session_id), AgentId("agent"), priority):
+            admitted.append(session_id)
+            await release.wait()
+
+    tasks = [asyncio.create_task(run_turn("first", TurnPriority.INTERACTIVE))]
+    await asyncio.sleep(0)
+
+    for session_id, priority in [
+        ("background", TurnPriority.BACKGROUND),
+        ("second", TurnPriority.INTERACTIVE),
+        ("third", TurnPriority.INTERACTIVE),
+    ]:
+        tasks.append(asyncio.create_task(run_turn(session_id, priority)))
+        await asyncio.sleep(0)
+
+    metrics = controller.metrics()
+    assert metrics.running == 1
+    assert metrics.queued == {TurnPriority.INTERACTIVE: 2, TurnPriority.BACKGROUND: 1}
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert admitted == ["first", "second", "third", "background"]
+    assert controller.metrics().running == 0
+
+
+async def test_that_an_agent_at_its_quota_does_not_hold_up_other_agents() -> None:
+    controller = create_controller(
+        AdmissionLimits(max_concurrent_turns=2, agent_quotas={AgentId("busy-agent"): 1})
+    )
+    release = asyncio.Event()
+    admitted = []
+
+    async def run_turn(session_id: str, agent_id: str) -> None:
+        async with controller.turn(SessionId(session_id), AgentId(agent_id)):
+            admitted.append(session_id)
+            await release.wait()
+
+    tasks = []
+
+    for session_id, agent_id in [("s1", "busy-agent"), ("s2", "busy-agent"), ("s3", "agent")]:
+        tasks.append(asyncio.create_task(run_turn(session_id, agent_id)))
+        await asyncio.sleep(0)
+
+    assert admitted == ["s1", "s3"]
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert admitted == ["s1", "s3", "s2"]
+
+
+async def test_that_new_turns_are_refused_once_the_queue_is_full() -> None:
+    controller = create_controller(AdmissionLimits(max_concurrent_turns=1, max_queued_turns=1))
+    release = asyncio.Event()
+
+    async def run_turn(session_id: str) -> None:
+        async with controller.turn(SessionId(session_id), AgentId("agent")):
+            await release.wait()
+
+    tasks = []
+
+    for session_id in ["s1", "s2"]:
+        tasks.append(asyncio.create_task(run_turn(session_id)))
+        await asyncio.sleep(0)
+
+    # A session with a turn in progress only replaces it
+    controller.check(AgentId("agent"), SessionId("s2"))
+
+    with raises(ServiceOverloadedError) as exc_info:
+        controller.check(AgentId("agent"), SessionId("s3"))
+
+    assert exc_info.value.retry_after == controller.limits.retry_after
+
+    with raises(ServiceOverloadedError):
+        async with controller.turn(SessionId("s3"), AgentId("agent")):
+            pass
+
+    assert controller.metrics().rejected == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+async def test_that_overload_is_not_refused_up_front_when_notifying() -> None:
+    controller = create_controller(
+        AdmissionLimits(
+            max_concurrent_turns=0,
+            max_queued_turns=0,
+            overload_response=OverloadResponse.NOTIFY,
+        )
+    )
+
+    controller.check(AgentId("agent"), SessionId("s1"))
+
+    with raises(ServiceOverloadedError):
+        async with controller.turn(SessionId("s1"), AgentId("agent")):
+            pass
+
+
+async def test_that_a_cancelled_queued_turn_leaves_the_queue() -> None:
+    controller = create_controller(AdmissionLimits(max_concurrent_turns=1))
+    release = asyncio.Event()
+
+    async def run_turn(session_id: str) -> None:
+        async with controller.turn(SessionId(session_id), AgentId("agent")):
+            await release.wait()
+
+    running = asyncio.create_task(run_turn("s1"))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(run_turn("s2"))
+    await asyncio.sleep(0)
+
+    queued.cancel()
+    await asyncio.gather(queued, return_exceptions=True)
+
+    assert controller.metrics().queued[TurnPriority.INTERACTIVE] == 0
+
+    release.set()
+    await running
+
+    assert controller.metrics().running == 0
+
+
+async def test_that_a_restarted_turn_takes_over_the_slot_of_the_one_it_replaces() -> None:
+    controller = create_controller(AdmissionLimits(max_concurrent_turns=1))
+    release = asyncio.Event()
+    admitted = []
+
+    async def run_turn(name: str, session_id: str) -> None:
+        async with controller.turn(SessionId(session_id), AgentId("agent")):
+            admitted.append(name)
+            await release.wait()
+
+    first = asyncio.create_task(run_turn("s1", "s1"))
+    await asyncio.sleep(0)
+
+    tasks = []
+
+    for session_id in ["s2", "s3"]:
+        tasks.append(asyncio.create_task(run_turn(session_id, session_id)))
+        await asyncio.sleep(0)
+
+    controller.hand_over(SessionId("s1"))
+    first.cancel()
+    await asyncio.gather(first, return_exceptions=True)
+
+    tasks.append(asyncio.create_task(run_turn("s1-restarted", "s1")))
+    await asyncio.sleep(0)
+
+    assert admitted == ["s1", "s1-restarted"]
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert admitted == ["s1", "s1-restarted", "s2", "s3"]
+    assert controller.metrics().running == 0
+
+
+async def test_that_a_restarted_turn_is_not_shed_and_keeps_its_place_in_the_queue() -> None:
+    controller = create_controller(AdmissionLimits(max_concurrent_turns=1, max_queued_turns=2))
+    release = asyncio.Event()
+    admitted = []
+
+    async def run_turn(name: str, session_id: str) -> None:
+        async with controller.turn(SessionId(session_id), AgentId("agent")):
+            admitted.append(name)
+            await release.wait()
+
+    tasks = []
+
+    for session_id in ["s1", "s2", "s3"]:
+        tasks.append(asyncio.create_task(run_turn(session_id, session_id)))
+        await asyncio.sleep(0)
+
+    queued = tasks.pop(1)
+
+    controller.check(AgentId("agent"), SessionId("s2"))
+    controller.hand_over(SessionId("s2"))
+    queued.cancel()
+    await asyncio.gather(queued, return_exceptions=True)
+
+    tasks.append(asyncio.create_task(run_turn("s2-restarted", "s2")))
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert admitted == ["s1", "s2-restarted", "s3"]
+    assert controller.metrics().rejected == 0
+
+
+async def test_that_a_slot_handed_over_to_no_turn_is_released() -> None:
+    controller = AdmissionController(
+        StdoutLogger(ContextualCorrelator(), LogLevel.ERROR),
+        AdmissionLimits(max_concurrent_turns=1),
+        handover_timeout=0.01,
+    )
+    release = asyncio.Event()
+
+    async def run_turn(session_id: str) -> None:
+        async with controller.turn(SessionId(session_id), AgentId("agent")):
+            await release.wait()
+
+    first = asyncio.create_task(run_turn("s1"))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(run_turn("s2"))
+    await asyncio.sleep(0)
+
+    controller.hand_over(SessionId("s1"))
+    first.cancel()
+    await asyncio.gather(first, return_exceptions=True)
+
+    assert controller.metrics().queued[TurnPriority.INTERACTIVE] == 1
+
+    await asyncio.sleep(0.05)
+
+    assert controller.metrics().queued[TurnPriority.INTERACTIVE] == 0
+    assert controller.metrics().running == 1
+
+    release.set()
+    await queued
+
+
+async def test_that_a_suspended_turn_gives_up_its_slot_and_is_readmitted_first() -> None:
+    controller = create_controller(AdmissionLimits(max_concurrent_turns=1))
+    release = asyncio.Event()
+    waited = asyncio.Event()
+    admitted = []
+
+    async def run_waiting_turn() -> None:
+        async with controller.turn(SessionId("waiting"), AgentId("agent")):
+            async with controller.suspended():
+                await waited.wait()
+
+            admitted.append("waiting")
+            await release.wait()
+
+    async def run_turn(session_id: str) -> None:
+        async with controller.turn(SessionId(session_id), AgentId("agent")):
+            admitted.append(session_id)
+            await release.wait()
+
+    tasks = [asyncio.create_task(run_waiting_turn())]
+    await asyncio.sleep(0)
+
+    for session_id in ["s1", "s2"]:
+        tasks.append(asyncio.create_task(run_turn(session_id)))
+        await asyncio.sleep(0)
+
+    assert admitted == ["s1"]
+
+    waited.set()
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert admitted == ["s1", "waiting", "s2"]
+    assert controller.metrics().running == 0
+
+
+async def test_that_a_checked_turn_is_not_shed_once_the_queue_fills_up() -> None:
+    controller = create_controller(AdmissionLimits(max_concurrent_turns=1, max_queued_turns=1))
+    release = asyncio.Event()
+
+    async def run_turn(session_id: str, checked: bool = False) -> None:
+        async with controller.turn(SessionId(session_id), AgentId("agent"), checked=checked):
+            await release.wait()
+
+    # The turn is let in while there's still room in the queue...
+    tasks = [asyncio.create_task(run_turn("s1"))]
+    await asyncio.sleep(0)
+
+    controller.check(AgentId("agent"), SessionId("s2"))
+
+    # ...which fills up before the turn itself starts
+    tasks.append(asyncio.create_task(run_turn("s3")))
+    await asyncio.sleep(0)
+
+    tasks.append(asyncio.create_task(run_turn("s2", checked=True)))
+    await asyncio.sleep(0)
+
+    assert controller.metrics().queued[TurnPriority.INTERACTIVE] == 2
+    assert controller.metrics().rejected == 0
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+def test_that_agent_quotas_are_read_from_the_environment(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("PARLANT_AGENT_TURN_QUOTAS", "agent-1=2, agent-2=8")
+
+    assert AdmissionLimits.from_environment().agent_quotas == {
+        AgentId("agent-1"): 2,
+        AgentId("agent-2"): 8,
+    }
+
+
+async def test_that_metrics_are_logged_only_while_there_is_activity() -> None:
+    logger = Mock(spec=Logger)
+    controller = AdmissionController(logger, AdmissionLimits(max_concurrent_turns=1))
+    release = asyncio.Event()
+
+    async def run_turn(session_id: str) -> None:
+        async with controller.turn(SessionId(session_id), AgentId("agent")):
+            await release.wait()
+
+    logging_task = asyncio.create_task(controller.log_metrics(interval=0))
+    await asyncio.sleep(0.01)
+
+    assert not logger.info.called
+
+    tasks = [asyncio.create_task(run_turn(session_id)) for session_id in ["s1", "s2"]]
+    await asyncio.sleep(0.01)
+
+    logging_task.cancel()
+    release.set()
+    await asyncio.gather(*tasks, logging_task, return_exceptions=True)
+
+    assert (
+        "1 turns running, 1 interactive and 0 background turns queued"
+        in (logger.info.call_args.args[0])
+    )
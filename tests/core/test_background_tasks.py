@@ -0,0 +1,61 @@
+# Copyright 2025 Emcie Co Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from parlant.core.background_tasks import BackgroundTaskService
+from parlant.core.contextual_correlator import ContextualCorrelator
+from parlant.core.loggers import LogLevel, StdoutLogger
+
+
+async def test_that_restarting_a_task_cancels_the_previous_one() -> None:
+    results = []
+
+    async def run(name: str) -> None:
+        await asyncio.sleep(0.2)
+        results.append(name)
+
+    async with BackgroundTaskService(
+        StdoutLogger(ContextualCorrelator(), LogLevel.WARNING)
+    ) as service:
+        await service.restart(run("first"), tag="session")
+        await asyncio.sleep(0.05)
+        await service.restart(run("second"), tag="session")
+
+    assert results == ["second"]
+
+
+async def test_that_a_slow_restart_does_not_block_restarts_under_other_tags() -> None:
+    async def wind_down_slowly() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0.5)
+
+    async def noop() -> None:
+        pass
+
+    async with BackgroundTaskService(
+        StdoutLogger(ContextualCorrelator(), LogLevel.WARNING)
+    ) as service:
+        await service.restart(wind_down_slowly(), tag="slow")
+        await asyncio.sleep(0.05)
+
+        slow_restart = asyncio.create_task(service.restart(noop(), tag="slow"))
+        await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(service.restart(noop(), tag="other"), timeout=0.2)
+
+        assert not slow_restart.done()
+        await slow_restart